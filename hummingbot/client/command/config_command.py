@@ -262,6 +262,11 @@ class ConfigCommand:
                 self._notify("Inventory price not updated due to bad input")
                 return
 
+            if isinstance(self.strategy, PureMarketMakingStrategy) and \
+                    self.strategy.inventory_cost_price_delegate is not None:
+                # The running strategy keeps the inventory cost in memory, and writes it to the database.
+                self.strategy.inventory_cost_price_delegate.set_volumes(balances[base_asset], quote_volume)
+                return
             session: Session = self.trade_fill_db.get_shared_session()
             InventoryCost.add_volume(
                 session,
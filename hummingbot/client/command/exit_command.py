@@ -27,6 +27,12 @@ class ExitCommand:
             # Freeze screen 1 second for better UI
             await asyncio.sleep(1)
 
+        if self.markets_recorder is not None:
+            # Writes the pending trade records.
+            self.markets_recorder.stop()
+
+        self._close_order_book_recorders()
+
         self._notify("Winding down notifiers...")
         for notifier in self.notifiers:
             notifier.stop()
@@ -1,6 +1,11 @@
 from typing import TYPE_CHECKING, Optional
 import os
-from typing import List
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
 import pandas as pd
 from sqlalchemy.orm import (
     Session,
@@ -8,6 +13,7 @@ from sqlalchemy.orm import (
 )
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.client.config.security import Security
+from hummingbot.client.performance import TradeColumns
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
 from hummingbot.client.config.global_config_map import global_config_map
@@ -67,6 +73,9 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        if self.markets_recorder is not None:
+            # Wait for the trades being recorded.
+            await self.markets_recorder.drain()
         trades: List[TradeFill] = self._get_trades_from_session(int(self.init_time * 1e3))
         if len(trades) == 0:
             self._notify("No past trades to export.")
@@ -88,14 +97,45 @@ class ExportCommand:
         self.placeholder_mode = False
         self.app.hide_input = False
 
+    @staticmethod
+    def _get_trade_filters(start_timestamp: int, config_file_path: str = None) -> List[Any]:
+        filters = [TradeFill.timestamp >= start_timestamp]
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        return filters
+
+    def _get_trade_columns_from_session(self,  # type: HummingbotApplication
+                                        start_timestamp: int,
+                                        config_file_path: str = None) -> Dict[Tuple[str, str], TradeColumns]:
+        """
+        Returns the trades of each market and trading pair as columns, in ascending timestamp order. Only the columns
+        used by the performance metrics are queried, rather than whole TradeFill objects.
+        The trades being recorded are only returned once committed, see MarketsRecorder.drain().
+        """
+        session: Session = self.trade_fill_db.get_shared_session()
+        query: Query = (session
+                        .query(TradeFill.market,
+                               TradeFill.symbol,
+                               TradeFill.trade_type,
+                               TradeFill.price,
+                               TradeFill.amount,
+                               TradeFill.order_id,
+                               TradeFill.position,
+                               TradeFill.trade_fee)
+                        .filter(*self._get_trade_filters(start_timestamp, config_file_path))
+                        .order_by(TradeFill.timestamp))
+        rows: Dict[Tuple[str, str], List[Any]] = {}
+        for row in query:
+            rows.setdefault((row.market, row.symbol), []).append(row)
+        return {(market, symbol): TradeColumns.from_trades(market_rows, symbol.split("-")[1])
+                for (market, symbol), market_rows in rows.items()}
+
     def _get_trades_from_session(self,  # type: HummingbotApplication
                                  start_timestamp: int,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
         session: Session = self.trade_fill_db.get_shared_session()
-        filters = [TradeFill.timestamp >= start_timestamp]
-        if config_file_path is not None:
-            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        filters = self._get_trade_filters(start_timestamp, config_file_path)
         query: Query = (session
                         .query(TradeFill)
                         .filter(*filters)
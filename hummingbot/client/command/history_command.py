@@ -3,7 +3,7 @@ import pandas as pd
 import threading
 import time
 from typing import (
-    Set,
+    Dict,
     Tuple,
     TYPE_CHECKING,
     List,
@@ -20,7 +20,12 @@ from hummingbot.client.settings import (
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.client.performance import PerformanceMetrics, calculate_performance_metrics, smart_round
+from hummingbot.client.performance import (
+    PerformanceMetrics,
+    TradeColumns,
+    calculate_performance_metrics,
+    smart_round,
+)
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -49,28 +54,35 @@ class HistoryCommand:
             return
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
+        safe_ensure_future(self.show_history(days, verbose, precision))
+
+    async def show_history(self,  # type: HummingbotApplication
+                           days: float = 0,
+                           verbose: bool = False,
+                           precision: Optional[int] = None):
+        if self.markets_recorder is not None:
+            # Wait for the trades being recorded.
+            await self.markets_recorder.drain()
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
+        trades: Dict[Tuple[str, str], TradeColumns] = self._get_trade_columns_from_session(
+            int(start_time * 1e3), config_file_path=self.strategy_file_name)
         if not trades:
             self._notify("\n  No past trades to report.")
             return
         if verbose:
             self.list_trades(start_time)
         if self.strategy_name != "celo_arb":
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            await self.history_report(start_time, trades, precision)
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Dict[Tuple[str, str], TradeColumns],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), cur_trades in trades.items():
             cur_balances = await self.get_current_balances(market)
             perf = await calculate_performance_metrics(market, symbol, cur_trades, cur_balances)
             if display_report:
@@ -196,8 +208,9 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
+        await self.markets_recorder.drain()
+        trades: Dict[Tuple[str, str], TradeColumns] = self._get_trade_columns_from_session(
+            int(start_time * 1e3), config_file_path=self.strategy_file_name)
         avg_return = await self.history_report(start_time, trades, display_report=False)
         return avg_return
 
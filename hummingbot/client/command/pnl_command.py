@@ -12,7 +12,10 @@ from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.market_price import usd_value
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.common import OpenOrder
-from hummingbot.client.performance import calculate_performance_metrics
+from hummingbot.client.performance import (
+    TradeColumns,
+    calculate_performance_metrics,
+)
 from hummingbot.client.command.history_command import get_timestamp
 from hummingbot.client.config.global_config_map import global_config_map
 
@@ -57,7 +60,8 @@ class PnlCommand:
         if market is not None:
             market = market.upper()
             trades: List[Trade] = await connector.get_my_trades(market, days)
-            perf = await calculate_performance_metrics(exchange, market, trades, cur_balances)
+            columns: TradeColumns = TradeColumns.from_trades(trades, market.split("-")[1])
+            perf = await calculate_performance_metrics(exchange, market, columns, cur_balances)
             self.report_performance_by_market(exchange, market, perf, precision=None)
             return
         self._notify(f"Starting: {datetime.fromtimestamp(get_timestamp(days)).strftime('%Y-%m-%d %H:%M:%S')}"
@@ -79,7 +83,8 @@ class PnlCommand:
             trades: List[Trade] = await connector.get_my_trades(market, days)
             if not trades:
                 continue
-            perf = await calculate_performance_metrics(exchange, market, trades, cur_balances)
+            columns: TradeColumns = TradeColumns.from_trades(trades, quote)
+            perf = await calculate_performance_metrics(exchange, market, columns, cur_balances)
             volume = await usd_value(quote, abs(perf.b_vol_quote) + abs(perf.s_vol_quote))
             fee = await usd_value(quote, perf.fee_in_quote)
             pnl = await usd_value(quote, perf.total_pnl)
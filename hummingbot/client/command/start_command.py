@@ -112,6 +112,10 @@ class StartCommand:
             raise NotImplementedError
 
         try:
+            # The markets recorder is created by the strategy starter. The market states are loaded from the
+            # database once its pending writes are committed.
+            if self.markets_recorder is not None:
+                await self.markets_recorder.drain()
             config_path: str = self.strategy_file_name
             self.start_time = time.time() * 1e3  # Time in milliseconds
             self.clock = Clock(ClockMode.REALTIME)
@@ -4,6 +4,7 @@ import threading
 from typing import TYPE_CHECKING
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.eth_gas_station_lookup import EthGasStationLookup
+from hummingbot.core.utils.price_oracle import PriceOracle
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
 
@@ -48,9 +49,14 @@ class StopCommand:
         if EthGasStationLookup.get_instance().started:
             EthGasStationLookup.get_instance().stop()
 
+        # The order books of the stopped connectors are not kept up to date anymore.
+        PriceOracle.get_instance().remove_connectors()
+
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
+        self._close_order_book_recorders()
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
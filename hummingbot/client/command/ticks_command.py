@@ -0,0 +1,53 @@
+from typing import (
+    Optional,
+    TYPE_CHECKING,
+)
+
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class TicksCommand:
+    def ticks(self,  # type: HummingbotApplication
+              enable: bool = False,
+              disable: bool = False,
+              reset: bool = False,
+              log_interval: Optional[float] = None,
+              live: bool = False):
+        if self.clock is None:
+            self._notify("\n This command can only be used while a strategy is running")
+            return
+        if disable:
+            self.clock.disable_profiling()
+            self._notify("\n Clock tick profiling disabled.")
+            return
+        profiler: Optional[ClockProfiler] = self.clock.profiler
+        if enable or log_interval is not None:
+            if log_interval is None:
+                log_interval = profiler.log_interval if profiler is not None else 0.0
+            profiler = self.clock.enable_profiling(log_interval)
+            log_text: str = f", logged every {profiler.log_interval:g} seconds" if profiler.log_interval > 0 else ""
+            self._notify(f"\n Clock tick profiling enabled{log_text}.")
+            return
+        if profiler is None:
+            self._notify("\n Clock tick profiling is disabled. Enable it with `ticks --enable`.")
+            return
+        if reset:
+            profiler.reset()
+            self._notify("\n Clock tick statistics reset.")
+            return
+        safe_ensure_future(self.show_ticks(live))
+
+    async def show_ticks(self,  # type: HummingbotApplication
+                         live: bool = False):
+        if live:
+            await self.stop_live_update()
+            self.app.live_updates = True
+            while self.app.live_updates and self.clock is not None and self.clock.profiler is not None:
+                await self.cls_display_delay(self.clock.profiler.report() + "\n\n Press escape key to stop update.", 1)
+            self._notify("Stopped live tick statistics display update.")
+        else:
+            self._notify("\n" + self.clock.profiler.report())
@@ -72,6 +72,25 @@ main_config_map = {
                   type_str="float",
                   required_if=lambda: False,
                   default=900),
+    "event_log_max_size":
+        ConfigVar(key="event_log_max_size",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=0, inclusive=True),
+                  default=10000),
+    "event_log_max_age":
+        ConfigVar(key="event_log_max_age",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  default=0.0),
+    "order_book_recording_enabled":
+        ConfigVar(key="order_book_recording_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
     "logger_override_whitelist":
         ConfigVar(key="logger_override_whitelist",
                   prompt=None,
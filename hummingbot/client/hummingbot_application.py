@@ -3,9 +3,11 @@
 import asyncio
 from collections import deque
 import logging
+import os
 import time
 from typing import List, Dict, Optional, Tuple, Set, Deque
 
+from hummingbot import data_path
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
 from hummingbot.logger import HummingbotLogger
@@ -34,9 +36,13 @@ from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+from hummingbot.core.utils.price_oracle import PriceOracle
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
 s_logger = None
 
@@ -95,6 +101,8 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        # The order book recorders attached to the trackers of the connectors, when order book recording is enabled.
+        self.order_book_recorders: List[Tuple[OrderBookTracker, OrderBookRecorder]] = []
         self._script_iterator = None
         # This is to start fetching trading pairs for auto-complete
         TradingPairFetcher.get_instance()
@@ -180,7 +188,11 @@ class HummingbotApplication(*commands):
         return success
 
     async def run(self):
-        await self.app.run()
+        try:
+            await self.app.run()
+        finally:
+            # Close the pooled connections shared by the connectors and data sources.
+            await HttpClientRegistry.get_instance().close()
 
     def add_application_warning(self, app_warning: ApplicationWarning):
         self._expire_old_application_warnings()
@@ -250,6 +262,9 @@ class HummingbotApplication(*commands):
                 connector_class = get_connector_class(connector_name)
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
+            PriceOracle.get_instance().add_connector(connector_name, connector)
+            if global_config_map.get("order_book_recording_enabled").value:
+                self._attach_order_book_recorder(connector_name, connector)
 
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
@@ -259,6 +274,22 @@ class HummingbotApplication(*commands):
         )
         self.markets_recorder.start()
 
+    def _attach_order_book_recorder(self, connector_name: str, connector: ExchangeBase):
+        order_book_tracker: Optional[OrderBookTracker] = getattr(connector, "order_book_tracker", None)
+        if order_book_tracker is None:
+            self.logger().warning(f"The order books of {connector_name} can't be recorded, as its connector doesn't "
+                                  f"expose its order book tracker.")
+            return
+        recorder: OrderBookRecorder = OrderBookRecorder(os.path.join(data_path(), "order_books", connector_name))
+        order_book_tracker.recorder = recorder
+        self.order_book_recorders.append((order_book_tracker, recorder))
+
+    def _close_order_book_recorders(self):
+        for order_book_tracker, recorder in self.order_book_recorders:
+            order_book_tracker.recorder = None
+            recorder.close()
+        self.order_book_recorders.clear()
+
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
             # TODO: refactor to use single instance
@@ -1,13 +1,19 @@
 from decimal import Decimal
 from dataclasses import dataclass
+import numpy as np
 from typing import (
     Dict,
+    Iterable,
     Optional,
     List,
-    Any
+    Any,
+    Tuple,
+    Union,
+)
+from hummingbot.core.utils.market_price import (
+    get_last_price,
+    get_last_prices,
 )
-from hummingbot.model.trade_fill import TradeFill
-from hummingbot.core.utils.market_price import get_last_price
 
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
@@ -53,75 +59,169 @@ class PerformanceMetrics:
         self.fees: Dict[str, Decimal] = {}
 
 
-def position_order(open: list, close: list):
+class TradeColumns:
+    """
+    The trades of a market as numpy columns, loaded in a single pass over TradeFill rows or Trade objects. Fees are
+    summed by asset while loading.
+    Prices and amounts which are not floats (e.g. Decimal for Trade objects) are kept in object columns, so that all
+    the sums and products are still done with their own arithmetic.
+    """
+    __slots__ = ("sides", "prices", "amounts", "order_ids", "positions", "fees", "is_trade_fill")
+
+    def __init__(self,
+                 sides: np.ndarray,
+                 prices: np.ndarray,
+                 amounts: np.ndarray,
+                 order_ids: np.ndarray,
+                 positions: np.ndarray,
+                 fees: Dict[str, Decimal],
+                 is_trade_fill: bool):
+        self.sides: np.ndarray = sides
+        self.prices: np.ndarray = prices
+        self.amounts: np.ndarray = amounts
+        self.order_ids: np.ndarray = order_ids
+        self.positions: np.ndarray = positions
+        self.fees: Dict[str, Decimal] = fees
+        self.is_trade_fill: bool = is_trade_fill
+
+    def __len__(self) -> int:
+        return len(self.sides)
+
+    @property
+    def is_derivative(self) -> bool:
+        return self.is_trade_fill and len(self) > 0 and not (self.positions == "NILL").any()
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Any], quote: str) -> "TradeColumns":
+        """
+        :param trades: TradeFill objects, TradeFill query rows with the trade_type, price, amount, order_id, position
+        and trade_fee columns, or Trade objects
+        :param quote: quote asset of the market, the percent fees are paid in it
+        """
+        sides: List[int] = []
+        prices: List[Any] = []
+        amounts: List[Any] = []
+        order_ids: List[str] = []
+        positions: List[Optional[str]] = []
+        fees: Dict[str, Decimal] = {}
+        is_trade_fill: Optional[bool] = None
+        for trade in trades:
+            trade_fee = trade.trade_fee
+            if is_trade_fill is None:
+                is_trade_fill = isinstance(trade_fee, dict)
+            if is_trade_fill:
+                side: str = trade.trade_type.upper()
+                order_ids.append(trade.order_id)
+                positions.append(trade.position)
+                percent = trade_fee.get("percent")
+                if percent is not None and percent > 0:
+                    fees[quote] = fees.get(quote, s_decimal_0) + Decimal(trade.price * trade.amount * percent)
+                for flat_fee in trade_fee.get("flat_fees", []):
+                    fees[flat_fee["asset"]] = fees.get(flat_fee["asset"], s_decimal_0) + Decimal(flat_fee["amount"])
+            else:
+                side: str = trade.side.name
+                if trade_fee.percent > 0:
+                    fees[quote] = (fees.get(quote, s_decimal_0) +
+                                   trade.price * trade.amount * Decimal(str(trade_fee.percent)))
+                for asset, amount in trade_fee.flat_fees:
+                    fees[asset] = fees.get(asset, s_decimal_0) + amount
+            sides.append(1 if side == "BUY" else -1 if side == "SELL" else 0)
+            prices.append(trade.price)
+            amounts.append(trade.amount)
+        numeric_dtype = float if len(prices) > 0 and type(prices[0]) is float and type(amounts[0]) is float else object
+        return TradeColumns(np.array(sides, dtype=np.int8),
+                            np.array(prices, dtype=numeric_dtype),
+                            np.array(amounts, dtype=numeric_dtype),
+                            np.array(order_ids, dtype=object),
+                            np.array(positions, dtype=object),
+                            fees,
+                            bool(is_trade_fill))
+
+
+def _sequential_sum(values: np.ndarray) -> Any:
     """
-    Pair open position order with close position orders
-    :param open: a list of orders that may have an open position order
-    :param close: a list of orders that may have an close position order
-    :return: A tuple containing a pair of an open order with a close position order
+    Sums the values one by one like the built-in sum does, rather than with numpy's pairwise summation, so that float
+    totals are the same to the last bit.
     """
-    for o in open:
-        for c in close:
-            if o.position == "OPEN" and c.position == "CLOSE":
-                open.remove(o)
-                close.remove(c)
-                return (o, c)
-    return None
+    if len(values) == 0:
+        return 0
+    total = np.cumsum(values)[-1]
+    return total.item() if isinstance(total, np.generic) else total
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value.item() if isinstance(value, np.generic) else value))
 
 
-def aggregate_position_order(buys: list, sells: list):
+def aggregate_orders(order_ids: np.ndarray,
+                     prices: np.ndarray,
+                     amounts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Aggregate the amount field for orders with multiple fills
-    :param buys: a list of buy orders
-    :param sells: a list of sell orders
-    :return: 2 lists containing aggregated amounts for buy and sell orders.
+    Aggregates the fills of each order, in the order in which the orders were first filled.
+    :return: the index of the first fill of each order, the mean price of its fills and their total amount
     """
-    aggregated_buys = []
-    aggregated_sells = []
-    for buy in buys:
-        if buy.order_id not in [ag.order_id for ag in aggregated_buys]:
-            aggregate_price = [b.price for b in buys if b.order_id == buy.order_id]
-            aggregate_amount = [b.amount for b in buys if b.order_id == buy.order_id]
-            buy.price = sum(aggregate_price) / len(aggregate_price)
-            buy.amount = sum(aggregate_amount)
-            aggregated_buys.append(buy)
-
-    for sell in sells:
-        if sell.order_id not in [ag.order_id for ag in aggregated_sells]:
-            aggregate_price = [s.price for s in sells if s.order_id == sell.order_id]
-            aggregate_amount = [s.amount for s in sells if s.order_id == sell.order_id]
-            sell.price = sum(aggregate_price) / len(aggregate_price)
-            sell.amount = sum(aggregate_amount)
-            aggregated_sells.append(sell)
-
-    return aggregated_buys, aggregated_sells
-
-
-def derivative_pnl(long: list, short: list):
-    # It is assumed that the amount and leverage for both open and close orders are thesame.
+    _, first_fills, inverse = np.unique(order_ids, return_index=True, return_inverse=True)
+    order_of_appearance: np.ndarray = np.argsort(first_fills, kind="stable")
+    fill_counts: np.ndarray = np.bincount(inverse)
+    if prices.dtype == object:
+        fill_counts = fill_counts.astype(object)
+        price_sums: np.ndarray = np.zeros(len(first_fills), dtype=object)
+        amount_sums: np.ndarray = np.zeros(len(first_fills), dtype=object)
+        for group, price, amount in zip(inverse, prices, amounts):
+            price_sums[group] += price
+            amount_sums[group] += amount
+    else:
+        # bincount adds the weights of each bin in order, which keeps the sums the same as adding the fills one by one.
+        price_sums: np.ndarray = np.bincount(inverse, weights=prices)
+        amount_sums: np.ndarray = np.bincount(inverse, weights=amounts)
+    return (first_fills[order_of_appearance],
+            (price_sums / fill_counts)[order_of_appearance],
+            amount_sums[order_of_appearance])
+
+
+def derivative_pnl(columns: TradeColumns) -> Any:
     """
-    Calculates PnL for a close position
-    :param long: a list containing pairs of open and closed long position orders
-    :param short: a list containing pairs of open and closed short position orders
-    :return: A list containing PnL for each closed positions
+    Calculates the PnL of the closed positions. The fills of each order are aggregated first, then the open position
+    orders are paired with the close position orders in FIFO order.
+    It is assumed that the amount and leverage for both open and close orders are the same.
+    :param columns: the trades of a derivative market
+    :return: the sum of the PnL of each closed position
     """
-    pnls = []
-    for lg in long:
-        pnls.append((lg[1].price - lg[0].price) * lg[1].amount)
-    for st in short:
-        pnls.append((st[0].price - st[1].price) * st[1].amount)
-    return pnls
+    buys: np.ndarray = np.flatnonzero(columns.sides == 1)
+    sells: np.ndarray = np.flatnonzero(columns.sides == -1)
+    buy_fills, buy_prices, buy_amounts = aggregate_orders(columns.order_ids[buys],
+                                                          columns.prices[buys],
+                                                          columns.amounts[buys])
+    sell_fills, sell_prices, sell_amounts = aggregate_orders(columns.order_ids[sells],
+                                                             columns.prices[sells],
+                                                             columns.amounts[sells])
+    buy_positions: np.ndarray = columns.positions[buys[buy_fills]]
+    sell_positions: np.ndarray = columns.positions[sells[sell_fills]]
+
+    def pair(open_positions: np.ndarray, close_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        opens: np.ndarray = np.flatnonzero(open_positions == "OPEN")
+        closes: np.ndarray = np.flatnonzero(close_positions == "CLOSE")
+        count: int = min(len(opens), len(closes))
+        return opens[:count], closes[:count]
+
+    long_opens, long_closes = pair(buy_positions, sell_positions)
+    short_opens, short_closes = pair(sell_positions, buy_positions)
+    pnls: np.ndarray = np.concatenate([
+        (sell_prices[long_closes] - buy_prices[long_opens]) * sell_amounts[long_closes],
+        (sell_prices[short_opens] - buy_prices[short_closes]) * buy_amounts[short_closes]
+    ])
+    return _sequential_sum(pnls)
 
 
 async def calculate_performance_metrics(exchange: str,
                                         trading_pair: str,
-                                        trades: List[Any],
+                                        trades: Union[List[Any], TradeColumns],
                                         current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
     """
     Calculates PnL, fees, Return % and etc...
     :param exchange: the exchange or connector name
     :param trading_pair: the trading market to get performance metrics
-    :param trades: the list of TradeFill or Trade object
+    :param trades: the list of TradeFill or Trade object, or their columns
     :param current_balances: current user account balance
     :return: A PerformanceMetrics object
     """
@@ -135,21 +235,21 @@ async def calculate_performance_metrics(exchange: str,
 
     base, quote = trading_pair.split("-")
     perf = PerformanceMetrics()
-    buys = [t for t in trades if t.trade_type.upper() == "BUY"]
-    sells = [t for t in trades if t.trade_type.upper() == "SELL"]
-    derivative = False
-    if trades and type(trades[0]) == TradeFill and "NILL" not in [t.position for t in trades]:
-        derivative = True
-    perf.num_buys = len(buys)
-    perf.num_sells = len(sells)
+    columns: TradeColumns = trades if isinstance(trades, TradeColumns) else TradeColumns.from_trades(trades, quote)
+    buys: np.ndarray = columns.sides == 1
+    sells: np.ndarray = columns.sides == -1
+    buy_amounts: np.ndarray = columns.amounts[buys]
+    sell_amounts: np.ndarray = columns.amounts[sells]
+    perf.num_buys = len(buy_amounts)
+    perf.num_sells = len(sell_amounts)
     perf.num_trades = perf.num_buys + perf.num_sells
 
-    perf.b_vol_base = Decimal(str(sum(b.amount for b in buys)))
-    perf.s_vol_base = Decimal(str(sum(s.amount for s in sells))) * Decimal("-1")
+    perf.b_vol_base = _to_decimal(_sequential_sum(buy_amounts))
+    perf.s_vol_base = _to_decimal(_sequential_sum(sell_amounts)) * Decimal("-1")
     perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
 
-    perf.b_vol_quote = Decimal(str(sum(b.amount * b.price for b in buys))) * Decimal("-1")
-    perf.s_vol_quote = Decimal(str(sum(s.amount * s.price for s in sells)))
+    perf.b_vol_quote = _to_decimal(_sequential_sum(buy_amounts * columns.prices[buys])) * Decimal("-1")
+    perf.s_vol_quote = _to_decimal(_sequential_sum(sell_amounts * columns.prices[sells]))
     perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
 
     perf.avg_b_price = divide(perf.b_vol_quote, perf.b_vol_base)
@@ -164,10 +264,10 @@ async def calculate_performance_metrics(exchange: str,
     perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
     perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
 
-    perf.start_price = Decimal(str(trades[0].price))
+    perf.start_price = _to_decimal(columns.prices[0])
     perf.cur_price = await get_last_price(exchange.replace("_PaperTrade", ""), trading_pair)
     if perf.cur_price is None:
-        perf.cur_price = Decimal(str(trades[-1].price))
+        perf.cur_price = _to_decimal(columns.prices[-1])
     perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
                                        (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
     perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
@@ -178,49 +278,18 @@ async def calculate_performance_metrics(exchange: str,
     perf.trade_pnl = perf.cur_value - perf.hold_value
 
     # Handle trade_pnl differently for derivatives
-    if derivative:
-        buys_copy, sells_copy = aggregate_position_order(buys.copy(), sells.copy())
-        long = []
-        short = []
-
-        while True:
-            lng = position_order(buys_copy, sells_copy)
-            if lng is not None:
-                long.append(lng)
-
-            sht = position_order(sells_copy, buys_copy)
-            if sht is not None:
-                short.append(sht)
-            if lng is None and sht is None:
-                break
-
-        perf.trade_pnl = Decimal(str(sum(derivative_pnl(long, short))))
-
-    for trade in trades:
-        if type(trade) is TradeFill:
-            if trade.trade_fee.get("percent") is not None and trade.trade_fee["percent"] > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += Decimal(trade.price * trade.amount * trade.trade_fee["percent"])
-            for flat_fee in trade.trade_fee.get("flat_fees", []):
-                if flat_fee["asset"] not in perf.fees:
-                    perf.fees[flat_fee["asset"]] = s_decimal_0
-                perf.fees[flat_fee["asset"]] += Decimal(flat_fee["amount"])
-        else:  # assume this is Trade object
-            if trade.trade_fee.percent > 0:
-                if quote not in perf.fees:
-                    perf.fees[quote] = s_decimal_0
-                perf.fees[quote] += (trade.price * trade.order_amount) * trade.trade_fee.percent
-            for flat_fee in trade.trade_fee.flat_fees:
-                if flat_fee[0] not in perf.fees:
-                    perf.fees[flat_fee[0]] = s_decimal_0
-                perf.fees[flat_fee[0]] += flat_fee[1]
+    if columns.is_derivative:
+        perf.trade_pnl = _to_decimal(derivative_pnl(columns))
 
+    perf.fees = dict(columns.fees)
+    fee_trading_pairs: List[str] = [f"{fee_token}-{quote}" for fee_token in perf.fees if fee_token != quote]
+    fee_prices: Dict[str, Optional[Decimal]] = await get_last_prices(exchange, fee_trading_pairs) \
+        if len(fee_trading_pairs) > 0 else {}
     for fee_token, fee_amount in perf.fees.items():
         if fee_token == quote:
             perf.fee_in_quote += fee_amount
         else:
-            last_price = await get_last_price(exchange, f"{fee_token}-{quote}")
+            last_price = fee_prices[f"{fee_token}-{quote}"]
             if last_price is not None:
                 perf.fee_in_quote += fee_amount * last_price
 
@@ -101,6 +101,20 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
     status_parser.add_argument("--live", default=False, action="store_true", dest="live", help="Show status updates")
     status_parser.set_defaults(func=hummingbot.status)
 
+    ticks_parser = subparsers.add_parser("ticks", help="Show the tick durations of the strategy, connectors and "
+                                                       "other clock iterators")
+    ticks_parser.add_argument("--enable", default=False, action="store_true", dest="enable",
+                              help="Start collecting tick statistics")
+    ticks_parser.add_argument("--disable", default=False, action="store_true", dest="disable",
+                              help="Stop collecting tick statistics")
+    ticks_parser.add_argument("--reset", default=False, action="store_true", dest="reset",
+                              help="Reset the tick statistics")
+    ticks_parser.add_argument("--log_interval", type=float, default=None, dest="log_interval",
+                              help="Log the tick statistics every given number of seconds, 0 to stop")
+    ticks_parser.add_argument("--live", default=False, action="store_true", dest="live",
+                              help="Show tick statistics updates")
+    ticks_parser.set_defaults(func=hummingbot.ticks)
+
     history_parser = subparsers.add_parser("history", help="See the past performance of the current bot")
     history_parser.add_argument("-d", "--days", type=float, default=0, dest="days",
                                 help="How many days in the past (can be decimal value)")
@@ -101,6 +101,7 @@ class BalancerConnector(ConnectorBase):
         return get_erc20_token_addresses()
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         token_list = BalancerConnector.token_list()
         trading_pairs = []
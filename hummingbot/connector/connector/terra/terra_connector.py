@@ -81,6 +81,7 @@ class TerraConnector(ConnectorBase):
         return "terra"
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         return ["LUNA-UST", "LUNA-KRT", "LUNA-SDT", "LUNA-MNT",
                 "UST-KRT", "UST-SDT", "UST-MNT",
@@ -100,6 +100,7 @@ class UniswapConnector(ConnectorBase):
         return get_erc20_token_addresses()
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         token_list = UniswapConnector.token_list()
         trading_pairs = []
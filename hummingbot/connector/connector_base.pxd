@@ -6,6 +6,7 @@ cdef class ConnectorBase(NetworkIterator):
     cdef:
         EventReporter _event_reporter
         EventLogger _event_logger
+        object _order_filled_balances
         public bint _trading_required
         public dict _account_available_balances
         public dict _account_balances
@@ -14,6 +15,7 @@ cdef class ConnectorBase(NetworkIterator):
         public double _in_flight_orders_snapshot_timestamp
         public set _current_trade_fills
         public dict _exchange_order_ids
+        public dict _trade_history_cursors
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
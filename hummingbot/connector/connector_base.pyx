@@ -11,11 +11,18 @@ from hummingbot.core.event.events import (
     OrderType,
     TradeType
 )
-from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.event_logger import (
+    DEFAULT_MAX_EVENTS,
+    EventLogger,
+)
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.order_filled_balances import (
+    add_fill_balance_changes,
+    OrderFilledBalances,
+)
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
@@ -42,10 +49,16 @@ cdef class ConnectorBase(NetworkIterator):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        max_events = global_config_map["event_log_max_size"].value
+        max_age = global_config_map["event_log_max_age"].value
+        self._event_logger = EventLogger(event_source=self.display_name,
+                                         max_events=max_events if max_events is not None else DEFAULT_MAX_EVENTS,
+                                         max_age=max_age if max_age is not None else 0)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        self._order_filled_balances = OrderFilledBalances(self.split_trading_pair)
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._order_filled_balances)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -58,6 +71,7 @@ cdef class ConnectorBase(NetworkIterator):
         self._in_flight_orders_snapshot_timestamp = 0.0
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
+        self._trade_history_cursors = {}  # Dict[trading_pair:str, last_trade_id:int]
 
     @property
     def real_time_balance_update(self) -> bool:
@@ -127,26 +141,18 @@ cdef class ConnectorBase(NetworkIterator):
         Calculates total asset balance changes from filled orders since the timestamp
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
         opposite. This does not account for fee.
-        :param starting_timestamp: The starting timestamp to include filter order filled events
+        :param starting_timestamp: The starting timestamp to include filter order filled events, 0 for all the fills
+        since the connector was created
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
+        if starting_timestamp <= 0:
+            # The fill events since the start may have been evicted from the event log, not from the running totals.
+            return self._order_filled_balances.balances
+        order_filled_events = [o for o in self.events_of_type(OrderFilledEvent) if o.timestamp > starting_timestamp]
         balances = {}
         for event in order_filled_events:
             base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
+            add_fill_balance_changes(balances, base, quote, event)
         return balances
 
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
@@ -178,6 +184,18 @@ cdef class ConnectorBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    def events_of_type(self, event_type: type) -> List[any]:
+        """
+        The recent events of a type, e.g. OrderFilledEvent. The full trade history is in the database.
+        """
+        return self._event_logger.events_of_type(event_type)
+
+    def events_for_order(self, order_id: str) -> List[any]:
+        """
+        The recent events of an order. The full trade history is in the database.
+        """
+        return self._event_logger.events_for_order(order_id)
+
     @property
     def ready(self) -> bool:
         """
@@ -429,6 +447,20 @@ cdef class ConnectorBase(NetworkIterator):
         """
         self._exchange_order_ids.update(current_exchange_order_ids)
 
+    @property
+    def trade_history_cursors(self) -> Dict[str, int]:
+        """
+        Last trade id reconciled with the exchange's trade history, by trading pair.
+        """
+        return self._trade_history_cursors
+
+    def add_trade_history_cursors_from_market_recorder(self, trade_history_cursors: Dict[str, int]):
+        """
+        Gets the trade history cursors saved in TradeHistoryCursor table. This is used in method connector
+        _history_reconciliation
+        """
+        self._trade_history_cursors.update(trade_history_cursors)
+
     def is_confirmed_new_order_filled_event(self, exchange_trade_id: str, exchange_order_id: str, trading_pair: str):
         """
         Returns True if order to be filled is not already present in TradeFill entries.
@@ -436,4 +468,4 @@ cdef class ConnectorBase(NetworkIterator):
         """
         # Assume (market, exchange_trade_id, trading_pair) are unique. Also order has to be recorded in Order table
         return (not TradeFillOrderDetails(self.display_name, exchange_trade_id, trading_pair) in self._current_trade_fills) and \
-               (exchange_order_id in set(self._exchange_order_ids.keys()))
+               (exchange_order_id in self._exchange_order_ids)
@@ -8,10 +8,10 @@ import aiohttp
 import pandas as pd
 import ujson
 import requests
-import cachetools.func
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -84,7 +84,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
     """
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str, domain=None) -> Optional[Decimal]:
         from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_to_exchange_trading_pair
 
@@ -95,6 +95,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=10)
     async def fetch_trading_pairs(domain=None) -> List[str]:
         try:
             from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair
@@ -17,15 +17,10 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_in_flig
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
 import asyncio
-import hashlib
-import hmac
 import time
 import logging
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, AsyncIterable
-from urllib.parse import urlencode
-
-import aiohttp
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.events import (
@@ -40,11 +35,16 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCompletedEvent, PositionSide, PositionMode, PositionAction)
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
-from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.asyncio_throttle import DEFAULT_PRIORITY
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book_tracker import BinancePerpetualOrderBookTracker
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_tracker import BinancePerpetualUserStreamTracker
-from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair, convert_to_exchange_trading_pair
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import (
+    ORDERS_LIMIT_ID,
+    convert_from_exchange_trading_pair,
+    convert_to_exchange_trading_pair,
+    get_throttler,
+)
 from hummingbot.connector.derivative.binance_perpetual.constants import (
     PERPETUAL_BASE_URL,
     TESTNET_BASE_URL,
@@ -52,6 +52,11 @@ from hummingbot.connector.derivative.binance_perpetual.constants import (
     TESTNET_STREAM_URL
 )
 from hummingbot.connector.derivative_base import DerivativeBase, s_decimal_NaN
+from hummingbot.connector.exchange.binance.binance_rest_client import (
+    ORDER_PRIORITY,
+    BinanceAPIError,
+    BinanceRESTClient,
+)
 from hummingbot.connector.trading_rule import TradingRule
 
 
@@ -130,7 +135,9 @@ class BinancePerpetualDerivative(DerivativeBase):
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
+        self._throttler = get_throttler(self._base_url)
+        self._client = BinanceRESTClient(self._base_url, self._api_key, self._api_secret, self._throttler,
+                                         recv_window=20000)
         self._funding_rate = 0
         self._account_positions = {}
         self._position_mode = None
@@ -258,7 +265,9 @@ class BinancePerpetualDerivative(DerivativeBase):
                                               params=api_params,
                                               method=MethodType.POST,
                                               add_timestamp = True,
-                                              is_signed=True)
+                                              is_signed=True,
+                                              limit_weights={ORDERS_LIMIT_ID: 1},
+                                              priority=ORDER_PRIORITY)
             exchange_order_id = str(order_result["orderId"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
@@ -360,7 +369,8 @@ class BinancePerpetualDerivative(DerivativeBase):
                 params=params,
                 method=MethodType.DELETE,
                 add_timestamp=True,
-                is_signed=True
+                is_signed=True,
+                priority=ORDER_PRIORITY
             )
             if response.get("code") == 200:
                 for order_id in list(self._in_flight_orders.keys()):
@@ -387,7 +397,8 @@ class BinancePerpetualDerivative(DerivativeBase):
                 method=MethodType.DELETE,
                 is_signed=True,
                 add_timestamp = True,
-                return_err=True
+                return_err=True,
+                priority=ORDER_PRIORITY
             )
             if response.get("code") == -2011 or "Unknown order sent" in response.get("msg", ""):
                 self.logger().debug(f"The order {client_order_id} does not exist on Binance Perpetuals. "
@@ -956,33 +967,16 @@ class BinancePerpetualDerivative(DerivativeBase):
         safe_ensure_future(self._set_position_mode(position_mode))
 
     async def request(self, path: str, params: Dict[str, Any] = {}, method: MethodType = MethodType.GET,
-                      add_timestamp: bool = False, is_signed: bool = False, request_weight: int = 1, return_err: bool = False):
-        async with self._throttler.weighted_task(request_weight):
-            try:
-                # TODO: QUESTION --- SHOULD I ADD AN ASYNC TIMEOUT? (aync with timeout(API_CALL_TIMEOUT)
-                # async with aiohttp.ClientSession() as client:
-                if add_timestamp:
-                    params["timestamp"] = f"{int(time.time()) * 1000}"
-                    params["recvWindow"] = f"{20000}"
-                query = urlencode(sorted(params.items()))
-                if is_signed:
-                    secret = bytes(self._api_secret.encode("utf-8"))
-                    signature = hmac.new(secret, query.encode("utf-8"), hashlib.sha256).hexdigest()
-                    query += f"&signature={signature}"
-
-                async with aiohttp.request(
-                        method=method.value,
-                        url=self._base_url + path + "?" + query,
-                        headers={"X-MBX-APIKEY": self._api_key}) as response:
-                    if response.status != 200:
-                        error_response = await response.json()
-                        if return_err:
-                            return error_response
-                        else:
-                            raise IOError(f"Error fetching data from {path}. HTTP status is {response.status}. "
-                                          f"Request Error: {error_response}")
-                    return await response.json()
-            except Exception as e:
-                self.logger().error(f"Error fetching {path}", exc_info=True)
-                self.logger().warning(f"{e}")
-                raise e
+                      add_timestamp: bool = False, is_signed: bool = False, request_weight: int = 1, return_err: bool = False,
+                      limit_weights: Optional[Dict[str, int]] = None, priority: int = DEFAULT_PRIORITY):
+        # The signed requests are timestamped by the client, once the throttler lets them through.
+        try:
+            return await self._client.request(method.value, path, params, signed=is_signed or add_timestamp,
+                                              request_weight=request_weight, limit_weights=limit_weights,
+                                              priority=priority)
+        except Exception as e:
+            if return_err and isinstance(e, BinanceAPIError):
+                return {"code": e.code, "msg": e.message}
+            self.logger().error(f"Error fetching {path}", exc_info=True)
+            self.logger().warning(f"{e}")
+            raise e
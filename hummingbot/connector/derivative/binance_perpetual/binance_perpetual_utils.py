@@ -1,8 +1,9 @@
 import re
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils.asyncio_throttle import RateLimit, Throttler
 
 
 CENTRALIZED = True
@@ -18,6 +19,19 @@ RE_4_LETTERS_QUOTE = re.compile(r"^(\w+)(USDT|USDC|USDS|TUSD|BUSD|IDRT|BKRW|BIDR
 RE_3_LETTERS_QUOTE = re.compile(r"^(\w+)(BTC|ETH|BNB|DAI|XRP|PAX|TRX|NGN|RUB|TRY|EUR|ZAR|UAH|GBP|USD|BRL)$")
 
 
+ORDERS_LIMIT_ID = "orders"
+# The request weight limit is counted per IP, with a per second limit on top to spread the bursts. The order limits
+# are counted per account.
+RATE_LIMITS: List[RateLimit] = [
+    RateLimit(2400, 60.0),
+    RateLimit(40, 1.0),
+    RateLimit(300, 10.0, ORDERS_LIMIT_ID),
+    RateLimit(1200, 60.0, ORDERS_LIMIT_ID),
+]
+
+_throttlers: Dict[str, Throttler] = {}
+
+
 # Helper Functions ---
 def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
     try:
@@ -40,6 +54,15 @@ def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
     return hb_trading_pair.replace("-", "")
 
 
+def get_throttler(base_url: str) -> Throttler:
+    """
+    Returns the throttler shared by the connectors of a Binance futures API, since they draw from the same rate limits.
+    """
+    if base_url not in _throttlers:
+        _throttlers[base_url] = Throttler(rate_limits=RATE_LIMITS)
+    return _throttlers[base_url]
+
+
 KEYS = {
     "binance_perpetual_api_key":
         ConfigVar(key="binance_perpetual_api_key",
@@ -16,6 +16,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils.ssl_client_request import SSLClientRequest
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -101,6 +102,7 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return {d["address"]: d for d in data}
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             trading_pairs = set()
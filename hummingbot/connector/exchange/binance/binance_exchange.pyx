@@ -1,5 +1,4 @@
 from traceback import format_exc
-from collections import defaultdict
 from libc.stdint cimport int64_t
 import aiohttp
 from aiokafka import (
@@ -8,11 +7,7 @@ from aiokafka import (
 )
 import asyncio
 from async_timeout import timeout
-from binance.client import Client as BinanceClient
-from binance import client as binance_client_module
-from binance.exceptions import BinanceAPIException
 from decimal import Decimal
-from functools import partial
 import logging
 import pandas as pd
 import time
@@ -22,13 +17,10 @@ from typing import (
     List,
     AsyncIterable,
     Optional,
-    Coroutine,
 )
 
 import conf
-from hummingbot.core.utils.asyncio_throttle import Throttler
 from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.async_utils import (
@@ -52,6 +44,7 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_status_poller import poll_order_statuses
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -60,12 +53,20 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from .binance_order_book_tracker import BinanceOrderBookTracker
+from .binance_rest_client import (
+    BinanceAPIError,
+    BinanceRESTClient,
+)
 from .binance_user_stream_tracker import BinanceUserStreamTracker
 from .binance_time import BinanceTime
 from .binance_in_flight_order import BinanceInFlightOrder
 from .binance_utils import (
+    OPEN_ORDERS_WEIGHT,
+    ORDER_STATUS_WEIGHT,
+    REQUEST_WEIGHT_LIMIT_ID,
     convert_from_exchange_trading_pair,
-    convert_to_exchange_trading_pair)
+    convert_to_exchange_trading_pair,
+    get_throttler)
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.data_type.trade import Trade
 s_logger = None
@@ -111,6 +112,8 @@ cdef class BinanceExchange(ExchangeBase):
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
     LONG_POLL_INTERVAL = 120.0
+    TRADE_HISTORY_PAGE_SIZE = 1000
+    TRADE_HISTORY_CURSOR_LAG = 60.0
     BINANCE_TRADE_TOPIC_NAME = "binance-trade.serialized"
     BINANCE_USER_STREAM_TOPIC_NAME = "binance-user-stream.serialized"
 
@@ -131,11 +134,13 @@ cdef class BinanceExchange(ExchangeBase):
                  domain="com"
                  ):
         self._domain = domain
-        self.monkey_patch_binance_time()
+        BinanceTime.get_instance().start()
         super().__init__()
         self._trading_required = trading_required
         self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs, domain=domain)
-        self._binance_client = BinanceClient(binance_api_key, binance_api_secret, tld=domain)
+        self._throttler = get_throttler(domain)
+        self._binance_client = BinanceRESTClient.spot_client(binance_api_key, binance_api_secret, domain,
+                                                             self._throttler)
         self._user_stream_tracker = BinanceUserStreamTracker(binance_client=self._binance_client, domain=domain)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
@@ -149,9 +154,7 @@ cdef class BinanceExchange(ExchangeBase):
         self._status_polling_task = None
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
-        self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
 
     @property
     def name(self) -> str:
@@ -160,12 +163,16 @@ cdef class BinanceExchange(ExchangeBase):
         else:
             return f"binance_{self._domain}"
 
+    @property
+    def order_book_tracker(self) -> BinanceOrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
     @property
-    def binance_client(self) -> BinanceClient:
+    def binance_client(self) -> BinanceRESTClient:
         return self._binance_client
 
     @property
@@ -207,41 +214,33 @@ cdef class BinanceExchange(ExchangeBase):
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await BinanceAPIOrderBookDataSource.get_active_exchange_markets()
 
-    def monkey_patch_binance_time(self):
-        if binance_client_module.time != BinanceTime.get_instance():
-            binance_client_module.time = BinanceTime.get_instance()
-            BinanceTime.get_instance().start()
-
-    async def schedule_async_call(
-            self,
-            coro: Coroutine,
-            timeout_seconds: float,
-            app_warning_msg: str = "Binance API call failed. Check API key and network connection.") -> any:
-        return await self._async_scheduler.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
-
     async def query_api(
             self,
             func,
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
-            request_weight: int = 1,
             **kwargs) -> Dict[str, any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
-            try:
-                return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
-                                                              timeout_seconds=self.API_CALL_TIMEOUT,
-                                                              app_warning_msg=app_warning_msg)
-            except Exception as ex:
-                if "Timestamp for this request" in str(ex):
-                    self.logger().warning("Got Binance timestamp error. "
-                                          "Going to force update Binance server time offset...")
-                    binance_time = BinanceTime.get_instance()
-                    binance_time.clear_time_offset_ms_samples()
-                    await binance_time.schedule_update_server_time_offset()
-                raise ex
+        """
+        Calls a method of the REST client, e.g. `self._binance_client.get_account`. The calls run concurrently, within
+        the rate limits of the throttler.
+        """
+        try:
+            return await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().debug(f"{app_warning_msg} [[Got exception: {str(ex)}]]", exc_info=True,
+                                app_warning_msg=f"{app_warning_msg} [[Got exception: {str(ex)}]]")
+            if "Timestamp for this request" in str(ex):
+                self.logger().warning("Got Binance timestamp error. "
+                                      "Going to force update Binance server time offset...")
+                binance_time = BinanceTime.get_instance()
+                binance_time.clear_time_offset_ms_samples()
+                await binance_time.schedule_update_server_time_offset()
+            raise ex
 
     async def query_url(self, url, request_weight: int = 1) -> any:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        async with self._throttler.weighted_task(limit_weights={REQUEST_WEIGHT_LIMIT_ID: request_weight}):
             async with aiohttp.ClientSession() as client:
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
                     if response.status != 200:
@@ -280,8 +279,9 @@ cdef class BinanceExchange(ExchangeBase):
         if current_timestamp - self._last_update_trade_fees_timestamp > 60.0 * 60.0 or len(self._trade_fees) < 1:
             try:
                 res = await self.query_api(self._binance_client.get_trade_fee)
-                for fee in res["tradeFee"]:
-                    self._trade_fees[fee["symbol"]] = (Decimal(fee["maker"]), Decimal(fee["taker"]))
+                for fee in res:
+                    self._trade_fees[fee["symbol"]] = (Decimal(fee["makerCommission"]),
+                                                       Decimal(fee["takerCommission"]))
                 self._last_update_trade_fees_timestamp = current_timestamp
             except asyncio.CancelledError:
                 raise
@@ -393,48 +393,9 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t last_tick = <int64_t>(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
 
-        if current_tick > last_tick:
-            if len(self._in_flight_orders) > 0:
-                trading_pairs_to_order_map = defaultdict(lambda: {})
-                for o in self._in_flight_orders.values():
-                    trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
-
-                trading_pairs = list(trading_pairs_to_order_map.keys())
-                tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                         for trading_pair in trading_pairs]
-                self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
-                results = await safe_gather(*tasks, return_exceptions=True)
-                for trades, trading_pair in zip(results, trading_pairs):
-                    order_map = trading_pairs_to_order_map[trading_pair]
-                    if isinstance(trades, Exception):
-                        self.logger().network(
-                            f"Error fetching trades update for the order {trading_pair}: {trades}.",
-                            app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
-                        )
-                        continue
-                    for trade in trades:
-                        order_id = str(trade["orderId"])
-                        if order_id in order_map:
-                            tracked_order = order_map[order_id]
-                            order_type = tracked_order.order_type
-                            applied_trade = order_map[order_id].update_with_trade_update(trade)
-                            if applied_trade:
-                                self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
-                                                     OrderFilledEvent(
-                                                         self._current_timestamp,
-                                                         tracked_order.client_order_id,
-                                                         tracked_order.trading_pair,
-                                                         tracked_order.trade_type,
-                                                         order_type,
-                                                         Decimal(trade["price"]),
-                                                         Decimal(trade["qty"]),
-                                                         TradeFee(
-                                                             percent=Decimal(0.0),
-                                                             flat_fees=[(trade["commissionAsset"],
-                                                                         Decimal(trade["commission"]))]
-                                                         ),
-                                                         exchange_trade_id=trade["id"]
-                                                     ))
+        if current_tick > last_tick and len(self._in_flight_orders) > 0:
+            trading_pairs = list({o.trading_pair for o in self._in_flight_orders.values()})
+            await self._reconcile_trades(trading_pairs)
 
     async def _history_reconciliation(self):
         cdef:
@@ -445,41 +406,95 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.LONG_POLL_INTERVAL)
 
         if current_tick > last_tick:
-            trading_pairs = self._order_book_tracker._trading_pairs
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
-                     for trading_pair in trading_pairs]
-            self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
-            exchange_history = await safe_gather(*tasks, return_exceptions=True)
-            for trades, trading_pair in zip(exchange_history, trading_pairs):
-                if isinstance(trades, Exception):
-                    self.logger().network(
-                        f"Error fetching trades update for the order {trading_pair}: {trades}.",
-                        app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
-                    )
-                    continue
-                for trade in trades:
-                    if self.is_confirmed_new_order_filled_event(str(trade["id"]), str(trade["orderId"]), trading_pair):
-                        # Should check if this is a partial filling of a in_flight order.
-                        # In that case, user_stream or _update_order_fills_from_trades will take care when fully filled.
-                        if not any(trade["id"] in in_flight_order.trade_id_set for in_flight_order in self._in_flight_orders.values()):
-                            self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
-                                                 OrderFilledEvent(
-                                                     trade["time"],
-                                                     self._exchange_order_ids.get(str(trade["orderId"]),
-                                                                                  get_client_order_id("buy" if trade["isBuyer"] else "sell", trading_pair)),
-                                                     trading_pair,
-                                                     TradeType.BUY if trade["isBuyer"] else TradeType.SELL,
-                                                     OrderType.LIMIT_MAKER,  # defaulting to this value since trade info lacks field
-                                                     Decimal(trade["price"]),
-                                                     Decimal(trade["qty"]),
-                                                     TradeFee(
-                                                         percent=Decimal(0.0),
-                                                         flat_fees=[(trade["commissionAsset"],
-                                                                     Decimal(trade["commission"]))]
-                                                     ),
-                                                     exchange_trade_id=trade["id"]
-                                                 ))
-                            self.logger().info(f"Recreating missing trade in TradeFill: {trade}")
+            await self._reconcile_trades(list(self._order_book_tracker._trading_pairs))
+
+    async def _reconcile_trades(self, trading_pairs: List[str]):
+        """
+        Downloads the trades of the trading pairs made since their trade history cursors, applies the trades of the
+        in flight orders, and records the fills missing from the local history.
+        """
+        self.logger().debug("Polling for order fills of %d trading pairs.", len(trading_pairs))
+        tasks = [self._fetch_new_trades(trading_pair) for trading_pair in trading_pairs]
+        exchange_history = await safe_gather(*tasks, return_exceptions=True)
+        tracked_orders = {o.exchange_order_id: o for o in self._in_flight_orders.values()}
+        for trades, trading_pair in zip(exchange_history, trading_pairs):
+            if isinstance(trades, Exception):
+                self.logger().network(
+                    f"Error fetching trades update for the order {trading_pair}: {trades}.",
+                    app_warning_msg=f"Failed to fetch trade update for {trading_pair}."
+                )
+                continue
+            for trade in trades:
+                self._process_trade(trade, trading_pair, tracked_orders)
+            self._advance_trade_history_cursor(trading_pair, trades)
+
+    async def _fetch_new_trades(self, trading_pair: str) -> List[Dict[str, Any]]:
+        """
+        Downloads the trades of a trading pair after its trade history cursor, or the latest trades if it has none.
+        """
+        symbol = convert_to_exchange_trading_pair(trading_pair)
+        last_trade_id = self._trade_history_cursors.get(trading_pair)
+        if last_trade_id is None:
+            return await self.query_api(self._binance_client.get_my_trades, symbol=symbol)
+        trades = []
+        while True:
+            page = await self.query_api(self._binance_client.get_my_trades, symbol=symbol, fromId=last_trade_id + 1,
+                                        limit=self.TRADE_HISTORY_PAGE_SIZE)
+            trades.extend(page)
+            if len(page) < self.TRADE_HISTORY_PAGE_SIZE:
+                return trades
+            last_trade_id = page[-1]["id"]
+
+    def _advance_trade_history_cursor(self, trading_pair: str, trades: List[Dict[str, Any]]):
+        # The trades of the last TRADE_HISTORY_CURSOR_LAG seconds are downloaded again on the next poll, in case they
+        # arrived before the creation of their orders was recorded.
+        settled_timestamp_ms = (self._current_timestamp - self.TRADE_HISTORY_CURSOR_LAG) * 1e3
+        settled_trade_ids = [trade["id"] for trade in trades if trade["time"] <= settled_timestamp_ms]
+        if len(settled_trade_ids) > 0:
+            self._trade_history_cursors[trading_pair] = max(self._trade_history_cursors.get(trading_pair, 0),
+                                                            max(settled_trade_ids))
+
+    def _process_trade(self, trade: Dict[str, Any], trading_pair: str, tracked_orders: Dict[str, BinanceInFlightOrder]):
+        tracked_order = tracked_orders.get(str(trade["orderId"]))
+        if tracked_order is not None:
+            # The trade ids of the in flight orders are deduplicated by the orders.
+            applied_trade = tracked_order.update_with_trade_update(trade)
+            if applied_trade:
+                self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
+                                     OrderFilledEvent(
+                                         self._current_timestamp,
+                                         tracked_order.client_order_id,
+                                         tracked_order.trading_pair,
+                                         tracked_order.trade_type,
+                                         tracked_order.order_type,
+                                         Decimal(trade["price"]),
+                                         Decimal(trade["qty"]),
+                                         TradeFee(
+                                             percent=Decimal(0.0),
+                                             flat_fees=[(trade["commissionAsset"],
+                                                         Decimal(trade["commission"]))]
+                                         ),
+                                         exchange_trade_id=trade["id"]
+                                     ))
+        elif self.is_confirmed_new_order_filled_event(str(trade["id"]), str(trade["orderId"]), trading_pair):
+            self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
+                                 OrderFilledEvent(
+                                     trade["time"],
+                                     self._exchange_order_ids.get(str(trade["orderId"]),
+                                                                  get_client_order_id("buy" if trade["isBuyer"] else "sell", trading_pair)),
+                                     trading_pair,
+                                     TradeType.BUY if trade["isBuyer"] else TradeType.SELL,
+                                     OrderType.LIMIT_MAKER,  # defaulting to this value since trade info lacks field
+                                     Decimal(trade["price"]),
+                                     Decimal(trade["qty"]),
+                                     TradeFee(
+                                         percent=Decimal(0.0),
+                                         flat_fees=[(trade["commissionAsset"],
+                                                     Decimal(trade["commission"]))]
+                                     ),
+                                     exchange_trade_id=trade["id"]
+                                 ))
+            self.logger().info(f"Recreating missing trade in TradeFill: {trade}")
 
     async def _update_order_status(self):
         cdef:
@@ -491,12 +506,22 @@ cdef class BinanceExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order,
-                                    symbol=convert_to_exchange_trading_pair(o.trading_pair), origClientOrderId=o.client_order_id)
-                     for o in tracked_orders]
-            self.logger().debug("Polling for order status updates of %d orders.", len(tasks))
-            results = await safe_gather(*tasks, return_exceptions=True)
-            for order_update, tracked_order in zip(results, tracked_orders):
+            # The open orders of each trading pair are fetched at once, and only the orders that left them are
+            # looked up one by one.
+            results, stats = await poll_order_statuses(
+                tracked_orders,
+                fetch_open_orders=lambda trading_pair: self.query_api(
+                    self._binance_client.get_open_orders, symbol=convert_to_exchange_trading_pair(trading_pair)),
+                fetch_order=lambda o: self.query_api(
+                    self._binance_client.get_order, symbol=convert_to_exchange_trading_pair(o.trading_pair),
+                    origClientOrderId=o.client_order_id),
+                open_order_id=lambda entry: entry["clientOrderId"],
+                tracked_order_id=lambda o: o.client_order_id,
+                snapshot_weight=OPEN_ORDERS_WEIGHT,
+                lookup_weight=ORDER_STATUS_WEIGHT
+            )
+            self.logger().debug(f"Order status poll: {stats}.")
+            for tracked_order, order_update in results:
                 client_order_id = tracked_order.client_order_id
 
                 # If the order has already been cancelled or has failed do nothing
@@ -504,7 +529,8 @@ cdef class BinanceExchange(ExchangeBase):
                     continue
 
                 if isinstance(order_update, Exception):
-                    if order_update.code == 2013 or order_update.message == "Order does not exist.":
+                    if isinstance(order_update, BinanceAPIError) and \
+                            (order_update.code == -2013 or order_update.message == "Order does not exist."):
                         self._order_not_found_records[client_order_id] = \
                             self._order_not_found_records.get(client_order_id, 0) + 1
                         if self._order_not_found_records[client_order_id] < self.ORDER_NOT_EXIST_CONFIRMATION_COUNT:
@@ -788,7 +814,6 @@ cdef class BinanceExchange(ExchangeBase):
 
     cdef c_stop(self, Clock clock):
         ExchangeBase.c_stop(self, clock)
-        self._async_scheduler.stop()
 
     async def start_network(self):
         self._order_book_tracker.start()
@@ -882,7 +907,7 @@ cdef class BinanceExchange(ExchangeBase):
         amount_str = f"{amount:f}"
         price_str = f"{price:f}"
         type_str = BinanceExchange.binance_order_type(order_type)
-        side_str = BinanceClient.SIDE_BUY if trade_type is TradeType.BUY else BinanceClient.SIDE_SELL
+        side_str = "BUY" if trade_type is TradeType.BUY else "SELL"
         api_params = {"symbol": convert_to_exchange_trading_pair(trading_pair),
                       "side": side_str,
                       "quantity": amount_str,
@@ -890,7 +915,7 @@ cdef class BinanceExchange(ExchangeBase):
                       "newClientOrderId": order_id,
                       "price": price_str}
         if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = BinanceClient.TIME_IN_FORCE_GTC
+            api_params["timeInForce"] = "GTC"
         self.c_start_tracking_order(order_id,
                                     "",
                                     trading_pair,
@@ -955,8 +980,8 @@ cdef class BinanceExchange(ExchangeBase):
             cancel_result = await self.query_api(self._binance_client.cancel_order,
                                                  symbol=convert_to_exchange_trading_pair(trading_pair),
                                                  origClientOrderId=order_id)
-        except BinanceAPIException as e:
-            if "Unknown order sent" in e.message or e.code == 2011:
+        except BinanceAPIError as e:
+            if "Unknown order sent" in e.message or e.code == -2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
                 self.logger().debug(f"The order {order_id} does not exist on Binance. No cancellation needed.")
                 self.c_stop_tracking_order(order_id)
@@ -990,7 +1015,7 @@ cdef class BinanceExchange(ExchangeBase):
             async with timeout(timeout_seconds):
                 cancellation_results = await safe_gather(*tasks, return_exceptions=True)
                 for cr in cancellation_results:
-                    if isinstance(cr, BinanceAPIException):
+                    if isinstance(cr, BinanceAPIError):
                         continue
                     if isinstance(cr, dict) and "origClientOrderId" in cr:
                         client_order_id = cr.get("origClientOrderId")
@@ -6,6 +6,7 @@ import logging
 import time
 from typing import (
     Deque,
+    AsyncContextManager,
     Dict,
     List,
     Optional
@@ -14,11 +15,19 @@ from typing import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.connector.exchange.binance.binance_utils import (
+    DEPTH_SNAPSHOT_WEIGHT,
+    get_throttler,
+    REQUEST_WEIGHT_LIMIT_ID,
+)
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 
 
 class BinanceOrderBookTracker(OrderBookTracker):
+    # The snapshots at start up go through the throttler of the domain, which the REST client shares. So they are
+    # fetched as fast as the request weight limit allows, the order requests being let through ahead of them.
+    INIT_ORDER_BOOK_CONCURRENCY: int = 5
     _bobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -41,6 +50,10 @@ class BinanceOrderBookTracker(OrderBookTracker):
         self._domain = domain
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
 
+    def _init_request_slot(self) -> AsyncContextManager:
+        return get_throttler(self._domain).weighted_task(request_weight=1,
+                                                         limit_weights={REQUEST_WEIGHT_LIMIT_ID: DEPTH_SNAPSHOT_WEIGHT})
+
     @property
     def exchange_name(self) -> str:
         if self._domain == "com":
@@ -100,13 +113,14 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 await asyncio.sleep(5.0)
 
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
+        past_diffs_window: Deque[OrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
@@ -116,15 +130,19 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 # Process saved messages first if there are any
                 if len(saved_messages) > 0:
                     message = saved_messages.popleft()
+                elif pending_message is not None:
+                    message = pending_message
+                    pending_message = None
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages: List[OrderBookMessage] = [message]
+                    if self.COALESCE_DIFFS and len(saved_messages) == 0:
+                        pending_message = self._drain_diff_messages(message_queue, diff_messages)
+                    self._apply_diff_messages(trading_pair, order_book, diff_messages)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -136,6 +154,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._record_snapshot(trading_pair, order_book)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+import aiohttp
+import hashlib
+import hmac
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+from urllib.parse import urlencode
+
+from hummingbot.connector.exchange.binance.binance_time import BinanceTime
+from hummingbot.connector.exchange.binance.binance_utils import (
+    ACCOUNT_WEIGHT,
+    ALL_OPEN_ORDERS_WEIGHT,
+    EXCHANGE_INFO_WEIGHT,
+    MY_TRADES_WEIGHT,
+    OPEN_ORDERS_WEIGHT,
+    ORDER_STATUS_WEIGHT,
+    ORDERS_LIMIT_ID,
+    REQUEST_WEIGHT_LIMIT_ID,
+)
+from hummingbot.core.utils.asyncio_throttle import (
+    DEFAULT_PRIORITY,
+    RequestWeight,
+    Throttler,
+)
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+
+SPOT_BASE_URL = "https://api.binance.{}"
+
+# Priority of the order placements and cancellations over the polling requests, in the throttler queue.
+ORDER_PRIORITY = 1
+
+
+class BinanceAPIError(IOError):
+    """
+    Error response of the Binance REST API, e.g. code -2011 for an unknown order.
+    """
+    def __init__(self, status_code: int, code: Optional[int], message: str, path: str):
+        super().__init__(f"Binance API error on {path}. HTTP status is {status_code}. Code {code}: {message}")
+        self.status_code: int = status_code
+        self.code: Optional[int] = code
+        self.message: str = message
+        self.path: str = path
+
+
+class BinanceRESTClient:
+    """
+    Signed REST client of the Binance spot and futures APIs, on the shared aiohttp session.
+
+    Requests run concurrently, within the rate limits of the throttler. Order placements and cancellations wait ahead
+    of the polling requests when the rate limits are reached.
+    """
+    API_CALL_TIMEOUT = 10.0
+
+    def __init__(self,
+                 base_url: str,
+                 api_key: Optional[str] = None,
+                 api_secret: Optional[str] = None,
+                 throttler: Optional[Throttler] = None,
+                 time_provider: Optional[Callable[[], float]] = None,
+                 recv_window: Optional[int] = None):
+        """
+        :param base_url: URL of the API, e.g. https://api.binance.com or https://fapi.binance.com
+        :param throttler: throttler of the rate limits of the API, none to send the requests right away
+        :param time_provider: server time in seconds, for the timestamps of the signed requests
+        :param recv_window: time for which the signed requests are valid on the server, in milliseconds
+        """
+        self._base_url: str = base_url
+        self._api_key: Optional[str] = api_key
+        self._api_secret: Optional[str] = api_secret
+        self._throttler: Optional[Throttler] = throttler
+        self._time_provider: Optional[Callable[[], float]] = time_provider
+        self._recv_window: Optional[int] = recv_window
+
+    @classmethod
+    def spot_client(cls,
+                    api_key: Optional[str] = None,
+                    api_secret: Optional[str] = None,
+                    domain: str = "com",
+                    throttler: Optional[Throttler] = None) -> "BinanceRESTClient":
+        return BinanceRESTClient(SPOT_BASE_URL.format(domain), api_key, api_secret, throttler,
+                                 time_provider=BinanceTime.get_instance().time)
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    def _timestamp_ms(self) -> int:
+        return int((self._time_provider or time.time)() * 1e3)
+
+    def _query_string(self, params: Dict[str, Any], signed: bool) -> str:
+        params = {key: value for key, value in params.items() if value is not None}
+        if signed:
+            params["timestamp"] = self._timestamp_ms()
+            if self._recv_window is not None:
+                params["recvWindow"] = self._recv_window
+        query: str = urlencode(params)
+        if signed:
+            signature: str = hmac.new(self._api_secret.encode("utf-8"), query.encode("utf-8"),
+                                      hashlib.sha256).hexdigest()
+            query += f"&signature={signature}"
+        return query
+
+    async def request(self,
+                      method: str,
+                      path: str,
+                      params: Optional[Dict[str, Any]] = None,
+                      signed: bool = False,
+                      request_weight: RequestWeight = 1,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                      priority: int = DEFAULT_PRIORITY) -> Any:
+        """
+        Sends a request and returns its decoded JSON response.
+
+        :param signed: whether the request is signed with the API secret, with a timestamp
+        :param request_weight: weight of the request in the default pool of the throttler, the request count
+        :param limit_weights: weights of the request in the other pools of the throttler, e.g. the request weight pool
+        :param priority: priority of the request in the throttler queue
+        :raise BinanceAPIError: on an error response
+        """
+        if self._throttler is not None:
+            async with self._throttler.weighted_task(request_weight, limit_weights, priority):
+                return await self._request(method, path, params or {}, signed)
+        return await self._request(method, path, params or {}, signed)
+
+    async def _request(self, method: str, path: str, params: Dict[str, Any], signed: bool) -> Any:
+        # The timestamp is taken once the throttler lets the request through, so that it's not stale on arrival.
+        query: str = self._query_string(params, signed)
+        url: str = f"{self._base_url}{path}?{query}" if query else f"{self._base_url}{path}"
+        headers: Dict[str, str] = {"X-MBX-APIKEY": self._api_key} if self._api_key is not None else {}
+        client: aiohttp.ClientSession = HttpClientRegistry.get_instance().get_client()
+        async with client.request(method, url, headers=headers,
+                                  timeout=aiohttp.ClientTimeout(total=self.API_CALL_TIMEOUT)) as response:
+            try:
+                data: Any = await response.json(content_type=None)
+            except ValueError:
+                data = await response.text()
+            if response.status != 200:
+                code: Optional[int] = data.get("code") if isinstance(data, dict) else None
+                message: str = data.get("msg", str(data)) if isinstance(data, dict) else str(data)
+                raise BinanceAPIError(response.status, code, message, path)
+            return data
+
+    # Spot API. Each request counts 1 in the default pool, the request count, and its documented weight in the
+    # request weight pool.
+
+    async def _weighted_request(self,
+                                method: str,
+                                path: str,
+                                params: Optional[Dict[str, Any]] = None,
+                                signed: bool = False,
+                                weight: RequestWeight = 1,
+                                limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                                priority: int = DEFAULT_PRIORITY) -> Any:
+        return await self.request(method, path, params, signed=signed,
+                                  limit_weights={REQUEST_WEIGHT_LIMIT_ID: weight, **(limit_weights or {})},
+                                  priority=priority)
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self._weighted_request("GET", "/api/v3/ping")
+
+    async def get_server_time(self) -> Dict[str, Any]:
+        return await self._weighted_request("GET", "/api/v3/time")
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        return await self._weighted_request("GET", "/api/v3/exchangeInfo", weight=EXCHANGE_INFO_WEIGHT)
+
+    async def get_account(self) -> Dict[str, Any]:
+        return await self._weighted_request("GET", "/api/v3/account", signed=True, weight=ACCOUNT_WEIGHT)
+
+    async def get_trade_fee(self) -> List[Dict[str, Any]]:
+        # The /sapi endpoints are limited apart from the request weight of the /api ones.
+        return await self.request("GET", "/sapi/v1/asset/tradeFee", signed=True)
+
+    async def get_my_trades(self, symbol: str, **params) -> List[Dict[str, Any]]:
+        return await self._weighted_request("GET", "/api/v3/myTrades", {"symbol": symbol, **params}, signed=True,
+                                            weight=MY_TRADES_WEIGHT)
+
+    async def get_order(self, symbol: str, **params) -> Dict[str, Any]:
+        return await self._weighted_request("GET", "/api/v3/order", {"symbol": symbol, **params}, signed=True,
+                                            weight=ORDER_STATUS_WEIGHT)
+
+    async def get_open_orders(self, **params) -> List[Dict[str, Any]]:
+        weight: RequestWeight = OPEN_ORDERS_WEIGHT if params.get("symbol") is not None else ALL_OPEN_ORDERS_WEIGHT
+        return await self._weighted_request("GET", "/api/v3/openOrders", params, signed=True, weight=weight)
+
+    async def create_order(self, **params) -> Dict[str, Any]:
+        return await self._weighted_request("POST", "/api/v3/order", params, signed=True,
+                                            limit_weights={ORDERS_LIMIT_ID: 1}, priority=ORDER_PRIORITY)
+
+    async def cancel_order(self, symbol: str, **params) -> Dict[str, Any]:
+        return await self._weighted_request("DELETE", "/api/v3/order", {"symbol": symbol, **params}, signed=True,
+                                            priority=ORDER_PRIORITY)
+
+    async def create_listen_key(self) -> str:
+        data: Dict[str, str] = await self._weighted_request("POST", "/api/v3/userDataStream")
+        return data["listenKey"]
+
+    async def keepalive_listen_key(self, listen_key: str):
+        await self._weighted_request("PUT", "/api/v3/userDataStream", {"listenKey": listen_key})
@@ -13,7 +13,7 @@ from hummingbot.core.utils.async_utils import (
     safe_gather,
 )
 from .binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
-from binance.client import Client as BinanceClient
+from .binance_rest_client import BinanceRESTClient
 
 
 class BinanceUserStreamTracker(UserStreamTracker):
@@ -25,9 +25,9 @@ class BinanceUserStreamTracker(UserStreamTracker):
             cls._bust_logger = logging.getLogger(__name__)
         return cls._bust_logger
 
-    def __init__(self, binance_client: Optional[BinanceClient] = None, domain: str = "com"):
+    def __init__(self, binance_client: Optional[BinanceRESTClient] = None, domain: str = "com"):
         super().__init__()
-        self._binance_client: BinanceClient = binance_client
+        self._binance_client: BinanceRESTClient = binance_client
         self._ev_loop: asyncio.events.AbstractEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[UserStreamTrackerDataSource] = None
         self._user_stream_tracking_task: Optional[asyncio.Task] = None
@@ -1,10 +1,16 @@
 import re
 from typing import (
+    Dict,
+    List,
     Optional,
     Tuple)
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    Throttler,
+)
 
 
 CENTRALIZED = True
@@ -16,6 +22,31 @@ RE_3_LETTERS_QUOTE = re.compile(r"^(\w+)(BTC|ETH|BNB|DAI|XRP|PAX|TRX|NGN|RUB|TRY
 
 USD_QUOTES = ["DAI", "USDT", "USDC", "USDS", "TUSD", "PAX", "BUSD", "USD"]
 
+REQUEST_WEIGHT_LIMIT_ID = "request_weight"
+ORDERS_LIMIT_ID = "orders"
+# The request weight limit is counted per IP, in the weights Binance documents for each endpoint. The requests are
+# also counted one by one in the default pool, at most 10 per second, to spread the bursts.
+# The order limits are counted per account.
+RATE_LIMITS: List[RateLimit] = [
+    RateLimit(1200, 60.0, REQUEST_WEIGHT_LIMIT_ID),
+    RateLimit(10, 1.0),
+    RateLimit(10, 1.0, ORDERS_LIMIT_ID),
+    RateLimit(100000, 86400.0, ORDERS_LIMIT_ID),
+]
+# Request weights of the endpoints, as counted by Binance against the request weight limit. The REST client throttles
+# the requests with them, and the order status poll stats count them.
+ACCOUNT_WEIGHT = 10
+MY_TRADES_WEIGHT = 10
+EXCHANGE_INFO_WEIGHT = 10
+# The 1000 levels order book snapshot.
+DEPTH_SNAPSHOT_WEIGHT = 10
+ORDER_STATUS_WEIGHT = 2
+# The open orders of a symbol, and of all the symbols.
+OPEN_ORDERS_WEIGHT = 3
+ALL_OPEN_ORDERS_WEIGHT = 40
+
+_throttlers: Dict[str, Throttler] = {}
+
 
 def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
     try:
@@ -41,6 +72,15 @@ def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
     return hb_trading_pair.replace("-", "")
 
 
+def get_throttler(domain: str = "com") -> Throttler:
+    """
+    Returns the throttler shared by the connectors of a Binance domain, since they draw from the same rate limits.
+    """
+    if domain not in _throttlers:
+        _throttlers[domain] = Throttler(rate_limits=RATE_LIMITS)
+    return _throttlers[domain]
+
+
 KEYS = {
     "binance_api_key":
         ConfigVar(key="binance_api_key",
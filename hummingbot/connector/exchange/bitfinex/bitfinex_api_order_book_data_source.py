@@ -8,7 +8,6 @@ import ujson
 import pandas as pd
 from decimal import Decimal
 import requests
-import cachetools.func
 from typing import (
     Any,
     AsyncIterable,
@@ -29,7 +28,7 @@ from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
     OrderBookMessageType,
 )
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bitfinex import (
@@ -92,7 +91,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._tracked_book_entries: Dict[int, OrderBookRow] = {}
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         exchange_trading_pair = convert_to_exchange_trading_pair(trading_pair)
         resp = requests.get(url=f"https://api-pub.bitfinex.com/v2/ticker/{exchange_trading_pair}")
@@ -101,6 +100,7 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             async with aiohttp.ClientSession() as client:
@@ -8,6 +8,7 @@ import time
 import pandas as pd
 
 from typing import Optional, List, Dict, Any, AsyncIterable
+from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -68,6 +69,7 @@ class BitmaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         async with aiohttp.ClientSession() as client:
             resp = await client.get(f"{REST_URL}/ticker")
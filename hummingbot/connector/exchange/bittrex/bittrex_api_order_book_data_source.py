@@ -15,9 +15,9 @@ from signalr_aio.hubs import Hub
 from async_timeout import timeout
 
 import requests
-import cachetools.func
 from decimal import Decimal
 
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -102,7 +102,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return self._websocket_connection, self._websocket_hub
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         resp = requests.get(url="https://api.bittrex.com/api/v1.1/public/getmarketsummaries")
         records = resp.json()
@@ -116,6 +116,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             async with aiohttp.ClientSession() as client:
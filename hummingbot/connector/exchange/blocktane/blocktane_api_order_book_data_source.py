@@ -2,7 +2,6 @@
 
 import asyncio
 import aiohttp
-import cachetools.func
 from collections import namedtuple
 from decimal import Decimal
 import logging
@@ -20,6 +19,7 @@ import time
 import ujson
 import websockets
 
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -69,7 +69,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return self._trading_pairs
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         exchange_trading_pair: str = convert_to_exchange_trading_pair(trading_pair)
 
@@ -83,6 +83,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return None
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             async with aiohttp.ClientSession() as client:
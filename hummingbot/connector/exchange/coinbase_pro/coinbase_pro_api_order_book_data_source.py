@@ -18,8 +18,8 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 import requests
-import cachetools.func
 
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -29,6 +29,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book_tracker_entry import CoinbaseProOrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 COINBASE_REST_URL = "https://api.pro.coinbase.com"
 COINBASE_WS_FEED = "wss://ws-feed.pro.coinbase.com"
@@ -60,14 +61,14 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             ticker_url: str = f"{COINBASE_REST_URL}/products/{trading_pair}/ticker"
-            resp = await client.get(ticker_url)
-            resp_json = await resp.json()
-            return float(resp_json["price"])
+            async with client.get(ticker_url) as resp:
+                resp_json = await resp.json()
+                return float(resp_json["price"])
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         COINBASE_PRO_PRICE_URL = "https://api.pro.coinbase.com/products/TO_BE_REPLACED/ticker"
         resp = requests.get(url=COINBASE_PRO_PRICE_URL.replace("TO_BE_REPLACED", trading_pair))
@@ -77,9 +78,10 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"{COINBASE_REST_URL}/products/", timeout=5) as response:
                     if response.status == 200:
                         markets = await response.json()
@@ -111,7 +113,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
@@ -133,7 +135,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :returns: A dictionary of order book trackers for each trading pair
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             trading_pairs: List[str] = self._trading_pairs
             retval: Dict[str, OrderBookTrackerEntry] = {}
 
@@ -259,7 +261,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
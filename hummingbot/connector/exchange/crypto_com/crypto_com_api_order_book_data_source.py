@@ -7,6 +7,7 @@ import pandas as pd
 import hummingbot.connector.exchange.crypto_com.crypto_com_constants as constants
 
 from typing import Optional, List, Dict, Any
+from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -51,6 +52,7 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         async with aiohttp.ClientSession() as client:
             async with client.get(f"{constants.REST_URL}/public/get-ticker", timeout=10) as response:
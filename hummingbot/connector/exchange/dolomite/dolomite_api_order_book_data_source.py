@@ -99,6 +99,7 @@ class DolomiteAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return DolomiteOrderBook
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             from hummingbot.connector.exchange.dolomite.dolomite_utils import convert_from_exchange_trading_pair
@@ -10,7 +10,6 @@ import logging
 # import math
 
 import requests
-import cachetools.func
 
 from typing import AsyncIterable, Dict, List, Optional, Any
 
@@ -19,6 +18,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.connector.exchange.dydx.dydx_order_book import DydxOrderBook
 from hummingbot.connector.exchange.dydx.dydx_active_order_tracker import DydxActiveOrderTracker
 from hummingbot.connector.exchange.dydx.dydx_api_token_configuration_data_source import DydxAPITokenConfigurationDataSource
@@ -140,7 +140,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             await ws.close()
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         exchange_pair: str = convert_to_exchange_trading_pair(trading_pair)
         market_info_response = requests.get(url=DYDX_MARKET_INFO_URL.format(exchange_pair))
@@ -156,6 +156,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return (best_bid + best_ask) / 2
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             async with aiohttp.ClientSession() as client:
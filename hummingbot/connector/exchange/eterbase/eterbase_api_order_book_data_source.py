@@ -167,6 +167,7 @@ class EterbaseAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return tp_map_mid
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             from hummingbot.connector.exchange.eterbase.eterbase_utils import convert_from_exchange_trading_pair
@@ -17,6 +17,7 @@ from typing import (
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -58,6 +59,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return results
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             from hummingbot.connector.exchange.huobi.huobi_utils import convert_from_exchange_trading_pair
@@ -55,6 +55,7 @@ from hummingbot.connector.exchange.huobi.huobi_utils import (
     convert_from_exchange_trading_pair)
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_status_poller import poll_order_statuses
 from hummingbot.connector.exchange.huobi.huobi_user_stream_tracker import HuobiUserStreamTracker
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -95,6 +96,7 @@ cdef class HuobiExchange(ExchangeBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    OPEN_ORDERS_PAGE_SIZE = 500
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 120.0
 
@@ -415,6 +417,29 @@ cdef class HuobiExchange(ExchangeBase):
         path_url = f"/order/orders/{exchange_order_id}"
         return await self._api_request("get", path_url=path_url, is_auth_required=True)
 
+    async def get_open_orders_status(self, trading_pair: str) -> List[Dict[str, Any]]:
+        """
+        Returns the open orders of a trading pair, in the format of the order status responses.
+        """
+        params = {
+            "account-id": self._account_id,
+            "symbol": convert_to_exchange_trading_pair(trading_pair),
+            "size": self.OPEN_ORDERS_PAGE_SIZE,
+        }
+        open_orders = await self._api_request("get", path_url="/order/openOrders", params=params,
+                                              is_auth_required=True)
+        if len(open_orders) >= self.OPEN_ORDERS_PAGE_SIZE:
+            raise IOError(f"More than {self.OPEN_ORDERS_PAGE_SIZE} open orders on {trading_pair}.")
+        # The open orders have the executed amounts under other names than the order status.
+        return [{**entry,
+                 "field-amount": entry["filled-amount"],
+                 "field-cash-amount": entry["filled-cash-amount"],
+                 "field-fees": entry["filled-fees"]}
+                for entry in open_orders]
+
+    async def _fetch_order_status(self, tracked_order: HuobiInFlightOrder) -> Dict[str, Any]:
+        return await self.get_order_status(await tracked_order.get_exchange_order_id())
+
     async def _update_order_status(self):
         cdef:
             # The poll interval for order status is 10 seconds.
@@ -423,12 +448,15 @@ cdef class HuobiExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            for tracked_order in tracked_orders:
-                exchange_order_id = await tracked_order.get_exchange_order_id()
-                try:
-                    order_update = await self.get_order_status(exchange_order_id)
-                except HuobiAPIError as e:
-                    err_code = e.error_payload.get("error").get("err-code")
+            results, stats = await poll_order_statuses(tracked_orders,
+                                                       fetch_open_orders=self.get_open_orders_status,
+                                                       fetch_order=self._fetch_order_status,
+                                                       open_order_id=lambda entry: entry["id"])
+            self.logger().debug(f"Order status poll: {stats}.")
+            for tracked_order, order_update in results:
+                exchange_order_id = tracked_order.exchange_order_id
+                if isinstance(order_update, HuobiAPIError):
+                    err_code = order_update.error_payload.get("error").get("err-code")
                     self.c_stop_tracking_order(tracked_order.client_order_id)
                     self.logger().info(f"The limit order {tracked_order.client_order_id} "
                                        f"has failed according to order status API. - {err_code}")
@@ -442,7 +470,7 @@ cdef class HuobiExchange(ExchangeBase):
                     )
                     continue
 
-                if order_update is None:
+                if order_update is None or isinstance(order_update, Exception):
                     self.logger().network(
                         f"Error fetching status update for the order {tracked_order.client_order_id}: "
                         f"{order_update}.",
@@ -18,9 +18,10 @@ import websockets
 from websockets.exceptions import ConnectionClosed
 
 import requests
-import cachetools.func
 
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_client_registry import shared_client_session
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -63,9 +64,9 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"{TICKER_URL}?pair={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
+        async with shared_client_session() as client:
+            async with client.get(f"{TICKER_URL}?pair={convert_to_exchange_trading_pair(trading_pair)}") as resp:
+                resp_json = await resp.json()
             record = list(resp_json["result"].values())[0]
             return float(record["c"][0])
 
@@ -94,7 +95,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KrakenOrderBook.snapshot_message_from_exchange(
@@ -132,7 +133,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
             await ws.close()
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         from hummingbot.connector.exchange.kraken.kraken_utils import convert_to_exchange_trading_pair
 
@@ -147,9 +148,10 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(ASSET_PAIRS_URL, timeout=5) as response:
                     if response.status == 200:
                         from hummingbot.connector.exchange.kraken.kraken_utils import convert_from_exchange_trading_pair
@@ -222,7 +224,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -143,8 +143,7 @@ cdef class KrakenExchange(ExchangeBase):
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
-        self._throttler = Throttler(rate_limit=(self.API_MAX_COUNTER, self.API_MAX_COUNTER/self.API_COUNTER_DECREASE_RATE_PER_SEC),
-                                    retry_interval=1.0/self.API_COUNTER_DECREASE_RATE_PER_SEC)
+        self._throttler = Throttler(rate_limit=(self.API_MAX_COUNTER, self.API_MAX_COUNTER/self.API_COUNTER_DECREASE_RATE_PER_SEC))
         self._last_pull_timestamp = 0
         self._shared_client = None
         self._asset_pairs = {}
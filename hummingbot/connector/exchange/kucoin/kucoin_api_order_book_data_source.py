@@ -4,7 +4,6 @@ from itertools import islice
 import aiohttp
 import asyncio
 from async_timeout import timeout
-import cachetools.func
 from collections import defaultdict
 from decimal import Decimal
 from enum import Enum
@@ -26,13 +25,16 @@ from typing import (
 import websockets
 from websockets.client import Connect as WSConnectionContext
 
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.indexed_order_book import IndexedOrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.kucoin.kucoin_order_book import KucoinOrderBook
 from hummingbot.connector.exchange.kucoin.kucoin_active_order_tracker import KucoinActiveOrderTracker
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_client_registry import shared_client_session
 
 SNAPSHOT_REST_URL = "https://api.kucoin.com/api/v2/market/orderbook/level2"
 DIFF_STREAM_URL = ""
@@ -95,7 +97,7 @@ class KucoinWSConnectionIterator:
 
     @staticmethod
     async def get_ws_connection_context() -> WSConnectionContext:
-        async with aiohttp.ClientSession() as session:
+        async with shared_client_session() as session:
             async with session.post('https://api.kucoin.com/api/v1/bullet-public', data=b'') as resp:
                 response: aiohttp.ClientResponse = resp
                 if response.status != 200:
@@ -292,15 +294,15 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     def __init__(self, trading_pairs: List[str]):
         super().__init__(trading_pairs)
-        self._order_book_create_function = lambda: OrderBook()
+        self._order_book_create_function = lambda: IndexedOrderBook()
         self._tasks: DefaultDict[StreamType, Dict[int, KucoinAPIOrderBookDataSource.TaskEntry]] = defaultdict(dict)
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(TICKER_PRICE_CHANGE_URL)
-            resp_json = await resp.json()
+        async with shared_client_session() as client:
+            async with client.get(TICKER_PRICE_CHANGE_URL) as resp:
+                resp_json = await resp.json()
             for trading_pair in trading_pairs:
                 resp_record = [o for o in resp_json["data"]["ticker"] if o["symbolName"] == trading_pair][0]
                 results[trading_pair] = float(resp_record["last"])
@@ -320,7 +322,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return self._trading_pairs
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         resp = requests.get(url=TICKER_PRICE_CHANGE_URL)
         records = resp.json()
@@ -332,8 +334,9 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             async with client.get(EXCHANGE_INFO_URL, timeout=5) as response:
                 if response.status == 200:
                     try:
@@ -357,7 +360,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
@@ -532,7 +535,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_client_session() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -48,6 +48,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_order_book_tracker import Kucoi
 from hummingbot.connector.exchange.kucoin.kucoin_user_stream_tracker import KucoinUserStreamTracker
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_status_poller import poll_order_statuses
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
@@ -86,6 +87,7 @@ cdef class KucoinExchange(ExchangeBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    ACTIVE_ORDERS_PAGE_SIZE = 500
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 120.0
 
@@ -488,6 +490,19 @@ cdef class KucoinExchange(ExchangeBase):
         path_url = f"/api/v1/orders/{exchange_order_id}"
         return await self._api_request("get", path_url=path_url, is_auth_required=True)
 
+    async def get_active_orders(self, trading_pair: str) -> List[Dict[str, Any]]:
+        """
+        Returns the active orders of a trading pair, in the format of the order status responses.
+        """
+        path_url = f"/api/v1/orders?status=active&symbol={trading_pair}&pageSize={self.ACTIVE_ORDERS_PAGE_SIZE}"
+        response = await self._api_request("get", path_url=path_url, is_auth_required=True)
+        if response["data"]["totalPage"] > 1:
+            raise IOError(f"More than {self.ACTIVE_ORDERS_PAGE_SIZE} active orders on {trading_pair}.")
+        return [{"data": entry} for entry in response["data"]["items"]]
+
+    async def _fetch_order_status(self, tracked_order: KucoinInFlightOrder) -> Dict[str, Any]:
+        return await self.get_order_status(await tracked_order.get_exchange_order_id())
+
     async def _update_order_status(self):
         cdef:
             # The poll interval for order status is 10 seconds.
@@ -496,10 +511,14 @@ cdef class KucoinExchange(ExchangeBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            for tracked_order in tracked_orders:
-                exchange_order_id = await tracked_order.get_exchange_order_id()
-                order_update = await self.get_order_status(exchange_order_id)
-                if order_update is None:
+            results, stats = await poll_order_statuses(tracked_orders,
+                                                       fetch_open_orders=self.get_active_orders,
+                                                       fetch_order=self._fetch_order_status,
+                                                       open_order_id=lambda entry: entry["data"]["id"])
+            self.logger().debug(f"Order status poll: {stats}.")
+            for tracked_order, order_update in results:
+                exchange_order_id = tracked_order.exchange_order_id
+                if order_update is None or isinstance(order_update, Exception):
                     self.logger().network(
                         f"Error fetching status update for the order {tracked_order.client_order_id}: "
                         f"{order_update}.",
@@ -22,6 +22,10 @@ from hummingbot.connector.exchange.kucoin.kucoin_active_order_tracker import Kuc
 
 
 class KucoinOrderBookTracker(OrderBookTracker):
+    # The full order book snapshots are limited to 30 requests every 3 seconds. At 5 per second, the other public
+    # requests keep some room.
+    INIT_ORDER_BOOK_CONCURRENCY: int = 5
+    INIT_ORDER_BOOK_INTERVAL: float = 0.2
     _kobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
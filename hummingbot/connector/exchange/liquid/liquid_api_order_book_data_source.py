@@ -7,11 +7,10 @@ from typing import Any, AsyncIterable, Dict, List, Optional
 from decimal import Decimal
 import ujson
 import requests
-import cachetools.func
 import websockets
 from websockets.exceptions import ConnectionClosed
 
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -163,7 +162,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         ]
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         resp = requests.get(url=Constants.GET_EXCHANGE_MARKETS_URL)
         records = resp.json()
@@ -176,6 +175,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return result
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
             # Returns a List of str, representing each active trading pair on the exchange.
@@ -67,12 +67,14 @@ class LiquidOrderBookTracker(OrderBookTracker):
                 # just one side of the book (either bids or asks), we have to manually check for existing entries here
                 # and include them with 0 amount.
                 if "asks" in ob_message.content and len(ob_message.content["asks"]) > 0:
-                    for price in order_book.snapshot[1].price:
-                        if price not in [float(p[0]) for p in ob_message.content["asks"]]:
+                    new_prices = set(float(p[0]) for p in ob_message.content["asks"])
+                    for price in order_book.ask_depth_array()[:, 0].tolist():
+                        if price not in new_prices:
                             ob_message.content["asks"].append([str(price), str(0)])
                 elif "bids" in ob_message.content and len(ob_message.content["bids"]) > 0:
-                    for price in order_book.snapshot[0].price:
-                        if price not in [float(p[0]) for p in ob_message.content["bids"]]:
+                    new_prices = set(float(p[0]) for p in ob_message.content["bids"])
+                    for price in order_book.bid_depth_array()[:, 0].tolist():
+                        if price not in new_prices:
                             ob_message.content["bids"].append([str(price), str(0)])
                 await message_queue.put(ob_message)
                 messages_accepted += 1
@@ -9,7 +9,6 @@ import logging
 # import math
 
 import requests
-import cachetools.func
 
 from typing import AsyncIterable, Dict, List, Optional, Any
 
@@ -18,7 +17,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
-# from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 # from hummingbot.core.utils.async_utils import safe_gather
 # from hummingbot.connector.exchange.loopring.loopring_active_order_tracker import LoopringActiveOrderTracker
 from hummingbot.connector.exchange.loopring.loopring_order_book import LoopringOrderBook
@@ -26,6 +25,7 @@ from hummingbot.connector.exchange.loopring.loopring_order_book import LoopringO
 from hummingbot.connector.exchange.loopring.loopring_api_token_configuration_data_source import LoopringAPITokenConfigurationDataSource
 from hummingbot.connector.exchange.loopring.loopring_utils import convert_from_exchange_trading_pair, get_ws_api_key
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.http_client_registry import shared_client_session
 from hummingbot.logger import HummingbotLogger
 # from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 # from hummingbot.connector.exchange.loopring.loopring_order_book_message import LoopringOrderBookMessage
@@ -64,10 +64,10 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
-            resp = await client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs)))
-            resp_json = await resp.json()
-            return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
+        async with shared_client_session() as client:
+            async with client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs))) as resp:
+                resp_json = await resp.json()
+                return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
 
     @property
     def order_book_class(self) -> LoopringOrderBook:
@@ -89,7 +89,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_client_session() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot["data"] = {"bids": snapshot["bids"], "asks": snapshot["asks"]}
             snapshot_timestamp: float = time.time()
@@ -124,7 +124,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             await ws.close()
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         resp = requests.get(url=LOOPRING_PRICE_URL, params={"market": trading_pair})
         record = resp.json()
@@ -135,9 +135,10 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return mid_price
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_client_session() as client:
                 async with client.get(f"https://api3.loopring.io{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -19,6 +19,7 @@ OKEX_INSTRUMENTS_URL = "api/spot/v3/instruments"
 
 OKEX_PLACE_ORDER = "api/spot/v3/orders"
 OKEX_ORDER_DETAILS_URL = 'api/spot/v3/orders/{exchange_order_id}'
+OKEX_PENDING_ORDERS_URL = 'api/spot/v3/orders_pending'
 OKEX_ORDER_CANCEL = 'api/spot/v3/cancel_orders/{exchange_order_id}'
 OKEX_BATCH_ORDER_CANCELL = 'api/spot/v3/cancel_batch_orders'
 OKEX_BALANCE_URL = "api/spot/v3/accounts"
@@ -16,14 +16,13 @@ from typing import (
 )
 from decimal import Decimal
 import requests
-import cachetools.func
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import async_ttl_cache, ttl_cache
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.okex.okex_order_book import OkexOrderBook
 from hummingbot.connector.exchange.okex.constants import (
@@ -84,7 +83,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 return all_markets
 
     @staticmethod
-    @cachetools.func.ttl_cache(ttl=10)
+    @ttl_cache(ttl=10, error_ttl=5)
     def get_mid_price(trading_pair: str) -> Optional[Decimal]:
         resp = requests.get(url=OKEX_PRICE_URL.format(trading_pair=trading_pair))
         record = resp.json()
@@ -92,6 +91,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return (Decimal(record["best_ask"]) + Decimal(record["best_bid"])) / Decimal("2")
 
     @staticmethod
+    @async_ttl_cache(ttl=60 * 5, maxsize=1)
     async def fetch_trading_pairs() -> List[str]:
         # Returns a List of str, representing each active trading pair on the exchange.
         async with aiohttp.ClientSession() as client:
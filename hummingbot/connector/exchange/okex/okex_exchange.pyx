@@ -59,6 +59,7 @@ from hummingbot.connector.exchange_base import (
     NaN,
     s_decimal_NaN)
 from hummingbot.connector.exchange.okex.okex_user_stream_tracker import OkexUserStreamTracker
+from hummingbot.connector.order_status_poller import poll_order_statuses
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -103,6 +104,7 @@ cdef class OkexExchange(ExchangeBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    PENDING_ORDERS_PAGE_SIZE = 100
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 120.0
 
@@ -395,6 +397,19 @@ cdef class OkexExchange(ExchangeBase):
         path_url = OKEX_ORDER_DETAILS_URL.format(exchange_order_id=exchange_order_id) + f"?instrument_id={trading_pair}"
         return await self._api_request("GET", path_url=path_url, is_auth_required=True)
 
+    async def get_pending_orders(self, trading_pair: str) -> List[Dict[str, Any]]:
+        """
+        Returns the open orders of a trading pair, in the format of the order details.
+        """
+        path_url = OKEX_PENDING_ORDERS_URL + f"?instrument_id={trading_pair}&limit={self.PENDING_ORDERS_PAGE_SIZE}"
+        pending_orders = await self._api_request("GET", path_url=path_url, is_auth_required=True)
+        if len(pending_orders) >= self.PENDING_ORDERS_PAGE_SIZE:
+            raise IOError(f"More than {self.PENDING_ORDERS_PAGE_SIZE} open orders on {trading_pair}.")
+        return pending_orders
+
+    async def _fetch_order_status(self, tracked_order: OkexInFlightOrder) -> Dict[str, Any]:
+        return await self.get_order_status(await tracked_order.get_exchange_order_id(), tracked_order.trading_pair)
+
     async def _update_order_status(self):
         cdef:
             # The poll interval for order status is 10 seconds.
@@ -402,12 +417,17 @@ cdef class OkexExchange(ExchangeBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDERS_INTERVAL)
 
         tracked_orders = list(self._in_flight_orders.values())
-        for tracked_order in tracked_orders:
-            exchange_order_id = await tracked_order.get_exchange_order_id()
-            try:
-                order_update = await self.get_order_status(exchange_order_id, tracked_order.trading_pair)
-            except OKExAPIError as e:
-                err_code = e.error_payload.get("error").get("err-code")
+        if len(tracked_orders) == 0:
+            return
+        results, stats = await poll_order_statuses(tracked_orders,
+                                                   fetch_open_orders=self.get_pending_orders,
+                                                   fetch_order=self._fetch_order_status,
+                                                   open_order_id=lambda entry: entry["order_id"])
+        self.logger().debug(f"Order status poll: {stats}.")
+        for tracked_order, order_update in results:
+            exchange_order_id = tracked_order.exchange_order_id
+            if isinstance(order_update, OKExAPIError):
+                err_code = order_update.error_payload.get("error").get("err-code")
                 self.c_stop_tracking_order(tracked_order.client_order_id)
                 self.logger().info(f"The limit order {tracked_order.client_order_id} "
                                    f"has failed according to order status API. - {err_code}")
@@ -421,7 +441,7 @@ cdef class OkexExchange(ExchangeBase):
                 )
                 continue
 
-            if order_update is None:
+            if order_update is None or isinstance(order_update, Exception):
                 self.logger().network(
                     f"Error fetching status update for the order {tracked_order.client_order_id}: "
                     f"{order_update}.",
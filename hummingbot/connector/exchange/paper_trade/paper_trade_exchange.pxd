@@ -2,6 +2,7 @@ from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
 from libcpp.unordered_map cimport unordered_map
 from libcpp.utility cimport pair
+from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.LimitOrder cimport LimitOrder as CPPLimitOrder
 from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
@@ -53,19 +54,11 @@ cdef class PaperTradeExchange(ExchangeBase):
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_order(self,
-                               bint is_buy,
-                               LimitOrders *limit_orders_map_ptr,
-                               LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_bid_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_ask_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+    cdef c_process_limit_orders(self,
+                                bint is_buy,
+                                LimitOrders *limit_orders_map_ptr,
+                                LimitOrdersIterator *map_it_ptr,
+                                vector[SingleTradingPairLimitOrdersIterator] &orders_its)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
@@ -7,6 +7,7 @@ from cpython cimport PyObject
 from decimal import Decimal
 from libcpp cimport bool as cppbool
 from libcpp.vector cimport vector
+from libc.math cimport isnan
 import math
 import pandas as pd
 import random
@@ -215,6 +216,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     def display_name(self) -> str:
         return f"{self._order_book_tracker.exchange_name}_PaperTrade"
 
+    @property
+    def order_book_tracker(self) -> OrderBookTracker:
+        return self._order_book_tracker
+
     @property
     def order_books(self) -> Dict[str, CompositeOrderBook]:
         return self._order_book_tracker.order_books
@@ -574,139 +579,136 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
-    cdef c_process_limit_bid_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
-        cdef:
-            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
-            str trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
-            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
-            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
-            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object quote_asset_balance = self.c_get_balance(quote_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
-
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
-        if quote_asset_balance < quote_asset_traded:
-            self.logger().warning(f"Not enough {quote_asset} balance to fill limit buy order on {trading_pair}. "
-                                  f"{quote_asset_traded:.8g} {quote_asset} needed vs. "
-                                  f"{quote_asset_balance:.8g} {quote_asset} available.")
-
-            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-            return
-
-        # Adjust the market balances according to the trade done.
-        self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) - quote_asset_traded)
-        self.c_set_balance(base_asset, self.c_get_balance(base_asset) + base_asset_traded)
-
-        # add fee
-        fees = estimate_fee(self.name, True)
-
-        # Emit the trade and order completed events.
-        config = self._config
-        self.c_trigger_event(
-            self.ORDER_FILLED_EVENT_TAG,
-            OrderFilledEvent(
-                self._current_timestamp,
-                order_id,
-                trading_pair,
-                TradeType.BUY,
-                OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
-                fees
-            ))
-
-        self.c_trigger_event(
-            self.BUY_ORDER_COMPLETED_EVENT_TAG,
-            BuyOrderCompletedEvent(
-                self._current_timestamp,
-                order_id,
-                base_asset,
-                quote_asset,
-                base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
-                s_decimal_0,
-                OrderType.LIMIT
-            ))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+    cdef c_process_limit_orders(self,
+                                bint is_buy,
+                                LimitOrders *limit_orders_map_ptr,
+                                LimitOrdersIterator *map_it_ptr,
+                                vector[SingleTradingPairLimitOrdersIterator] &orders_its):
+        """
+        Fills a batch of limit orders of a trading pair, on the same side. The assets and the fee estimate are looked up
+        once per batch. The balances are updated before the events of each order are emitted, as they would be if the
+        orders were filled one by one.
 
-    cdef c_process_limit_ask_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+        :param is_buy: are the limit orders on the bid side?
+        :param limit_orders_map_ptr: pointer to the limit orders map
+        :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
+        :param orders_its: iterators of the limit orders to fill, in filling order
+        """
         cdef:
-            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
-            str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
-            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
-            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
-            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object base_asset_balance = self.c_get_balance(base_asset)
-            object quote_asset_traded = <object> cpp_limit_order_ptr.getPrice() * \
-                                        <object> cpp_limit_order_ptr.getQuantity()
-            object base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
-
-        # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing anything.
-        if base_asset_balance < base_asset_traded:
-            self.logger().warning(f"Not enough {base_asset} balance to fill limit sell order on {trading_pair_str}. "
-                                  f"{base_asset_traded:.8g} {base_asset} needed vs. "
-                                  f"{base_asset_balance:.8g} {base_asset} available.")
-            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            SingleTradingPairLimitOrdersIterator orders_it
+            str trading_pair
+            str base_asset
+            str quote_asset
+            str base_balance_key
+            str quote_balance_key
+            str balance_key
+            str fee_asset
+            str order_id
+            dict balances = self._account_balances
+            object base_asset_balance
+            object quote_asset_balance
+            object price
+            object base_asset_traded
+            object quote_asset_traded
+            object fees
+            object config = self._config
+
+        if orders_its.size() == 0:
             return
 
-        # Adjust the market balances according to the trade done.
-        self.c_set_balance(quote_asset, self.c_get_balance(quote_asset) + quote_asset_traded)
-        self.c_set_balance(base_asset, self.c_get_balance(base_asset) - base_asset_traded)
-
-        # add fee
+        cpp_limit_order_ptr = address(deref(orders_its[0]))
+        trading_pair = cpp_limit_order_ptr.getTradingPair().decode("utf8")
+        base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
+        quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
+        base_balance_key = base_asset.upper()
+        quote_balance_key = quote_asset.upper()
+        for balance_key in (base_balance_key, quote_balance_key):
+            if balance_key not in balances:
+                self.logger().warning(f"Account balance does not have asset {balance_key}.")
+        if is_buy:
+            fee_asset = base_asset if config.buy_fees_asset is AssetType.BASE_CURRENCY else quote_asset
+        else:
+            fee_asset = base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset
         fees = estimate_fee(self.name, True)
 
-        # Emit the trade and order completed events.
-        config = self._config
-        self.c_trigger_event(
-            self.ORDER_FILLED_EVENT_TAG,
-            OrderFilledEvent(
-                self._current_timestamp,
-                order_id,
-                trading_pair_str,
-                TradeType.SELL,
-                OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
-                fees
-            ))
-
-        self.c_trigger_event(
-            self.SELL_ORDER_COMPLETED_EVENT_TAG,
-            SellOrderCompletedEvent(
-                self._current_timestamp,
-                order_id,
-                base_asset,
-                quote_asset,
-                base_asset if config.sell_fees_asset is AssetType.BASE_CURRENCY else quote_asset,
-                base_asset_traded,
-                quote_asset_traded,
-                s_decimal_0,
-                OrderType.LIMIT
-            ))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-
-    cdef c_process_limit_order(self,
-                               bint is_buy,
-                               LimitOrders *limit_orders_map_ptr,
-                               LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
-        try:
-            if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-            else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-        except Exception as e:
-            self.logger().error(f"Error processing limit order.", exc_info=True)
+        for orders_it in orders_its:
+            try:
+                cpp_limit_order_ptr = address(deref(orders_it))
+                order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+                price = <object> cpp_limit_order_ptr.getPrice()
+                base_asset_traded = <object> cpp_limit_order_ptr.getQuantity()
+                quote_asset_traded = price * base_asset_traded
+                base_asset_balance = balances.get(base_balance_key, s_decimal_0)
+                quote_asset_balance = balances.get(quote_balance_key, s_decimal_0)
+
+                # Check if there's enough balance to satisfy the order. If not, remove the limit order without doing
+                # anything.
+                if is_buy and quote_asset_balance < quote_asset_traded:
+                    self.logger().warning(f"Not enough {quote_asset} balance to fill limit buy order on {trading_pair}. "
+                                          f"{quote_asset_traded:.8g} {quote_asset} needed vs. "
+                                          f"{quote_asset_balance:.8g} {quote_asset} available.")
+                    self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                    continue
+                if not is_buy and base_asset_balance < base_asset_traded:
+                    self.logger().warning(f"Not enough {base_asset} balance to fill limit sell order on {trading_pair}. "
+                                          f"{base_asset_traded:.8g} {base_asset} needed vs. "
+                                          f"{base_asset_balance:.8g} {base_asset} available.")
+                    self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                    continue
+
+                # Adjust the market balances according to the trade done.
+                if is_buy:
+                    balances[quote_balance_key] = quote_asset_balance - quote_asset_traded
+                    balances[base_balance_key] = base_asset_balance + base_asset_traded
+                else:
+                    balances[quote_balance_key] = quote_asset_balance + quote_asset_traded
+                    balances[base_balance_key] = base_asset_balance - base_asset_traded
+
+                # Emit the trade and order completed events.
+                self.c_trigger_event(
+                    self.ORDER_FILLED_EVENT_TAG,
+                    OrderFilledEvent(
+                        self._current_timestamp,
+                        order_id,
+                        trading_pair,
+                        TradeType.BUY if is_buy else TradeType.SELL,
+                        OrderType.LIMIT,
+                        price,
+                        base_asset_traded,
+                        fees
+                    ))
+                if is_buy:
+                    self.c_trigger_event(
+                        self.BUY_ORDER_COMPLETED_EVENT_TAG,
+                        BuyOrderCompletedEvent(
+                            self._current_timestamp,
+                            order_id,
+                            base_asset,
+                            quote_asset,
+                            fee_asset,
+                            base_asset_traded,
+                            quote_asset_traded,
+                            s_decimal_0,
+                            OrderType.LIMIT
+                        ))
+                else:
+                    self.c_trigger_event(
+                        self.SELL_ORDER_COMPLETED_EVENT_TAG,
+                        SellOrderCompletedEvent(
+                            self._current_timestamp,
+                            order_id,
+                            base_asset,
+                            quote_asset,
+                            fee_asset,
+                            base_asset_traded,
+                            quote_asset_traded,
+                            s_decimal_0,
+                            OrderType.LIMIT
+                        ))
+                self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+            except Exception:
+                self.logger().error(f"Error processing limit order.", exc_info=True)
 
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
@@ -722,48 +724,59 @@ cdef class PaperTradeExchange(ExchangeBase):
         """
         cdef:
             str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double opposite_order_book_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
-            const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        try:
+            opposite_order_book_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            self.logger().warning(f"{'Ask' if is_buy else 'Buy'} orderbook for {trading_pair} is empty.")
+            return
+        if isnan(opposite_order_book_price):
+            return
+
+        # The limit orders are sorted by their exact prices, so their double prices are sorted too.
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
-                cpp_limit_order_ptr = address(deref(orders_rit))
-                if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price > deref(orders_rit).getPriceValue():
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             while orders_it != orders_collection_ptr.end():
-                cpp_limit_order_ptr = address(deref(orders_it))
-                if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price < deref(orders_it).getPriceValue():
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+        self.c_process_limit_orders(is_buy, limit_orders_map_ptr, map_it_ptr, process_order_its)
 
     cdef c_process_crossed_limit_orders(self):
         cdef:
             LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
             LimitOrdersIterator map_it = limit_orders_ptr.begin()
+            size_t trading_pairs_count
 
+        # When all the limit orders of a trading pair are filled, its entry is erased and `map_it` already points to
+        # the next trading pair.
         while map_it != limit_orders_ptr.end():
+            trading_pairs_count = limit_orders_ptr.size()
             self.c_process_crossed_limit_orders_for_trading_pair(True, limit_orders_ptr, address(map_it))
-            if map_it != limit_orders_ptr.end():
+            if limit_orders_ptr.size() == trading_pairs_count:
                 inc(map_it)
 
         limit_orders_ptr = address(self._ask_limit_orders)
         map_it = limit_orders_ptr.begin()
 
         while map_it != limit_orders_ptr.end():
+            trading_pairs_count = limit_orders_ptr.size()
             self.c_process_crossed_limit_orders_for_trading_pair(False, limit_orders_ptr, address(map_it))
-            if map_it != limit_orders_ptr.end():
+            if limit_orders_ptr.size() == trading_pairs_count:
                 inc(map_it)
 
     # <editor-fold desc="Event listener functions">
@@ -776,8 +789,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             string cpp_trading_pair = order_book_trade_event.trading_pair.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
-            object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
+            double trade_price = float(order_book_trade_event.price)
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -786,7 +798,6 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersIterator orders_it
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
-            const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
         if map_it == limit_orders_map_ptr.end():
             return
@@ -795,8 +806,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
-                cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if deref(orders_rit).getPriceValue() <= trade_price:
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -804,14 +814,12 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
-                cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if deref(orders_it).getPriceValue() >= trade_price:
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        self.c_process_limit_orders(is_maker_buy, limit_orders_map_ptr, address(map_it), process_order_its)
 
     # </editor-fold>
 
@@ -10,6 +10,8 @@ from sqlalchemy.orm import (
 import time
 import threading
 from typing import (
+    Any,
+    Callable,
     Dict,
     List,
     Optional,
@@ -36,11 +38,20 @@ from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_batch_writer import SQLBatchWriter
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_history_cursor import TradeHistoryCursor
 
 
 class MarketsRecorder:
+    """
+    Records the orders, order status changes and trade fills of the markets, and their tracking states, to the
+    database.
+
+    The records are written behind, by a `SQLBatchWriter` worker thread, so market events never wait for the database.
+    The query methods wait for the pending writes first, so they always see the recorded events.
+    """
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -50,7 +61,9 @@ class MarketsRecorder:
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 batch_interval: float = 0.1,
+                 batch_size: int = 100):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -59,6 +72,7 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._writer: SQLBatchWriter = SQLBatchWriter(sql, batch_interval=batch_interval, batch_size=batch_size)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -68,6 +82,7 @@ class MarketsRecorder:
 
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
+            market.add_trade_history_cursors_from_market_recorder(self.get_trade_history_cursors(market))
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -107,7 +122,19 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def writer(self) -> SQLBatchWriter:
+        return self._writer
+
+    @property
+    def queue_lag(self) -> float:
+        """
+        How long the oldest pending write has been waiting, in seconds.
+        """
+        return self._writer.queue_lag
+
     def start(self):
+        self._writer.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -116,10 +143,33 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+            self.save_trade_history_cursors(market)
+        # Writes the pending records before returning.
+        self._writer.stop()
+
+    def flush(self):
+        """
+        Waits for all the pending writes to be committed.
+        """
+        self._writer.flush()
+
+    async def drain(self):
+        """
+        Waits for all the pending writes to be committed, without blocking the event loop. Coroutines call it before
+        the queries below, for these to see the writes.
+        """
+        await self._writer.drain()
+
+    def _flush_unless_loop_running(self):
+        # The queries only see the committed writes. While the event loop is running, waiting for them here would
+        # block it, so its coroutines await drain() before querying instead.
+        if not self._ev_loop.is_running():
+            self._writer.flush()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self._flush_unless_loop_running()
         session: Session = self.session
         filters = [Order.config_file_path == config_file_path,
                    Order.market == market.display_name]
@@ -128,41 +178,69 @@ class MarketsRecorder:
         query: Query = (session
                         .query(Order)
                         .filter(*filters)
-                        .order_by(Order.creation_timestamp))
+                        .order_by(Order.creation_timestamp)
+                        .populate_existing())
         if number_of_rows is None:
             return query.all()
         else:
             return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self._flush_unless_loop_running()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
                         .filter(TradeFill.config_file_path == config_file_path)
-                        .order_by(TradeFill.timestamp.desc()))
+                        .order_by(TradeFill.timestamp.desc())
+                        .populate_existing())
         if number_of_rows is None:
             return query.all()
         else:
             return query.limit(number_of_rows).all()
 
-    def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
+    def get_trades_for_order(self, order_id: str) -> List[TradeFill]:
+        """
+        Returns all the trade fills of an order, including the ones no longer kept in the event logs of the markets.
+        """
+        self._flush_unless_loop_running()
         session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
+        query: Query = (session
+                        .query(TradeFill)
+                        .filter(TradeFill.order_id == order_id)
+                        .order_by(TradeFill.timestamp)
+                        .populate_existing())
+        return query.all()
+
+    def save_market_states(self, config_file_path: str, market: ConnectorBase):
+        saved_state: Dict[str, Any] = market.tracking_states
+        market_name: str = market.display_name
         timestamp: int = self.db_timestamp
 
+        def write(session: Session):
+            self._save_market_states(session, config_file_path, market_name, saved_state, timestamp)
+        self._writer.enqueue(write)
+
+    @staticmethod
+    def _save_market_states(session: Session,
+                            config_file_path: str,
+                            market_name: str,
+                            saved_state: Dict[str, Any],
+                            timestamp: int):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
-        if not no_commit:
-            session.commit()
-
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
 
@@ -170,14 +248,56 @@ class MarketsRecorder:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
+        self._flush_unless_loop_running()
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
                         .filter(MarketState.config_file_path == config_file_path,
-                                MarketState.market == market.display_name))
+                                MarketState.market == market.display_name)
+                        .populate_existing())
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def get_trade_history_cursors(self, market: ConnectorBase) -> Dict[str, int]:
+        self._flush_unless_loop_running()
+        session: Session = self.session
+        query: Query = (session
+                        .query(TradeHistoryCursor)
+                        .filter(TradeHistoryCursor.market == market.display_name)
+                        .populate_existing())
+        return {cursor.symbol: cursor.last_trade_id for cursor in query.all()}
+
+    def save_trade_history_cursors(self, market: ConnectorBase):
+        cursors: Dict[str, int] = dict(market.trade_history_cursors)
+        market_name: str = market.display_name
+        timestamp: int = self.db_timestamp
+        if len(cursors) == 0:
+            return
+
+        def write(session: Session):
+            self._save_trade_history_cursors(session, market_name, cursors, timestamp)
+        self._writer.enqueue(write, rows=len(cursors))
+
+    @staticmethod
+    def _save_trade_history_cursors(session: Session,
+                                    market_name: str,
+                                    cursors: Dict[str, int],
+                                    timestamp: int):
+        saved_cursors: Dict[str, TradeHistoryCursor] = {
+            cursor.symbol: cursor
+            for cursor in session.query(TradeHistoryCursor).filter(TradeHistoryCursor.market == market_name)
+        }
+        for symbol, last_trade_id in cursors.items():
+            saved_cursor: Optional[TradeHistoryCursor] = saved_cursors.get(symbol)
+            if saved_cursor is None:
+                session.add(TradeHistoryCursor(market=market_name,
+                                               symbol=symbol,
+                                               last_trade_id=last_trade_id,
+                                               timestamp=timestamp))
+            elif saved_cursor.last_trade_id != last_trade_id:
+                saved_cursor.last_trade_id = last_trade_id
+                saved_cursor.timestamp = timestamp
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -186,34 +306,37 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-        order_record: Order = Order(id=evt.order_id,
-                                    config_file_path=self._config_file_path,
-                                    strategy=self._strategy_name,
-                                    market=market.display_name,
-                                    symbol=evt.trading_pair,
-                                    base_asset=base_asset,
-                                    quote_asset=quote_asset,
-                                    creation_timestamp=timestamp,
-                                    order_type=evt.type.name,
-                                    amount=float(evt.amount),
-                                    leverage=evt.leverage if evt.leverage else 1,
-                                    price=float(evt.price) if evt.price == evt.price else 0,
-                                    position=evt.position if evt.position else "NILL",
-                                    last_status=event_type.name,
-                                    last_update_timestamp=timestamp,
-                                    exchange_order_id=evt.exchange_order_id)
-        order_status: OrderStatus = OrderStatus(order=order_record,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        session.add(order_record)
-        session.add(order_status)
+        market_name: str = market.display_name
+        saved_state: Dict[str, Any] = market.tracking_states
         market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+
+        def write(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=float(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=float(evt.price) if evt.price == evt.price else 0,
+                                        position=evt.position if evt.position else "NILL",
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+            self._save_market_states(session, self._config_file_path, market_name, saved_state, timestamp)
+        self._writer.enqueue(write, rows=3)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -223,45 +346,52 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
-        session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        # Try to find the order record, and update it if necessary.
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-
-        # Order status and trade fill record should be added even if the order record is not found, because it's
-        # possible for fill event to come in before the order created event for market orders.
-        order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                timestamp=timestamp,
-                                                status=event_type.name)
-        trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
-                                                 strategy=self.strategy_name,
-                                                 market=market.display_name,
-                                                 symbol=evt.trading_pair,
-                                                 base_asset=base_asset,
-                                                 quote_asset=quote_asset,
-                                                 timestamp=timestamp,
-                                                 order_id=order_id,
-                                                 trade_type=evt.trade_type.name,
-                                                 order_type=evt.order_type.name,
-                                                 price=float(evt.price) if evt.price == evt.price else 0,
-                                                 amount=float(evt.amount),
-                                                 leverage=evt.leverage if evt.leverage else 1,
-                                                 trade_fee=TradeFee.to_json(evt.trade_fee),
-                                                 exchange_trade_id=evt.exchange_trade_id,
-                                                 position=evt.position if evt.position else "NILL",)
-        session.add(order_status)
-        session.add(trade_fill_record)
-        self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
-        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market, trade_fill_record.exchange_trade_id, trade_fill_record.symbol)})
-        self.append_to_csv(trade_fill_record)
+        market_name: str = market.display_name
+        saved_state: Dict[str, Any] = market.tracking_states
+        cursors: Dict[str, int] = dict(market.trade_history_cursors)
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+
+        def write(session: Session) -> Callable[[], None]:
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because
+            # it's possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            trade_fill_record: TradeFill = TradeFill(config_file_path=self.config_file_path,
+                                                     strategy=self.strategy_name,
+                                                     market=market_name,
+                                                     symbol=evt.trading_pair,
+                                                     base_asset=base_asset,
+                                                     quote_asset=quote_asset,
+                                                     timestamp=timestamp,
+                                                     order_id=order_id,
+                                                     trade_type=evt.trade_type.name,
+                                                     order_type=evt.order_type.name,
+                                                     price=float(evt.price) if evt.price == evt.price else 0,
+                                                     amount=float(evt.amount),
+                                                     leverage=evt.leverage if evt.leverage else 1,
+                                                     trade_fee=TradeFee.to_json(evt.trade_fee),
+                                                     exchange_trade_id=evt.exchange_trade_id,
+                                                     position=evt.position if evt.position else "NILL",)
+            session.add(order_status)
+            session.add(trade_fill_record)
+            self._save_market_states(session, self._config_file_path, market_name, saved_state, timestamp)
+            self._save_trade_history_cursors(session, market_name, cursors, timestamp)
+            # The trade fill id is only known once it's committed.
+            return lambda: self.append_to_csv(trade_fill_record)
+        self._writer.enqueue(write, rows=4)
 
     @staticmethod
     def _is_primitive_type(obj: object) -> bool:
@@ -314,23 +444,23 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
-        session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-        order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-        if order_record is not None:
-            order_record.last_status = event_type.name
-            order_record.last_update_timestamp = timestamp
-            order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                    timestamp=timestamp,
-                                                    status=event_type.name)
-            session.add(order_status)
-            self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
-            session.rollback()
+        market_name: str = market.display_name
+        saved_state: Dict[str, Any] = market.tracking_states
+
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                self._save_market_states(session, self._config_file_path, market_name, saved_state, timestamp)
+        self._writer.enqueue(write, rows=3)
 
     def _did_cancel_order(self,
                           event_tag: int,
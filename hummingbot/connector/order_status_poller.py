@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+from collections import defaultdict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.core.utils.async_utils import safe_gather
+
+
+class OrderStatusPollStats(NamedTuple):
+    orders: int
+    snapshot_requests: int
+    lookup_requests: int
+    request_weight: int
+
+    def __str__(self) -> str:
+        return f"{self.orders} orders polled with {self.snapshot_requests} open orders requests and " \
+               f"{self.lookup_requests} order lookups, request weight {self.request_weight}"
+
+
+async def poll_order_statuses(
+        tracked_orders: List[InFlightOrderBase],
+        fetch_open_orders: Callable[[str], Awaitable[List[Dict[str, Any]]]],
+        fetch_order: Callable[[InFlightOrderBase], Awaitable[Any]],
+        open_order_id: Callable[[Dict[str, Any]], str],
+        tracked_order_id: Callable[[InFlightOrderBase], Optional[str]] = lambda o: o.exchange_order_id,
+        snapshot_weight: int = 1,
+        lookup_weight: int = 1) -> Tuple[List[Tuple[InFlightOrderBase, Any]], OrderStatusPollStats]:
+    """
+    Fetches the status of the tracked orders with one open orders request per trading pair, in place of one request
+    per order. Only the orders missing from the open orders of their trading pair, i.e. filled, cancelled or not
+    acknowledged yet, are looked up one by one. The orders of a trading pair whose open orders request failed are
+    looked up one by one as well.
+
+    :param fetch_open_orders: fetches the open orders of a trading pair
+    :param fetch_order: fetches the status of an order
+    :param open_order_id: id of an entry of the open orders, matched against `tracked_order_id`
+    :param tracked_order_id: id of a tracked order, the exchange order id by default
+    :param snapshot_weight: request weight of an open orders request, as throttled by `fetch_open_orders`
+    :param lookup_weight: request weight of an order lookup, as throttled by `fetch_order`
+    :return: the order updates, or the errors of the lookups, in the order of `tracked_orders`, and the poll stats
+    """
+    orders_by_trading_pair: Dict[str, List[InFlightOrderBase]] = defaultdict(list)
+    for tracked_order in tracked_orders:
+        orders_by_trading_pair[tracked_order.trading_pair].append(tracked_order)
+    trading_pairs: List[str] = list(orders_by_trading_pair.keys())
+    snapshots: List[Any] = await safe_gather(*[fetch_open_orders(trading_pair) for trading_pair in trading_pairs],
+                                             return_exceptions=True)
+
+    updates: Dict[int, Any] = {}
+    lookups: List[InFlightOrderBase] = []
+    for trading_pair, snapshot in zip(trading_pairs, snapshots):
+        if isinstance(snapshot, Exception):
+            lookups.extend(orders_by_trading_pair[trading_pair])
+            continue
+        open_orders: Dict[str, Dict[str, Any]] = {str(open_order_id(entry)): entry for entry in snapshot}
+        for tracked_order in orders_by_trading_pair[trading_pair]:
+            order_id: Optional[str] = tracked_order_id(tracked_order)
+            if order_id is not None and str(order_id) in open_orders:
+                updates[id(tracked_order)] = open_orders[str(order_id)]
+            else:
+                lookups.append(tracked_order)
+
+    results: List[Any] = await safe_gather(*[fetch_order(tracked_order) for tracked_order in lookups],
+                                           return_exceptions=True)
+    for tracked_order, result in zip(lookups, results):
+        updates[id(tracked_order)] = result
+
+    stats: OrderStatusPollStats = OrderStatusPollStats(
+        orders=len(tracked_orders),
+        snapshot_requests=len(trading_pairs),
+        lookup_requests=len(lookups),
+        request_weight=len(trading_pairs) * snapshot_weight + len(lookups) * lookup_weight
+    )
+    return [(tracked_order, updates[id(tracked_order)]) for tracked_order in tracked_orders], stats
@@ -1,5 +1,15 @@
 # distutils: language=c++
 
+cdef class TickSchedule:
+    cdef:
+        double _tick_interval
+        double _tick_offset
+        double _next_tick
+
+    cdef bint c_is_due(self, double timestamp)
+    cdef c_advance(self, double timestamp)
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +20,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        object _profiler
+        dict _tick_schedules
+        dict _tick_triggers
+        dict _requested_ticks
+        dict _last_requested_ticks
+
+    cdef c_request_tick(self, object iterator, double min_interval)
+    cdef c_cancel_requested_tick(self, object iterator)
+    cdef c_run_requested_backtest_ticks(self)
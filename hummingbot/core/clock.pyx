@@ -1,16 +1,84 @@
 # distutils: language=c++
 
 import asyncio
+from enum import Enum
+from libc.math cimport (
+    ceil,
+    floor,
+)
 import logging
 import time
-from typing import List
+from typing import (
+    List,
+    Optional,
+)
 
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.pubsub import PubSub
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+# Tolerance on the tick schedules, for the rounding errors of the tick timestamps.
+cdef double SCHEDULE_EPSILON = 1e-6
+
+
+cdef class TickSchedule:
+    """
+    Tick interval and phase offset of a clock iterator. The iterator ticks at the first clock tick at or after each
+    `tick_offset + n * tick_interval` timestamp.
+    """
+    def __init__(self, double tick_interval, double tick_offset = 0.0):
+        if not tick_interval > 0:
+            raise ValueError(f"Tick interval must be positive, got {tick_interval}.")
+        self._tick_interval = tick_interval
+        self._tick_offset = tick_offset
+        self._next_tick = float("nan")
+
+    @property
+    def tick_interval(self) -> float:
+        return self._tick_interval
+
+    @property
+    def tick_offset(self) -> float:
+        return self._tick_offset
+
+    @property
+    def next_tick(self) -> float:
+        return self._next_tick
+
+    cdef bint c_is_due(self, double timestamp):
+        if self._next_tick != self._next_tick:
+            # First due time at or after the first tick.
+            self._next_tick = (self._tick_offset +
+                               ceil((timestamp - self._tick_offset) / self._tick_interval - SCHEDULE_EPSILON) *
+                               self._tick_interval)
+        return timestamp + SCHEDULE_EPSILON >= self._next_tick
+
+    cdef c_advance(self, double timestamp):
+        # The due times missed while the clock was blocked are skipped.
+        self._next_tick = (self._tick_offset +
+                           (floor((timestamp - self._tick_offset) / self._tick_interval + SCHEDULE_EPSILON) + 1) *
+                           self._tick_interval)
+
+
+cdef class TickTriggerListener(EventListener):
+    cdef:
+        Clock _clock
+        TimeIterator _iterator
+        double _min_interval
+
+    def __init__(self, Clock clock, TimeIterator iterator, double min_interval):
+        super().__init__()
+        self._clock = clock
+        self._iterator = iterator
+        self._min_interval = min_interval
+
+    cdef c_call(self, object arg):
+        self._clock.c_request_tick(self._iterator, self._min_interval)
 
 
 cdef class Clock:
@@ -36,6 +104,11 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._profiler = None
+        self._tick_schedules = {}
+        self._tick_triggers = {}
+        self._requested_ticks = {}
+        self._last_requested_ticks = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +130,23 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def profiler(self) -> Optional[ClockProfiler]:
+        return self._profiler
+
+    def enable_profiling(self, log_interval: float = 0.0) -> ClockProfiler:
+        """
+        Starts timing the ticks of the child iterators, and logs their statistics every `log_interval` seconds if it
+        isn't 0. If profiling is already enabled, only the log interval is changed.
+        """
+        if self._profiler is None:
+            self._profiler = ClockProfiler(self._tick_size)
+        self._profiler.log_interval = log_interval
+        return self._profiler
+
+    def disable_profiling(self):
+        self._profiler = None
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -69,7 +159,15 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, tick_interval: float = 0.0, tick_offset: float = 0.0):
+        """
+        :param iterator: the iterator to tick
+        :param tick_interval: time interval between the ticks of the iterator. 0 to tick it at every clock tick.
+        :param tick_offset: phase offset of the iterator's ticks, to spread the iterators with the same tick interval
+        over different clock ticks
+        """
+        if tick_interval > 0:
+            self.set_tick_interval(iterator, tick_interval, tick_offset)
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
@@ -81,6 +179,97 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_schedules.pop(iterator, None)
+        self.remove_tick_triggers(iterator)
+
+    def set_tick_interval(self, iterator: TimeIterator, tick_interval: float, tick_offset: float = 0.0):
+        """
+        Changes the time interval between the ticks of an iterator. 0 to tick it at every clock tick.
+        """
+        if tick_interval > 0:
+            self._tick_schedules[iterator] = TickSchedule(tick_interval, tick_offset)
+        else:
+            self._tick_schedules.pop(iterator, None)
+
+    def get_tick_schedule(self, iterator: TimeIterator) -> Optional[TickSchedule]:
+        return self._tick_schedules.get(iterator)
+
+    def add_tick_trigger(self, iterator: TimeIterator, publisher: PubSub, event_tag: Enum, min_interval: float = 0.0):
+        """
+        Ticks an iterator as soon as the publisher triggers an event, e.g. a strategy on the updates of an order book,
+        on top of its scheduled ticks. The events triggered before the iterator gets to tick are merged into one tick.
+
+        :param min_interval: minimum time interval between the ticks triggered by events, in seconds
+        """
+        cdef TickTriggerListener listener = TickTriggerListener(self, iterator, min_interval)
+        publisher.add_listener(event_tag, listener)
+        # The publishers only keep weak references to their listeners.
+        self._tick_triggers.setdefault(iterator, []).append((publisher, event_tag, listener))
+
+    def remove_tick_triggers(self, iterator: TimeIterator):
+        for publisher, event_tag, listener in self._tick_triggers.pop(iterator, []):
+            publisher.remove_listener(event_tag, listener)
+        self.c_cancel_requested_tick(iterator)
+        self._last_requested_ticks.pop(iterator, None)
+
+    def request_tick(self, iterator: TimeIterator, min_interval: float = 0.0):
+        """
+        Ticks an iterator out of its schedule, as soon as possible in real time mode, or at the end of the current
+        clock tick in back testing mode.
+        """
+        self.c_request_tick(iterator, min_interval)
+
+    cdef c_request_tick(self, object iterator, double min_interval):
+        cdef:
+            double delay
+        if not self._started or iterator in self._requested_ticks:
+            return
+        if self._clock_mode is ClockMode.BACKTEST:
+            self._requested_ticks[iterator] = None
+            return
+        if self._current_context is None:
+            return
+        delay = max(self._last_requested_ticks.get(iterator, 0.0) + min_interval - time.time(), 0.0)
+        self._requested_ticks[iterator] = asyncio.get_event_loop().call_later(delay, self._run_requested_tick, iterator)
+
+    cdef c_cancel_requested_tick(self, object iterator):
+        # A regular tick of the iterator takes the place of its requested tick.
+        handle = self._requested_ticks.pop(iterator, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _run_requested_tick(self, iterator: TimeIterator):
+        cdef:
+            TimeIterator child_iterator = iterator
+            double now = time.time()
+            double iterator_start = time.perf_counter()
+        self._requested_ticks.pop(iterator, None)
+        if self._current_context is None or iterator not in self._current_context:
+            return
+        self._last_requested_ticks[iterator] = now
+        try:
+            child_iterator.c_tick(now)
+        except StopIteration:
+            self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+        except Exception:
+            self.logger().error("Unexpected error running requested tick.", exc_info=True)
+        if self._profiler is not None:
+            self._profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start)
+
+    cdef c_run_requested_backtest_ticks(self):
+        cdef:
+            TimeIterator child_iterator
+        requested_iterators = list(self._requested_ticks.keys())
+        self._requested_ticks.clear()
+        for ci in requested_iterators:
+            child_iterator = ci
+            if child_iterator in self._child_iterators:
+                try:
+                    child_iterator.c_tick(self._current_tick)
+                except StopIteration:
+                    raise
+                except Exception:
+                    self.logger().error("Unexpected error running requested tick.", exc_info=True)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +279,11 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            double iterator_start
+            object profiler
+            dict tick_schedules = self._tick_schedules
+            TickSchedule tick_schedule
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -110,11 +304,29 @@ cdef class Clock:
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
                 await asyncio.sleep(next_tick_time - now)
+                profiler = self._profiler
+                if profiler is not None:
+                    tick_start = time.perf_counter()
+                    # The ticks skipped because the previous one ran past them.
+                    profiler.record_missed_ticks(
+                        max(int(round((next_tick_time - self._current_tick) / self._tick_size)) - 1, 0)
+                    )
+                    profiler.record_lateness(time.time() - next_tick_time)
                 self._current_tick = next_tick_time
 
-                # Run through all the child iterators.
+                # Run through all the child iterators which are due.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if len(tick_schedules) > 0:
+                        tick_schedule = tick_schedules.get(child_iterator)
+                        if tick_schedule is not None:
+                            if not tick_schedule.c_is_due(self._current_tick):
+                                continue
+                            tick_schedule.c_advance(self._current_tick)
+                    if profiler is not None:
+                        iterator_start = time.perf_counter()
+                    if len(self._requested_ticks) > 0:
+                        self.c_cancel_requested_tick(child_iterator)
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +334,25 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiler is not None:
+                        profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start)
+                if profiler is not None:
+                    profiler.record_tick(time.perf_counter() - tick_start)
         finally:
+            for ci in list(self._requested_ticks.keys()):
+                self.c_cancel_requested_tick(ci)
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double tick_start
+            double iterator_start
+            object profiler = self._profiler
+            dict tick_schedules = self._tick_schedules
+            TickSchedule tick_schedule
 
         if not self._started:
             for ci in self._child_iterators:
@@ -139,14 +363,32 @@ cdef class Clock:
         try:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
+                if profiler is not None:
+                    tick_start = time.perf_counter()
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if len(tick_schedules) > 0:
+                        tick_schedule = tick_schedules.get(child_iterator)
+                        if tick_schedule is not None:
+                            if not tick_schedule.c_is_due(self._current_tick):
+                                continue
+                            tick_schedule.c_advance(self._current_tick)
+                    if profiler is not None:
+                        iterator_start = time.perf_counter()
+                    if len(self._requested_ticks) > 0:
+                        self.c_cancel_requested_tick(child_iterator)
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiler is not None:
+                        profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start)
+                if len(self._requested_ticks) > 0:
+                    self.c_run_requested_backtest_ticks()
+                if profiler is not None:
+                    profiler.record_tick(time.perf_counter() - tick_start)
         except StopIteration:
             return
         finally:
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+from bisect import bisect_left
+import logging
+import pandas as pd
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+# Upper bounds of the tick duration histogram buckets, in seconds. The last bucket holds the longer ticks.
+TICK_DURATION_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+def bucket_label(index: int) -> str:
+    if index < len(TICK_DURATION_BUCKETS):
+        return f"<{TICK_DURATION_BUCKETS[index] * 1e3:g}ms"
+    return f">{TICK_DURATION_BUCKETS[-1] * 1e3:g}ms"
+
+
+class IteratorTickStats:
+    """
+    Tick durations of one of the clock's iterators.
+    """
+    __slots__ = ("name", "ticks", "total_duration", "max_duration", "histogram")
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.ticks: int = 0
+        self.total_duration: float = 0.0
+        self.max_duration: float = 0.0
+        self.histogram: List[int] = [0] * (len(TICK_DURATION_BUCKETS) + 1)
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.ticks if self.ticks > 0 else 0.0
+
+    def record(self, duration: float):
+        self.ticks += 1
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+        self.histogram[bisect_left(TICK_DURATION_BUCKETS, duration)] += 1
+
+
+class ClockProfiler:
+    """
+    Collects the tick durations of every iterator of a clock, and the ticks which were late or missed because the
+    previous ticks took too long. Only collected while profiling is enabled on the clock.
+    """
+    _cp_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._cp_logger is None:
+            cls._cp_logger = logging.getLogger(__name__)
+        return cls._cp_logger
+
+    def __init__(self, tick_size: float, log_interval: float = 0.0, late_tick_threshold: Optional[float] = None):
+        """
+        :param tick_size: tick size of the clock
+        :param log_interval: interval between the statistics log lines, in seconds. 0 to disable them.
+        :param late_tick_threshold: delay after which a tick is counted as late, in seconds. Defaults to 10% of the
+        tick size.
+        """
+        self._tick_size: float = tick_size
+        self._late_tick_threshold: float = late_tick_threshold if late_tick_threshold is not None else tick_size * 0.1
+        self.log_interval: float = log_interval
+        self._iterator_stats: Dict[int, IteratorTickStats] = {}
+        self.reset()
+
+    def reset(self):
+        self._iterator_stats.clear()
+        self._start_time: float = time.time()
+        self._last_log_time: float = self._start_time
+        self._ticks: int = 0
+        self._late_ticks: int = 0
+        self._missed_ticks: int = 0
+        self._max_lateness: float = 0.0
+        self._total_tick_duration: float = 0.0
+        self._max_tick_duration: float = 0.0
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def late_ticks(self) -> int:
+        return self._late_ticks
+
+    @property
+    def missed_ticks(self) -> int:
+        return self._missed_ticks
+
+    @property
+    def max_lateness(self) -> float:
+        return self._max_lateness
+
+    @property
+    def max_tick_duration(self) -> float:
+        return self._max_tick_duration
+
+    @property
+    def iterator_stats(self) -> List[IteratorTickStats]:
+        return list(self._iterator_stats.values())
+
+    def record_iterator_tick(self, iterator: object, duration: float):
+        stats: Optional[IteratorTickStats] = self._iterator_stats.get(id(iterator))
+        if stats is None:
+            name: str = getattr(iterator, "display_name", None) or type(iterator).__name__
+            stats = self._iterator_stats[id(iterator)] = IteratorTickStats(name)
+        stats.record(duration)
+
+    def record_missed_ticks(self, missed_ticks: int):
+        """
+        :param missed_ticks: number of ticks skipped since the previous one, because it ran past them
+        """
+        self._missed_ticks += missed_ticks
+
+    def record_lateness(self, lateness: float):
+        """
+        :param lateness: delay between the scheduled time of a tick and its start, in seconds
+        """
+        if lateness > self._late_tick_threshold:
+            self._late_ticks += 1
+        if lateness > self._max_lateness:
+            self._max_lateness = lateness
+
+    def record_tick(self, duration: float):
+        """
+        :param duration: time taken by all the iterators in a tick, in seconds
+        """
+        self._ticks += 1
+        self._total_tick_duration += duration
+        if duration > self._max_tick_duration:
+            self._max_tick_duration = duration
+        if self.log_interval > 0:
+            now: float = time.time()
+            if now - self._last_log_time >= self.log_interval:
+                self._last_log_time = now
+                self.logger().info(self.summary())
+
+    def worst_offenders(self, count: int = 3) -> List[IteratorTickStats]:
+        """
+        Returns the iterators with the longest ticks.
+        """
+        return sorted(self._iterator_stats.values(), key=lambda stats: stats.max_duration, reverse=True)[:count]
+
+    def summary(self) -> str:
+        mean_duration: float = self._total_tick_duration / self._ticks if self._ticks > 0 else 0.0
+        offenders: str = ", ".join(f"{stats.name} {stats.max_duration * 1e3:.1f}ms"
+                                   for stats in self.worst_offenders())
+        return (f"Clock ticks: {self._ticks}, late: {self._late_ticks}, missed: {self._missed_ticks}, "
+                f"mean duration: {mean_duration * 1e3:.2f}ms, max duration: {self._max_tick_duration * 1e3:.1f}ms. "
+                f"Slowest iterators: {offenders or 'none'}.")
+
+    def iterator_stats_df(self) -> pd.DataFrame:
+        columns: List[str] = ["Iterator", "Ticks", "Mean (ms)", "Max (ms)"] + \
+            [bucket_label(i) for i in range(len(TICK_DURATION_BUCKETS) + 1)]
+        data: List[List] = [
+            [stats.name, stats.ticks, round(stats.mean_duration * 1e3, 3), round(stats.max_duration * 1e3, 3)] +
+            stats.histogram
+            for stats in sorted(self._iterator_stats.values(), key=lambda stats: stats.total_duration, reverse=True)
+        ]
+        return pd.DataFrame(data=data, columns=columns)
+
+    def report(self) -> str:
+        lines: List[str] = [f"  Profiled for {time.time() - self._start_time:.0f} seconds, "
+                            f"tick size {self._tick_size:g} seconds.",
+                            f"  {self.summary()}",
+                            f"  Max lateness: {self._max_lateness * 1e3:.1f}ms."]
+        if len(self._iterator_stats) > 0:
+            lines.extend(["", "  Tick durations:"] +
+                         ["    " + line for line in self.iterator_stats_df().to_string(index=False).split("\n")])
+        return "\n".join(lines)
@@ -1,4 +1,18 @@
 #include "LimitOrder.h"
+#include <cmath>
+
+// The price as a double, for matching orders without boxing their prices. NaN if the price is not a number.
+static double toDouble(PyObject *value) {
+    if (value == NULL) {
+        return NAN;
+    }
+    double retval = PyFloat_AsDouble(value);
+    if (retval == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return NAN;
+    }
+    return retval;
+}
 
 LimitOrder::LimitOrder() {
     this->clientOrderID = "";
@@ -8,6 +22,7 @@ LimitOrder::LimitOrder() {
     this->quoteCurrency = "";
     this->price = NULL;
     this->quantity = NULL;
+    this->priceValue = NAN;
 }
 
 LimitOrder::LimitOrder(std::string clientOrderID,
@@ -24,6 +39,7 @@ LimitOrder::LimitOrder(std::string clientOrderID,
     this->quoteCurrency = quoteCurrency;
     this->price = price;
     this->quantity = quantity;
+    this->priceValue = toDouble(price);
     Py_XINCREF(price);
     Py_XINCREF(quantity);
 }
@@ -36,6 +52,7 @@ LimitOrder::LimitOrder(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
+    this->priceValue = other.priceValue;
     Py_XINCREF(this->price);
     Py_XINCREF(this->quantity);
 }
@@ -55,6 +72,7 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
     this->quantity = other.quantity;
+    this->priceValue = other.priceValue;
     Py_XINCREF(this->price);
     Py_XINCREF(this->quantity);
 
@@ -97,3 +115,7 @@ PyObject *LimitOrder::getPrice() const {
 PyObject *LimitOrder::getQuantity() const {
     return this->quantity;
 }
+
+double LimitOrder::getPriceValue() const {
+    return this->priceValue;
+}
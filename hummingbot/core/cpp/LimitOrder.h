@@ -12,6 +12,7 @@ class LimitOrder {
     std::string quoteCurrency;
     PyObject *price;
     PyObject *quantity;
+    double priceValue;
 
     public:
         LimitOrder();
@@ -34,6 +35,7 @@ class LimitOrder {
         std::string getQuoteCurrency() const;
         PyObject *getPrice() const;
         PyObject *getQuantity() const;
+        double getPriceValue() const;
 };
 
 #endif
@@ -24,3 +24,4 @@ cdef extern from "../cpp/LimitOrder.h":
         string getQuoteCurrency()
         PyObject *getPrice()
         PyObject *getQuantity()
+        double getPriceValue()
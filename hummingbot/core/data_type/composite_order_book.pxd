@@ -1,8 +1,43 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+cimport numpy as np
+
+
+cdef class CompositeEntryCursor:
+    cdef:
+        CompositeOrderBook _order_book
+        bint _is_buy
+        set[OrderBookEntry] *_book
+        set[OrderBookEntry] *_traded_book
+        set[OrderBookEntry].iterator _book_it
+        set[OrderBookEntry].iterator _traded_it
+
+    cdef double c_consumed_amount(self, double price)
+    cdef bint c_next(self, OrderBookEntry *entry)
+
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_decay_traded_entries(self,
+                                vector[OrderBookEntry] &changes,
+                                set[OrderBookEntry] *book,
+                                set[OrderBookEntry] *traded_book)
+    cdef c_remove_outside_traded_entries(self)
+    cdef list c_simulate_fill(self, bint is_buy, double amount)
+    cdef size_t c_fill_depth_array(self, bint is_buy, np.ndarray[np.float64_t, ndim=2] output)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
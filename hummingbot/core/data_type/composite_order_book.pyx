@@ -1,18 +1,100 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from typing import (
+    Iterator,
+    List,
+)
 from libcpp.set cimport set
 from cython.operator cimport(
     postincrement as inc,
+    predecrement as dec,
     dereference as deref,
     address as ref
 )
+from libc.stdint cimport int64_t
 from libcpp.vector cimport vector
+cimport numpy as np
 
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+
+NaN = float("nan")
+
+
+cdef class CompositeEntryCursor:
+    """
+    Walks the composite entries of one side of a `CompositeOrderBook`, from the best price outwards, merging the real
+    order book levels with the amounts consumed by simulated fills. Only the levels walked are visited.
+
+    A cursor must not outlive changes to the order book it walks.
+    """
+    def __cinit__(self, CompositeOrderBook order_book, bint is_buy):
+        self._order_book = order_book
+        self._is_buy = is_buy
+        if is_buy:
+            self._book = ref(order_book._ask_book)
+            self._traded_book = ref(order_book._traded_order_book._ask_book)
+            self._book_it = self._book.begin()
+            self._traded_it = self._traded_book.begin()
+        else:
+            self._book = ref(order_book._bid_book)
+            self._traded_book = ref(order_book._traded_order_book._bid_book)
+            self._book_it = self._book.end()
+            self._traded_it = self._traded_book.end()
+
+    cdef double c_consumed_amount(self, double price):
+        """
+        Moves the traded entries iterator past `price`, and returns the amount consumed at that price.
+        """
+        cdef:
+            double traded_price
+        if self._is_buy:
+            while self._traded_it != self._traded_book.end():
+                traded_price = deref(self._traded_it).getPrice()
+                if traded_price > price:
+                    return 0
+                if traded_price == price:
+                    return deref(inc(self._traded_it)).getAmount()
+                inc(self._traded_it)
+        else:
+            while self._traded_it != self._traded_book.begin():
+                dec(self._traded_it)
+                traded_price = deref(self._traded_it).getPrice()
+                if traded_price < price:
+                    inc(self._traded_it)
+                    return 0
+                if traded_price == price:
+                    return deref(self._traded_it).getAmount()
+        return 0
+
+    cdef bint c_next(self, OrderBookEntry *entry):
+        """
+        Writes the next composite entry into `entry`. Returns False once the side is exhausted.
+        """
+        cdef:
+            double price
+            double amount
+        while True:
+            if self._is_buy:
+                if self._book_it == self._book.end():
+                    return False
+                entry[0] = deref(self._book_it)
+                inc(self._book_it)
+            else:
+                if self._book_it == self._book.begin():
+                    return False
+                dec(self._book_it)
+                entry[0] = deref(self._book_it)
+            if self._traded_book.empty():
+                return True
+            price = entry[0].getPrice()
+            amount = entry[0].getAmount() - self.c_consumed_amount(price)
+            if amount > 0:
+                entry[0] = OrderBookEntry(price, amount, entry[0].getUpdateId())
+                return True
 
 
 cdef class CompositeOrderBook(OrderBook):
@@ -20,6 +102,10 @@ cdef class CompositeOrderBook(OrderBook):
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
     Override the order book bid_entries, ask_entries methods to return the composite order book entries
+
+    The consumed amounts are kept in the traded order book, indexed by price. They decay as the real order book
+    changes: a diff that adds liquidity to a price level replenishes the amount consumed there, and the consumed
+    amount never exceeds the level's amount. Price levels that are removed, and snapshots, reset the consumption.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
@@ -35,46 +121,87 @@ cdef class CompositeOrderBook(OrderBook):
 
     def record_filled_order(self, order_fill_event):
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            set[OrderBookEntry].reverse_iterator bid_order_it = self._traded_order_book._bid_book.rbegin()
-            set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry entry
-
-        price = order_fill_event.price
-        amount = float(order_fill_event.amount)
-        timestamp = order_fill_event.timestamp
+            set[OrderBookEntry] *traded_book
+            set[OrderBookEntry].iterator traded_it
+            double price = float(order_fill_event.price)
+            double amount = float(order_fill_event.amount)
+            int64_t timestamp = <int64_t> order_fill_event.timestamp
 
         if order_fill_event.trade_type is TradeType.BUY:
-            while ask_order_it != self._traded_order_book._ask_book.end():
-                entry = deref(ask_order_it)
-                # price is in the order book, sum the amount
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is outside of the ask price range, break and insert the new filled ask order into the ask book
-                elif entry.getPrice() > price:
-                    break
-                # price is further up the ask price range, continue searching
-                elif entry.getPrice() < price:
-                    inc(ask_order_it)
-            cpp_asks.push_back(OrderBookEntry(price, amount, timestamp))
-
+            traded_book = ref(self._traded_order_book._ask_book)
         elif order_fill_event.trade_type is TradeType.SELL:
-            while bid_order_it != self._traded_order_book._bid_book.rend():
-                entry = deref(bid_order_it)
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is further down the bid price range, continue searching
-                elif entry.getPrice() > price:
-                    inc(bid_order_it)
-                # price is outside of the bid price range, break and insert the new filled order into the bid book
-                elif entry.getPrice() < price:
-                    break
-            cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
-
-        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+            traded_book = ref(self._traded_order_book._bid_book)
+        else:
+            return
+
+        # Sum the amount with the amount already consumed at the price.
+        traded_it = traded_book.find(OrderBookEntry(price, 0, 0))
+        if traded_it != traded_book.end():
+            amount += deref(traded_it).getAmount()
+            traded_book.erase(traded_it)
+        traded_book.insert(OrderBookEntry(price, amount, timestamp))
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        if not self._traded_order_book._bid_book.empty():
+            self.c_decay_traded_entries(bids, ref(self._bid_book), ref(self._traded_order_book._bid_book))
+        if not self._traded_order_book._ask_book.empty():
+            self.c_decay_traded_entries(asks, ref(self._ask_book), ref(self._traded_order_book._ask_book))
+        OrderBook.c_apply_diffs(self, bids, asks, update_id)
+        self.c_remove_outside_traded_entries()
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self.clear_traded_order_book()
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+
+    cdef c_decay_traded_entries(self,
+                                vector[OrderBookEntry] &changes,
+                                set[OrderBookEntry] *book,
+                                set[OrderBookEntry] *traded_book):
+        """
+        Updates the consumed amounts at the price levels about to be changed by `changes`.
+        """
+        cdef:
+            set[OrderBookEntry].iterator traded_it
+            set[OrderBookEntry].iterator book_it
+            double previous_amount
+            double new_amount
+            double consumed_amount
+            OrderBookEntry traded_entry
+
+        for change in changes:
+            traded_it = traded_book.find(change)
+            if traded_it == traded_book.end():
+                continue
+            traded_entry = deref(traded_it)
+            traded_book.erase(traded_it)
+            book_it = book.find(change)
+            previous_amount = deref(book_it).getAmount() if book_it != book.end() else 0
+            new_amount = change.getAmount()
+            consumed_amount = min(traded_entry.getAmount() - max(new_amount - previous_amount, 0), new_amount)
+            if consumed_amount > 0:
+                traded_book.insert(OrderBookEntry(traded_entry.getPrice(), consumed_amount, traded_entry.getUpdateId()))
+
+    cdef c_remove_outside_traded_entries(self):
+        """
+        Removes the consumed amounts at prices that are no longer within the order book, e.g. after the bid and ask
+        books have been truncated.
+        """
+        cdef:
+            set[OrderBookEntry] *traded_bids = ref(self._traded_order_book._bid_book)
+            set[OrderBookEntry] *traded_asks = ref(self._traded_order_book._ask_book)
+            set[OrderBookEntry].iterator traded_it
+
+        while not traded_bids.empty():
+            traded_it = traded_bids.end()
+            dec(traded_it)
+            if not self._bid_book.empty() and deref(traded_it).getPrice() <= self._best_bid:
+                break
+            traded_bids.erase(traded_it)
+        while not traded_asks.empty():
+            traded_it = traded_asks.begin()
+            if not self._ask_book.empty() and deref(traded_it).getPrice() >= self._best_ask:
+                break
+            traded_asks.erase(traded_it)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -84,115 +211,157 @@ cdef class CompositeOrderBook(OrderBook):
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, False)
+            OrderBookEntry entry
+        while cursor.c_next(ref(entry)):
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, True)
+            OrderBookEntry entry
+        while cursor.c_next(ref(entry)):
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
 
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
+    def simulate_buy(self, amount: float) -> List[OrderBookRow]:
+        return self.c_simulate_fill(True, amount)
+
+    def simulate_sell(self, amount: float) -> List[OrderBookRow]:
+        return self.c_simulate_fill(False, amount)
 
-            inc(order_it)
+    cdef list c_simulate_fill(self, bint is_buy, double amount):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            double amount_left = amount
+            list retval = []
+        while cursor.c_next(ref(entry)):
+            if entry.getAmount() < amount_left:
+                retval.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+                amount_left -= entry.getAmount()
+            else:
+                retval.append(OrderBookRow(entry.getPrice(), amount_left, entry.getUpdateId()))
+                break
+        return retval
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+    cdef size_t c_fill_depth_array(self, bint is_buy, np.ndarray[np.float64_t, ndim=2] output):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            size_t max_rows = output.shape[0]
+            size_t row = 0
+        while row < max_rows and cursor.c_next(ref(entry)):
+            output[row, 0] = entry.getPrice()
+            output[row, 1] = entry.getAmount()
+            output[row, 2] = entry.getUpdateId()
+            row += 1
+        return row
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
-        if deref(book).size() < 1:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+        if not cursor.c_next(ref(entry)):
             raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return entry.getPrice()
 
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
-            else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+    # The depth queries below walk the composite entries, so the simulated fills are taken into account.
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while cursor.c_next(ref(entry)):
+            cumulative_volume += entry.getAmount()
+            if cumulative_volume >= volume:
+                result_price = entry.getPrice()
+                break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+            double incremental_amount
+
+        while cursor.c_next(ref(entry)):
+            if total_volume + entry.getAmount() >= volume:
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * entry.getPrice()
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+            total_cost += entry.getAmount() * entry.getPrice()
+            total_volume += entry.getAmount()
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while cursor.c_next(ref(entry)):
+            cumulative_volume += entry.getAmount() * entry.getPrice()
+            if cumulative_volume >= quote_volume:
+                result_price = entry.getPrice()
+                break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        while cursor.c_next(ref(entry)):
+            row_amount = entry.getAmount()
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * entry.getPrice()
+            if cumulative_base_amount >= base_amount:
+                break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while cursor.c_next(ref(entry)):
+            if (is_buy and entry.getPrice() > price) or (not is_buy and entry.getPrice() < price):
+                break
+            cumulative_volume += entry.getAmount()
+            result_price = entry.getPrice()
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            CompositeEntryCursor cursor = CompositeEntryCursor(self, is_buy)
+            OrderBookEntry entry
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while cursor.c_next(ref(entry)):
+            if (is_buy and entry.getPrice() > price) or (not is_buy and entry.getPrice() < price):
+                break
+            cumulative_volume += entry.getAmount() * entry.getPrice()
+            result_price = entry.getPrice()
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
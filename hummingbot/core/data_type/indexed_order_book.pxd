@@ -0,0 +1,40 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.map cimport map
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+from .order_book_query_result cimport OrderBookQueryResult
+cimport numpy as np
+
+
+cdef class IndexedOrderBook(OrderBook):
+    cdef:
+        map[double, OrderBookEntry] _bid_levels
+        map[double, OrderBookEntry] _ask_levels
+        # Cumulative depth, best price first. Prices are stored as sort keys (negated for bids), so both sides are
+        # in ascending order and can be binary searched the same way.
+        vector[double] _bid_keys
+        vector[double] _bid_cum_amounts
+        vector[double] _bid_cum_quote_volumes
+        vector[double] _ask_keys
+        vector[double] _ask_cum_amounts
+        vector[double] _ask_cum_quote_volumes
+        bint _bid_depth_dirty
+        bint _ask_depth_dirty
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_truncate_overlap_entries(self)
+    cdef c_update_best_prices(self)
+    cdef c_rebuild_depth(self, bint is_buy)
+    cdef size_t c_get_depth(self, bint is_buy)
+    cdef size_t c_fill_depth_array(self, bint is_buy, np.ndarray[np.float64_t, ndim=2] output)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
@@ -0,0 +1,358 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from cython.operator cimport(
+    postincrement as inc,
+    dereference as deref,
+    address as ref
+)
+from typing import Iterator
+
+from .order_book_row import OrderBookRow
+
+NaN = float("nan")
+
+
+cdef inline size_t c_bisect_left(vector[double] *values, double target):
+    cdef:
+        size_t lo = 0
+        size_t hi = deref(values).size()
+        size_t mid
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if deref(values)[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+cdef inline size_t c_bisect_right(vector[double] *values, double target):
+    cdef:
+        size_t lo = 0
+        size_t hi = deref(values).size()
+        size_t mid
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if target < deref(values)[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+cdef class IndexedOrderBook(OrderBook):
+    """
+    Order book backend keyed by price level, for exchanges with very high diff rates.
+
+    Diffs update the amount of an existing price level in place, rather than erasing and re-inserting the entry. Depth
+    queries run against cumulative volume arrays, which are rebuilt lazily on the first query after a change, so
+    "price for volume X" style queries are binary searches instead of scans from the top of the book.
+
+    Connectors opt in by setting their data source's `order_book_create_function` to create this class.
+    """
+    def __init__(self, dex=False):
+        super().__init__(dex=dex)
+        self._bid_depth_dirty = True
+        self._ask_depth_dirty = True
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            if bid.getAmount() > 0:
+                self._bid_levels[bid.getPrice()] = bid
+            else:
+                self._bid_levels.erase(bid.getPrice())
+        for ask in asks:
+            if ask.getAmount() > 0:
+                self._ask_levels[ask.getPrice()] = ask
+            else:
+                self._ask_levels.erase(ask.getPrice())
+        if bids.size() > 0:
+            self._bid_depth_dirty = True
+        if asks.size() > 0:
+            self._ask_depth_dirty = True
+
+        self.c_truncate_overlap_entries()
+        self.c_update_best_prices()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Start with an empty order book, and then insert all entries.
+        self._bid_levels.clear()
+        self._ask_levels.clear()
+        for bid in bids:
+            self._bid_levels[bid.getPrice()] = bid
+        for ask in asks:
+            self._ask_levels[ask.getPrice()] = ask
+        self._bid_depth_dirty = True
+        self._ask_depth_dirty = True
+
+        if self._dex:
+            self.c_truncate_overlap_entries()
+
+        self._best_bid = self._best_ask = NaN
+        self.c_update_best_prices()
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
+    cdef c_truncate_overlap_entries(self):
+        """
+        Same rules as `truncateOverlapEntries()` in OrderBookEntry.cpp. For centralised exchanges, newer entries win.
+        For DEXes, the entry with the larger quote volume wins.
+        """
+        cdef:
+            map[double, OrderBookEntry].reverse_iterator bid_it
+            map[double, OrderBookEntry].iterator ask_it
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+            bint ask_wins
+
+        while not self._bid_levels.empty() and not self._ask_levels.empty():
+            bid_it = self._bid_levels.rbegin()
+            ask_it = self._ask_levels.begin()
+            top_bid = deref(bid_it).second
+            top_ask = deref(ask_it).second
+            if top_bid.getPrice() < top_ask.getPrice():
+                break
+            if self._dex:
+                ask_wins = not (top_bid.getAmount() * top_bid.getPrice() > top_ask.getAmount() * top_ask.getPrice())
+            else:
+                ask_wins = not (top_bid.getUpdateId() > top_ask.getUpdateId())
+            if ask_wins:
+                self._bid_levels.erase(top_bid.getPrice())
+                self._bid_depth_dirty = True
+            else:
+                self._ask_levels.erase(ask_it)
+                self._ask_depth_dirty = True
+
+    cdef c_update_best_prices(self):
+        # Record the current best prices, for faster c_get_price() calls.
+        if not self._bid_levels.empty():
+            self._best_bid = deref(self._bid_levels.rbegin()).first
+        if not self._ask_levels.empty():
+            self._best_ask = deref(self._ask_levels.begin()).first
+
+    cdef c_rebuild_depth(self, bint is_buy):
+        cdef:
+            map[double, OrderBookEntry].iterator ask_it
+            map[double, OrderBookEntry].reverse_iterator bid_it
+            vector[double] *keys
+            vector[double] *cum_amounts
+            vector[double] *cum_quote_volumes
+            double cumulative_amount = 0
+            double cumulative_quote_volume = 0
+            double price
+            double amount
+
+        if is_buy:
+            keys = ref(self._ask_keys)
+            cum_amounts = ref(self._ask_cum_amounts)
+            cum_quote_volumes = ref(self._ask_cum_quote_volumes)
+        else:
+            keys = ref(self._bid_keys)
+            cum_amounts = ref(self._bid_cum_amounts)
+            cum_quote_volumes = ref(self._bid_cum_quote_volumes)
+        keys.clear()
+        cum_amounts.clear()
+        cum_quote_volumes.clear()
+
+        if is_buy:
+            keys.reserve(self._ask_levels.size())
+            cum_amounts.reserve(self._ask_levels.size())
+            cum_quote_volumes.reserve(self._ask_levels.size())
+            ask_it = self._ask_levels.begin()
+            while ask_it != self._ask_levels.end():
+                price = deref(ask_it).first
+                amount = deref(ask_it).second.getAmount()
+                cumulative_amount += amount
+                cumulative_quote_volume += amount * price
+                keys.push_back(price)
+                cum_amounts.push_back(cumulative_amount)
+                cum_quote_volumes.push_back(cumulative_quote_volume)
+                inc(ask_it)
+            self._ask_depth_dirty = False
+        else:
+            keys.reserve(self._bid_levels.size())
+            cum_amounts.reserve(self._bid_levels.size())
+            cum_quote_volumes.reserve(self._bid_levels.size())
+            bid_it = self._bid_levels.rbegin()
+            while bid_it != self._bid_levels.rend():
+                price = deref(bid_it).first
+                amount = deref(bid_it).second.getAmount()
+                cumulative_amount += amount
+                cumulative_quote_volume += amount * price
+                keys.push_back(-price)
+                cum_amounts.push_back(cumulative_amount)
+                cum_quote_volumes.push_back(cumulative_quote_volume)
+                inc(bid_it)
+            self._bid_depth_dirty = False
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            map[double, OrderBookEntry].reverse_iterator it = self._bid_levels.rbegin()
+            OrderBookEntry entry
+        while it != self._bid_levels.rend():
+            entry = deref(it).second
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            map[double, OrderBookEntry].iterator it = self._ask_levels.begin()
+            OrderBookEntry entry
+        while it != self._ask_levels.end():
+            entry = deref(it).second
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
+
+    cdef size_t c_get_depth(self, bint is_buy):
+        return self._ask_levels.size() if is_buy else self._bid_levels.size()
+
+    cdef size_t c_fill_depth_array(self, bint is_buy, np.ndarray[np.float64_t, ndim=2] output):
+        cdef:
+            size_t max_rows = output.shape[0]
+            size_t row = 0
+            double *data = <double *> output.data
+            map[double, OrderBookEntry].iterator ask_it = self._ask_levels.begin()
+            map[double, OrderBookEntry].reverse_iterator bid_it = self._bid_levels.rbegin()
+
+        if is_buy:
+            while row < max_rows and ask_it != self._ask_levels.end():
+                data[row * 3] = deref(ask_it).second.getPrice()
+                data[row * 3 + 1] = deref(ask_it).second.getAmount()
+                data[row * 3 + 2] = <double> deref(ask_it).second.getUpdateId()
+                row += 1
+                inc(ask_it)
+        else:
+            while row < max_rows and bid_it != self._bid_levels.rend():
+                data[row * 3] = deref(bid_it).second.getPrice()
+                data[row * 3 + 1] = deref(bid_it).second.getAmount()
+                data[row * 3 + 2] = <double> deref(bid_it).second.getUpdateId()
+                row += 1
+                inc(bid_it)
+        return row
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            map[double, OrderBookEntry] *book = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+        if deref(book).size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            vector[double] *keys
+            vector[double] *cum_amounts
+            size_t index
+
+        if (self._ask_depth_dirty if is_buy else self._bid_depth_dirty):
+            self.c_rebuild_depth(is_buy)
+        keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+        cum_amounts = ref(self._ask_cum_amounts) if is_buy else ref(self._bid_cum_amounts)
+
+        index = c_bisect_left(cum_amounts, volume)
+        if index < cum_amounts.size():
+            return OrderBookQueryResult(NaN, volume, abs(deref(keys)[index]), volume)
+        return OrderBookQueryResult(NaN, volume, NaN, min(cum_amounts.back() if index > 0 else 0, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            vector[double] *keys
+            vector[double] *cum_amounts
+            vector[double] *cum_quote_volumes
+            size_t index
+            double total_cost = 0
+            double total_volume = 0
+
+        if (self._ask_depth_dirty if is_buy else self._bid_depth_dirty):
+            self.c_rebuild_depth(is_buy)
+        keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+        cum_amounts = ref(self._ask_cum_amounts) if is_buy else ref(self._bid_cum_amounts)
+        cum_quote_volumes = ref(self._ask_cum_quote_volumes) if is_buy else ref(self._bid_cum_quote_volumes)
+
+        index = c_bisect_left(cum_amounts, volume)
+        if index < cum_amounts.size():
+            if index > 0:
+                total_cost = deref(cum_quote_volumes)[index - 1]
+                total_volume = deref(cum_amounts)[index - 1]
+            total_cost += (volume - total_volume) * abs(deref(keys)[index])
+            return OrderBookQueryResult(NaN, volume, total_cost / volume, volume)
+        return OrderBookQueryResult(NaN, volume, NaN, min(cum_amounts.back() if index > 0 else 0, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            vector[double] *keys
+            vector[double] *cum_quote_volumes
+            size_t index
+
+        if (self._ask_depth_dirty if is_buy else self._bid_depth_dirty):
+            self.c_rebuild_depth(is_buy)
+        keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+        cum_quote_volumes = ref(self._ask_cum_quote_volumes) if is_buy else ref(self._bid_cum_quote_volumes)
+
+        index = c_bisect_left(cum_quote_volumes, quote_volume)
+        if index < cum_quote_volumes.size():
+            return OrderBookQueryResult(NaN, quote_volume, abs(deref(keys)[index]), quote_volume)
+        return OrderBookQueryResult(NaN, quote_volume, NaN,
+                                    min(cum_quote_volumes.back() if index > 0 else 0, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            vector[double] *keys
+            vector[double] *cum_amounts
+            vector[double] *cum_quote_volumes
+            size_t index
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+
+        if (self._ask_depth_dirty if is_buy else self._bid_depth_dirty):
+            self.c_rebuild_depth(is_buy)
+        keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+        cum_amounts = ref(self._ask_cum_amounts) if is_buy else ref(self._bid_cum_amounts)
+        cum_quote_volumes = ref(self._ask_cum_quote_volumes) if is_buy else ref(self._bid_cum_quote_volumes)
+
+        index = c_bisect_left(cum_amounts, base_amount)
+        if index > 0:
+            cumulative_volume = deref(cum_quote_volumes)[index - 1]
+            cumulative_base_amount = deref(cum_amounts)[index - 1]
+        if index < cum_amounts.size():
+            cumulative_volume += (base_amount - cumulative_base_amount) * abs(deref(keys)[index])
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            vector[double] *keys
+            vector[double] *cum_amounts
+            size_t index
+
+        if (self._ask_depth_dirty if is_buy else self._bid_depth_dirty):
+            self.c_rebuild_depth(is_buy)
+        keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+        cum_amounts = ref(self._ask_cum_amounts) if is_buy else ref(self._bid_cum_amounts)
+
+        # Number of levels at or better than the query price.
+        index = c_bisect_right(keys, price if is_buy else -price)
+        if index == 0:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price, NaN, abs(deref(keys)[index - 1]), deref(cum_amounts)[index - 1])
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            vector[double] *keys
+            vector[double] *cum_quote_volumes
+            size_t index
+
+        if (self._ask_depth_dirty if is_buy else self._bid_depth_dirty):
+            self.c_rebuild_depth(is_buy)
+        keys = ref(self._ask_keys) if is_buy else ref(self._bid_keys)
+        cum_quote_volumes = ref(self._ask_cum_quote_volumes) if is_buy else ref(self._bid_cum_quote_volumes)
+
+        index = c_bisect_right(keys, price if is_buy else -price)
+        if index == 0:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price, NaN, abs(deref(keys)[index - 1]), deref(cum_quote_volumes)[index - 1])
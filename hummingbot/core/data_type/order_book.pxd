@@ -26,10 +26,19 @@ cdef class OrderBook(PubSub):
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef int64_t c_numpy_to_entries(self,
+                                    np.ndarray[np.float64_t, ndim=2] bids_array,
+                                    np.ndarray[np.float64_t, ndim=2] asks_array,
+                                    vector[OrderBookEntry] &cpp_bids,
+                                    vector[OrderBookEntry] &cpp_asks)
+    cdef size_t c_get_depth(self, bint is_buy)
+    cdef size_t c_fill_depth_array(self, bint is_buy, np.ndarray[np.float64_t, ndim=2] output)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -35,6 +35,7 @@ NaN = float("nan")
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.UpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -92,6 +93,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -132,6 +134,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -168,12 +171,76 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.depth_snapshot()
+
+    def depth_snapshot(self, max_levels: int = -1) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Same as `snapshot`, but only includes the top `max_levels` levels of each side if `max_levels` is not negative.
+        """
+        bids_df = pd.DataFrame(data=self.bid_depth_array(max_levels), columns=OrderBookRow._fields, copy=False)
+        asks_df = pd.DataFrame(data=self.ask_depth_array(max_levels), columns=OrderBookRow._fields, copy=False)
         return bids_df, asks_df
 
+    def bid_depth_array(self, max_levels: int = -1, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Copies the bid levels, best first, into a float64 array of shape (n, 3) with [price, amount, update_id]
+        columns, without creating any per level Python objects.
+
+        :param max_levels: number of levels to copy, all levels if negative
+        :param out: optional preallocated C-contiguous float64 array with 3 columns, reused across calls
+        :return: view of the filled rows
+        """
+        return self._fill_depth_array(False, max_levels, out)
+
+    def ask_depth_array(self, max_levels: int = -1, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Same as `bid_depth_array()`, for the ask levels, best first.
+        """
+        return self._fill_depth_array(True, max_levels, out)
+
+    def _fill_depth_array(self, bint is_buy, int64_t max_levels, object out) -> np.ndarray:
+        cdef:
+            size_t rows = self.c_get_depth(is_buy)
+            size_t filled
+        if 0 <= max_levels < rows:
+            rows = max_levels
+        if out is None:
+            out = np.empty((rows, 3), dtype=np.float64)
+        elif (not isinstance(out, np.ndarray) or out.dtype != np.float64 or out.ndim != 2 or out.shape[1] != 3 or
+                not out.flags.c_contiguous):
+            raise ValueError("Output array must be a C-contiguous float64 array of shape (n, 3).")
+        elif <size_t>out.shape[0] > rows:
+            out = out[:rows]
+        filled = self.c_fill_depth_array(is_buy, out)
+        return out[:filled]
+
+    cdef size_t c_get_depth(self, bint is_buy):
+        return self._ask_book.size() if is_buy else self._bid_book.size()
+
+    cdef size_t c_fill_depth_array(self, bint is_buy, np.ndarray[np.float64_t, ndim=2] output):
+        cdef:
+            size_t max_rows = output.shape[0]
+            size_t row = 0
+            double *data = <double *> output.data
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if is_buy:
+            while row < max_rows and ask_it != self._ask_book.end():
+                data[row * 3] = deref(ask_it).getPrice()
+                data[row * 3 + 1] = deref(ask_it).getAmount()
+                data[row * 3 + 2] = <double> deref(ask_it).getUpdateId()
+                row += 1
+                inc(ask_it)
+        else:
+            while row < max_rows and bid_it != self._bid_book.rend():
+                data[row * 3] = deref(bid_it).getPrice()
+                data[row * 3 + 1] = deref(bid_it).getAmount()
+                data[row * 3 + 2] = <double> deref(bid_it).getUpdateId()
+                row += 1
+                inc(bid_it)
+        return row
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -205,16 +272,19 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If `update_id` is not given, the largest update ID in the arrays is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -222,26 +292,23 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = self.c_numpy_to_entries(bids_array, asks_array, cpp_bids, cpp_asks)
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = -1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+
+        If `update_id` is not given, the largest update ID in the arrays is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -249,15 +316,36 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
+            int64_t last_update_id = self.c_numpy_to_entries(bids_array, asks_array, cpp_bids, cpp_asks)
+
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    cdef int64_t c_numpy_to_entries(self,
+                                    np.ndarray[np.float64_t, ndim=2] bids_array,
+                                    np.ndarray[np.float64_t, ndim=2] asks_array,
+                                    vector[OrderBookEntry] &cpp_bids,
+                                    vector[OrderBookEntry] &cpp_asks):
+        """
+        Converts [price, amount, update_id] rows into order book entries, and returns the largest update ID seen.
+        """
+        cdef:
+            Py_ssize_t i
+            int64_t row_update_id
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            row_update_id = <int64_t> bids_array[i, 2]
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], row_update_id))
+            if row_update_id > last_update_id:
+                last_update_id = row_update_id
+        for i in range(asks_array.shape[0]):
+            row_update_id = <int64_t> asks_array[i, 2]
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], row_update_id))
+            if row_update_id > last_update_id:
+                last_update_id = row_update_id
+        return last_update_id
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -319,19 +407,26 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
 
+        # Walk the C++ books directly, so no Python objects are created per price level.
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -340,30 +435,37 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+            double row_price
+            double row_amount
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                row_price = deref(ask_it).getPrice()
+                row_amount = deref(ask_it).getAmount()
+                if total_volume + row_amount >= volume:
+                    total_cost += (volume - total_volume) * row_price
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += row_amount * row_price
+                total_volume += row_amount
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                row_price = deref(bid_it).getPrice()
+                row_amount = deref(bid_it).getAmount()
+                if total_volume + row_amount >= volume:
+                    total_cost += (volume - total_volume) * row_price
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += row_amount * row_price
+                total_volume += row_amount
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -371,19 +473,25 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -392,25 +500,31 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                row_amount = deref(ask_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(ask_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                row_amount = deref(bid_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(bid_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -418,19 +532,25 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -438,19 +558,25 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -495,6 +621,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.c_apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.c_apply_numpy_diffs(diff.bids_array, diff.asks_array, diff.update_id)
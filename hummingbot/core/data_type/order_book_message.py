@@ -3,6 +3,7 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
+import numpy as np
 from typing import (
     Dict,
     List,
@@ -10,6 +11,7 @@ from typing import (
 )
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_row_packer import pack_order_book_rows
 
 
 class OrderBookMessageType(Enum):
@@ -70,6 +72,35 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def asks_array(self) -> np.ndarray:
+        """
+        The asks as a float64 array with [price, amount, update_id] columns, ready for `OrderBook.apply_numpy_diffs()`.
+        Parsed on first access and cached.
+        """
+        packed: Optional[np.ndarray] = self.__dict__.get("_asks_array")
+        if packed is None:
+            packed = self.__dict__["_asks_array"] = self._pack_side("asks")
+        return packed
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bids as a float64 array with [price, amount, update_id] columns, ready for `OrderBook.apply_numpy_diffs()`.
+        Parsed on first access and cached.
+        """
+        packed: Optional[np.ndarray] = self.__dict__.get("_bids_array")
+        if packed is None:
+            packed = self.__dict__["_bids_array"] = self._pack_side("bids")
+        return packed
+
+    def _pack_side(self, side: str) -> np.ndarray:
+        if getattr(type(self), side) is not getattr(OrderBookMessage, side):
+            # Exchange specific message classes parse their own content format.
+            rows: List[OrderBookRow] = getattr(self, side)
+            return np.array(rows, dtype=np.float64).reshape(len(rows), 3)
+        return pack_order_book_rows(self.content[side], self.update_id)
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
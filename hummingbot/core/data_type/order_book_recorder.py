@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+
+import logging
+import os
+import struct
+import numpy as np
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.logger import HummingbotLogger
+
+# Order book recording files are append-only sequences of records, after a short file header.
+#
+# Every record is a fixed size header, followed by its price levels stored column by column:
+#   record type (uint8), timestamp (float64), update id (int64), bid level count (uint32), ask level count (uint32)
+#   bid prices, bid amounts, bid update ids, ask prices, ask amounts, ask update ids (float64 each)
+#
+# Record types are the `OrderBookMessageType` values. A trade record has a single level: on the bid side for a buy
+# trade, on the ask side for a sell trade.
+#
+# Version 1 files have no update id columns, their levels take the update id of their record.
+RECORDING_FILE_MAGIC: bytes = b"HBOB"
+RECORDING_FILE_VERSION: int = 2
+RECORDING_FILE_EXTENSION: str = ".obr"
+FILE_HEADER: struct.Struct = struct.Struct("<4sH")
+RECORD_HEADER: struct.Struct = struct.Struct("<BdqII")
+
+
+class OrderBookRecord(NamedTuple):
+    type: OrderBookMessageType
+    timestamp: float
+    update_id: int
+    # [price, amount, update_id] arrays, as accepted by `OrderBook.apply_numpy_snapshot()/apply_numpy_diffs()`
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+def recording_file_path(data_dir: str, trading_pair: str) -> str:
+    return os.path.join(data_dir, f"{trading_pair}{RECORDING_FILE_EXTENSION}")
+
+
+class OrderBookRecordWriter:
+    """
+    Appends order book records to a single trading pair's recording file.
+
+    An existing file is only appended to if it has the header of the current version. Any other file is moved aside
+    to `<path>.<n>`, and the records are written to a new file at `path`.
+    """
+    _obrw_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obrw_logger is None:
+            cls._obrw_logger = logging.getLogger(__name__)
+        return cls._obrw_logger
+
+    def __init__(self, path: str):
+        self._path: str = path
+        if os.path.exists(path) and os.path.getsize(path) > 0 and not self._has_current_header(path):
+            rotated_path: str = self._rotate(path)
+            self.logger().warning(f"{path} is not a version {RECORDING_FILE_VERSION} order book recording file. "
+                                  f"It has been moved to {rotated_path}.")
+        is_new_file: bool = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file: BinaryIO = open(path, "ab")
+        if is_new_file:
+            self._file.write(FILE_HEADER.pack(RECORDING_FILE_MAGIC, RECORDING_FILE_VERSION))
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @staticmethod
+    def _has_current_header(path: str) -> bool:
+        with open(path, "rb") as f:
+            return f.read(FILE_HEADER.size) == FILE_HEADER.pack(RECORDING_FILE_MAGIC, RECORDING_FILE_VERSION)
+
+    @staticmethod
+    def _rotate(path: str) -> str:
+        index: int = 1
+        while os.path.exists(f"{path}.{index}"):
+            index += 1
+        rotated_path: str = f"{path}.{index}"
+        os.rename(path, rotated_path)
+        return rotated_path
+
+    def write(self,
+              record_type: OrderBookMessageType,
+              timestamp: float,
+              update_id: int,
+              bids: np.ndarray,
+              asks: np.ndarray):
+        """
+        :param bids: bid levels, as a [price, amount, update_id] array, or a [price, amount] array whose levels take
+        the record's update id
+        :param asks: ask levels, in the same format as the bids
+        """
+        self._file.write(RECORD_HEADER.pack(record_type.value, timestamp, int(update_id), len(bids), len(asks)))
+        for side in (bids, asks):
+            if len(side) > 0:
+                self._file.write(np.ascontiguousarray(side[:, 0], dtype=np.float64).tobytes())
+                self._file.write(np.ascontiguousarray(side[:, 1], dtype=np.float64).tobytes())
+                update_ids: np.ndarray = (side[:, 2] if side.shape[1] > 2
+                                          else np.full(len(side), update_id, dtype=np.float64))
+                self._file.write(np.ascontiguousarray(update_ids, dtype=np.float64).tobytes())
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class OrderBookRecordReader:
+    """
+    Reads the records of a recording file in order.
+
+    A truncated record at the end of the file, e.g. left by a recorder that did not shut down cleanly, is ignored.
+    """
+
+    def __init__(self, path: str):
+        self._path: str = path
+        self._file: BinaryIO = open(path, "rb")
+        magic, version = FILE_HEADER.unpack(self._file.read(FILE_HEADER.size))
+        if magic != RECORDING_FILE_MAGIC:
+            raise ValueError(f"{path} is not an order book recording file.")
+        if version not in (1, RECORDING_FILE_VERSION):
+            raise ValueError(f"Unsupported order book recording file version {version} in {path}.")
+        # Number of float64 columns per level.
+        self._level_columns: int = 2 if version == 1 else 3
+        self._next_record: Optional[OrderBookRecord] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _read_record(self) -> Optional[OrderBookRecord]:
+        header: bytes = self._file.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return None
+        record_type, timestamp, update_id, bid_count, ask_count = RECORD_HEADER.unpack(header)
+        payload_size: int = (bid_count + ask_count) * self._level_columns * 8
+        payload: bytes = self._file.read(payload_size)
+        if len(payload) < payload_size:
+            return None
+        columns: np.ndarray = np.frombuffer(payload, dtype=np.float64)
+        bids: np.ndarray = np.empty((bid_count, 3), dtype=np.float64)
+        asks: np.ndarray = np.empty((ask_count, 3), dtype=np.float64)
+        bids[:, 2] = update_id
+        asks[:, 2] = update_id
+        # Columns of each side, one after the other.
+        bid_columns: np.ndarray = columns[:bid_count * self._level_columns].reshape(self._level_columns, bid_count)
+        ask_columns: np.ndarray = columns[bid_count * self._level_columns:].reshape(self._level_columns, ask_count)
+        bids[:, :self._level_columns] = bid_columns.T
+        asks[:, :self._level_columns] = ask_columns.T
+        return OrderBookRecord(OrderBookMessageType(record_type), timestamp, update_id, bids, asks)
+
+    def peek(self) -> Optional[OrderBookRecord]:
+        """
+        Returns the next record without consuming it, or None at the end of the file.
+        """
+        if self._next_record is None:
+            self._next_record = self._read_record()
+        return self._next_record
+
+    def read_until(self, timestamp: float) -> Iterator[OrderBookRecord]:
+        """
+        Yields the next records, up to and including those recorded at `timestamp`.
+        """
+        while True:
+            record: Optional[OrderBookRecord] = self.peek()
+            if record is None or record.timestamp > timestamp:
+                return
+            self._next_record = None
+            yield record
+
+    def seek_snapshot(self, timestamp: float) -> Optional[OrderBookRecord]:
+        """
+        Moves to the last snapshot recorded at or before `timestamp`, or to the first snapshot if there is none, and
+        returns it. Only the record headers are read while seeking.
+
+        :return: the snapshot record, which is consumed, or None if the file contains no snapshot at all
+        """
+        self._next_record = None
+        self._file.seek(FILE_HEADER.size)
+        snapshot_position: int = -1
+        while True:
+            position: int = self._file.tell()
+            header: bytes = self._file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                break
+            record_type, record_timestamp, _, bid_count, ask_count = RECORD_HEADER.unpack(header)
+            if record_type == OrderBookMessageType.SNAPSHOT.value:
+                if record_timestamp > timestamp and snapshot_position >= 0:
+                    break
+                snapshot_position = position
+                if record_timestamp > timestamp:
+                    break
+            self._file.seek((bid_count + ask_count) * self._level_columns * 8, os.SEEK_CUR)
+        if snapshot_position < 0:
+            return None
+        self._file.seek(snapshot_position)
+        return self._read_record()
+
+    def __iter__(self) -> Iterator[OrderBookRecord]:
+        return self.read_until(float("inf"))
+
+    def close(self):
+        self._file.close()
+
+
+class OrderBookRecorder:
+    """
+    Records the order book updates of an `OrderBookTracker` into one recording file per trading pair, for replaying
+    with `OrderBookReplayTracker`.
+
+    Diffs are recorded as applied by the tracker, so coalesced diffs take a single record. A snapshot of the order
+    book is recorded when tracking starts, whenever the tracker applies a snapshot message, and at least every
+    `snapshot_interval` seconds, so a replay can start anywhere in a recording without replaying it from the start.
+    """
+    def __init__(self, data_dir: str, snapshot_interval: float = 60.0, snapshot_depth: int = -1):
+        """
+        :param data_dir: directory for the recording files, created if missing
+        :param snapshot_interval: maximum number of seconds between two snapshot records of a trading pair
+        :param snapshot_depth: number of price levels per side in snapshot records, -1 for all of them
+        """
+        os.makedirs(data_dir, exist_ok=True)
+        self._data_dir: str = data_dir
+        self._snapshot_interval: float = snapshot_interval
+        self._snapshot_depth: int = snapshot_depth
+        self._writers: Dict[str, OrderBookRecordWriter] = {}
+        self._last_snapshot_timestamps: Dict[str, float] = {}
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    def _get_writer(self, trading_pair: str) -> OrderBookRecordWriter:
+        writer: Optional[OrderBookRecordWriter] = self._writers.get(trading_pair)
+        if writer is None:
+            writer = self._writers[trading_pair] = OrderBookRecordWriter(
+                recording_file_path(self._data_dir, trading_pair)
+            )
+        return writer
+
+    def record_snapshot(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        writer: OrderBookRecordWriter = self._get_writer(trading_pair)
+        writer.write(OrderBookMessageType.SNAPSHOT,
+                     timestamp,
+                     max(order_book.snapshot_uid, order_book.last_diff_uid),
+                     order_book.bid_depth_array(self._snapshot_depth),
+                     order_book.ask_depth_array(self._snapshot_depth))
+        writer.flush()
+        self._last_snapshot_timestamps[trading_pair] = timestamp
+
+    def record_diff(self,
+                    trading_pair: str,
+                    order_book: OrderBook,
+                    bids: np.ndarray,
+                    asks: np.ndarray,
+                    update_id: int,
+                    timestamp: float):
+        """
+        Records a diff, after it has been applied to `order_book`.
+        """
+        if trading_pair not in self._last_snapshot_timestamps:
+            self.record_snapshot(trading_pair, order_book, timestamp)
+            return
+        self._get_writer(trading_pair).write(OrderBookMessageType.DIFF, timestamp, update_id, bids, asks)
+        if timestamp - self._last_snapshot_timestamps[trading_pair] >= self._snapshot_interval:
+            self.record_snapshot(trading_pair, order_book, timestamp)
+
+    def record_trade(self, trade_event: OrderBookTradeEvent, timestamp: float):
+        trade_row: np.ndarray = np.array([[float(trade_event.price), float(trade_event.amount)]], dtype=np.float64)
+        no_rows: np.ndarray = np.empty((0, 2), dtype=np.float64)
+        is_buy: bool = trade_event.type is TradeType.BUY
+        self._get_writer(trade_event.trading_pair).write(OrderBookMessageType.TRADE,
+                                                         timestamp,
+                                                         0,
+                                                         trade_row if is_buy else no_rows,
+                                                         no_rows if is_buy else trade_row)
+
+    def flush(self):
+        for writer in self._writers.values():
+            writer.flush()
+
+    def close(self):
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        self._last_snapshot_timestamps.clear()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import asyncio
+import os
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_recorder import (
+    RECORDING_FILE_EXTENSION,
+    OrderBookRecord,
+    OrderBookRecordReader,
+    recording_file_path,
+)
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Reads the order book recording files written by `OrderBookRecorder`.
+
+    Recorded updates are not streamed through the tracker's message queues. They are applied synchronously by
+    `OrderBookReplayTracker.replay_until()`, so a replay runs as fast as the clock ticks.
+    """
+
+    def __init__(self, data_dir: str, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self._data_dir: str = data_dir
+        self._readers: Dict[str, OrderBookRecordReader] = {}
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    @staticmethod
+    def recorded_trading_pairs(data_dir: str) -> List[str]:
+        return sorted(file_name[:-len(RECORDING_FILE_EXTENSION)]
+                      for file_name in os.listdir(data_dir)
+                      if file_name.endswith(RECORDING_FILE_EXTENSION))
+
+    async def get_trading_pairs(self) -> List[str]:
+        return self.recorded_trading_pairs(self._data_dir)
+
+    def _get_reader(self, trading_pair: str) -> OrderBookRecordReader:
+        reader: Optional[OrderBookRecordReader] = self._readers.get(trading_pair)
+        if reader is None:
+            reader = self._readers[trading_pair] = OrderBookRecordReader(
+                recording_file_path(self._data_dir, trading_pair)
+            )
+        return reader
+
+    def create_order_book(self, trading_pair: str, timestamp: float) -> OrderBook:
+        """
+        Creates the order book from the last snapshot recorded at or before `timestamp`, and positions the replay of
+        the trading pair right after that snapshot.
+        """
+        snapshot: Optional[OrderBookRecord] = self._get_reader(trading_pair).seek_snapshot(timestamp)
+        if snapshot is None:
+            raise ValueError(f"No order book snapshot recorded for {trading_pair} in {self._data_dir}.")
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_numpy_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        return order_book
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.create_order_book(trading_pair, float("-inf"))
+
+    def read_until(self, trading_pair: str, timestamp: float) -> Iterator[OrderBookRecord]:
+        return self._get_reader(trading_pair).read_until(timestamp)
+
+    def is_replay_finished(self, trading_pair: str) -> bool:
+        return self._get_reader(trading_pair).peek() is None
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    def close(self):
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+import numpy as np
+from typing import List
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class OrderBookReplayTracker(OrderBookTracker):
+    """
+    Order book tracker for backtesting, which replays recorded order books instead of listening to an exchange.
+
+    Usage, with a `Clock` in `ClockMode.BACKTEST` mode:
+
+        data_source = OrderBookReplayDataSource(data_dir, trading_pairs)
+        tracker = OrderBookReplayTracker(data_source, trading_pairs, "binance", start_time)
+        market = PaperTradeExchange(tracker, config, BinanceExchange)
+        clock.add_iterator(OrderBookReplayIterator(tracker))
+        clock.add_iterator(market)
+        clock.add_iterator(strategy)
+        clock.backtest()
+
+    The exchange name is the one of the recorded exchange, which the paper trade market uses for trading fees. The
+    replay iterator must be added before the market, so that every tick sees the order books as of the tick.
+    """
+
+    def __init__(self,
+                 data_source: OrderBookReplayDataSource,
+                 trading_pairs: List[str],
+                 exchange_name: str,
+                 start_time: float = float("-inf")):
+        super().__init__(data_source, trading_pairs)
+        self._start_time: float = start_time
+        self._exchange_name: str = exchange_name
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def replay_finished(self) -> bool:
+        return all(self._data_source.is_replay_finished(trading_pair) for trading_pair in self._trading_pairs)
+
+    def start(self):
+        """
+        Creates the order books as they were at the start time, from the closest snapshots. The trades recorded
+        between these snapshots and the start time only update the last trade prices.
+
+        The market must be created first, since it can change the data source's order book create function.
+        """
+        self.stop()
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.create_order_book(trading_pair, self._start_time)
+        self.replay_until(self._start_time, emit_trades=False)
+        self._order_books_initialized.set()
+
+    def stop(self):
+        super().stop()
+        self._order_books.clear()
+
+    def replay_until(self, timestamp: float, emit_trades: bool = True):
+        """
+        Applies the updates recorded up to `timestamp` to the order books.
+
+        :param emit_trades: whether recorded trades trigger order book trade events, e.g. to fill paper trade limit
+                            orders, or only update the last trade price
+        """
+        for trading_pair, order_book in self._order_books.items():
+            for record in self._data_source.read_until(trading_pair, timestamp):
+                if record.type is OrderBookMessageType.DIFF:
+                    order_book.apply_numpy_diffs(record.bids, record.asks, record.update_id)
+                elif record.type is OrderBookMessageType.SNAPSHOT:
+                    order_book.apply_numpy_snapshot(record.bids, record.asks, record.update_id)
+                else:
+                    self._apply_trade_record(trading_pair, order_book, record.timestamp, record.bids, record.asks,
+                                             emit_trades)
+
+    @staticmethod
+    def _apply_trade_record(trading_pair: str,
+                            order_book: OrderBook,
+                            timestamp: float,
+                            bids: np.ndarray,
+                            asks: np.ndarray,
+                            emit_trade: bool):
+        is_buy: bool = len(bids) > 0
+        price, amount = (bids if is_buy else asks)[0, :2]
+        if not emit_trade:
+            order_book.last_trade_price = float(price)
+            return
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=trading_pair,
+            timestamp=timestamp,
+            price=float(price),
+            amount=float(amount),
+            type=TradeType.BUY if is_buy else TradeType.SELL
+        ))
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Replays the recorded order book updates of an `OrderBookReplayTracker` on every clock tick. Ends the backtest once
+    all recordings are replayed.
+    """
+
+    def __init__(self, tracker: OrderBookReplayTracker):
+        super().__init__()
+        self._tracker: OrderBookReplayTracker = tracker
+
+    def tick(self, timestamp: float):
+        if not self._tracker.ready:
+            self._tracker.start()
+        if self._tracker.replay_finished:
+            raise StopIteration
+        self._tracker.replay_until(timestamp)
@@ -0,0 +1,31 @@
+# distutils: language=c++
+
+import numpy as np
+cimport numpy as np
+
+
+def pack_order_book_rows(object rows, double update_id) -> np.ndarray:
+    """
+    Converts exchange order book levels, e.g. [["0.0241", "12.5"], ...] with prices and amounts as strings, Decimals
+    or floats, into a float64 array with [price, amount, update_id] columns. Extra fields per level are ignored.
+
+    Arrays that are already packed are returned as they are.
+    """
+    cdef:
+        Py_ssize_t num_rows
+        Py_ssize_t i
+        np.ndarray[np.float64_t, ndim=2] packed
+        double *data
+
+    if isinstance(rows, np.ndarray) and rows.dtype == np.float64 and rows.ndim == 2 and rows.shape[1] == 3:
+        return rows
+
+    num_rows = len(rows)
+    packed = np.empty((num_rows, 3), dtype=np.float64)
+    data = <double *> packed.data
+    for i in range(num_rows):
+        row = rows[i]
+        data[i * 3] = float(row[0])
+        data[i * 3 + 1] = float(row[1])
+        data[i * 3 + 2] = update_id
+    return packed
@@ -2,11 +2,15 @@
 import asyncio
 from abc import ABC
 from collections import deque
+from contextlib import asynccontextmanager
 from enum import Enum
 import logging
+import numpy as np
 import pandas as pd
 import re
 from typing import (
+    Any,
+    AsyncContextManager,
     Dict,
     Deque,
     Optional,
@@ -16,7 +20,11 @@ import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -32,8 +40,48 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class DiffCoalescingStats:
+    """
+    Per trading pair counters for the diff messages applied by `OrderBookTracker._apply_diff_messages()`.
+    """
+    __slots__ = ("messages_applied", "batches_applied", "rows_received", "rows_applied", "max_batch_size")
+
+    def __init__(self):
+        self.messages_applied: int = 0
+        self.batches_applied: int = 0
+        self.rows_received: int = 0
+        self.rows_applied: int = 0
+        self.max_batch_size: int = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """
+        Average number of diff messages merged into each order book update. 1.0 means no coalescing took place.
+        """
+        return self.messages_applied / self.batches_applied if self.batches_applied > 0 else 1.0
+
+    @property
+    def row_reduction_ratio(self) -> float:
+        """
+        Number of price level changes received per price level change applied.
+        """
+        return self.rows_received / self.rows_applied if self.rows_applied > 0 else 1.0
+
+
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # When enabled, all diff messages already waiting in a trading pair's queue are merged into one net set of price
+    # level changes (last write wins per price), and applied to the order book in a single call.
+    COALESCE_DIFFS: bool = True
+    MAX_COALESCED_DIFFS: int = 1000
+    # Order book snapshots are fetched one per second at start up by default. Connectors can fetch them faster and
+    # concurrently, within the exchange's REST rate limits, taking the weight of the snapshot request into account:
+    # with a shorter interval, or by throttling the requests with their throttler, see `_init_request_slot()`.
+    INIT_ORDER_BOOK_CONCURRENCY: int = 1
+    INIT_ORDER_BOOK_INTERVAL: float = 1.0
+    INIT_ORDER_BOOK_RETRY_INTERVAL: float = 5.0
+    # Diff messages received before a trading pair's snapshot is ready are held back, and replayed after it.
+    PENDING_DIFF_WINDOW_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -51,6 +99,10 @@ class OrderBookTracker(ABC):
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        self._diff_coalescing_stats: Dict[str, DiffCoalescingStats] = {}
+        self._pending_diff_messages: Dict[str, Deque[OrderBookMessage]] = {}
+        self._next_init_request_time: float = 0
+        self._recorder: Optional[OrderBookRecorder] = None
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -77,6 +129,25 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def order_book_readiness(self) -> Dict[str, bool]:
+        """
+        Whether each trading pair's order book has its snapshot and is being tracked. Individual order books become
+        usable before `ready` is set, which only happens once all of them are initialized.
+        """
+        return {trading_pair: trading_pair in self._tracking_tasks for trading_pair in self._trading_pairs}
+
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[OrderBookRecorder]):
+        """
+        Sets the recorder that the order book updates of all trading pairs are written to, or None to stop recording.
+        """
+        self._recorder = recorder
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -84,6 +155,24 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def diff_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Current diff queue depth and coalescing metrics, per trading pair.
+        """
+        retval: Dict[str, Dict[str, Any]] = {}
+        for trading_pair, message_queue in self._tracking_message_queues.items():
+            stats: DiffCoalescingStats = self._diff_coalescing_stats.get(trading_pair, DiffCoalescingStats())
+            retval[trading_pair] = {
+                "queue_depth": message_queue.qsize(),
+                "messages_applied": stats.messages_applied,
+                "batches_applied": stats.batches_applied,
+                "max_batch_size": stats.max_batch_size,
+                "coalescing_ratio": stats.coalescing_ratio,
+                "row_reduction_ratio": stats.row_reduction_ratio,
+            }
+        return retval
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -141,6 +230,7 @@ class OrderBookTracker(ABC):
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        self._pending_diff_messages.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
@@ -172,17 +262,63 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books concurrently, with at most `INIT_ORDER_BOOK_CONCURRENCY` snapshot requests in flight,
+        each one started once `_init_request_slot()` lets it through. Each order book is tracked as soon as its own
+        snapshot is applied.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        self._next_init_request_time = 0
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.INIT_ORDER_BOOK_CONCURRENCY)
+        await safe_gather(*[self._init_order_book(trading_pair, semaphore) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore):
+        while True:
+            try:
+                async with semaphore, self._init_request_slot():
+                    order_book: OrderBook = await self._data_source.get_new_order_book(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Unexpected error initializing order book for {trading_pair}. "
+                                      f"Retrying after {self.INIT_ORDER_BOOK_RETRY_INTERVAL:.0f} seconds.",
+                                      exc_info=True)
+                await asyncio.sleep(self.INIT_ORDER_BOOK_RETRY_INTERVAL)
+
+        message_queue: asyncio.Queue = asyncio.Queue()
+        for message in self._pending_diff_messages.pop(trading_pair, ()):
+            if message.update_id >= order_book.snapshot_uid:
+                message_queue.put_nowait(message)
+        self._order_books[trading_pair] = order_book
+        self._record_snapshot(trading_pair, order_book)
+        self._tracking_message_queues[trading_pair] = message_queue
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._tracking_tasks)}/{len(self._trading_pairs)} completed.")
+
+    def _init_request_slot(self) -> AsyncContextManager:
+        """
+        Waits for the rate limits before a snapshot request at start up. By default, the requests are spaced out by
+        `INIT_ORDER_BOOK_INTERVAL` seconds. Connectors with a throttler return one of its weighted tasks instead, so the
+        snapshots share the exchange's rate limits with the other requests.
+        """
+        return self._init_request_interval()
+
+    @asynccontextmanager
+    async def _init_request_interval(self):
+        await self._wait_for_init_request_slot()
+        yield
+
+    async def _wait_for_init_request_slot(self):
+        """
+        Spaces out the start of snapshot requests, in the order they asked for a slot.
+        """
+        now: float = self._ev_loop.time()
+        request_time: float = max(now, self._next_init_request_time)
+        self._next_init_request_time = request_time + self.INIT_ORDER_BOOK_INTERVAL
+        if request_time > now:
+            await asyncio.sleep(request_time - now)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -190,14 +326,21 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
+        messages_queued: int = 0
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    if trading_pair in self._trading_pairs:
+                        # Hold the diff until the snapshot for the trading pair is ready.
+                        if trading_pair not in self._pending_diff_messages:
+                            self._pending_diff_messages[trading_pair] = deque(maxlen=self.PENDING_DIFF_WINDOW_SIZE)
+                        self._pending_diff_messages[trading_pair].append(ob_message)
+                        messages_queued += 1
+                    else:
+                        messages_rejected += 1
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -212,9 +355,11 @@ class OrderBookTracker(ABC):
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}, "
+                                        f"queued: {messages_queued}")
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -227,7 +372,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -242,24 +386,87 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _drain_diff_messages(self,
+                             message_queue: asyncio.Queue,
+                             diff_messages: List[OrderBookMessage]) -> Optional[OrderBookMessage]:
+        """
+        Moves the diff messages already waiting in `message_queue` into `diff_messages`, without awaiting.
+
+        Stops at the first message that is not a diff, so that messages are still processed in order, and returns it.
+        """
+        while len(diff_messages) < self.MAX_COALESCED_DIFFS and not message_queue.empty():
+            message: OrderBookMessage = message_queue.get_nowait()
+            if message.type is not OrderBookMessageType.DIFF:
+                return message
+            diff_messages.append(message)
+        return None
+
+    def _apply_diff_messages(self, trading_pair: str, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        """
+        Applies a list of diff messages to the order book as a single net change set. Later messages win over earlier
+        ones for the same price level.
+        """
+        stats: DiffCoalescingStats = self._diff_coalescing_stats.get(trading_pair)
+        if stats is None:
+            stats = self._diff_coalescing_stats[trading_pair] = DiffCoalescingStats()
+
+        if len(diff_messages) == 1:
+            bids: np.ndarray = diff_messages[0].bids_array
+            asks: np.ndarray = diff_messages[0].asks_array
+            stats.rows_received += len(bids) + len(asks)
+        else:
+            bids: np.ndarray = np.concatenate([message.bids_array for message in diff_messages])
+            asks: np.ndarray = np.concatenate([message.asks_array for message in diff_messages])
+            stats.rows_received += len(bids) + len(asks)
+            bids = self._last_level_changes(bids)
+            asks = self._last_level_changes(asks)
+
+        order_book.apply_numpy_diffs(bids, asks, diff_messages[-1].update_id)
+        if self._recorder is not None:
+            self._recorder.record_diff(trading_pair, order_book, bids, asks, diff_messages[-1].update_id, time.time())
+
+        stats.messages_applied += len(diff_messages)
+        stats.batches_applied += 1
+        stats.rows_applied += len(bids) + len(asks)
+        stats.max_batch_size = max(stats.max_batch_size, len(diff_messages))
+
+    def _record_snapshot(self, trading_pair: str, order_book: OrderBook):
+        if self._recorder is not None:
+            self._recorder.record_snapshot(trading_pair, order_book, time.time())
+
+    @staticmethod
+    def _last_level_changes(rows: np.ndarray) -> np.ndarray:
+        """
+        Keeps only the last change for every price in a [price, amount, update_id] array.
+        """
+        if len(rows) < 2:
+            return rows
+        reversed_rows: np.ndarray = rows[::-1]
+        _, first_indices = np.unique(reversed_rows[:, 0], return_index=True)
+        return reversed_rows[first_indices]
+
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
+        past_diffs_window: Deque[OrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
+                message: OrderBookMessage = (pending_message if pending_message is not None
+                                             else await message_queue.get())
+                pending_message = None
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages: List[OrderBookMessage] = [message]
+                    if self.COALESCE_DIFFS:
+                        pending_message = self._drain_diff_messages(message_queue, diff_messages)
+                    self._apply_diff_messages(trading_pair, order_book, diff_messages)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -271,6 +478,7 @@ class OrderBookTracker(ABC):
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._record_snapshot(trading_pair, order_book)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
@@ -282,7 +490,6 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -293,14 +500,17 @@ class OrderBookTracker(ABC):
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
+                trade_event: OrderBookTradeEvent = OrderBookTradeEvent(
                     trading_pair=trade_message.trading_pair,
                     timestamp=trade_message.timestamp,
                     price=float(trade_message.content["price"]),
                     amount=float(trade_message.content["amount"]),
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                )
+                order_book.apply_trade(trade_event)
+                if self._recorder is not None:
+                    self._recorder.record_trade(trade_event, time.time())
 
                 messages_accepted += 1
 
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+
+from collections import deque
+import math
+from typing import (
+    Deque,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed capacity time series of float64 values, e.g. the mid prices of a market, where the oldest values are dropped
+    as new ones are added.
+
+    With an `interval`, the values are aligned on time slots of `interval` seconds given their timestamps: a value added
+    in the same slot as the last one replaces it, one from an earlier slot is ignored, and the slots skipped since the
+    last value are filled with it. So the n-th last value is always the one of `n * interval` seconds ago, even if some
+    ticks were missed.
+
+    The buffer keeps running sums, so the mean of the last values is computed in constant time. With a `range_window`,
+    it also keeps the min and max of the last `range_window` values, and their range relative to the min, for ATR
+    style volatility.
+    """
+
+    def __init__(self, capacity: int, interval: Optional[float] = None, range_window: Optional[int] = None):
+        if capacity < 1:
+            raise ValueError(f"The capacity must be positive, got {capacity}.")
+        if range_window is not None and not 1 <= range_window <= capacity:
+            raise ValueError(f"The range window must be between 1 and the capacity ({capacity}), got {range_window}.")
+        self._capacity: int = capacity
+        self._interval: Optional[float] = interval
+        self._range_window: Optional[int] = range_window
+        self._values: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        # Running sum of all the values added, up to each value. The sum before the oldest value is kept apart.
+        self._sums: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self._dropped_sum: float = 0.0
+        # Range of the last `range_window` values, at each value.
+        self._ranges: Optional[np.ndarray] = np.zeros(capacity, dtype=np.float64) if range_window is not None else None
+        # Monotonic queues of (index, value), of the values which can still be the min or max of the range window.
+        self._min_queue: Deque[Tuple[int, float]] = deque()
+        self._max_queue: Deque[Tuple[int, float]] = deque()
+        # Number of values added since the start, the index of the next value.
+        self._count: int = 0
+        self._last_slot: Optional[int] = None
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def interval(self) -> Optional[float]:
+        return self._interval
+
+    @property
+    def range_window(self) -> Optional[int]:
+        return self._range_window
+
+    @property
+    def is_full(self) -> bool:
+        return self._count >= self._capacity
+
+    @property
+    def last_value(self) -> float:
+        if self._count == 0:
+            raise IndexError("The buffer is empty.")
+        return float(self._values[(self._count - 1) % self._capacity])
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """
+        Start of the time slot of the last value, if the buffer has an interval.
+        """
+        return self._last_slot * self._interval if self._last_slot is not None else None
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[float, np.ndarray]:
+        if isinstance(key, slice):
+            return self.get_as_numpy_array()[key]
+        length: int = len(self)
+        if not -length <= key < length:
+            raise IndexError(f"Index {key} out of range for {length} values.")
+        first_index: int = self._count - length
+        return float(self._values[(first_index + key % length) % self._capacity])
+
+    def __iter__(self):
+        return iter(self.get_as_numpy_array().tolist())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(capacity={self._capacity}, values={len(self)})"
+
+    def get_as_numpy_array(self) -> np.ndarray:
+        """
+        Copy of the values, from the oldest to the last.
+        """
+        start: int = self._count % self._capacity
+        if not self.is_full:
+            return self._values[:self._count].copy()
+        return np.concatenate((self._values[start:], self._values[:start]))
+
+    def add_value(self, value: float, timestamp: Optional[float] = None):
+        if self._interval is not None and timestamp is not None:
+            slot: int = int(math.floor(timestamp / self._interval))
+            if self._last_slot is not None:
+                if slot <= self._last_slot:
+                    if slot == self._last_slot:
+                        self._replace_last_value(float(value))
+                    return
+                # Fills the skipped slots with the last value, but no more than the capacity.
+                last_value: float = self.last_value
+                for _ in range(min(slot - self._last_slot - 1, self._capacity)):
+                    self._append(last_value)
+            self._last_slot = slot
+        self._append(float(value))
+
+    def take_samples(self, interval: int, length: int) -> Optional[np.ndarray]:
+        """
+        Takes `length` values, every `interval` values back from the last one, e.g. for values [1, 2, 3, 4, 5, 6, 7]
+        an interval of 3 and length of 2 gives [4, 7].
+        :returns None if there are not enough values, otherwise the samples from the oldest to the last.
+        """
+        if length < 1 or interval < 1:
+            raise ValueError(f"The interval and length must be positive, got {interval} and {length}.")
+        last_index: int = self._count - 1
+        if last_index - interval * (length - 1) < self._count - len(self):
+            return None
+        return self._values[(last_index - interval * np.arange(length - 1, -1, -1)) % self._capacity]
+
+    def mean(self, length: Optional[int] = None) -> float:
+        """
+        Mean of the last `length` values, or of all the values. NaN if there are not enough values.
+        """
+        stored: int = len(self)
+        length = stored if length is None else length
+        if length < 1 or length > stored:
+            return float("nan")
+        last_sum: float = self._sums[(self._count - 1) % self._capacity]
+        first_index: int = self._count - length
+        sum_before: float = (self._dropped_sum if first_index == self._count - stored
+                             else self._sums[(first_index - 1) % self._capacity])
+        return float((last_sum - sum_before) / length)
+
+    def rolling_min(self) -> float:
+        """
+        Min of the last `range_window` values.
+        """
+        self._check_range_window()
+        return self._min_queue[0][1] if len(self._min_queue) > 0 else float("nan")
+
+    def rolling_max(self) -> float:
+        """
+        Max of the last `range_window` values.
+        """
+        self._check_range_window()
+        return self._max_queue[0][1] if len(self._max_queue) > 0 else float("nan")
+
+    def volatility(self, length: int) -> float:
+        """
+        ATR style volatility: the mean of the `(max - min) / min` ranges of the last `length` windows of
+        `range_window` values. While there are not enough values, the windows available are used, the first one
+        possibly partial.
+        :returns NaN if there are less than 2 values.
+        """
+        self._check_range_window()
+        last_index: int = self._count - 1
+        first_index: int = max(self._count - len(self), 1)
+        available: int = (last_index - first_index) // self._range_window + 1 if last_index >= first_index else 0
+        length = min(length, available)
+        if length < 1:
+            return float("nan")
+        indices: np.ndarray = (last_index - self._range_window * np.arange(length)) % self._capacity
+        return float(np.mean(self._ranges[indices]))
+
+    def _check_range_window(self):
+        if self._range_window is None:
+            raise ValueError("The buffer has no range window.")
+
+    def _append(self, value: float):
+        index: int = self._count % self._capacity
+        if self._count >= self._capacity:
+            self._dropped_sum = float(self._sums[index])
+        previous_sum: float = self._sums[(self._count - 1) % self._capacity] if self._count > 0 else 0.0
+        self._values[index] = value
+        self._sums[index] = previous_sum + value
+        self._count += 1
+        if self._range_window is not None:
+            self._push_range_queues(self._count - 1, value)
+            self._update_range(self._count - 1)
+
+    def _replace_last_value(self, value: float):
+        index: int = (self._count - 1) % self._capacity
+        self._sums[index] += value - self._values[index]
+        self._values[index] = value
+        if self._range_window is not None:
+            # The values dropped from the queues by the last value may be needed again, so the queues are rebuilt out
+            # of the last window. Only the range of the last value changes, the ranges before it are kept.
+            self._min_queue.clear()
+            self._max_queue.clear()
+            for i in range(max(self._count - self._range_window, self._count - len(self)), self._count):
+                self._push_range_queues(i, float(self._values[i % self._capacity]))
+            self._update_range(self._count - 1)
+
+    def _push_range_queues(self, index: int, value: float):
+        while len(self._min_queue) > 0 and self._min_queue[-1][1] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((index, value))
+        while len(self._max_queue) > 0 and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((index, value))
+        window_start: int = index - self._range_window + 1
+        while self._min_queue[0][0] < window_start:
+            self._min_queue.popleft()
+        while self._max_queue[0][0] < window_start:
+            self._max_queue.popleft()
+
+    def _update_range(self, index: int):
+        min_value: float = self._min_queue[0][1]
+        max_value: float = self._max_queue[0][1]
+        self._ranges[index % self._capacity] = (max_value - min_value) / min_value if min_value > 0 else float("nan")
@@ -1,10 +1,19 @@
+from libc.stdint cimport int64_t
+
 from .event_listener cimport EventListener
 
 
 cdef class EventLogger(EventListener):
     cdef:
         str _event_source
-        object _logged_events
+        dict _logged_events
+        dict _order_events
+        int64_t _sequence
+        int64_t _max_events
+        double _max_age
+        int64_t _evicted_count
         dict _waiting
         dict _wait_returns
     cdef c_call(self, object event_object)
+    cdef c_evict_events(self, object events, object newest_event)
+    cdef c_unindex_event(self, object event_object)
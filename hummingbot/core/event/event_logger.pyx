@@ -2,6 +2,8 @@
 
 import asyncio
 from async_timeout import timeout
+from collections import deque
+import heapq
 from typing import (
     List,
     Optional,
@@ -9,25 +11,68 @@ from typing import (
 
 from hummingbot.core.event.event_listener cimport EventListener
 
+DEFAULT_MAX_EVENTS = 10000
+
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    """
+    Keeps the events it listens to, for the status reports, the strategies and the tests.
+
+    The events are kept per event type, up to the last `max_events` events of each type, and for `max_age` seconds
+    before the newest event of the type when the events have a timestamp. Zero disables the limit. Longer histories
+    belong to the SQL store: the orders and trade fills are recorded by the `MarketsRecorder`.
+
+    The kept events are indexed by order id.
+    """
+
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_events: int = DEFAULT_MAX_EVENTS,
+                 max_age: float = 0):
         super().__init__()
         self._event_source = event_source
-        self._logged_events = []
+        self._logged_events = {}
+        self._order_events = {}
+        self._sequence = 0
+        self._max_events = max_events
+        self._max_age = max_age
+        self._evicted_count = 0
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return self._logged_events.copy()
+        """
+        The kept events, in the order they were logged.
+        """
+        return [event_object for _, event_object in heapq.merge(*self._logged_events.values())]
 
     @property
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def evicted_count(self) -> int:
+        """
+        Number of events dropped to keep the log within its limits.
+        """
+        return self._evicted_count
+
+    def events_of_type(self, event_type: type) -> List[any]:
+        """
+        The kept events of a type, in the order they were logged.
+        """
+        return [event_object for _, event_object in self._logged_events.get(event_type, ())]
+
+    def events_for_order(self, order_id: str) -> List[any]:
+        """
+        The kept events of an order, in the order they were logged.
+        """
+        return list(self._order_events.get(order_id, ()))
+
     def clear(self):
         self._logged_events.clear()
+        self._order_events.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -45,8 +90,19 @@ cdef class EventLogger(EventListener):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.append(event_object)
         event_object_type = type(event_object)
+        events = self._logged_events.get(event_object_type)
+        if events is None:
+            events = self._logged_events[event_object_type] = deque()
+        events.append((self._sequence, event_object))
+        self._sequence += 1
+        order_id = getattr(event_object, "order_id", None)
+        if order_id is not None:
+            order_events = self._order_events.get(order_id)
+            if order_events is None:
+                order_events = self._order_events[order_id] = deque()
+            order_events.append(event_object)
+        self.c_evict_events(events, event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
@@ -55,3 +111,38 @@ cdef class EventLogger(EventListener):
                 self._wait_returns[notifier] = event_object
         for notifier in should_notify:
             notifier.set()
+
+    cdef c_evict_events(self, object events, object newest_event):
+        cdef:
+            object newest_timestamp = getattr(newest_event, "timestamp", None) if self._max_age > 0 else None
+            object oldest_timestamp
+
+        while self._max_events > 0 and len(events) > self._max_events:
+            self.c_unindex_event(events.popleft()[1])
+            self._evicted_count += 1
+        if newest_timestamp is None:
+            return
+        while len(events) > 1:
+            oldest_timestamp = getattr(events[0][1], "timestamp", None)
+            if oldest_timestamp is None or newest_timestamp - oldest_timestamp <= self._max_age:
+                break
+            self.c_unindex_event(events.popleft()[1])
+            self._evicted_count += 1
+
+    cdef c_unindex_event(self, object event_object):
+        order_id = getattr(event_object, "order_id", None)
+        if order_id is None:
+            return
+        order_events = self._order_events.get(order_id)
+        if order_events is None:
+            return
+        # The events of a type are evicted in order, so the evicted event is usually the oldest one of its order.
+        if order_events[0] is event_object:
+            order_events.popleft()
+        else:
+            for i, order_event in enumerate(order_events):
+                if order_event is event_object:
+                    del order_events[i]
+                    break
+        if len(order_events) == 0:
+            del self._order_events[order_id]
@@ -51,6 +51,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    UpdateEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+from decimal import Decimal
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+)
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    TradeType,
+)
+
+s_decimal_0 = Decimal(0)
+
+
+def add_fill_balance_changes(balances: Dict[str, Decimal], base: str, quote: str, fill_event: OrderFilledEvent):
+    """
+    Adds the balance changes of an order fill: for a buy, the quote balance goes down while the base balance goes up,
+    and for a sell, it's the opposite. This does not account for fee.
+    """
+    quote_value: Decimal = fill_event.price * fill_event.amount
+    if fill_event.trade_type is TradeType.BUY:
+        balances[base] = balances.get(base, s_decimal_0) + fill_event.amount
+        balances[quote] = balances.get(quote, s_decimal_0) - quote_value
+    else:
+        balances[base] = balances.get(base, s_decimal_0) - fill_event.amount
+        balances[quote] = balances.get(quote, s_decimal_0) + quote_value
+
+
+class OrderFilledBalances(EventListener):
+    """
+    Running totals of the asset balance changes from the order fill events it listens to.
+
+    Connectors keep them next to their bounded event logs, so the balances since the bot started stay exact once the
+    older fill events are evicted from the log.
+    """
+    def __init__(self, split_trading_pair: Callable[[str], Tuple[str, str]]):
+        super().__init__()
+        self._split_trading_pair: Callable[[str], Tuple[str, str]] = split_trading_pair
+        self._balances: Dict[str, Decimal] = {}
+        self._fill_count: int = 0
+
+    @property
+    def balances(self) -> Dict[str, Decimal]:
+        return self._balances.copy()
+
+    @property
+    def fill_count(self) -> int:
+        return self._fill_count
+
+    def __call__(self, fill_event: OrderFilledEvent):
+        base, quote = self._split_trading_pair(fill_event.trading_pair)
+        add_fill_balance_changes(self._balances, base, quote, fill_event)
+        self._fill_count += 1
@@ -14,7 +14,6 @@ from cython.operator cimport(
 from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +23,42 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class ListenerDeathCallback:
+    """
+    Weak reference callback, which tells a PubSub that one of its listeners is dead. It only holds a weak reference to
+    the PubSub, so the PubSub can be garbage collected before its listeners.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_ref
+        object _listener_ref
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, object listener_ref):
+        self._pubsub_ref = PyWeakref_NewRef(pubsub, None)
+        self._listener_ref = listener_ref
+
+    def __call__(self, object watcher_ref):
+        cdef:
+            PubSub pubsub = <object>PyWeakref_GetObject(self._pubsub_ref)
+        if pubsub is not None:
+            pubsub._listener_snapshots.clear()
+            pubsub._listener_watchers.pop(self._listener_ref, None)
 
-    Here's how the dead listener GC is performed:
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem by performing GC on dead event listeners.
+
+    Every event tag has a cached, immutable snapshot of its listener weak references, which c_trigger_event() and
+    c_get_listeners() dispatch from. The snapshots are rebuilt, and the dead listeners of the event tag removed by
+    c_remove_dead_listeners() in O(n), only after:
+
+    1. c_add_listener() or c_remove_listener() changed the listeners of the event tag.
+    2. A listener died. Every listener is watched by a weak reference with a ListenerDeathCallback, which discards all
+       the snapshots.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    So a trigger costs the listener calls only. Since the snapshots are immutable, listeners are allowed to add and
+    remove listeners while they're called.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,6 +67,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        self._listener_snapshots = {}
+        self._listener_watchers = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -84,8 +103,11 @@ cdef class PubSub:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        if listener_weakref not in self._listener_watchers:
+            self._listener_watchers[listener_weakref] = PyWeakref_NewRef(
+                listener, ListenerDeathCallback(self, listener_weakref)
+            )
+        self._listener_snapshots.pop(event_tag, None)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
@@ -101,6 +123,7 @@ cdef class PubSub:
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
         self.c_remove_dead_listeners(event_tag)
+        self._listener_snapshots.pop(event_tag, None)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
         cdef:
@@ -123,43 +146,50 @@ cdef class PubSub:
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag):
+        """
+        Returns the weak references to the listeners of the event tag, rebuilding the snapshot if needed.
+        """
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            tuple snapshot = self._listener_snapshots.get(event_tag)
+            EventsIterator it
+            list listener_weakrefs = []
+        if snapshot is not None:
+            return snapshot
 
-        if it == self._events.end():
-            return []
+        self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
+        if it != self._events.end():
+            for pyref in deref(it).second:
+                listener_weakrefs.append(<object>pyref.get())
+        snapshot = tuple(listener_weakrefs)
+        self._listener_snapshots[event_tag] = snapshot
+        return snapshot
 
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef:
+            object listener
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in self.c_get_listener_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple snapshot = self._listener_snapshots.get(event_tag)
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        if snapshot is None:
+            snapshot = self.c_get_listener_snapshot(event_tag)
+
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                # The listener died during the dispatch. Its death callback has discarded the snapshot.
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
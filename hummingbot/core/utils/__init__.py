@@ -1,19 +1,207 @@
+import asyncio
 import cachetools
 import functools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Sized,
+    Tuple,
+)
 
+# Separates the positional arguments from the keyword arguments in the cache keys.
+_KWARGS_MARK = object()
 
-def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
-    cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    coalesced: int
+    errors: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of the calls served without calling the function, coalesced calls included.
+        """
+        calls: int = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / calls if calls > 0 else 0.0
+
+
+def make_cache_key(args: Tuple, kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Cache key of a call. The keyword arguments are sorted, so that their order doesn't matter.
+    """
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+class Memoizer:
+    """
+    Results of the calls to a function, kept for `ttl` seconds, with the least recently used ones evicted above
+    `maxsize`. With `error_ttl`, the exceptions raised by the calls are kept too, and raised again for that time.
+
+    Empty results, None or empty collections, are not kept: the connectors' fetch functions return them when their
+    request fails, and the next call must try again rather than get the failure for the whole `ttl`.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int, error_ttl: float = 0):
+        self.name: str = name
+        self._results: cachetools.TTLCache = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        self._errors: Optional[cachetools.TTLCache] = cachetools.TTLCache(maxsize=maxsize, ttl=error_ttl) \
+            if error_ttl > 0 else None
+        self.in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+        self.errors: int = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, coalesced=self.coalesced, errors=self.errors,
+                          size=len(self._results) + (len(self._errors) if self._errors is not None else 0))
+
+    def clear(self):
+        self._results.clear()
+        if self._errors is not None:
+            self._errors.clear()
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        :return: whether the call is cached, and its result
+        :raise: the cached exception of the call
+        """
+        try:
+            result: Any = self._results[key]
+            self.hits += 1
+            return True, result
+        except KeyError:
+            pass
+        if self._errors is not None:
+            error: Optional[BaseException] = self._errors.get(key)
+            if error is not None:
+                self.hits += 1
+                raise error
+        return False, None
+
+    def store(self, key: Hashable, result: Any):
+        if result is None or (isinstance(result, Sized) and len(result) == 0):
+            return
+        self._results[key] = result
+
+    def store_error(self, key: Hashable, error: BaseException):
+        self.errors += 1
+        if self._errors is not None:
+            self._errors[key] = error
+
+
+# Memoizers of the decorated functions, by qualified function name.
+_memoizers: Dict[str, Memoizer] = {}
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """
+    Returns the hit and miss counts of the functions decorated with async_ttl_cache or ttl_cache.
+    """
+    return {name: memoizer.stats for name, memoizer in _memoizers.items()}
+
+
+def _create_memoizer(fn: Callable, ttl: float, maxsize: int, error_ttl: float) -> Memoizer:
+    # Methods of the Cython classes are method descriptors, without a module of their own.
+    module: str = getattr(fn, "__module__", None) or getattr(getattr(fn, "__objclass__", None), "__module__", "")
+    name: str = f"{module}.{fn.__qualname__}"
+    memoizer: Memoizer = Memoizer(name, ttl, maxsize, error_ttl)
+    _memoizers[name] = memoizer
+    return memoizer
+
+
+def _hashable(key: Hashable) -> bool:
+    try:
+        hash(key)
+        return True
+    except TypeError:
+        return False
+
+
+def async_ttl_cache(ttl: int = 3600, maxsize: int = 1, error_ttl: float = 0):
+    """
+    Caches the results of a coroutine function by arguments, for `ttl` seconds and up to `maxsize` argument sets.
+    Concurrent calls with the same arguments are coalesced into a single call of the function, which isn't cancelled
+    with its callers. With `error_ttl`, the exceptions raised are cached for that time. Empty results aren't cached.
+    Calls with unhashable arguments are not cached.
+    """
 
     def decorator(fn):
+        memoizer: Memoizer = _create_memoizer(fn, ttl, maxsize, error_ttl)
+
+        def on_call_done(key: Hashable, task: asyncio.Task):
+            del memoizer.in_flight[key]
+            if task.cancelled():
+                return
+            error: Optional[BaseException] = task.exception()
+            if error is None:
+                memoizer.store(key, task.result())
+            else:
+                memoizer.store_error(key, error)
+
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
-            key = str((args, kwargs))
+            key: Hashable = make_cache_key(args, kwargs)
+            if not _hashable(key):
+                memoizer.misses += 1
+                return await fn(*args, **kwargs)
+            is_cached, result = memoizer.lookup(key)
+            if is_cached:
+                return result
+            task: Optional[asyncio.Task] = memoizer.in_flight.get(key)
+            if task is None:
+                memoizer.misses += 1
+                task = memoizer.in_flight[key] = asyncio.ensure_future(fn(*args, **kwargs))
+                task.add_done_callback(functools.partial(on_call_done, key))
+            else:
+                memoizer.coalesced += 1
+            return await asyncio.shield(task)
+
+        memoize.cache_stats = lambda: memoizer.stats
+        memoize.cache_clear = memoizer.clear
+        return memoize
+
+    return decorator
+
+
+def ttl_cache(ttl: int = 3600, maxsize: int = 128, error_ttl: float = 0):
+    """
+    Caches the results of a function by arguments, like async_ttl_cache does for coroutine functions.
+    """
+
+    def decorator(fn):
+        memoizer: Memoizer = _create_memoizer(fn, ttl, maxsize, error_ttl)
+
+        @functools.wraps(fn)
+        def memoize(*args, **kwargs):
+            key: Hashable = make_cache_key(args, kwargs)
+            if not _hashable(key):
+                memoizer.misses += 1
+                return fn(*args, **kwargs)
+            is_cached, result = memoizer.lookup(key)
+            if is_cached:
+                return result
+            memoizer.misses += 1
             try:
-                return cache[key]
-            except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                memoizer.store_error(key, e)
+                raise
+            memoizer.store(key, result)
+            return result
+
+        memoize.cache_stats = lambda: memoizer.stats
+        memoize.cache_clear = memoizer.clear
         return memoize
 
     return decorator
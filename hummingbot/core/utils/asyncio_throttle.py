@@ -2,10 +2,15 @@ import logging
 import time
 import asyncio
 from collections import deque
+import heapq
+import itertools
 from typing import (
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
     Optional,
     Tuple,
-    Deque
 )
 
 RequestWeight = int
@@ -13,32 +18,92 @@ Seconds = float
 Timestamp_s = float
 TaskLog = Tuple[Timestamp_s, RequestWeight]
 
+DEFAULT_LIMIT_ID = "default"
+DEFAULT_PRIORITY = 0
 
-class Throttler:
-    def __init__(self,
-                 rate_limit: Tuple[RequestWeight, Seconds],
-                 period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+
+class RateLimit(NamedTuple):
+    """
+    At most `limit` weight of the `limit_id` pool in any `time_interval` seconds. A pool can have several limits, e.g.
+    a per second and a per minute one.
+    """
+    limit: RequestWeight
+    time_interval: Seconds
+    limit_id: str = DEFAULT_LIMIT_ID
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the weights recently taken against a rate limit.
+    """
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds):
+        self._rate_limit: RateLimit = rate_limit
+        # The weights are only released after the time interval and the safety margin, to make up for the network
+        # latency between the request and its arrival on the server.
+        self._release_delay: Seconds = rate_limit.time_interval + period_safety_margin
+        self._task_logs: Deque[TaskLog] = deque()
+        self._used_weight: RequestWeight = 0
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def used_weight(self) -> RequestWeight:
+        return self._used_weight
+
+    def flush(self, now: Timestamp_s):
         """
-        :param rate_limit: Max weight allowed in the given period
-        :param retry_interval: Time between each limit check
+        Releases the weights whose time interval has passed.
         """
-        self._rate_limit_weight: int = rate_limit[0]
-        self._period: float = rate_limit[1]
-        self._retry_interval: float = retry_interval
-        self._period_safety_margin = period_safety_margin
-        self._task_logs: Deque[TaskLog] = deque()
+        task_logs: Deque[TaskLog] = self._task_logs
+        while len(task_logs) > 0 and task_logs[0][0] + self._release_delay <= now:
+            self._used_weight -= task_logs.popleft()[1]
 
-    def weighted_task(self,
-                      request_weight):
-        return ThrottlerContextManager(
-            rate_limit=self._rate_limit_weight,
-            period=self._period,
-            request_weight=request_weight,
-            task_logs=self._task_logs)
+    def has_capacity(self, weight: RequestWeight) -> bool:
+        return self._used_weight + weight <= self._rate_limit.limit
 
+    def add(self, now: Timestamp_s, weight: RequestWeight):
+        self._task_logs.append((now, weight))
+        self._used_weight += weight
 
-class ThrottlerContextManager:
+    def available_at(self, weight: RequestWeight) -> Timestamp_s:
+        """
+        Returns the time at which enough weight is released for a task of the given weight, assuming the window is
+        flushed.
+        """
+        excess: RequestWeight = self._used_weight + weight - self._rate_limit.limit
+        available_ts: Timestamp_s = 0.0
+        for task_ts, task_weight in self._task_logs:
+            if excess <= 0:
+                break
+            excess -= task_weight
+            available_ts = task_ts + self._release_delay
+        return available_ts
+
+
+class ThrottlerWaiter(NamedTuple):
+    future: asyncio.Future
+    weights: Dict[str, RequestWeight]
+    priority: int
+
+
+# Waiting tasks, ordered by descending priority, then by arrival.
+WaiterEntry = Tuple[int, int, ThrottlerWaiter]
+
+
+class Throttler:
+    """
+    Rate limiter for the API requests of a connector. A task waits until its weights fit in every rate limit of the
+    pools it uses. Waiting tasks are let through by priority, then in the order they arrive, and are woken up exactly
+    when the weight they need is released, so a heavy task is never overtaken by lighter ones of the same priority.
+
+        throttler = Throttler(rate_limits=[RateLimit(1200, 60.0), RateLimit(10, 1.0, "orders")])
+        async with throttler.weighted_task(request_weight=5):
+            ...
+        async with throttler.weighted_task(request_weight=1, limit_weights={"orders": 1}, priority=1):
+            ...
+    """
     throttler_logger: Optional[logging.Logger] = None
 
     @classmethod
@@ -48,54 +113,134 @@ class ThrottlerContextManager:
         return cls.throttler_logger
 
     def __init__(self,
-                 task_logs: Deque[TaskLog],
-                 rate_limit: RequestWeight,
-                 request_weight: RequestWeight = 1,
+                 rate_limit: Optional[Tuple[RequestWeight, Seconds]] = None,
                  period_safety_margin: Seconds = 0.1,
-                 period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
+                 rate_limits: Optional[List[RateLimit]] = None):
         """
-        :param task_logs: Shared task logs
-        :param rate_limit: Max weight allowed in the given period
-        :param request_weight: Weight of the request of the added task
+        :param rate_limit: Max weight allowed in the given period, for the default pool
         :param period_safety_margin: estimate for the network latency
-        :param period: Time interval of the rate limit
-        :param retry_interval: Time between each limit check
+        :param rate_limits: Rate limits of all the pools, in place of `rate_limit`
         """
-        self._period_safety_margin = period_safety_margin
-        self._lock = asyncio.Lock()
-        self._request_weight: RequestWeight = request_weight
-        self._rate_limit: int = rate_limit
-        self._period: float = period
-        self._retry_interval: float = retry_interval
-        self._task_logs: Deque[TaskLog] = task_logs
-
-    def flush(self):
+        if rate_limits is None:
+            if rate_limit is None:
+                raise ValueError("Either rate_limit or rate_limits must be given.")
+            rate_limits = [RateLimit(int(rate_limit[0]), rate_limit[1])]
+        self._windows: Dict[str, List[RateLimitWindow]] = {}
+        for limit in rate_limits:
+            self._windows.setdefault(limit.limit_id, []).append(RateLimitWindow(limit, period_safety_margin))
+        self._waiters: List[WaiterEntry] = []
+        self._sequence = itertools.count()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return [window.rate_limit for windows in self._windows.values() for window in windows]
+
+    @property
+    def waiting_tasks(self) -> int:
+        return len(self._waiters)
+
+    def used_weight(self, limit_id: str = DEFAULT_LIMIT_ID) -> List[RequestWeight]:
         """
-        Remove task logs that have passed rate limit periods
-        :return:
+        Returns the weight currently taken against each rate limit of a pool.
         """
-        now: float = time.time()
-        while self._task_logs:
-            task_ts, _ = self._task_logs[0]
-            elapsed: float = now - task_ts
-            if elapsed > self._period - self._period_safety_margin:
-                self._task_logs.popleft()
+        now: Timestamp_s = time.monotonic()
+        windows: List[RateLimitWindow] = self._windows.get(limit_id, [])
+        for window in windows:
+            window.flush(now)
+        return [window.used_weight for window in windows]
+
+    def weighted_task(self,
+                      request_weight: RequestWeight = 1,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None,
+                      priority: int = DEFAULT_PRIORITY) -> "ThrottlerContextManager":
+        """
+        :param request_weight: Weight of the task in the default pool
+        :param limit_weights: Weights of the task in the other pools
+        :param priority: Waiting tasks with a higher priority are let through first
+        """
+        weights: Dict[str, RequestWeight] = {DEFAULT_LIMIT_ID: request_weight}
+        if limit_weights is not None:
+            weights.update(limit_weights)
+        return ThrottlerContextManager(self, weights, priority)
+
+    def _try_acquire(self, weights: Dict[str, RequestWeight], now: Timestamp_s) -> bool:
+        for limit_id, weight in weights.items():
+            for window in self._windows.get(limit_id, ()):
+                window.flush(now)
+                if not window.has_capacity(weight):
+                    return False
+        for limit_id, weight in weights.items():
+            for window in self._windows.get(limit_id, ()):
+                window.add(now, weight)
+        return True
+
+    def _available_at(self, weights: Dict[str, RequestWeight]) -> Timestamp_s:
+        return max(window.available_at(weight)
+                   for limit_id, weight in weights.items()
+                   for window in self._windows.get(limit_id, ()))
+
+    async def acquire(self, weights: Dict[str, RequestWeight], priority: int = DEFAULT_PRIORITY):
+        for limit_id, weight in weights.items():
+            for window in self._windows.get(limit_id, ()):
+                if weight > window.rate_limit.limit:
+                    raise ValueError(f"Task weight {weight} exceeds the rate limit {window.rate_limit}.")
+        if len(self._waiters) == 0 and self._try_acquire(weights, time.monotonic()):
+            return
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        waiter: ThrottlerWaiter = ThrottlerWaiter(future, weights, priority)
+        heapq.heappush(self._waiters, (-priority, next(self._sequence), waiter))
+        if self._waiters[0][2] is waiter:
+            # First in line, ahead of the tasks already waiting if any.
+            self._wake_up_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                # Let the next tasks through, if the cancelled task was first in line.
+                self._waiters = [entry for entry in self._waiters if entry[2].future is not future]
+                heapq.heapify(self._waiters)
+                self._wake_up_waiters()
+            raise
+
+    def _wake_up_waiters(self):
+        """
+        Lets the waiting tasks through, in order, while their weights fit in the rate limits. Then schedules the next
+        call for when the weights of the first task in line are released.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+        now: Timestamp_s = time.monotonic()
+        while len(self._waiters) > 0:
+            waiter: ThrottlerWaiter = self._waiters[0][2]
+            if waiter.future.done():
+                heapq.heappop(self._waiters)
+            elif self._try_acquire(waiter.weights, now):
+                heapq.heappop(self._waiters)
+                waiter.future.set_result(None)
             else:
+                delay: Seconds = self._available_at(waiter.weights) - now
+                self._wake_up_handle = waiter.future.get_loop().call_later(max(delay, 0.0), self._wake_up_waiters)
                 break
 
-    async def acquire(self):
-        while True:
-            self.flush()
-            current_capacity: int = self._rate_limit - sum(weight for (ts, weight) in self._task_logs)
-            if current_capacity - self._request_weight > 0:
-                break
-            await asyncio.sleep(self._retry_interval)
-        self._task_logs.append((time.time(), self._request_weight))
+
+class ThrottlerContextManager:
+    def __init__(self,
+                 throttler: Throttler,
+                 weights: Dict[str, RequestWeight],
+                 priority: int = DEFAULT_PRIORITY):
+        """
+        :param throttler: Throttler holding the shared task logs
+        :param weights: Weights of the task, by rate limit pool
+        :param priority: Priority of the task among the waiting ones
+        """
+        self._throttler: Throttler = throttler
+        self._weights: Dict[str, RequestWeight] = weights
+        self._priority: int = priority
 
     async def __aenter__(self):
-        async with self._lock:
-            await self.acquire()
+        await self._throttler.acquire(self._weights, self._priority)
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
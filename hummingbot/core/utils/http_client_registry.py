@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+from typing import (
+    AsyncIterator,
+    Dict,
+    NamedTuple,
+    Optional,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+
+class HttpClientStats(NamedTuple):
+    sessions: int
+    open_connections: int
+    idle_connections: int
+    connections_created: int
+    connections_reused: int
+    requests: int
+
+
+class HttpClientRegistry:
+    """
+    Process-wide registry of pooled aiohttp client sessions, one per event loop, shared by the connectors and data
+    sources. Connections are kept alive and reused per host, and DNS lookups are cached, so REST calls don't pay for a
+    new TCP and TLS handshake every time.
+
+    Usage, in place of a session created for a few requests:
+
+        async with shared_client_session() as client:
+            async with client.get(url) as response:
+                ...
+
+    The shared sessions must not be closed by their users. They are closed by `close()`, on application shutdown.
+    """
+    _hcr_logger: Optional[HummingbotLogger] = None
+    _shared_instance: "HttpClientRegistry" = None
+
+    CONNECTION_LIMIT = 100
+    CONNECTION_LIMIT_PER_HOST = 20
+    KEEPALIVE_TIMEOUT = 30.0
+    DNS_CACHE_TTL = 300
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hcr_logger is None:
+            cls._hcr_logger = logging.getLogger(__name__)
+        return cls._hcr_logger
+
+    @classmethod
+    def get_instance(cls) -> "HttpClientRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = HttpClientRegistry()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._clients: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._connections_created: int = 0
+        self._connections_reused: int = 0
+        self._requests: int = 0
+
+    def get_client(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared client session of the current event loop, creating it if needed.
+        """
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        client: Optional[aiohttp.ClientSession] = self._clients.get(ev_loop)
+        if client is None or client.closed:
+            # Forget the sessions of the event loops closed since, e.g. in tests.
+            for closed_loop in [loop for loop in self._clients if loop.is_closed()]:
+                del self._clients[closed_loop]
+            client = self._clients[ev_loop] = self._create_client()
+        return client
+
+    def _create_client(self) -> aiohttp.ClientSession:
+        trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace_config.on_request_start.append(self._on_request_start)
+        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self.CONNECTION_LIMIT,
+                                                               limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+                                                               keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                                                               ttl_dns_cache=self.DNS_CACHE_TTL,
+                                                               enable_cleanup_closed=True)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        self._connections_created += 1
+
+    async def _on_connection_reuseconn(self, session, trace_config_ctx, params):
+        self._connections_reused += 1
+
+    async def _on_request_start(self, session, trace_config_ctx, params):
+        self._requests += 1
+
+    @property
+    def stats(self) -> HttpClientStats:
+        idle_connections: int = 0
+        acquired_connections: int = 0
+        for client in self._clients.values():
+            if client.closed:
+                continue
+            # The pooled connections aren't part of the public connector API.
+            idle_connections += sum(len(conns) for conns in getattr(client.connector, "_conns", {}).values())
+            acquired_connections += len(getattr(client.connector, "_acquired", ()))
+        return HttpClientStats(sessions=len(self._clients),
+                               open_connections=idle_connections + acquired_connections,
+                               idle_connections=idle_connections,
+                               connections_created=self._connections_created,
+                               connections_reused=self._connections_reused,
+                               requests=self._requests)
+
+    async def close(self):
+        """
+        Closes the shared client session of the current event loop, and forgets the ones of the other event loops.
+        """
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        clients: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = self._clients
+        self._clients = {}
+        for loop, client in clients.items():
+            if loop is ev_loop and not client.closed:
+                await client.close()
+
+
+@asynccontextmanager
+async def shared_client_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Drop-in replacement for `async with aiohttp.ClientSession() as client:` blocks, which yields the shared client
+    session of the current event loop instead of a new one, and leaves it open.
+    """
+    yield HttpClientRegistry.get_instance().get_client()
@@ -1,10 +1,10 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from decimal import Decimal
 import importlib
 from hummingbot.core.utils import async_ttl_cache
-from hummingbot.client.settings import ALL_CONNECTORS, CONNECTOR_SETTINGS, ConnectorType
-from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.client.settings import ALL_CONNECTORS
 from hummingbot.connector.exchange.binance.binance_utils import USD_QUOTES
+from hummingbot.core.utils.price_oracle import PriceOracle
 
 
 async def usd_value(token: str, amount: Decimal) -> Optional[Decimal]:
@@ -16,12 +16,14 @@ async def usd_value(token: str, amount: Decimal) -> Optional[Decimal]:
 
 async def get_binance_mid_price(trading_pair: str) -> Dict[str, Decimal]:
     # Binance is the place to go to for pricing atm
+    from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
     prices = await BinanceAPIOrderBookDataSource.get_all_mid_prices()
     return prices.get(trading_pair, None)
 
 
 @async_ttl_cache(ttl=5, maxsize=100)
 async def token_usd_values() -> Dict[str, Decimal]:
+    from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
     prices = await BinanceAPIOrderBookDataSource.get_all_mid_prices()
     prices = {k: v for k, v in prices.items() if k is not None}
     tokens = {t.split("-")[0] for t in prices}
@@ -43,8 +45,9 @@ async def token_usd_values() -> Dict[str, Decimal]:
 
 
 def get_mid_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
-
-    mid_price = None
+    mid_price = PriceOracle.get_instance().get_live_price(exchange, trading_pair, mid_price=True)
+    if mid_price is not None:
+        return mid_price
     for connector_type, connectors in ALL_CONNECTORS.items():
         if exchange in connectors:
             try:
@@ -66,18 +69,8 @@ def get_mid_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
 
 
 async def get_last_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
-    if exchange in CONNECTOR_SETTINGS:
-        conn_setting = CONNECTOR_SETTINGS[exchange]
-        if CONNECTOR_SETTINGS[exchange].type in (ConnectorType.Exchange, ConnectorType.Derivative):
-            module_name = f"{conn_setting.base_name()}_api_order_book_data_source"
-            class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
-                         "APIOrderBookDataSource"
-            module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
-                          f"{conn_setting.base_name()}.{module_name}"
-            module = getattr(importlib.import_module(module_path), class_name)
-            args = {"trading_pairs": [trading_pair]}
-            if conn_setting.is_sub_domain:
-                args["domain"] = conn_setting.domain_parameter
-            last_prices = await module.get_last_traded_prices(**args)
-            if last_prices:
-                return Decimal(str(last_prices[trading_pair]))
+    return await PriceOracle.get_instance().get_last_price(exchange, trading_pair)
+
+
+async def get_last_prices(exchange: str, trading_pairs: List[str]) -> Dict[str, Optional[Decimal]]:
+    return await PriceOracle.get_instance().get_last_prices(exchange, trading_pairs)
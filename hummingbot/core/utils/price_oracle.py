@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+
+import asyncio
+from decimal import Decimal
+from functools import lru_cache
+import importlib
+import logging
+import math
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.client.settings import (
+    CONNECTOR_SETTINGS,
+    ConnectorType,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+@lru_cache(maxsize=None)
+def order_book_data_source(exchange: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+    """
+    Returns the order book data source class of an exchange or derivative connector, and the arguments which select
+    its domain, or None if the connector has none.
+    """
+    conn_setting = CONNECTOR_SETTINGS.get(exchange)
+    if conn_setting is None or conn_setting.type not in (ConnectorType.Exchange, ConnectorType.Derivative):
+        return None
+    module_name: str = f"{conn_setting.base_name()}_api_order_book_data_source"
+    class_name: str = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
+                      "APIOrderBookDataSource"
+    module_path: str = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
+                       f"{conn_setting.base_name()}.{module_name}"
+    data_source = getattr(importlib.import_module(module_path), class_name)
+    args: Dict[str, str] = {}
+    if conn_setting.is_sub_domain:
+        args["domain"] = conn_setting.domain_parameter
+    return data_source, args
+
+
+class PriceOracle:
+    """
+    Process-wide source of the last traded prices of the markets, for the performance metrics, the kill switch and
+    the status reports.
+
+    Prices are read from the order books of the running connectors when they track the market. Otherwise they're
+    fetched from the REST API of the exchange and cached for `price_ttl` seconds. The lookups of an exchange requested
+    while a fetch is being scheduled are batched into a single `get_last_traded_prices()` call, and concurrent lookups
+    of the same market share the same request.
+    """
+    _po_logger: Optional[HummingbotLogger] = None
+    _shared_instance: "PriceOracle" = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._po_logger is None:
+            cls._po_logger = logging.getLogger(__name__)
+        return cls._po_logger
+
+    @classmethod
+    def get_instance(cls) -> "PriceOracle":
+        if cls._shared_instance is None:
+            cls._shared_instance = PriceOracle()
+        return cls._shared_instance
+
+    def __init__(self, price_ttl: float = 5.0, batch_delay: float = 0.01):
+        """
+        :param price_ttl: time for which the fetched prices are served from the cache, in seconds
+        :param batch_delay: time for which the lookups of an exchange are collected before fetching them, in seconds
+        """
+        self._price_ttl: float = price_ttl
+        self._batch_delay: float = batch_delay
+        self._connectors: Dict[str, Any] = {}
+        self._prices: Dict[Tuple[str, str], Tuple[float, Decimal]] = {}
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._pending: Dict[str, List[str]] = {}
+        self._fetches: int = 0
+
+    @property
+    def fetches(self) -> int:
+        """
+        Number of REST calls made for the prices.
+        """
+        return self._fetches
+
+    def add_connector(self, connector_name: str, connector: Any):
+        # Paper trade connectors track the order books of their exchange, and are looked up by the exchange name.
+        self._connectors[self._exchange_name(connector_name)] = connector
+
+    def remove_connectors(self):
+        self._connectors.clear()
+
+    def clear_cache(self):
+        self._prices.clear()
+
+    @staticmethod
+    def _exchange_name(exchange: str) -> str:
+        return exchange.replace("_PaperTrade", "")
+
+    def get_live_price(self, exchange: str, trading_pair: str, mid_price: bool = False) -> Optional[Decimal]:
+        """
+        Returns the last traded price from the order book of a running connector, or its mid price if asked for or
+        before any trade.
+        """
+        connector = self._connectors.get(self._exchange_name(exchange))
+        if connector is None or not connector.ready:
+            return None
+        order_book = getattr(connector, "order_books", {}).get(trading_pair)
+        if order_book is None:
+            return None
+        price: float = float("NaN") if mid_price else order_book.last_trade_price
+        if math.isnan(price):
+            try:
+                price = (order_book.get_price(True) + order_book.get_price(False)) / 2
+            except EnvironmentError:
+                return None
+        if math.isnan(price) or price <= 0:
+            return None
+        return Decimal(str(price))
+
+    def get_cached_price(self, exchange: str, trading_pair: str) -> Optional[Decimal]:
+        cached: Optional[Tuple[float, Decimal]] = self._prices.get((self._exchange_name(exchange), trading_pair))
+        if cached is not None and time.time() - cached[0] < self._price_ttl:
+            return cached[1]
+        return None
+
+    async def get_last_price(self, exchange: str, trading_pair: str) -> Optional[Decimal]:
+        prices: Dict[str, Optional[Decimal]] = await self.get_last_prices(exchange, [trading_pair])
+        return prices[trading_pair]
+
+    async def get_last_prices(self, exchange: str, trading_pairs: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Returns the last traded prices of the markets of an exchange, None for the ones which couldn't be found.
+        """
+        exchange = self._exchange_name(exchange)
+        prices: Dict[str, Optional[Decimal]] = {}
+        futures: Dict[str, asyncio.Future] = {}
+        for trading_pair in trading_pairs:
+            price: Optional[Decimal] = self.get_live_price(exchange, trading_pair)
+            if price is None:
+                price = self.get_cached_price(exchange, trading_pair)
+            if price is not None:
+                prices[trading_pair] = price
+            elif self._has_data_source(exchange):
+                futures[trading_pair] = self._request_price(exchange, trading_pair)
+            else:
+                prices[trading_pair] = None
+        for trading_pair, future in futures.items():
+            # Shielded, as the other lookups of the market wait for the same future.
+            prices[trading_pair] = await asyncio.shield(future)
+        return prices
+
+    def _has_data_source(self, exchange: str) -> bool:
+        try:
+            return order_book_data_source(exchange) is not None
+        except Exception:
+            self.logger().error(f"Error loading the order book data source of {exchange}.", exc_info=True)
+            return False
+
+    def _request_price(self, exchange: str, trading_pair: str) -> asyncio.Future:
+        key: Tuple[str, str] = (exchange, trading_pair)
+        future: Optional[asyncio.Future] = self._in_flight.get(key)
+        if future is None:
+            future = self._in_flight[key] = asyncio.get_event_loop().create_future()
+            if exchange not in self._pending:
+                self._pending[exchange] = []
+                safe_ensure_future(self._fetch_prices(exchange))
+            self._pending[exchange].append(trading_pair)
+        return future
+
+    async def _fetch_prices(self, exchange: str):
+        await asyncio.sleep(self._batch_delay)
+        trading_pairs: List[str] = self._pending.pop(exchange)
+        last_prices: Dict[str, Any] = {}
+        try:
+            data_source, args = order_book_data_source(exchange)
+            self._fetches += 1
+            last_prices = await data_source.get_last_traded_prices(trading_pairs=trading_pairs, **args)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Error fetching the last traded prices of {', '.join(trading_pairs)} on {exchange}.",
+                                  exc_info=True,
+                                  app_warning_msg=f"Could not fetch the last traded prices from {exchange}.")
+        finally:
+            now: float = time.time()
+            for trading_pair in trading_pairs:
+                price: Optional[Decimal] = None
+                if last_prices.get(trading_pair) is not None:
+                    price = Decimal(str(last_prices[trading_pair]))
+                    self._prices[(exchange, trading_pair)] = (now, price)
+                future: asyncio.Future = self._in_flight.pop((exchange, trading_pair))
+                if not future.done():
+                    future.set_result(price)
@@ -1,21 +1,58 @@
+import asyncio
 import importlib
+import json
+import os
+import time
 from typing import (
     Dict,
     Any,
+    Iterable,
+    List,
     Optional,
+    Set,
+)
+from hummingbot import (
+    data_path,
+    get_executor,
 )
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
-from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
+from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorSetting, ConnectorType
 import logging
 
 from .async_utils import safe_ensure_future
 
 
+def trading_pair_source(conn_setting: ConnectorSetting) -> Any:
+    """
+    Imports and returns the class of a connector which fetches its trading pairs: the order book data source for the
+    exchanges and derivatives, the connector itself for the other connectors.
+    """
+    module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
+        else f"{conn_setting.base_name()}_api_order_book_data_source"
+    module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
+                  f"{conn_setting.base_name()}.{module_name}"
+    class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
+                 "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
+                 else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
+    return getattr(importlib.import_module(module_path), class_name)
+
+
 class TradingPairFetcher:
+    """
+    Catalogue of the trading pairs of the connectors, for the autocompletion and the validation of the markets.
+
+    The catalogue is persisted in the data directory and loaded on start, so that no connector module is imported
+    and no exchange is queried until the trading pairs of a connector are asked for. The trading pairs of a connector
+    are fetched in the background when they're missing or older than `CATALOGUE_TTL`.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    CATALOGUE_FILE_NAME = "trading_pairs.json"
+    CATALOGUE_TTL = 60 * 60 * 24
+    RETRY_INTERVAL = 60
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -28,28 +65,102 @@ class TradingPairFetcher:
             cls._sf_shared_instance = TradingPairFetcher()
         return cls._sf_shared_instance
 
-    def __init__(self):
-        self.ready = False
-        self.trading_pairs: Dict[str, Any] = {}
-        safe_ensure_future(self.fetch_all())
-
-    async def fetch_all(self):
-        tasks = []
-        fetched_connectors = []
-        for conn_setting in CONNECTOR_SETTINGS.values():
-            module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
-                else f"{conn_setting.base_name()}_api_order_book_data_source"
-            module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
-                          f"{conn_setting.base_name()}.{module_name}"
-            class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
-                         "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
-                         else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
-            module = getattr(importlib.import_module(module_path), class_name)
+    def __init__(self, catalogue_path: Optional[str] = None):
+        self._catalogue_path: str = catalogue_path or os.path.join(data_path(), self.CATALOGUE_FILE_NAME)
+        self.trading_pairs: Dict[str, List[str]] = {}
+        self._fetch_times: Dict[str, float] = {}
+        self._attempt_times: Dict[str, float] = {}
+        self._fetching: Set[str] = set()
+        self._load_catalogue()
+        # The catalogue can be used as soon as it's loaded. The connectors missing from it are considered to have no
+        # known trading pairs until they're fetched, which doesn't prevent the validation of their markets.
+        self.ready = True
+        self.refresh_stale()
+
+    def _load_catalogue(self):
+        try:
+            with open(self._catalogue_path) as catalogue_file:
+                catalogue: Dict[str, Dict[str, Any]] = json.load(catalogue_file)
+            for connector_name, entry in catalogue.items():
+                if connector_name in CONNECTOR_SETTINGS:
+                    self.trading_pairs[connector_name] = entry["trading_pairs"]
+                    self._fetch_times[connector_name] = entry["timestamp"]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self.logger().warning(f"Error loading the trading pair catalogue from {self._catalogue_path}. It will be "
+                                  f"fetched again.", exc_info=True)
+
+    def _save_catalogue(self, catalogue: Dict[str, Dict[str, Any]]):
+        temp_path: str = f"{self._catalogue_path}.tmp"
+        with open(temp_path, "w") as catalogue_file:
+            json.dump(catalogue, catalogue_file)
+        os.replace(temp_path, self._catalogue_path)
+
+    def is_stale(self, connector_name: str) -> bool:
+        fetch_time: Optional[float] = self._fetch_times.get(connector_name)
+        return fetch_time is None or time.time() - fetch_time > self.CATALOGUE_TTL
+
+    def get_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the known trading pairs of a connector, and fetches them in the background if they're missing or
+        stale.
+        """
+        if connector_name in CONNECTOR_SETTINGS and self.is_stale(connector_name) and \
+                connector_name not in self._fetching and \
+                time.time() - self._attempt_times.get(connector_name, 0) > self.RETRY_INTERVAL:
+            self._schedule_fetch([connector_name])
+        return self.trading_pairs.get(connector_name, [])
+
+    def refresh_stale(self):
+        """
+        Fetches again in the background the trading pairs of the catalogue which are stale.
+        """
+        stale_connectors: List[str] = [connector_name for connector_name in self.trading_pairs
+                                       if self.is_stale(connector_name)]
+        if len(stale_connectors) > 0:
+            self._schedule_fetch(stale_connectors)
+
+    def _schedule_fetch(self, connector_names: List[str]):
+        now: float = time.time()
+        for connector_name in connector_names:
+            self._attempt_times[connector_name] = now
+        safe_ensure_future(self.fetch_all(connector_names))
+
+    async def fetch_all(self, connector_names: Optional[Iterable[str]] = None):
+        """
+        Fetches the trading pairs of the connectors, all of them by default, and saves them to the catalogue.
+        """
+        async def fetch(conn_setting: ConnectorSetting) -> List[str]:
             args = {}
             args = conn_setting.add_domain_parameter(args)
-            tasks.append(module.fetch_trading_pairs(**args))
-            fetched_connectors.append(conn_setting.name)
+            return await trading_pair_source(conn_setting).fetch_trading_pairs(**args)
 
-        results = await safe_gather(*tasks, return_exceptions=True)
-        self.trading_pairs = dict(zip(fetched_connectors, results))
-        self.ready = True
+        connector_names = [connector_name for connector_name in (connector_names or CONNECTOR_SETTINGS.keys())
+                           if connector_name not in self._fetching]
+        if len(connector_names) == 0:
+            return
+        self._fetching.update(connector_names)
+        try:
+            for connector_name in connector_names:
+                self._attempt_times[connector_name] = time.time()
+            results = await safe_gather(*[fetch(CONNECTOR_SETTINGS[connector_name])
+                                          for connector_name in connector_names],
+                                        return_exceptions=True)
+        finally:
+            self._fetching.difference_update(connector_names)
+
+        now: float = time.time()
+        for connector_name, result in zip(connector_names, results):
+            # Failed fetches return no trading pairs, or raise. They're retried on a later lookup.
+            if isinstance(result, list) and len(result) > 0:
+                self.trading_pairs[connector_name] = result
+                self._fetch_times[connector_name] = now
+        catalogue: Dict[str, Dict[str, Any]] = {
+            connector_name: {"timestamp": self._fetch_times[connector_name], "trading_pairs": trading_pairs}
+            for connector_name, trading_pairs in self.trading_pairs.items()
+        }
+        try:
+            await asyncio.get_event_loop().run_in_executor(get_executor(), self._save_catalogue, catalogue)
+        except Exception:
+            self.logger().warning(f"Error saving the trading pair catalogue to {self._catalogue_path}.", exc_info=True)
@@ -11,6 +11,7 @@ cdef class MarketBase(NetworkIterator):
     cdef:
         EventReporter _event_reporter
         EventLogger _event_logger
+        object _order_filled_balances
         dict _account_available_balances
         dict _account_balances
         dict _asset_limit
@@ -24,7 +24,14 @@ from hummingbot.core.event.events import (
     TradeType,
     TradeFee
 )
-from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.event_logger import (
+    DEFAULT_MAX_EVENTS,
+    EventLogger,
+)
+from hummingbot.core.event.order_filled_balances import (
+    add_fill_balance_changes,
+    OrderFilledBalances,
+)
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.data_type.order_book import OrderBook
@@ -54,10 +61,16 @@ cdef class MarketBase(NetworkIterator):
     def __init__(self):
         super().__init__()
         self._event_reporter = EventReporter(event_source=self.name)
-        self._event_logger = EventLogger(event_source=self.name)
+        max_events = global_config_map["event_log_max_size"].value
+        max_age = global_config_map["event_log_max_age"].value
+        self._event_logger = EventLogger(event_source=self.name,
+                                         max_events=max_events if max_events is not None else DEFAULT_MAX_EVENTS,
+                                         max_age=max_age if max_age is not None else 0)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        self._order_filled_balances = OrderFilledBalances(self._split_exchange_trading_pair)
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._order_filled_balances)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -103,27 +116,22 @@ cdef class MarketBase(NetworkIterator):
         Calculates the individual asset balances as a result of order being filled
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
         opposite. This does not account for fee.
+        A starting timestamp of 0 gives the balances of all the fills since the market was created.
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
+        if starting_timestamp <= 0:
+            # The fill events since the start may have been evicted from the event log, not from the running totals.
+            return self._order_filled_balances.balances
+        order_filled_events = [o for o in self.events_of_type(OrderFilledEvent) if o.timestamp > starting_timestamp]
         balances = {}
         for event in order_filled_events:
-            hb_trading_pair = self.convert_from_exchange_trading_pair(event.trading_pair)
-            base, quote = hb_trading_pair.split("-")[0], hb_trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
+            base, quote = self._split_exchange_trading_pair(event.trading_pair)
+            add_fill_balance_changes(balances, base, quote, event)
         return balances
 
+    def _split_exchange_trading_pair(self, exchange_trading_pair: str) -> Tuple[str, str]:
+        base, quote = self.convert_from_exchange_trading_pair(exchange_trading_pair).split("-")
+        return base, quote
+
     @staticmethod
     def convert_from_exchange_trading_pair(exchange_trading_pair: str) -> Optional[str]:
         return exchange_trading_pair
@@ -148,6 +156,12 @@ cdef class MarketBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    def events_of_type(self, event_type: type) -> List[any]:
+        return self._event_logger.events_of_type(event_type)
+
+    def events_for_order(self, order_id: str) -> List[any]:
+        return self._event_logger.events_for_order(order_id)
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         raise NotImplementedError
@@ -11,4 +11,5 @@ def get_declarative_base():
     from .order import Order  # noqa: F401
     from .order_status import OrderStatus  # noqa: F401
     from .trade_fill import TradeFill  # noqa: F401
+    from .trade_history_cursor import TradeHistoryCursor  # noqa: F401
     return HummingbotBase
@@ -55,3 +55,11 @@ class DatabaseTransformation(ABC):
             logging.getLogger().info(f"Query to execute in DB: {query_to_execute}")
         else:
             engine.execute(query_to_execute)
+
+    def add_index(self, engine, table_name, index_name, column_names, dry_run=True):
+        columns = ", ".join(f'"{column_name}"' for column_name in column_names)
+        query_to_execute = f'CREATE INDEX IF NOT EXISTS \"{index_name}\" ON \"{table_name}\" ({columns})'
+        if dry_run:
+            logging.getLogger().info(f"Query to execute in DB: {query_to_execute}")
+        else:
+            engine.execute(query_to_execute)
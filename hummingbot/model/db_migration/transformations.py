@@ -45,3 +45,20 @@ class AddLeverageAndPositionColumns(DatabaseTransformation):
     @property
     def to_version(self):
         return 20210119
+
+
+class AddTradeFillOrderIdIndex(DatabaseTransformation):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        self.add_index(db_handle.engine, "TradeFill", "tf_order_id_index", ["order_id"], dry_run=False)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddTradeFillOrderIdIndex"
+
+    @property
+    def to_version(self):
+        return 20210120
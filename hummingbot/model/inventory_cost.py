@@ -45,6 +45,25 @@ class InventoryCost(HummingbotBase):
         quote_volume: Decimal,
         overwrite: bool = False,
     ) -> None:
+        cls.update_volume(sql_session, base_asset, quote_asset, base_volume, quote_volume, overwrite)
+        try:
+            sql_session.commit()
+        except Exception:
+            sql_session.rollback()
+
+    @classmethod
+    def update_volume(
+        cls,
+        sql_session: Session,
+        base_asset: str,
+        quote_asset: str,
+        base_volume: Decimal,
+        quote_volume: Decimal,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Same as `add_volume`, without committing the session.
+        """
         if overwrite:
             update = {
                 "base_volume": base_volume,
@@ -68,8 +87,3 @@ class InventoryCost(HummingbotBase):
                 quote_volume=float(quote_volume),
             )
             sql_session.add(record)
-
-        try:
-            sql_session.commit()
-        except Exception:
-            sql_session.rollback()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import logging
+import threading
+import time
+from typing import (
+    Callable,
+    Deque,
+    List,
+    NamedTuple,
+    Optional,
+)
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+# A write job adds or updates rows in the session it's given. It can return a callback, which is called after the
+# rows are committed.
+SQLWriteJob = Callable[[Session], Optional[Callable[[], None]]]
+
+
+class QueuedSQLWrite(NamedTuple):
+    enqueue_time: float
+    rows: int
+    job: SQLWriteJob
+
+
+class SQLBatchWriter:
+    """
+    Write-behind queue for database writes. The write jobs are queued by the caller, and run on a dedicated worker
+    thread, which commits them in batches of at most `batch_size` rows, in a single transaction, every
+    `batch_interval` seconds.
+
+    Jobs are run in the order they're queued, in the worker thread's own session. So the callers never wait for the
+    database, but the rows they've queued are only visible to other sessions once `flush()` returns, or `drain()`
+    on the event loop.
+    """
+    _sbw_logger: Optional[HummingbotLogger] = None
+
+    # The write lag above which a warning is logged, in seconds.
+    LAG_WARNING_THRESHOLD = 5.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sbw_logger is None:
+            cls._sbw_logger = logging.getLogger(__name__)
+        return cls._sbw_logger
+
+    def __init__(self, sql: SQLConnectionManager, batch_interval: float = 0.1, batch_size: int = 100):
+        self._sql: SQLConnectionManager = sql
+        self._batch_interval: float = batch_interval
+        self._batch_size: int = batch_size
+        self._queue: Deque[QueuedSQLWrite] = deque()
+        self._queued_rows: int = 0
+        self._condition: threading.Condition = threading.Condition()
+        self._worker_thread: Optional[threading.Thread] = None
+        self._stopping: bool = False
+        self._writing: bool = False
+        self._flushing: int = 0
+        self._last_write_lag: float = 0.0
+        self._rows_written: int = 0
+
+    @property
+    def started(self) -> bool:
+        return self._worker_thread is not None
+
+    @property
+    def pending_writes(self) -> int:
+        """
+        The number of queued write jobs, not counting the batch being written.
+        """
+        return len(self._queue)
+
+    @property
+    def queue_lag(self) -> float:
+        """
+        How long the oldest queued write job has been waiting to be committed, in seconds.
+        """
+        with self._condition:
+            return time.monotonic() - self._queue[0].enqueue_time if len(self._queue) > 0 else 0.0
+
+    @property
+    def last_write_lag(self) -> float:
+        """
+        How long the oldest job of the last committed batch waited to be committed, in seconds.
+        """
+        return self._last_write_lag
+
+    @property
+    def rows_written(self) -> int:
+        return self._rows_written
+
+    def start(self):
+        if self._worker_thread is not None:
+            return
+        self._stopping = False
+        self._worker_thread = threading.Thread(target=self._write_loop, name="SQLBatchWriter", daemon=True)
+        self._worker_thread.start()
+
+    def stop(self):
+        """
+        Writes all the queued jobs, and stops the worker thread.
+        """
+        if self._worker_thread is None:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._worker_thread.join()
+        self._worker_thread = None
+
+    def enqueue(self, job: SQLWriteJob, rows: int = 1):
+        """
+        Queues a write job. If the writer isn't started, the job is run and committed right away.
+
+        :param job: write job, run with the worker thread's session
+        :param rows: number of rows the job writes, counted towards the batch size
+        """
+        if self._worker_thread is None:
+            self._write_batch([QueuedSQLWrite(time.monotonic(), rows, job)])
+            return
+        with self._condition:
+            self._queue.append(QueuedSQLWrite(time.monotonic(), rows, job))
+            self._queued_rows += rows
+            if self._queued_rows >= self._batch_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until all the jobs queued so far are committed. Returns False if the timeout expired first.
+        """
+        if self._worker_thread is None:
+            return True
+        deadline: Optional[float] = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while len(self._queue) > 0 or self._writing:
+                    remaining: Optional[float] = deadline - time.monotonic() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+            finally:
+                self._flushing -= 1
+        return True
+
+    async def drain(self):
+        """
+        Waits until all the jobs queued so far are committed, like `flush()` but without blocking the event loop.
+        """
+        if self._worker_thread is None:
+            return
+        await asyncio.get_event_loop().run_in_executor(None, self.flush)
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while len(self._queue) == 0 and not self._stopping:
+                    self._condition.wait()
+                if len(self._queue) == 0:
+                    return
+                # Wait for the batch to fill up, until its oldest job is due, or the writer is flushed or stopped.
+                due_time: float = self._queue[0].enqueue_time + self._batch_interval
+                if (self._queued_rows < self._batch_size and not self._stopping and self._flushing == 0 and
+                        time.monotonic() < due_time):
+                    self._condition.wait(due_time - time.monotonic())
+                batch: List[QueuedSQLWrite] = []
+                rows: int = 0
+                while len(self._queue) > 0 and (len(batch) == 0 or rows + self._queue[0].rows <= self._batch_size):
+                    batch.append(self._queue[0])
+                    rows += self._queue[0].rows
+                    self._queue.popleft()
+                self._queued_rows -= rows
+                self._writing = True
+            try:
+                self._write_batch(batch)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write_batch(self, batch: List[QueuedSQLWrite]):
+        session: Session = self._sql.get_new_session()
+        callbacks: List[Callable[[], None]] = []
+        try:
+            try:
+                for queued_write in batch:
+                    callback: Optional[Callable[[], None]] = queued_write.job(session)
+                    if callback is not None:
+                        callbacks.append(callback)
+                session.commit()
+            except Exception:
+                session.rollback()
+                if len(batch) == 1:
+                    raise
+                # Write the jobs one by one, so a failing job doesn't discard the rest of the batch.
+                self.logger().warning(f"Error writing a batch of {len(batch)} jobs. Writing them one by one.",
+                                      exc_info=True)
+                callbacks.clear()
+                for queued_write in batch:
+                    try:
+                        callback = queued_write.job(session)
+                        session.commit()
+                        if callback is not None:
+                            callbacks.append(callback)
+                    except Exception:
+                        session.rollback()
+                        self.logger().error("Error writing to the database.", exc_info=True)
+            self._last_write_lag = time.monotonic() - batch[0].enqueue_time
+            if self._last_write_lag > self.LAG_WARNING_THRESHOLD:
+                self.logger().warning(f"Database writes are lagging {self._last_write_lag:.1f} seconds behind, "
+                                      f"with {self.pending_writes} writes pending.")
+            self._rows_written += sum(queued_write.rows for queued_write in batch)
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    self.logger().error("Error calling a database write callback.", exc_info=True)
+        except Exception:
+            self.logger().error("Error writing to the database.", exc_info=True)
+        finally:
+            session.close()
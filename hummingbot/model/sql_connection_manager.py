@@ -46,7 +46,7 @@ class SQLConnectionManager:
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20210119"
+    LOCAL_DB_VERSION_VALUE = "20210120"
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -150,6 +150,9 @@ class SQLConnectionManager:
     def get_shared_session(self) -> Session:
         return self._shared_session
 
+    def get_new_session(self) -> Session:
+        return self._session_cls()
+
     def get_local_db_version(self):
         query: Query = (self._shared_session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
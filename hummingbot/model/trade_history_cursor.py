@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+from sqlalchemy import (
+    Column,
+    Text,
+    Integer,
+    BigInteger,
+    Index
+)
+
+from . import HummingbotBase
+
+
+class TradeHistoryCursor(HummingbotBase):
+    """
+    Last trade id of a trading pair already reconciled with the exchange's trade history, so that the next
+    reconciliation only downloads the newer trades.
+    """
+    __tablename__ = "TradeHistoryCursor"
+    __table_args__ = (Index("thc_market_symbol_index",
+                            "market", "symbol", unique=True),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    last_trade_id = Column(BigInteger, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradeHistoryCursor(id={self.id}, market='{self.market}', symbol='{self.symbol}', " \
+            f"last_trade_id={self.last_trade_id}, timestamp={self.timestamp})"
@@ -1,16 +1,20 @@
 import asyncio
 import traceback
 from multiprocessing import Queue
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Union
 from decimal import Decimal
 from statistics import mean, median
-from operator import itemgetter
+import numpy as np
 from .script_interface import OnTick, OnStatus, PMMParameters, CallNotify, CallLog, PmmMarketInfo, ScriptError
+from hummingbot.core.data_type.ring_buffer import RingBuffer
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent
 )
 
+# The number of mid prices kept, one per second: a day.
+MID_PRICES_CAPACITY = 24 * 60 * 60
+
 
 class ScriptBase:
     """
@@ -21,7 +25,8 @@ class ScriptBase:
         self._parent_queue: Queue = None
         self._child_queue: Queue = None
         self._queue_check_interval: float = 0.0
-        self.mid_prices: List[Decimal] = []
+        # The mid prices of the last ticks, one per second, as floats.
+        self.mid_prices: RingBuffer = RingBuffer(MID_PRICES_CAPACITY, interval=1.0)
         self.pmm_parameters: PMMParameters = None
         self.pmm_market_info: PmmMarketInfo = None
         # all_total_balances stores balances in {exchange: {token: balance}} format
@@ -40,7 +45,7 @@ class ScriptBase:
         """
         The current market mid price (the average of top bid and top ask)
         """
-        return self.mid_prices[-1]
+        return Decimal(str(self.mid_prices[-1]))
 
     async def run(self):
         asyncio.ensure_future(self.listen_to_parent())
@@ -58,7 +63,7 @@ class ScriptBase:
                     asyncio.get_event_loop().stop()
                     break
                 if isinstance(item, OnTick):
-                    self.mid_prices.append(item.mid_price)
+                    self.mid_prices.add_value(float(item.mid_price), item.timestamp)
                     self.pmm_parameters = item.pmm_parameters
                     self.all_total_balances = item.all_total_balances
                     self.all_available_balances = item.all_available_balances
@@ -107,7 +112,7 @@ class ScriptBase:
         samples = self.take_samples(self.mid_prices, interval, length)
         if samples is None:
             return None
-        return mean(samples)
+        return Decimal(str(np.mean(samples)))
 
     def avg_price_volatility(self, interval: int, length: int) -> Optional[Decimal]:
         """
@@ -147,10 +152,9 @@ class ScriptBase:
         samples = self.take_samples(self.mid_prices, interval, length + 1)
         if samples is None:
             return None
-        changes = []
-        for index in range(1, len(samples)):
-            changes.append(max(samples[index], samples[index - 1]) / min(samples[index], samples[index - 1]) - 1)
-        return locate_function(changes)
+        samples = np.array(samples, dtype=np.float64)
+        changes = np.maximum(samples[1:], samples[:-1]) / np.minimum(samples[1:], samples[:-1]) - 1
+        return Decimal(str(locate_function(changes.tolist())))
 
     @staticmethod
     def round_by_step(a_number: Decimal, step_size: Decimal):
@@ -163,26 +167,23 @@ class ScriptBase:
         return (a_number // step_size) * step_size
 
     @staticmethod
-    def take_samples(a_list: List[Any], interval: int, length: int) -> Optional[List[any]]:
+    def take_samples(a_list: Union[List[Any], RingBuffer], interval: int, length: int) -> Optional[List[any]]:
         """
         Takes samples out of a given list where the last item is the most recent,
         Examples: a list = [1, 2, 3, 4, 5, 6, 7] an interval of 3 and length of 2 will return you [4, 7],
         for an interval of 2 and length of 4, you'll get [1, 3, 5, 7]
-        :param a_list: A list which to take samples from
+        :param a_list: A list or ring buffer which to take samples from
         :param interval: The interval at which to take sample, starting from the last item on the list.
         :param length: The number of the samples.
         :returns None if there is not enough samples to satisfy length, otherwise the sample list.
         """
-        index_list = list(range(len(a_list) - 1, -1, -1 * interval))
-        index_list = sorted(index_list)
-        index_list = index_list[-1 * length:]
-        if len(index_list) < length:
+        if isinstance(a_list, RingBuffer):
+            samples = a_list.take_samples(interval, length)
+            return samples.tolist() if samples is not None else None
+        first_index = len(a_list) - 1 - interval * (length - 1)
+        if first_index < 0:
             return None
-        if len(index_list) == 1:
-            # return a list with just 1 item in it.
-            return [a_list[index_list[0]]]
-        samples = list(itemgetter(*index_list)(a_list))
-        return samples
+        return list(a_list[first_index::interval])
 
     def on_tick(self):
         """
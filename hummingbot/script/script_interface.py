@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional
 from decimal import Decimal
 
 child_queue = None
@@ -117,8 +117,10 @@ class OnTick:
                  pmm_parameters: PMMParameters,
                  all_total_balances: Dict[str, Dict[str, Decimal]],
                  all_available_balances: Dict[str, Dict[str, Decimal]],
+                 timestamp: Optional[float] = None,
                  ):
         self.mid_price = mid_price
+        self.timestamp = timestamp
         self.pmm_parameters = pmm_parameters
         self.all_total_balances = all_total_balances
         self.all_available_balances = all_available_balances
@@ -99,7 +99,7 @@ cdef class ScriptIterator(TimeIterator):
                 param_value = getattr(self._strategy, attr)
                 setattr(pmm_strategy, attr, param_value)
         cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
+                                     self.all_total_balances(), self.all_available_balances(), timestamp)
         self._parent_queue.put(on_tick)
 
     def _did_complete_buy_order(self,
@@ -4,9 +4,9 @@ import asyncio
 from typing import Dict, List, Set
 import pandas as pd
 import numpy as np
-from statistics import mean
 import time
 from hummingbot.core.clock import Clock
+from hummingbot.core.data_type.ring_buffer import RingBuffer
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.connector.exchange_base import ExchangeBase
@@ -69,7 +69,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        # The mid prices needed for the volatility calculation, one per second.
+        self._mid_prices = {
+            market: RingBuffer(volatility_interval * avg_volatility_period, interval=1.0,
+                               range_window=volatility_interval)
+            for market in market_infos
+        }
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
@@ -382,25 +387,15 @@ class LiquidityMiningStrategy(StrategyPyBase):
     def update_mid_prices(self):
         for market in self._market_infos:
             mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+            self._mid_prices[market].add_value(float(mid_price), self.current_timestamp)
 
     def update_volatility(self):
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
         for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+            # The average of the (max - min) / min ranges of the mid prices, over the volatility intervals.
+            volatility = mid_prices.volatility(self._avg_volatility_period)
+            if not np.isnan(volatility):
+                self._volatility[market] = Decimal(str(volatility))
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
                 if not vol.is_nan():
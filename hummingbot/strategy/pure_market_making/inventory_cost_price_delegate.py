@@ -1,37 +1,76 @@
 from decimal import Decimal, InvalidOperation
-from typing import Optional
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from sqlalchemy.orm import Session
 
 from hummingbot.core.event.events import OrderFilledEvent, TradeType
 from hummingbot.model.inventory_cost import InventoryCost
+from hummingbot.model.sql_batch_writer import SQLBatchWriter
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
 s_decimal_0 = Decimal("0")
 
 
 class InventoryCostPriceDelegate:
-    def __init__(self, sql: SQLConnectionManager, trading_pair: str) -> None:
+    """
+    Inventory cost price of a trading pair. The base and quote volumes are loaded from the database at start, and then
+    kept in memory and updated from the fill events, so the price lookups never query the database.
+
+    The volumes are written behind by a `SQLBatchWriter`, as totals, so a write only needs the latest volumes, and the
+    writes of successive fills are coalesced while one is pending. If the bot stops before a write is committed, the
+    database keeps the volumes of the last committed write. Without a started writer, the volumes are written right
+    away.
+    """
+    def __init__(self, sql: SQLConnectionManager, trading_pair: str, writer: Optional[SQLBatchWriter] = None) -> None:
         self.base_asset, self.quote_asset = trading_pair.split("-")
-        self._session = sql.get_shared_session()
+        self._writer: SQLBatchWriter = writer if writer is not None else SQLBatchWriter(sql)
+        self._write_pending: bool = False
+        # (base volume, quote volume), replaced as a whole so the writer thread always reads a consistent pair.
+        self._volumes: Optional[Tuple[Decimal, Decimal]] = None
+        # The query below can only see the committed writes.
+        self._writer.flush()
+        session: Session = sql.get_new_session()
+        try:
+            record: Optional[InventoryCost] = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+            if record is not None and record.base_volume is not None and record.quote_volume is not None:
+                self._volumes = (Decimal(record.base_volume), Decimal(record.quote_volume))
+        finally:
+            session.close()
 
     @property
     def ready(self) -> bool:
         return True
 
-    def get_price(self) -> Optional[Decimal]:
-        record = InventoryCost.get_record(
-            self._session, self.base_asset, self.quote_asset
-        )
+    @property
+    def writer(self) -> SQLBatchWriter:
+        return self._writer
 
-        if record is None or record.base_volume is None or record.base_volume is None:
+    @property
+    def volumes(self) -> Optional[Tuple[Decimal, Decimal]]:
+        return self._volumes
+
+    def get_price(self) -> Optional[Decimal]:
+        if self._volumes is None:
             return None
+        base_volume, quote_volume = self._volumes
 
         try:
-            price = record.quote_volume / record.base_volume
+            price = quote_volume / base_volume
         except InvalidOperation:
             # decimal.InvalidOperation: [<class 'decimal.DivisionUndefined'>] - both volumes are 0
             return None
         return Decimal(price)
 
+    def set_volumes(self, base_volume: Decimal, quote_volume: Decimal) -> None:
+        """
+        Overwrites the inventory cost, e.g. when the inventory price is configured while the strategy is running.
+        """
+        self._volumes = (base_volume, quote_volume)
+        self._schedule_write()
+
     def process_order_fill_event(self, fill_event: OrderFilledEvent) -> None:
         base_asset, quote_asset = fill_event.trading_pair.split("-")
         quote_volume = fill_event.amount * fill_event.price
@@ -57,14 +96,30 @@ class InventoryCostPriceDelegate:
                     base_volume /= 1 + fill_event.trade_fee.percent
 
         if fill_event.trade_type == TradeType.SELL:
-            record = InventoryCost.get_record(self._session, base_asset, quote_asset)
-            if not record:
+            if self._volumes is None:
                 raise RuntimeError("Sold asset without having inventory price set. This should not happen.")
 
             # We're keeping initial buy price intact. Profits are not changing inventory price intentionally.
-            quote_volume = -(Decimal(record.quote_volume / record.base_volume) * base_volume)
+            quote_volume = -(Decimal(self._volumes[1] / self._volumes[0]) * base_volume)
             base_volume = -base_volume
 
-        InventoryCost.add_volume(
-            self._session, base_asset, quote_asset, base_volume, quote_volume
+        if self._volumes is None:
+            self._volumes = (base_volume, quote_volume)
+        else:
+            self._volumes = (self._volumes[0] + base_volume, self._volumes[1] + quote_volume)
+        self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        # The queued write reads the volumes when it runs, so the fills processed in the meantime don't need their own.
+        if self._write_pending:
+            return
+        self._write_pending = True
+        self._writer.enqueue(self._write_volumes)
+
+    def _write_volumes(self, session: Session) -> None:
+        # Cleared before the volumes are read, so the volumes set after the read schedule another write.
+        self._write_pending = False
+        base_volume, quote_volume = self._volumes
+        InventoryCost.update_volume(
+            session, self.base_asset, self.quote_asset, base_volume, quote_volume, overwrite=True
         )
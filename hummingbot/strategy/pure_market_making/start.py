@@ -71,7 +71,9 @@ def start(self):
         inventory_cost_price_delegate = None
         if price_type == "inventory_cost":
             db = HummingbotApplication.main_application().trade_fill_db
-            inventory_cost_price_delegate = InventoryCostPriceDelegate(db, trading_pair)
+            # Writes the inventory cost behind, with the trade fills.
+            inventory_cost_price_delegate = InventoryCostPriceDelegate(db, trading_pair,
+                                                                       writer=self.markets_recorder.writer)
         take_if_crossed = c_map.get("take_if_crossed").value
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
@@ -134,8 +134,7 @@ cdef class StrategyBase(TimeIterator):
                          order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
+            order_filled_events = market.events_of_type(OrderFilledEvent)
             past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
 
         return sorted(past_trades, key=lambda x: x.timestamp)
@@ -121,7 +121,6 @@ def main():
         "pandas",
         "pytz",
         "pyyaml",
-        "python-binance==0.7.5",
         "sqlalchemy",
         "ujson",
         "yarl",
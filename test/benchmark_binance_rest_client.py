@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+from functools import partial
+import requests
+import time
+from typing import (
+    List,
+    Tuple,
+)
+
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRESTClient
+from hummingbot.connector.exchange.binance.binance_utils import RATE_LIMITS
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.asyncio_throttle import (
+    DEFAULT_PRIORITY,
+    RateLimit,
+    Throttler,
+)
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+
+# Simulated latency of the exchange, per request.
+SERVER_DELAY = 0.05
+# The connector's rate limits allow 10 requests per second.
+BURST_SIZE = 10
+
+
+async def start_server() -> Tuple[web.AppRunner, str]:
+    async def handle_order(request: web.Request) -> web.Response:
+        await asyncio.sleep(SERVER_DELAY)
+        return web.json_response({"clientOrderId": request.query.get("origClientOrderId"), "status": "CANCELED"})
+
+    app: web.Application = web.Application()
+    app.router.add_route("*", "/api/v3/order", handle_order)
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+    site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+async def scheduler_burst(base_url: str) -> float:
+    # What the connector did before: blocking requests in an executor, one at a time, every 0.5s at most.
+    scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.5)
+    session: requests.Session = requests.Session()
+
+    def cancel(order_id: str):
+        return session.delete(f"{base_url}/api/v3/order", params={"origClientOrderId": order_id}).json()
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*[scheduler.call_async(partial(cancel, f"order-{i}"), timeout_seconds=60)
+                           for i in range(BURST_SIZE)])
+    elapsed: float = time.perf_counter() - start
+    scheduler.stop()
+    session.close()
+    return elapsed
+
+
+async def client_burst(base_url: str) -> float:
+    client: BinanceRESTClient = BinanceRESTClient(base_url, "key", "secret", Throttler(rate_limits=RATE_LIMITS))
+    start: float = time.perf_counter()
+    await asyncio.gather(*[client.cancel_order("ETHUSDT", origClientOrderId=f"order-{i}") for i in range(BURST_SIZE)])
+    return time.perf_counter() - start
+
+
+async def cancel_behind_polling(base_url: str, prioritized: bool) -> float:
+    # The rate limit is saturated by polling requests when the cancellation is sent.
+    client: BinanceRESTClient = BinanceRESTClient(base_url, "key", "secret",
+                                                  Throttler(rate_limits=[RateLimit(5, 0.25)]))
+    polls: List[asyncio.Future] = [
+        asyncio.ensure_future(client.get_order("ETHUSDT", origClientOrderId=f"poll-{i}")) for i in range(20)
+    ]
+    await asyncio.sleep(0.01)
+    start: float = time.perf_counter()
+    if prioritized:
+        await client.cancel_order("ETHUSDT", origClientOrderId="cancel")
+    else:
+        await client.request("DELETE", "/api/v3/order", {"symbol": "ETHUSDT", "origClientOrderId": "cancel"},
+                             signed=True, priority=DEFAULT_PRIORITY)
+    elapsed: float = time.perf_counter() - start
+    await asyncio.gather(*polls)
+    return elapsed
+
+
+async def run_benchmarks():
+    runner, base_url = await start_server()
+    try:
+        print(f"Burst of {BURST_SIZE} cancellations, {SERVER_DELAY * 1e3:.0f}ms server latency:")
+        print(f"  requests + AsyncCallScheduler       {await scheduler_burst(base_url) * 1e3:>9,.1f}ms")
+        print(f"  BinanceRESTClient                   {await client_burst(base_url) * 1e3:>9,.1f}ms")
+        print("Cancellation latency behind 20 queued polling requests, 5 requests per 250ms:")
+        print(f"  without priority                    {await cancel_behind_polling(base_url, False) * 1e3:>9,.1f}ms")
+        print(f"  order priority                      {await cancel_behind_polling(base_url, True) * 1e3:>9,.1f}ms")
+    finally:
+        await HttpClientRegistry.get_instance().close()
+        await runner.cleanup()
+
+
+def main():
+    asyncio.get_event_loop().run_until_complete(run_benchmarks())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import numpy as np
+import time
+from typing import List
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+def make_order_book(depth: int) -> CompositeOrderBook:
+    order_book: CompositeOrderBook = CompositeOrderBook()
+    bid_prices: np.ndarray = 100.0 - np.arange(1, depth + 1) * 0.01
+    ask_prices: np.ndarray = 100.0 + np.arange(1, depth + 1) * 0.01
+    order_book.apply_numpy_snapshot(np.column_stack([bid_prices, np.full(depth, 10.0), np.ones(depth)]),
+                                    np.column_stack([ask_prices, np.full(depth, 10.0), np.ones(depth)]))
+    return order_book
+
+
+def simulate_market_orders(order_book: CompositeOrderBook, orders: int, amount: float, diff_interval: int) -> int:
+    """
+    Alternates market buys and sells, each walking a few levels deep and recording its fills. Every `diff_interval`
+    orders, a diff replenishes the top levels of the order book.
+    """
+    fills: int = 0
+    rng = np.random.RandomState(42)
+    for i in range(orders):
+        trade_type: TradeType = TradeType.BUY if i % 2 == 0 else TradeType.SELL
+        rows: List[OrderBookRow] = (order_book.simulate_buy(amount) if trade_type is TradeType.BUY
+                                    else order_book.simulate_sell(amount))
+        for fill_event in OrderFilledEvent.order_filled_events_from_order_book_rows(
+                i, "order", "COINALPHA-HBOT", trade_type, OrderType.MARKET, TradeFee(0), rows):
+            order_book.record_filled_order(fill_event)
+            fills += 1
+        if i % diff_interval == diff_interval - 1:
+            levels: np.ndarray = np.arange(1, 21) * 0.01
+            amounts: np.ndarray = 10.0 + rng.randint(0, 5, 20)
+            update_ids: np.ndarray = np.full(20, i + 2)
+            order_book.apply_numpy_diffs(np.column_stack([100.0 - levels, amounts, update_ids]),
+                                         np.column_stack([100.0 + levels, amounts, update_ids]),
+                                         i + 2)
+    return fills
+
+
+def main():
+    depth: int = 5000
+    orders: int = 20000
+    print(f"CompositeOrderBook, {depth:,} levels per side:")
+
+    order_book: CompositeOrderBook = make_order_book(depth)
+    start: float = time.perf_counter()
+    fills: int = simulate_market_orders(order_book, orders, 5.0, 50)
+    elapsed: float = time.perf_counter() - start
+    print(f"  {'market orders, with fills recorded':<40} {orders / elapsed:>12,.0f} orders/s ({fills:,} fills)")
+    print(f"  {'consumed levels left':<40} {len(list(order_book.traded_order_book.bid_entries())):>12,} bids, "
+          f"{len(list(order_book.traded_order_book.ask_entries())):,} asks")
+
+    queries: int = 20000
+    start = time.perf_counter()
+    for i in range(queries):
+        order_book.get_price(i % 2 == 0)
+        order_book.get_vwap_for_volume(i % 2 == 0, 30.0)
+    elapsed = time.perf_counter() - start
+    print(f"  {'price and vwap queries':<40} {queries / elapsed:>12,.0f} queries/s")
+
+
+if __name__ == "__main__":
+    main()
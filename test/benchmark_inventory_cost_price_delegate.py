@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import os
+import tempfile
+import time
+from typing import Callable
+
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.inventory_cost import InventoryCost
+from hummingbot.model.sql_batch_writer import SQLBatchWriter
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.strategy.pure_market_making.inventory_cost_price_delegate import InventoryCostPriceDelegate
+
+TRADING_PAIR = "BTC-USDT"
+ITERATIONS = 2000
+
+
+def fill_event(index: int) -> OrderFilledEvent:
+    return OrderFilledEvent(timestamp=index, order_id=f"order-{index}", trading_pair=TRADING_PAIR,
+                            trade_type=TradeType.BUY, order_type=OrderType.LIMIT, price=Decimal("9000"),
+                            amount=Decimal("0.1"), trade_fee=TradeFee(percent=Decimal("0.001"), flat_fees=[]))
+
+
+def timed(fn: Callable[[int], None]) -> float:
+    start: float = time.perf_counter()
+    for i in range(ITERATIONS):
+        fn(i)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                         db_path=os.path.join(temp_dir, "trades.sqlite"))
+        session = sql.get_shared_session()
+        writer: SQLBatchWriter = SQLBatchWriter(sql)
+        writer.start()
+        delegate: InventoryCostPriceDelegate = InventoryCostPriceDelegate(sql, TRADING_PAIR, writer=writer)
+
+        # What the delegate did before: one query per price lookup, and one read-modify-write per fill.
+        def query_fill(i: int):
+            InventoryCost.get_record(session, "BTC", "USDT")
+            InventoryCost.add_volume(session, "BTC", "USDT", Decimal("0.1"), Decimal("900"))
+
+        print(f"Per call, over {ITERATIONS:,} calls, SQLite database file:")
+        print(f"  process_order_fill_event, SQL read-modify-write  {timed(query_fill):>9,.1f}us")
+        print(f"  process_order_fill_event, write behind           "
+              f"{timed(lambda i: delegate.process_order_fill_event(fill_event(i))):>9,.1f}us")
+        print(f"  get_price, SQL query                             "
+              f"{timed(lambda i: InventoryCost.get_record(session, 'BTC', 'USDT')):>9,.1f}us")
+        print(f"  get_price, in memory                             {timed(lambda i: delegate.get_price()):>9,.1f}us")
+        writer.stop()
+        print(f"  database writes for {ITERATIONS:,} fills                  {writer.rows_written:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import random
+import time
+from typing import (
+    Any,
+    Dict,
+    List
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+
+
+def make_diff_payloads(count: int, levels_per_side: int) -> List[Dict[str, Any]]:
+    """
+    Binance depth update stream payloads, with prices and amounts as strings.
+    """
+    payloads: List[Dict[str, Any]] = []
+    for update_id in range(1, count + 1):
+        payloads.append({
+            "e": "depthUpdate",
+            "E": 1600000000000 + update_id,
+            "s": "ETHUSDT",
+            "U": update_id,
+            "u": update_id,
+            "b": [[f"{random.uniform(350, 400):.2f}", f"{random.choice([0, random.uniform(0, 20)]):.5f}"]
+                  for _ in range(levels_per_side)],
+            "a": [[f"{random.uniform(400.01, 450):.2f}", f"{random.choice([0, random.uniform(0, 20)]):.5f}"]
+                  for _ in range(levels_per_side)],
+        })
+    return payloads
+
+
+def run_row_path(payloads: List[Dict[str, Any]]) -> float:
+    order_book: OrderBook = OrderBook()
+    start: float = time.perf_counter()
+    for payload in payloads:
+        message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(payload, payload["E"] * 1e-3)
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    return time.perf_counter() - start
+
+
+def run_packed_path(payloads: List[Dict[str, Any]]) -> float:
+    order_book: OrderBook = OrderBook()
+    start: float = time.perf_counter()
+    for payload in payloads:
+        message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(payload, payload["E"] * 1e-3)
+        order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+    return time.perf_counter() - start
+
+
+def main():
+    count: int = 20000
+    print(f"Binance diff messages, {count} messages per run:")
+    for levels_per_side in (1, 10, 100):
+        payloads: List[Dict[str, Any]] = make_diff_payloads(count, levels_per_side)
+        row_elapsed: float = run_row_path(payloads)
+        packed_elapsed: float = run_packed_path(payloads)
+        print(f"  {levels_per_side:>3} levels per side: "
+              f"OrderBookRow path {count / row_elapsed:>10,.0f} msgs/s, "
+              f"packed float64 path {count / packed_elapsed:>10,.0f} msgs/s")
+
+
+if __name__ == "__main__":
+    main()
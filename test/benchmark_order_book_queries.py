@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import numpy as np
+import time
+from typing import (
+    Callable,
+    Iterator
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.indexed_order_book import IndexedOrderBook
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+
+NaN = float("nan")
+
+
+def make_order_book(levels: int, order_book_class=OrderBook) -> OrderBook:
+    mid_price: float = 100.0
+    offsets: np.ndarray = np.arange(1, levels + 1, dtype=np.float64) * 0.001
+    amounts: np.ndarray = np.random.uniform(0.1, 10.0, levels)
+    update_ids: np.ndarray = np.ones(levels, dtype=np.float64)
+    bids: np.ndarray = np.column_stack([mid_price - offsets, amounts, update_ids])
+    asks: np.ndarray = np.column_stack([mid_price + offsets, amounts[::-1], update_ids])
+    order_book: OrderBook = order_book_class()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def generator_price_for_volume(entries: Iterator, volume: float) -> OrderBookQueryResult:
+    """
+    The original generator based implementation of `c_get_price_for_volume()`, kept here as the baseline.
+    """
+    cumulative_volume: float = 0
+    result_price: float = NaN
+    for order_book_row in entries:
+        cumulative_volume += order_book_row.amount
+        if cumulative_volume >= volume:
+            result_price = order_book_row.price
+            break
+    return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+
+def run(name: str, func: Callable, iterations: int):
+    start: float = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed: float = time.perf_counter() - start
+    print(f"  {name:<40} {iterations / elapsed:>12,.0f} queries/s")
+
+
+def main():
+    levels: int = 5000
+    iterations: int = 200
+    order_book: OrderBook = make_order_book(levels)
+    # Ask for slightly more than the whole book, so every query walks all levels.
+    volume: float = sum(row.amount for row in order_book.ask_entries()) + 1.0
+
+    print(f"Order book depth queries, {levels} levels per side, full depth walk:")
+    run("generator get_price_for_volume (old)",
+        lambda: generator_price_for_volume(order_book.ask_entries(), volume), iterations)
+    run("native get_price_for_volume",
+        lambda: order_book.get_price_for_volume(True, volume), iterations)
+    run("native get_vwap_for_volume",
+        lambda: order_book.get_vwap_for_volume(True, volume), iterations)
+    run("native get_price_for_quote_volume",
+        lambda: order_book.get_price_for_quote_volume(False, volume * 100), iterations)
+    run("native get_quote_volume_for_base_amount",
+        lambda: order_book.get_quote_volume_for_base_amount(False, volume), iterations)
+    run("native get_volume_for_price",
+        lambda: order_book.get_volume_for_price(True, 1e9), iterations)
+    run("native get_quote_volume_for_price",
+        lambda: order_book.get_quote_volume_for_price(False, 0.0), iterations)
+
+    indexed_order_book: IndexedOrderBook = make_order_book(levels, IndexedOrderBook)
+    print(f"IndexedOrderBook, {levels} levels per side, full depth walk:")
+    run("indexed get_price_for_volume",
+        lambda: indexed_order_book.get_price_for_volume(True, volume), iterations)
+    run("indexed get_vwap_for_volume",
+        lambda: indexed_order_book.get_vwap_for_volume(True, volume), iterations)
+    run("indexed get_volume_for_price",
+        lambda: indexed_order_book.get_volume_for_price(True, 1e9), iterations)
+
+
+if __name__ == "__main__":
+    main()
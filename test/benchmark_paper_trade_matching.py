@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import numpy as np
+import time
+from typing import (
+    List,
+    Tuple,
+)
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    OrderType,
+    TradeType,
+)
+
+
+class BenchmarkDataSource(OrderBookTrackerDataSource):
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        raise NotImplementedError
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class BenchmarkOrderBookTracker(OrderBookTracker):
+    @property
+    def exchange_name(self) -> str:
+        return "binance"
+
+
+class BenchmarkMarket:
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+
+def make_market(trading_pairs: List[str]) -> PaperTradeExchange:
+    tracker: BenchmarkOrderBookTracker = BenchmarkOrderBookTracker(BenchmarkDataSource(trading_pairs), trading_pairs)
+    market: PaperTradeExchange = PaperTradeExchange(tracker, MarketConfig.default_config(), BenchmarkMarket)
+    for trading_pair in trading_pairs:
+        order_book: OrderBook = tracker.data_source.order_book_create_function()
+        order_book.apply_numpy_snapshot(np.array([[99.0, 1000.0, 1]]), np.array([[101.0, 1000.0, 1]]))
+        tracker.order_books[trading_pair] = order_book
+        market.set_balance(trading_pair.split("-")[0], Decimal(10 ** 9))
+    market.set_balance("HBOT", Decimal(10 ** 9))
+    tracker._order_books_initialized.set()
+    assert market.ready
+    return market
+
+
+def place_orders(market: PaperTradeExchange, trading_pairs: List[str], orders_per_pair: int):
+    """
+    Resting limit orders on both sides of every trading pair, none of them crossing the order book.
+    """
+    for trading_pair in trading_pairs:
+        for i in range(orders_per_pair // 2):
+            market.sell(trading_pair, Decimal(1), OrderType.LIMIT, Decimal(102 + i * 0.01))
+            market.buy(trading_pair, Decimal(1), OrderType.LIMIT, Decimal(98 - i * 0.001))
+
+
+def main():
+    trading_pairs: List[str] = [f"COIN{i}-HBOT" for i in range(20)]
+    orders_per_pair: int = 500
+    ticks: int = 2000
+
+    market: PaperTradeExchange = make_market(trading_pairs)
+    place_orders(market, trading_pairs, orders_per_pair)
+    print(f"PaperTradeExchange, {len(market.limit_orders):,} resting limit orders on {len(trading_pairs)} pairs:")
+
+    clock: Clock = Clock(ClockMode.BACKTEST, 1.0, 0, ticks)
+    clock.add_iterator(market)
+    start: float = time.perf_counter()
+    clock.backtest_til(ticks)
+    elapsed: float = time.perf_counter() - start
+    print(f"  {'tick without fills':<40} {ticks / elapsed:>12,.0f} ticks/s")
+
+    # Sweep the asks up with buy trades, filling 10 orders per trade.
+    trade_events: List[OrderBookTradeEvent] = [
+        OrderBookTradeEvent(trading_pair, 0, TradeType.BUY, 102 + (i + 1) * 0.1 - 0.005, 10.0)
+        for i in range(orders_per_pair // 20)
+        for trading_pair in trading_pairs
+    ]
+    start = time.perf_counter()
+    for trade_event in trade_events:
+        market.match_trade_to_limit_orders(trade_event)
+    elapsed = time.perf_counter() - start
+    filled: int = len(trading_pairs) * orders_per_pair // 2 - sum(not order.is_buy for order in market.limit_orders)
+    print(f"  {'limit order fills from trades':<40} {filled / elapsed:>12,.0f} fills/s ({filled:,} fills)")
+
+    # Move the best asks under the resting bids, and fill them all on the next tick.
+    for trading_pair in trading_pairs:
+        market.order_books[trading_pair].apply_numpy_snapshot(np.array([[90.0, 1000.0, 2]]),
+                                                              np.array([[91.0, 1000.0, 2]]))
+    clock = Clock(ClockMode.BACKTEST, 1.0, 0, 1)
+    clock.add_iterator(market)
+    start = time.perf_counter()
+    clock.backtest_til(1)
+    elapsed = time.perf_counter() - start
+    filled = len(trading_pairs) * orders_per_pair // 2 - sum(order.is_buy for order in market.limit_orders)
+    print(f"  {'crossed limit order fills':<40} {filled / elapsed:>12,.0f} fills/s ({filled:,} fills)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import namedtuple
+from decimal import Decimal
+import numpy as np
+import time
+from typing import (
+    List,
+    Tuple,
+)
+from unittest.mock import patch
+
+from hummingbot.client.performance import (
+    calculate_performance_metrics,
+    TradeColumns,
+)
+
+# The columns of a TradeFill query used by the performance metrics.
+TradeFillRow = namedtuple("TradeFillRow", "trade_type, price, amount, order_id, position, trade_fee")
+
+
+def make_rows(count: int, derivative: bool) -> List[TradeFillRow]:
+    """
+    Fills of orders with 1 to 3 fills each, alternating between the sides and positions.
+    """
+    rng: np.random.RandomState = np.random.RandomState(0)
+    order_numbers: np.ndarray = np.cumsum(rng.randint(0, 3, count) == 0)
+    prices: np.ndarray = rng.uniform(90, 110, count)
+    amounts: np.ndarray = rng.uniform(0.1, 10, count)
+    rows: List[TradeFillRow] = []
+    for order_number, price, amount in zip(order_numbers.tolist(), prices.tolist(), amounts.tolist()):
+        if derivative:
+            position: str = "OPEN" if order_number % 4 < 2 else "CLOSE"
+        else:
+            position: str = "NILL"
+        rows.append(TradeFillRow("BUY" if order_number % 2 == 0 else "SELL", price, amount, f"order-{order_number}",
+                                 position, {"percent": 0.001, "flat_fees": []}))
+    return rows
+
+
+def benchmark(rows: List[TradeFillRow]) -> Tuple[float, float]:
+    ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    start: float = time.perf_counter()
+    columns: TradeColumns = TradeColumns.from_trades(rows, "USDT")
+    loaded: float = time.perf_counter()
+    ev_loop.run_until_complete(calculate_performance_metrics("binance", "HBOT-USDT", columns,
+                                                             {"HBOT": Decimal("100"), "USDT": Decimal("10000")}))
+    return loaded - start, time.perf_counter() - loaded
+
+
+def main():
+    print("calculate_performance_metrics(), best of 3 runs:")
+    with patch("hummingbot.client.performance.get_last_price") as get_last_price:
+        get_last_price.return_value = Decimal("100")
+        for derivative in (False, True):
+            for count in (10000, 100000, 1000000):
+                rows: List[TradeFillRow] = make_rows(count, derivative)
+                load_time, metrics_time = min(benchmark(rows) for _ in range(3))
+                print(f"  {'derivative' if derivative else 'spot':>10} {count:>9,} fills "
+                      f"load {load_time * 1e3:>9,.1f}ms metrics {metrics_time * 1e3:>9,.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
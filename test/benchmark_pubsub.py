@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from enum import Enum
+import time
+from typing import List
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class BenchmarkEvent(Enum):
+    Triggered = 1
+    Other = 2
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count: int = 0
+
+    def __call__(self, arg: any):
+        self.count += 1
+
+
+def benchmark_triggers(listener_count: int, triggers: int) -> float:
+    pubsub: PubSub = PubSub()
+    listeners: List[CountingListener] = [CountingListener() for _ in range(listener_count)]
+    for listener in listeners:
+        pubsub.add_listener(BenchmarkEvent.Triggered, listener)
+    # Listeners of other event tags don't take part in the dispatch.
+    other_listeners: List[CountingListener] = [CountingListener() for _ in range(10)]
+    for listener in other_listeners:
+        pubsub.add_listener(BenchmarkEvent.Other, listener)
+
+    start: float = time.perf_counter()
+    for _ in range(triggers):
+        pubsub.trigger_event(BenchmarkEvent.Triggered, None)
+    elapsed: float = time.perf_counter() - start
+    assert all(listener.count == triggers for listener in listeners)
+    return elapsed
+
+
+def main():
+    print("PubSub.trigger_event(), best of 5 runs:")
+    for listener_count, triggers in ((0, 1000000), (1, 500000), (10, 200000), (100, 20000)):
+        elapsed: float = min(benchmark_triggers(listener_count, triggers) for _ in range(5))
+        print(f"  {listener_count:>3} listeners {triggers / elapsed:>14,.0f} events/s "
+              f"{triggers * listener_count / elapsed:>14,.0f} listener calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+from operator import itemgetter
+import random
+from statistics import mean
+import time
+from typing import (
+    Callable,
+    List,
+)
+
+from hummingbot.core.data_type.ring_buffer import RingBuffer
+
+# A day of mid prices, one per second, as scripts keep them.
+HISTORY_SIZE = 24 * 60 * 60
+# Liquidity mining defaults: 5 minutes volatility interval, averaged over 10 intervals.
+VOLATILITY_INTERVAL = 300
+AVG_VOLATILITY_PERIOD = 10
+ITERATIONS = 200
+
+
+def list_take_samples(a_list: List[Decimal], interval: int, length: int) -> List[Decimal]:
+    # ScriptBase.take_samples before the ring buffer.
+    index_list = sorted(range(len(a_list) - 1, -1, -1 * interval))[-1 * length:]
+    return list(itemgetter(*index_list)(a_list))
+
+
+def list_volatility(mid_prices: List[Decimal]) -> Decimal:
+    # LiquidityMiningStrategy.update_volatility before the ring buffer.
+    last_index = len(mid_prices) - 1
+    atr = []
+    first_index = max(last_index - (VOLATILITY_INTERVAL * AVG_VOLATILITY_PERIOD), 0)
+    for i in range(last_index, first_index, VOLATILITY_INTERVAL * -1):
+        prices = mid_prices[i - VOLATILITY_INTERVAL + 1: i + 1]
+        atr.append((max(prices) - min(prices)) / min(prices))
+    return mean(atr)
+
+
+def timed(fn: Callable[[], None]) -> float:
+    start: float = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def main():
+    random.seed(1)
+    prices: List[float] = [100 + random.uniform(-1, 1) for _ in range(HISTORY_SIZE)]
+    decimal_prices: List[Decimal] = [Decimal(str(p)) for p in prices]
+    history: RingBuffer = RingBuffer(HISTORY_SIZE)
+    max_len: int = VOLATILITY_INTERVAL * AVG_VOLATILITY_PERIOD
+    volatility_buffer: RingBuffer = RingBuffer(max_len, range_window=VOLATILITY_INTERVAL)
+    for p in prices:
+        history.add_value(p)
+        volatility_buffer.add_value(p)
+    lm_list: List[Decimal] = decimal_prices[-max_len:]
+
+    def list_lm_tick():
+        nonlocal lm_list
+        lm_list.append(decimal_prices[-1])
+        lm_list = lm_list[-max_len:]
+        list_volatility(lm_list)
+
+    def buffer_lm_tick():
+        volatility_buffer.add_value(prices[-1])
+        volatility_buffer.volatility(AVG_VOLATILITY_PERIOD)
+
+    print(f"Per call, {HISTORY_SIZE:,} mid prices of history:")
+    print(f"  take_samples(60, 10), list                  "
+          f"{timed(lambda: list_take_samples(decimal_prices, 60, 10)):>11,.1f}us")
+    print(f"  take_samples(60, 10), ring buffer           {timed(lambda: history.take_samples(60, 10)):>11,.1f}us")
+    print(f"Liquidity mining tick, {VOLATILITY_INTERVAL}s interval over {AVG_VOLATILITY_PERIOD} periods:")
+    print(f"  append and volatility, list                 {timed(list_lm_tick):>11,.1f}us")
+    print(f"  append and volatility, ring buffer          {timed(buffer_lm_tick):>11,.1f}us")
+
+
+if __name__ == "__main__":
+    main()
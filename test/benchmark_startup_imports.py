@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import json
+import subprocess
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+PACKAGE_PATH: str = realpath(join(__file__, "../../"))
+
+# Each scenario runs in a fresh interpreter, so that the import costs are not shared between them.
+SCENARIO_SETUP: str = f"""
+import json, os, sys, tempfile, time
+sys.path.insert(0, {PACKAGE_PATH!r})
+start = time.perf_counter()
+from hummingbot.client.settings import CONNECTOR_SETTINGS
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher, trading_pair_source
+settings_elapsed = time.perf_counter() - start
+start = time.perf_counter()
+"""
+
+SCENARIO_REPORT: str = """
+elapsed = time.perf_counter() - start
+print(json.dumps({"settings_elapsed": settings_elapsed,
+                  "elapsed": elapsed,
+                  "modules": len(sys.modules),
+                  "connector_modules": len([m for m in sys.modules if m.startswith("hummingbot.connector.")])}))
+"""
+
+SCENARIOS: Dict[str, str] = {
+    # What the trading pair fetcher imported on start before the catalogue: every connector's data source.
+    "eager, all connectors": """
+for conn_setting in CONNECTOR_SETTINGS.values():
+    try:
+        trading_pair_source(conn_setting)
+    except Exception:
+        pass
+""",
+    # The catalogue is loaded on start, and only the data source of the connector in use is imported.
+    "lazy, catalogue + binance": """
+catalogue_path = os.path.join(tempfile.mkdtemp(), "trading_pairs.json")
+with open(catalogue_path, "w") as catalogue_file:
+    json.dump({name: {"timestamp": time.time(), "trading_pairs": ["ETH-USDT"]} for name in CONNECTOR_SETTINGS},
+              catalogue_file)
+fetcher = TradingPairFetcher(catalogue_path)
+fetcher.get_trading_pairs("binance")
+trading_pair_source(CONNECTOR_SETTINGS["binance"])
+""",
+}
+
+
+def run_scenario(code: str) -> Dict[str, Any]:
+    output: str = subprocess.check_output([sys.executable, "-c", SCENARIO_SETUP + code + SCENARIO_REPORT],
+                                          stderr=subprocess.DEVNULL)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    print("Startup imports of the trading pair catalogue, best of 3 runs:")
+    for name, code in SCENARIOS.items():
+        results: List[Dict[str, Any]] = [run_scenario(code) for _ in range(3)]
+        best: Dict[str, Any] = min(results, key=lambda r: r["elapsed"])
+        print(f"  {name:<28} settings {best['settings_elapsed'] * 1e3:>7,.1f}ms "
+              f"catalogue {best['elapsed'] * 1e3:>7,.1f}ms {best['modules']:>6,} modules "
+              f"{best['connector_modules']:>5,} connector modules")
+
+
+if __name__ == "__main__":
+    main()
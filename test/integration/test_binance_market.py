@@ -42,7 +42,6 @@ from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 from hummingbot.connector.exchange.binance.binance_exchange import (
     BinanceExchange,
     BinanceTime,
-    binance_client_module
 )
 from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
 from hummingbot.connector.markets_recorder import MarketsRecorder
@@ -456,10 +455,10 @@ class BinanceExchangeUnitTest(unittest.TestCase):
         [order_created_event] = self.run_parallel(
             self.market_logger.wait_for(BuyOrderCreatedEvent, timeout_seconds=10)
         )
-        order_data: Dict[str, any] = binance_client.get_order(
-            symbol=trading_pair,
+        order_data: Dict[str, any] = self.run_parallel(binance_client.get_order(
+            symbol=convert_to_exchange_trading_pair(trading_pair),
             origClientOrderId=bid_order_id
-        )
+        ))[0]
         quantized_bid_price: Decimal = self.market.quantize_order_price(trading_pair, Decimal(bid_price))
         bid_size_quantum: Decimal = self.market.get_order_size_quantum(trading_pair, Decimal(bid_amount))
         self.assertEqual(quantized_bid_price, Decimal(order_data["price"]))
@@ -484,10 +483,10 @@ class BinanceExchangeUnitTest(unittest.TestCase):
         [order_created_event] = self.run_parallel(
             self.market_logger.wait_for(SellOrderCreatedEvent, timeout_seconds=10)
         )
-        order_data = binance_client.get_order(
-            symbol=trading_pair,
+        order_data = self.run_parallel(binance_client.get_order(
+            symbol=convert_to_exchange_trading_pair(trading_pair),
             origClientOrderId=ask_order_id
-        )
+        ))[0]
         quantized_ask_price: Decimal = self.market.quantize_order_price(trading_pair, Decimal(ask_price))
         quantized_ask_size: Decimal = self.market.quantize_order_amount(trading_pair, Decimal(amount))
         self.assertEqual(quantized_ask_price, Decimal(order_data["price"]))
@@ -506,7 +505,7 @@ class BinanceExchangeUnitTest(unittest.TestCase):
             self.assertEqual(cr.success, True)
 
     def test_server_time_offset(self):
-        time_obj: BinanceTime = binance_client_module.time
+        time_obj: BinanceTime = BinanceTime.get_instance()
         old_check_interval: float = time_obj._server_time_offset_check_interval
         time_obj._server_time_offset_check_interval = 1.0
         time_obj.stop()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import logging
+import math
+import unittest
+import numpy as np
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.indexed_order_book import IndexedOrderBook
+
+
+class IndexedOrderBookUnitTest(unittest.TestCase):
+    def assertSameResult(self, expected, actual):
+        for field in ("query_price", "query_volume", "result_price", "result_volume"):
+            expected_value = getattr(expected, field)
+            actual_value = getattr(actual, field)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value), field)
+            else:
+                self.assertAlmostEqual(expected_value, actual_value, places=6, msg=field)
+
+    def assertSameBook(self, expected: OrderBook, actual: IndexedOrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        np.testing.assert_array_equal(expected.bid_depth_array(), actual.bid_depth_array())
+        np.testing.assert_array_equal(expected.ask_depth_array(7), actual.ask_depth_array(7))
+        self.assertEqual(expected.get_price(True), actual.get_price(True))
+        self.assertEqual(expected.get_price(False), actual.get_price(False))
+        for is_buy in (True, False):
+            for volume in (0.5, 3.0, 25.0, 1e6):
+                self.assertSameResult(expected.get_price_for_volume(is_buy, volume),
+                                      actual.get_price_for_volume(is_buy, volume))
+                self.assertSameResult(expected.get_vwap_for_volume(is_buy, volume),
+                                      actual.get_vwap_for_volume(is_buy, volume))
+                self.assertSameResult(expected.get_quote_volume_for_base_amount(is_buy, volume),
+                                      actual.get_quote_volume_for_base_amount(is_buy, volume))
+                self.assertSameResult(expected.get_price_for_quote_volume(is_buy, volume * 100),
+                                      actual.get_price_for_quote_volume(is_buy, volume * 100))
+            for price in (0.0, 95.0, 99.5, 100.0, 100.5, 105.0, 1e6):
+                self.assertSameResult(expected.get_volume_for_price(is_buy, price),
+                                      actual.get_volume_for_price(is_buy, price))
+                self.assertSameResult(expected.get_quote_volume_for_price(is_buy, price),
+                                      actual.get_quote_volume_for_price(is_buy, price))
+
+    def test_matches_order_book(self):
+        np.random.seed(7)
+        for dex in (False, True):
+            expected = OrderBook(dex=dex)
+            actual = IndexedOrderBook(dex=dex)
+            bids = np.array([[100 - i * 0.1, 1 + i % 3, 1] for i in range(1, 50)], dtype=np.float64)
+            asks = np.array([[100 + i * 0.1, 1 + i % 4, 1] for i in range(1, 50)], dtype=np.float64)
+            expected.apply_numpy_snapshot(bids, asks)
+            actual.apply_numpy_snapshot(bids, asks)
+            self.assertSameBook(expected, actual)
+
+            for update_id in range(2, 200):
+                bid_prices = np.round(np.random.uniform(94, 100.3, 5), 1)
+                ask_prices = np.round(np.random.uniform(99.7, 106, 5), 1)
+                bid_amounts = np.random.choice([0, 0.5, 2, 7], 5)
+                ask_amounts = np.random.choice([0, 0.5, 2, 7], 5)
+                ids = np.full(5, update_id, dtype=np.float64)
+                bid_diffs = np.column_stack([bid_prices, bid_amounts, ids])
+                ask_diffs = np.column_stack([ask_prices, ask_amounts, ids])
+                expected.apply_numpy_diffs(bid_diffs, ask_diffs)
+                actual.apply_numpy_diffs(bid_diffs, ask_diffs)
+                self.assertSameBook(expected, actual)
+
+    def test_empty_book(self):
+        order_book = IndexedOrderBook()
+        self.assertRaises(EnvironmentError, order_book.get_price, True)
+        result = order_book.get_price_for_volume(True, 1)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+        result = order_book.get_volume_for_price(False, 1)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
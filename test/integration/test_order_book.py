@@ -6,6 +6,7 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -53,6 +54,97 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2.5)
+        self.assertEqual(6, result.result_price)
+        self.assertEqual(2.5, result.result_volume)
+        result = order_book.get_price_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2.5)
+        self.assertAlmostEqual((4 + 5 + 6 * 0.5) / 2.5, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 1.5)
+        self.assertAlmostEqual((3 + 2 * 0.5) / 1.5, result.result_price)
+
+        result = order_book.get_price_for_quote_volume(True, 9)
+        self.assertEqual(5, result.result_price)
+        result = order_book.get_price_for_quote_volume(False, 4)
+        self.assertEqual(2, result.result_price)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 1.5)
+        self.assertAlmostEqual(6.5, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 1.5)
+        self.assertAlmostEqual(4, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 5.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_volume_for_price(False, 2)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(True, 5)
+        self.assertEqual(9, result.result_volume)
+        result = order_book.get_quote_volume_for_price(False, 1)
+        self.assertEqual(6, result.result_volume)
+
+    def test_depth_arrays(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        np.testing.assert_array_equal(bids_array[::-1], order_book.bid_depth_array())
+        np.testing.assert_array_equal(asks_array, order_book.ask_depth_array())
+        np.testing.assert_array_equal(asks_array[:2], order_book.ask_depth_array(2))
+
+        out = np.zeros((10, 3), dtype=np.float64)
+        result = order_book.bid_depth_array(out=out)
+        self.assertEqual((3, 3), result.shape)
+        self.assertTrue(np.shares_memory(out, result))
+        np.testing.assert_array_equal(bids_array[::-1], out[:3])
+        result = order_book.ask_depth_array(1, out=out)
+        np.testing.assert_array_equal(asks_array[:1], result)
+        self.assertRaises(ValueError, order_book.ask_depth_array, out=np.zeros((3, 2)))
+        self.assertRaises(ValueError, order_book.ask_depth_array, out=np.zeros((3, 3), dtype=np.float32))
+
+        bids, asks = order_book.depth_snapshot(2)
+        self.assertEqual([3., 1., 3.], bids.iloc[0].tolist())
+        self.assertEqual(2, len(asks))
+        self.assertEqual(["price", "amount", "update_id"], list(asks.columns))
+
+    def test_restore_from_snapshot_and_diffs(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 10,
+            "bids": [["99.5", "1.5"], ["99", "2"]],
+            "asks": [["100.5", "1", "extra field"]]
+        }, timestamp=1.0)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": update_id,
+                "bids": bids,
+                "asks": []
+            }, timestamp=1.0)
+            for update_id, bids in [(9, [["99.5", "0"]]), (11, [["99", "0"]]), (12, [])]
+        ]
+        np.testing.assert_array_equal([[99.5, 1.5, 10], [99, 2, 10]], snapshot.bids_array)
+        self.assertIs(snapshot.bids_array, snapshot.bids_array)
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+        self.assertEqual([(99.5, 1.5, 10)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual([(100.5, 1.0, 10)], [tuple(row) for row in order_book.ask_entries()])
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual(12, order_book.last_diff_uid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from decimal import Decimal
+import logging
+import os
+import tempfile
+from typing import Tuple
+import unittest
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    FILE_HEADER,
+    OrderBookRecorder,
+    OrderBookRecordReader,
+    RECORDING_FILE_MAGIC,
+    RECORDING_FILE_VERSION,
+    recording_file_path,
+)
+from hummingbot.core.data_type.order_book_replay_data_source import OrderBookReplayDataSource
+from hummingbot.core.data_type.order_book_replay_tracker import (
+    OrderBookReplayIterator,
+    OrderBookReplayTracker,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderBookTradeEvent,
+    OrderType,
+    TradeType,
+)
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class ReplayMarket:
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+
+class OrderBookReplayUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def record(self, snapshot_interval: float = 10.0):
+        """
+        Records a random walk of the order book, from timestamp 1000 to 1099, with a buy trade at 100 at timestamp
+        1050. Returns the bid and ask depth arrays of the live order book after every second.
+        """
+        rng = np.random.RandomState(42)
+        recorder = OrderBookRecorder(self.data_dir, snapshot_interval=snapshot_interval)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99.0, 1.0, 1], [98.0, 2.0, 1]]),
+                                        np.array([[101.0, 1.0, 1], [102.0, 2.0, 1]]))
+        recorder.record_snapshot(TRADING_PAIR, order_book, 1000)
+        states = {}
+        for update_id, timestamp in enumerate(range(1000, 1100), start=2):
+            bids = np.column_stack([90 + rng.randint(0, 10, 3), rng.randint(0, 3, 3), np.full(3, update_id)])
+            asks = np.column_stack([101 + rng.randint(0, 10, 3), rng.randint(0, 3, 3), np.full(3, update_id)])
+            order_book.apply_numpy_diffs(bids.astype(np.float64), asks.astype(np.float64), update_id)
+            recorder.record_diff(TRADING_PAIR, order_book, bids, asks, update_id, timestamp)
+            if timestamp == 1050:
+                recorder.record_trade(OrderBookTradeEvent(TRADING_PAIR, timestamp, TradeType.BUY, 100, 0.5), timestamp)
+            states[timestamp] = (order_book.bid_depth_array()[:, :2].copy(), order_book.ask_depth_array()[:, :2].copy())
+        recorder.close()
+        return states
+
+    def test_record_and_read(self):
+        self.record()
+        reader = OrderBookRecordReader(recording_file_path(self.data_dir, TRADING_PAIR))
+        records = list(reader)
+        types = [record.type for record in records]
+        self.assertEqual(100, types.count(OrderBookMessageType.DIFF))
+        self.assertEqual(1, types.count(OrderBookMessageType.TRADE))
+        # The initial snapshot, and one every 10 seconds after it.
+        self.assertEqual(10, types.count(OrderBookMessageType.SNAPSHOT))
+        trade = records[types.index(OrderBookMessageType.TRADE)]
+        self.assertEqual([[100, 0.5]], trade.bids[:, :2].tolist())
+        self.assertEqual(0, len(trade.asks))
+
+        snapshot = reader.seek_snapshot(1035)
+        self.assertEqual(1030, snapshot.timestamp)
+        self.assertEqual(OrderBookMessageType.DIFF, reader.peek().type)
+        self.assertEqual(1031, reader.peek().timestamp)
+        self.assertEqual(1000, reader.seek_snapshot(0).timestamp)
+        reader.close()
+
+        # A record cut short at the end of the file is ignored.
+        with open(recording_file_path(self.data_dir, TRADING_PAIR), "ab") as f:
+            f.write(b"\x02\x00\x00")
+        reader = OrderBookRecordReader(recording_file_path(self.data_dir, TRADING_PAIR))
+        self.assertEqual(len(records), len(list(reader)))
+        reader.close()
+
+    def test_append_to_other_file(self):
+        path = recording_file_path(self.data_dir, TRADING_PAIR)
+        # A version 1 file, and a file that isn't a recording, are moved aside rather than appended to.
+        with open(path, "wb") as f:
+            f.write(FILE_HEADER.pack(RECORDING_FILE_MAGIC, 1))
+        with open(f"{path}.1", "wb") as f:
+            f.write(b"not a recording")
+        for previous_content in (FILE_HEADER.pack(RECORDING_FILE_MAGIC, 1), b"HB"):
+            with self.assertLogs("hummingbot.core.data_type.order_book_recorder", logging.WARNING):
+                self.record()
+            with open(path, "rb") as f:
+                self.assertEqual(FILE_HEADER.pack(RECORDING_FILE_MAGIC, RECORDING_FILE_VERSION),
+                                 f.read(FILE_HEADER.size))
+            reader = OrderBookRecordReader(path)
+            self.assertEqual(111, len(list(reader)))
+            reader.close()
+            rotated_path = f"{path}.2"
+            with open(rotated_path, "rb") as f:
+                self.assertEqual(previous_content, f.read())
+            os.remove(rotated_path)
+            with open(path, "wb") as f:
+                f.write(b"HB")
+
+        # A file of the current version is appended to.
+        os.remove(path)
+        self.record()
+        self.record()
+        reader = OrderBookRecordReader(path)
+        self.assertEqual(222, len(list(reader)))
+        reader.close()
+
+    def test_replay(self):
+        states = self.record()
+        for start_time in (float("-inf"), 1035.5):
+            data_source = OrderBookReplayDataSource(self.data_dir, [TRADING_PAIR])
+            tracker = OrderBookReplayTracker(data_source, [TRADING_PAIR], "binance", start_time=start_time)
+            tracker.start()
+            self.assertTrue(tracker.ready)
+            order_book = tracker.order_books[TRADING_PAIR]
+            for timestamp in range(1040, 1100, 7):
+                tracker.replay_until(timestamp)
+                np.testing.assert_array_equal(states[timestamp][0], order_book.bid_depth_array()[:, :2])
+                np.testing.assert_array_equal(states[timestamp][1], order_book.ask_depth_array()[:, :2])
+            tracker.replay_until(1099)
+            self.assertTrue(tracker.replay_finished)
+            data_source.close()
+
+    def test_paper_trade_backtest(self):
+        self.record()
+        data_source = OrderBookReplayDataSource(self.data_dir, [TRADING_PAIR])
+        tracker = OrderBookReplayTracker(data_source, [TRADING_PAIR], "binance", start_time=1000)
+        market = PaperTradeExchange(tracker, MarketConfig.default_config(), ReplayMarket)
+        market.set_balance("COINALPHA", Decimal(10))
+        market.set_balance("HBOT", Decimal(10000))
+        fill_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderFilled, fill_logger)
+
+        clock = Clock(ClockMode.BACKTEST, 1.0, 1000, float("nan"))
+        clock.add_iterator(OrderBookReplayIterator(tracker))
+        clock.add_iterator(market)
+        clock.backtest_til(1001)
+        self.assertTrue(market.ready)
+        market.sell(TRADING_PAIR, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+        # Runs until the end of the recording, which fills the order on the recorded buy trade.
+        clock.backtest()
+        self.assertEqual(1100, clock.current_timestamp)
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(tracker.order_books[TRADING_PAIR].last_trade_price, 100)
+        data_source.close()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
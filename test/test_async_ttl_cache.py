@@ -1,23 +1,152 @@
-import unittest
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
 import asyncio
 import time
+from typing import List
+import unittest
 
-from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils import (
+    async_ttl_cache,
+    cache_stats,
+    CacheStats,
+    ttl_cache,
+)
 
 
 class AsyncTTLCacheUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def test_coalesced_calls(self):
+        calls: List[str] = []
+
+        @async_ttl_cache(ttl=0.2, maxsize=10)
+        async def fetch(name: str, suffix: str = "") -> str:
+            calls.append(name)
+            await asyncio.sleep(0.05)
+            return name + suffix
+
+        async def fetch_concurrently():
+            return await asyncio.gather(*[fetch("a") for _ in range(10)],
+                                        fetch("b", suffix="!"),
+                                        fetch("b", **{"suffix": "!"}))
+
+        results: List[str] = self.ev_loop.run_until_complete(fetch_concurrently())
+        self.assertEqual(["a"] * 10 + ["b!", "b!"], results)
+        self.assertEqual(["a", "b"], calls)
+        self.assertEqual(CacheStats(hits=0, misses=2, coalesced=10, errors=0, size=2), fetch.cache_stats())
+
+        self.assertEqual("a", self.ev_loop.run_until_complete(fetch("a")))
+        self.assertEqual(1, fetch.cache_stats().hits)
+        time.sleep(0.2)
+        self.assertEqual("a", self.ev_loop.run_until_complete(fetch("a")))
+        self.assertEqual(["a", "b", "a"], calls)
+        self.assertIn(f"{__name__}.AsyncTTLCacheUnitTest.test_coalesced_calls.<locals>.fetch", cache_stats())
+
+    def test_cancelled_caller(self):
+        calls: List[int] = []
+
+        @async_ttl_cache(ttl=10, maxsize=1)
+        async def fetch() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return len(calls)
+
+        async def cancel_first_caller():
+            first: asyncio.Task = asyncio.ensure_future(fetch())
+            second: asyncio.Task = asyncio.ensure_future(fetch())
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        self.assertEqual(1, self.ev_loop.run_until_complete(cancel_first_caller()))
+        self.assertEqual(1, self.ev_loop.run_until_complete(fetch()))
+        self.assertEqual(1, len(calls))
+
+    def test_lru_eviction(self):
+        @async_ttl_cache(ttl=10, maxsize=2)
+        async def double(value: int) -> int:
+            return value * 2
+
+        for value in (1, 2, 1, 3, 1, 2):
+            self.ev_loop.run_until_complete(double(value))
+        # 2 was evicted by 3, as 1 was used more recently.
+        self.assertEqual(CacheStats(hits=2, misses=4, coalesced=0, errors=0, size=2), double.cache_stats())
+
+        # Unhashable arguments are passed through.
+        self.assertEqual([1, 1], self.ev_loop.run_until_complete(double([1])))
+        self.assertEqual(5, double.cache_stats().misses)
+
+    def test_negative_caching(self):
+        calls: List[int] = []
+
+        @async_ttl_cache(ttl=10, maxsize=1, error_ttl=0.1)
+        async def failing() -> int:
+            calls.append(1)
+            raise IOError("Exchange unavailable.")
+
+        for _ in range(3):
+            with self.assertRaises(IOError):
+                self.ev_loop.run_until_complete(failing())
+        self.assertEqual(1, len(calls))
+        time.sleep(0.1)
+        with self.assertRaises(IOError):
+            self.ev_loop.run_until_complete(failing())
+        self.assertEqual(2, len(calls))
+        self.assertEqual(CacheStats(hits=2, misses=2, coalesced=0, errors=2, size=1), failing.cache_stats())
+
+        @async_ttl_cache(ttl=10, maxsize=1)
+        async def not_cached_failing() -> int:
+            calls.append(1)
+            raise IOError("Exchange unavailable.")
+
+        for _ in range(2):
+            with self.assertRaises(IOError):
+                self.ev_loop.run_until_complete(not_cached_failing())
+        self.assertEqual(4, len(calls))
+
+    def test_empty_results(self):
+        calls: List[int] = []
+
+        @async_ttl_cache(ttl=60 * 5, maxsize=1)
+        async def fetch_trading_pairs() -> List[str]:
+            # Fails on the first call, returning no trading pairs as the connectors do.
+            calls.append(1)
+            if len(calls) == 1:
+                return []
+            return ["ETH-USDT"]
+
+        self.assertEqual([], self.ev_loop.run_until_complete(fetch_trading_pairs()))
+        self.assertEqual(["ETH-USDT"], self.ev_loop.run_until_complete(fetch_trading_pairs()))
+        self.assertEqual(["ETH-USDT"], self.ev_loop.run_until_complete(fetch_trading_pairs()))
+        self.assertEqual(2, len(calls))
+        self.assertEqual(CacheStats(hits=1, misses=2, coalesced=0, errors=0, size=1), fetch_trading_pairs.cache_stats())
+
+    def test_ttl_cache(self):
+        calls: List[str] = []
+
+        @ttl_cache(ttl=10, error_ttl=10)
+        def get_price(trading_pair: str) -> float:
+            calls.append(trading_pair)
+            if trading_pair == "XYZ-USDT":
+                raise ValueError("Unknown trading pair.")
+            return 100.0
+
+        self.assertEqual(100.0, get_price("ETH-USDT"))
+        self.assertEqual(100.0, get_price(trading_pair="ETH-USDT"))
+        self.assertEqual(100.0, get_price("ETH-USDT"))
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                get_price("XYZ-USDT")
+        self.assertEqual(["ETH-USDT", "ETH-USDT", "XYZ-USDT"], calls)
+        self.assertEqual(CacheStats(hits=2, misses=3, coalesced=0, errors=1, size=3), get_price.cache_stats())
+        get_price.cache_clear()
+        get_price("ETH-USDT")
+        self.assertEqual(4, len(calls))
+
 
-    @async_ttl_cache(ttl=3, maxsize=1)
-    async def get_timestamp(self):
-        return time.time()
-
-    def test_async_ttl_cache(self):
-        ret_1 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
-        ret_2 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
-        self.assertEqual(ret_1, ret_2)
-        time.sleep(2)
-        ret_3 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
-        self.assertEqual(ret_2, ret_3)
-        time.sleep(2)
-        ret_4 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
-        self.assertGreater(ret_4, ret_3)
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import random
+import time
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.core.utils.asyncio_throttle import (
+    DEFAULT_LIMIT_ID,
+    DEFAULT_PRIORITY,
+    RateLimit,
+    Throttler,
+)
+
+ORDERS_LIMIT_ID = "orders"
+SAFETY_MARGIN = 0.01
+
+
+class ThrottlerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        # Timestamps and weights of the tasks, in the order they went through.
+        self.task_logs: List[Tuple[int, float, Dict[str, int]]] = []
+
+    async def task(self, throttler: Throttler, task_id: int, request_weight: int, order_weight: int = 0,
+                   priority: int = DEFAULT_PRIORITY):
+        async with throttler.weighted_task(request_weight=request_weight,
+                                           limit_weights={ORDERS_LIMIT_ID: order_weight},
+                                           priority=priority):
+            self.task_logs.append((task_id, time.monotonic(), {DEFAULT_LIMIT_ID: request_weight,
+                                                               ORDERS_LIMIT_ID: order_weight}))
+
+    def assert_limits_respected(self, rate_limits: List[RateLimit]):
+        for rate_limit in rate_limits:
+            for i, (_, start_ts, _) in enumerate(self.task_logs):
+                window_weight: int = sum(weights[rate_limit.limit_id]
+                                         for _, ts, weights in self.task_logs[i:]
+                                         if ts < start_ts + rate_limit.time_interval)
+                self.assertLessEqual(window_weight, rate_limit.limit, f"{rate_limit} exceeded at {start_ts}.")
+
+    def test_simulated_load(self):
+        rate_limits: List[RateLimit] = [
+            RateLimit(10, 0.1),
+            RateLimit(40, 1.0),
+            RateLimit(3, 0.1, ORDERS_LIMIT_ID),
+            RateLimit(8, 1.0, ORDERS_LIMIT_ID),
+        ]
+        throttler: Throttler = Throttler(rate_limits=rate_limits, period_safety_margin=SAFETY_MARGIN)
+        rng: random.Random = random.Random(42)
+        tasks: List[Tuple[int, int]] = [(rng.randint(1, 5), 1 if rng.random() < 0.2 else 0) for _ in range(60)]
+        start: float = time.monotonic()
+        self.ev_loop.run_until_complete(asyncio.gather(*[
+            self.task(throttler, task_id, request_weight, order_weight)
+            for task_id, (request_weight, order_weight) in enumerate(tasks)
+        ]))
+        elapsed: float = time.monotonic() - start
+
+        self.assertEqual(list(range(len(tasks))), [task_id for task_id, _, _ in self.task_logs])
+        self.assert_limits_respected(rate_limits)
+        self.assertEqual(0, throttler.waiting_tasks)
+        # The tasks go through as soon as the limits allow. The per second limits are the bottleneck here.
+        total_weight: int = sum(request_weight for request_weight, _ in tasks)
+        total_orders: int = sum(order_weight for _, order_weight in tasks)
+        windows: int = max(total_weight // 40, total_orders // 8)
+        self.assertLess(elapsed, windows * (1.0 + SAFETY_MARGIN) + 0.5)
+
+    def test_exact_wake_up(self):
+        throttler: Throttler = Throttler(rate_limit=(10, 0.2), period_safety_margin=SAFETY_MARGIN)
+        self.ev_loop.run_until_complete(asyncio.gather(self.task(throttler, 0, 8), self.task(throttler, 1, 9)))
+        wait_time: float = self.task_logs[1][1] - self.task_logs[0][1]
+        self.assertGreaterEqual(wait_time, 0.2 + SAFETY_MARGIN)
+        self.assertLess(wait_time, 0.2 + SAFETY_MARGIN + 0.03)
+
+    def test_heavy_task_not_overtaken(self):
+        throttler: Throttler = Throttler(rate_limit=(10, 0.2), period_safety_margin=SAFETY_MARGIN)
+        self.ev_loop.run_until_complete(asyncio.gather(
+            self.task(throttler, 0, 8), self.task(throttler, 1, 9), self.task(throttler, 2, 1)
+        ))
+        # The light task would fit right away, but waits for the heavy one queued before it.
+        self.assertEqual([0, 1, 2], [task_id for task_id, _, _ in self.task_logs])
+
+    def test_priority(self):
+        throttler: Throttler = Throttler(rate_limit=(10, 0.1), period_safety_margin=SAFETY_MARGIN)
+
+        async def run():
+            await self.task(throttler, 0, 10)
+            polls: List[asyncio.Task] = [asyncio.ensure_future(self.task(throttler, i, 5)) for i in range(1, 5)]
+            await asyncio.sleep(0)
+            # The order actions queued after the polls go through first, in the order they arrive.
+            orders: List[asyncio.Task] = [asyncio.ensure_future(self.task(throttler, i, 5, priority=1))
+                                          for i in range(5, 8)]
+            await asyncio.gather(*polls, *orders)
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual([0, 5, 6, 7, 1, 2, 3, 4], [task_id for task_id, _, _ in self.task_logs])
+
+    def test_cancelled_waiter(self):
+        throttler: Throttler = Throttler(rate_limit=(10, 0.2), period_safety_margin=SAFETY_MARGIN)
+
+        async def run():
+            await self.task(throttler, 0, 10)
+            cancelled_task: asyncio.Task = asyncio.ensure_future(self.task(throttler, 1, 10))
+            next_task: asyncio.Task = asyncio.ensure_future(self.task(throttler, 2, 5))
+            await asyncio.sleep(0.05)
+            self.assertEqual(2, throttler.waiting_tasks)
+            cancelled_task.cancel()
+            await next_task
+
+        self.ev_loop.run_until_complete(run())
+        self.assertEqual([0, 2], [task_id for task_id, _, _ in self.task_logs])
+        self.assertEqual([5], throttler.used_weight())
+
+    def test_task_over_limit(self):
+        throttler: Throttler = Throttler(rate_limit=(10, 1.0))
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(self.task(throttler, 0, 11))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+from decimal import Decimal
+import hashlib
+import hmac
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from urllib.parse import urlencode
+
+from hummingbot.connector.exchange.binance.binance_rest_client import (
+    BinanceAPIError,
+    BinanceRESTClient,
+)
+from hummingbot.connector.exchange.binance.binance_utils import (
+    OPEN_ORDERS_WEIGHT,
+    ORDER_STATUS_WEIGHT,
+    RATE_LIMITS,
+    REQUEST_WEIGHT_LIMIT_ID,
+)
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.order_status_poller import (
+    OrderStatusPollStats,
+    poll_order_statuses,
+)
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    Throttler,
+)
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType,
+)
+from hummingbot.core.utils.http_client_registry import HttpClientRegistry
+
+API_KEY = "test-key"
+API_SECRET = "test-secret"
+SERVER_DELAY = 0.1
+
+
+class BinanceRESTClientUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.registry: HttpClientRegistry = HttpClientRegistry()
+        HttpClientRegistry._shared_instance = self.registry
+        # Requests received by the mock server, in the order they arrived.
+        self.requests: List[Dict[str, Any]] = []
+        self.ev_loop.run_until_complete(self.start_server())
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.registry.close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+        HttpClientRegistry._shared_instance = None
+
+    async def start_server(self):
+        async def handle_order(request: web.Request) -> web.Response:
+            self.requests.append({"method": request.method,
+                                  "params": dict(request.query),
+                                  "api_key": request.headers.get("X-MBX-APIKEY")})
+            await asyncio.sleep(SERVER_DELAY)
+            if request.query.get("origClientOrderId") == "unknown":
+                return web.json_response({"code": -2011, "msg": "Unknown order sent."}, status=400)
+            return web.json_response({"clientOrderId": request.query.get("origClientOrderId"), "status": "CANCELED"})
+
+        async def handle_account(request: web.Request) -> web.Response:
+            return web.json_response({"balances": []})
+
+        async def handle_open_orders(request: web.Request) -> web.Response:
+            # order-1 of ETHUSDT is still open, order-2 is not.
+            return web.json_response([{"clientOrderId": "order-1", "status": "NEW"}]
+                                     if request.query["symbol"] == "ETHUSDT" else [])
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/api/v3/order", handle_order)
+        app.router.add_route("GET", "/api/v3/account", handle_account)
+        app.router.add_route("GET", "/api/v3/openOrders", handle_open_orders)
+        self.runner: web.AppRunner = web.AppRunner(app)
+        await self.runner.setup()
+        site: web.TCPSite = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port: int = site._server.sockets[0].getsockname()[1]
+        self.base_url: str = f"http://127.0.0.1:{port}"
+
+    def client(self, throttler: Throttler = None) -> BinanceRESTClient:
+        return BinanceRESTClient(self.base_url, API_KEY, API_SECRET, throttler, time_provider=lambda: 1000.0,
+                                 recv_window=5000)
+
+    def test_signed_request(self):
+        response: Dict[str, Any] = self.ev_loop.run_until_complete(
+            self.client().cancel_order("ETHUSDT", origClientOrderId="order-1"))
+        self.assertEqual("order-1", response["clientOrderId"])
+
+        [request] = self.requests
+        self.assertEqual("DELETE", request["method"])
+        self.assertEqual(API_KEY, request["api_key"])
+        self.assertEqual("1000000", request["params"]["timestamp"])
+        self.assertEqual("5000", request["params"]["recvWindow"])
+        unsigned_query: str = urlencode({key: value for key, value in request["params"].items()
+                                         if key != "signature"})
+        signature: str = hmac.new(API_SECRET.encode("utf-8"), unsigned_query.encode("utf-8"),
+                                  hashlib.sha256).hexdigest()
+        self.assertEqual(signature, request["params"]["signature"])
+
+    def test_error_response(self):
+        with self.assertRaises(BinanceAPIError) as context:
+            self.ev_loop.run_until_complete(self.client().cancel_order("ETHUSDT", origClientOrderId="unknown"))
+        self.assertEqual(400, context.exception.status_code)
+        self.assertEqual(-2011, context.exception.code)
+        self.assertEqual("Unknown order sent.", context.exception.message)
+
+    def test_concurrent_requests(self):
+        client: BinanceRESTClient = self.client(Throttler(rate_limits=[RateLimit(100, 1.0)]))
+        start: float = time.perf_counter()
+        responses: List[Dict[str, Any]] = self.ev_loop.run_until_complete(asyncio.gather(*[
+            client.cancel_order("ETHUSDT", origClientOrderId=f"order-{i}") for i in range(20)
+        ]))
+        elapsed: float = time.perf_counter() - start
+        self.assertEqual([f"order-{i}" for i in range(20)], [r["clientOrderId"] for r in responses])
+        # The cancellations are not serialized, they take about one server round trip in total.
+        self.assertLess(elapsed, SERVER_DELAY * 5)
+
+    def test_order_priority(self):
+        client: BinanceRESTClient = self.client(Throttler(rate_limits=[RateLimit(2, 0.5)]))
+
+        async def run():
+            # The polling requests fill the rate limit, then a cancellation comes in behind them.
+            polls: List[asyncio.Future] = [
+                asyncio.ensure_future(client.get_order("ETHUSDT", origClientOrderId=f"poll-{i}")) for i in range(6)
+            ]
+            await asyncio.sleep(0.05)
+            await client.cancel_order("ETHUSDT", origClientOrderId="cancel")
+            await asyncio.gather(*polls)
+
+        self.ev_loop.run_until_complete(run())
+        order_ids: List[str] = [request["params"]["origClientOrderId"] for request in self.requests]
+        # The cancellation goes out in the next window, ahead of the polling requests queued before it.
+        self.assertEqual("cancel", order_ids[2])
+
+    def test_request_weights(self):
+        throttler: Throttler = Throttler(rate_limits=RATE_LIMITS)
+        client: BinanceRESTClient = self.client(throttler)
+        self.ev_loop.run_until_complete(client.get_account())
+        # The account request weighs 10 against the per minute request weight limit, and counts as 1 request against
+        # the per second limit.
+        self.assertEqual([10], throttler.used_weight(REQUEST_WEIGHT_LIMIT_ID))
+        self.assertEqual([1], throttler.used_weight())
+        self.ev_loop.run_until_complete(client.get_order("ETHUSDT", origClientOrderId="order-1"))
+        self.assertEqual([12], throttler.used_weight(REQUEST_WEIGHT_LIMIT_ID))
+        self.assertEqual([2], throttler.used_weight())
+
+    def test_order_status_poll_weights(self):
+        throttler: Throttler = Throttler(rate_limits=RATE_LIMITS)
+        client: BinanceRESTClient = self.client(throttler)
+        orders: List[InFlightOrderBase] = [
+            InFlightOrderBase(f"order-{i}", f"{i}", trading_pair, OrderType.LIMIT, TradeType.BUY, Decimal(100),
+                              Decimal(1), "OPEN")
+            for i, trading_pair in [(1, "ETH-USDT"), (2, "ETH-USDT"), (3, "BTC-USDT")]
+        ]
+        _, stats = self.ev_loop.run_until_complete(poll_order_statuses(
+            orders,
+            fetch_open_orders=lambda trading_pair: client.get_open_orders(symbol=trading_pair.replace("-", "")),
+            fetch_order=lambda o: client.get_order(symbol=o.trading_pair.replace("-", ""),
+                                                   origClientOrderId=o.client_order_id),
+            open_order_id=lambda entry: entry["clientOrderId"],
+            tracked_order_id=lambda o: o.client_order_id,
+            snapshot_weight=OPEN_ORDERS_WEIGHT,
+            lookup_weight=ORDER_STATUS_WEIGHT
+        ))
+        self.assertEqual(OrderStatusPollStats(orders=3, snapshot_requests=2, lookup_requests=2, request_weight=10),
+                         stats)
+        # The poll stats count the weights the requests were throttled with.
+        self.assertEqual([stats.request_weight], throttler.used_weight(REQUEST_WEIGHT_LIMIT_ID))
+        self.assertEqual([4], throttler.used_weight())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.binance.binance_in_flight_order import BinanceInFlightOrder
+from hummingbot.connector.exchange.binance.binance_time import BinanceTime
+from hummingbot.connector.utils import TradeFillOrderDetails
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeType,
+)
+
+START_TIMESTAMP = 1600000000.0
+
+
+def trade(trade_id: int, order_id: int, timestamp: float) -> Dict[str, Any]:
+    return {"id": trade_id, "orderId": order_id, "time": int(timestamp * 1e3), "isBuyer": True, "price": "100",
+            "qty": "1", "quoteQty": "100", "commission": "0.001", "commissionAsset": "ETH"}
+
+
+class BinanceTradeReconciliationUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.market: BinanceExchange = BinanceExchange("key", "secret", ["ETH-USDT"], trading_required=False)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + 1000)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(START_TIMESTAMP + 300)
+        self.fills_logger: EventLogger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.fills_logger)
+
+        # Trades of the account on the mock exchange, and the fromId of the requests made.
+        self.trades: List[Dict[str, Any]] = []
+        self.from_ids: List[Any] = []
+
+        async def get_my_trades(symbol: str, fromId: int = None, limit: int = 500) -> List[Dict[str, Any]]:
+            self.from_ids.append(fromId)
+            if fromId is None:
+                return self.trades[-limit:]
+            return [t for t in self.trades if t["id"] >= fromId][:limit]
+
+        self.market.binance_client.get_my_trades = get_my_trades
+
+    def tearDown(self):
+        BinanceTime.get_instance().stop()
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+
+    def reconcile(self):
+        self.ev_loop.run_until_complete(self.market._reconcile_trades(["ETH-USDT"]))
+
+    def test_cursor(self):
+        self.market.add_exchange_order_ids_from_market_recorder({"1": "buy-1", "2": "buy-2"})
+        self.trades = [trade(i, 1, START_TIMESTAMP) for i in range(1, 4)]
+        self.reconcile()
+        # Without cursor, the latest trades are downloaded.
+        self.assertEqual([None], self.from_ids)
+        self.assertEqual(3, len(self.fills_logger.event_log))
+        self.assertEqual({"ETH-USDT": 3}, self.market.trade_history_cursors)
+        self.market.add_trade_fills_from_market_recorder({TradeFillOrderDetails("binance", str(i), "ETH-USDT")
+                                                          for i in range(1, 4)})
+
+        # The next reconciliation only downloads the trades after the cursor.
+        self.trades += [trade(4, 2, START_TIMESTAMP + 100), trade(5, 3, START_TIMESTAMP + 290)]
+        self.reconcile()
+        self.assertEqual(4, self.from_ids[-1])
+        filled_event: OrderFilledEvent = self.fills_logger.event_log[-1]
+        self.assertEqual(("buy-2", 4), (filled_event.order_id, filled_event.exchange_trade_id))
+        # The trade of the last minute, of an order not recorded yet, is downloaded again on the next poll.
+        self.assertEqual({"ETH-USDT": 4}, self.market.trade_history_cursors)
+        self.market.add_exchange_order_ids_from_market_recorder({"3": "buy-3"})
+        self.market.add_trade_fills_from_market_recorder({TradeFillOrderDetails("binance", "4", "ETH-USDT")})
+        self.reconcile()
+        self.assertEqual(5, self.from_ids[-1])
+        self.assertEqual(("buy-3", 5), (self.fills_logger.event_log[-1].order_id,
+                                        self.fills_logger.event_log[-1].exchange_trade_id))
+        self.assertEqual(5, len(self.fills_logger.event_log))
+
+    def test_pages_and_in_flight_orders(self):
+        self.market.add_trade_history_cursors_from_market_recorder({"ETH-USDT": 0})
+        self.trades = [trade(i, 7, START_TIMESTAMP) for i in range(1, BinanceExchange.TRADE_HISTORY_PAGE_SIZE + 11)]
+        in_flight_order: BinanceInFlightOrder = BinanceInFlightOrder("buy-7", "7", "ETH-USDT", OrderType.LIMIT,
+                                                                     TradeType.BUY, Decimal(100), Decimal(2000))
+        self.market.restore_tracking_states({"buy-7": in_flight_order.to_json()})
+        self.reconcile()
+        self.assertEqual([1, BinanceExchange.TRADE_HISTORY_PAGE_SIZE + 1], self.from_ids)
+        # The trades of the in flight order are applied to it once.
+        self.assertEqual(len(self.trades), len(self.fills_logger.event_log))
+        self.assertEqual(Decimal(len(self.trades)), self.market.in_flight_orders["buy-7"].executed_amount_base)
+        self.market.add_trade_history_cursors_from_market_recorder({"ETH-USDT": 0})
+        self.reconcile()
+        self.assertEqual(len(self.trades), len(self.fills_logger.event_log))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.clock_profiler import (
+    ClockProfiler,
+    IteratorTickStats,
+)
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class SlowStrategy(StrategyPyBase):
+    def __init__(self, tick_duration: float, slow_tick_every: int = 1):
+        super().__init__()
+        self.tick_duration: float = tick_duration
+        self.slow_tick_every: int = slow_tick_every
+        self.ticks: int = 0
+
+    def tick(self, timestamp: float):
+        self.ticks += 1
+        if self.ticks % self.slow_tick_every == 0:
+            time.sleep(self.tick_duration)
+
+
+class ClockProfilerUnitTest(unittest.TestCase):
+    def test_backtest_profiling(self):
+        clock: Clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=0.0, end_time=10.0)
+        fast_iterator: TimeIterator = TimeIterator()
+        strategy: SlowStrategy = SlowStrategy(0.002)
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(strategy)
+        self.assertIsNone(clock.profiler)
+        clock.backtest_til(5.0)
+
+        profiler: ClockProfiler = clock.enable_profiling()
+        clock.backtest_til(10.0)
+        self.assertEqual(5, profiler.ticks)
+        self.assertEqual(0, profiler.late_ticks)
+        self.assertEqual(0, profiler.missed_ticks)
+        self.assertGreaterEqual(profiler.max_tick_duration, 0.002)
+
+        [slowest, fastest] = profiler.worst_offenders()
+        self.assertEqual("SlowStrategy", slowest.name)
+        self.assertEqual("TimeIterator", fastest.name)
+        for stats in (slowest, fastest):
+            self.assertEqual(5, stats.ticks)
+            self.assertEqual(5, sum(stats.histogram))
+        self.assertGreaterEqual(slowest.mean_duration, 0.002)
+        self.assertEqual(0, slowest.histogram[0])
+        self.assertIn("SlowStrategy", profiler.report())
+
+        clock.disable_profiling()
+        self.assertIsNone(clock.profiler)
+
+    def test_realtime_overruns(self):
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        # Every third tick runs past the next two.
+        strategy: SlowStrategy = SlowStrategy(0.12, slow_tick_every=3)
+        clock.add_iterator(strategy)
+        profiler: ClockProfiler = clock.enable_profiling()
+
+        async def run():
+            with clock:
+                await clock.run_til(time.time() + 1.0)
+
+        asyncio.get_event_loop().run_until_complete(run())
+        [stats] = profiler.iterator_stats
+        stats: IteratorTickStats = stats
+        self.assertEqual(profiler.ticks, stats.ticks)
+        self.assertGreaterEqual(profiler.missed_ticks, 2 * (stats.ticks // 3) - 2)
+        self.assertGreaterEqual(stats.max_duration, 0.12)
+        self.assertGreaterEqual(profiler.max_tick_duration, 0.12)
+        self.assertEqual(stats.ticks // 3, stats.histogram[-3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.indexed_order_book import IndexedOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class RecordingStrategy(StrategyPyBase):
+    def __init__(self):
+        super().__init__()
+        self.tick_timestamps: List[float] = []
+
+    def tick(self, timestamp: float):
+        self.tick_timestamps.append(timestamp)
+
+
+class OrderBookUpdater(StrategyPyBase):
+    def __init__(self, order_book: OrderBook, update_timestamps: List[float]):
+        super().__init__()
+        self.order_book: OrderBook = order_book
+        self.update_timestamps: List[float] = update_timestamps
+
+    def tick(self, timestamp: float):
+        if timestamp in self.update_timestamps:
+            update_order_book(self.order_book, int(timestamp))
+
+
+def update_order_book(order_book: OrderBook, update_id: int):
+    order_book.apply_snapshot([OrderBookRow(99.0, 1.0, update_id)], [OrderBookRow(101.0, 1.0, update_id)], update_id)
+
+
+class ClockSchedulingUnitTest(unittest.TestCase):
+    def test_tick_intervals(self):
+        clock: Clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=0.0, end_time=20.0)
+        every_tick: RecordingStrategy = RecordingStrategy()
+        every_five: RecordingStrategy = RecordingStrategy()
+        every_five_offset: RecordingStrategy = RecordingStrategy()
+        clock.add_iterator(every_tick)
+        clock.add_iterator(every_five, tick_interval=5.0)
+        clock.add_iterator(every_five_offset, tick_interval=5.0, tick_offset=2.0)
+        clock.backtest_til(12.0)
+        self.assertEqual([float(t) for t in range(1, 13)], every_tick.tick_timestamps)
+        self.assertEqual([5.0, 10.0], every_five.tick_timestamps)
+        self.assertEqual([2.0, 7.0, 12.0], every_five_offset.tick_timestamps)
+
+        # Changing the tick interval while running.
+        clock.set_tick_interval(every_five, 0.0)
+        clock.set_tick_interval(every_tick, 4.0)
+        clock.backtest_til(20.0)
+        self.assertEqual([float(t) for t in range(1, 13)] + [16.0, 20.0], every_tick.tick_timestamps)
+        self.assertEqual([5.0, 10.0] + [float(t) for t in range(13, 21)], every_five.tick_timestamps)
+        self.assertEqual([2.0, 7.0, 12.0, 17.0], every_five_offset.tick_timestamps)
+        self.assertIsNone(clock.get_tick_schedule(every_five))
+        self.assertEqual(24.0, clock.get_tick_schedule(every_tick).next_tick)
+
+    def test_backtest_tick_trigger(self):
+        for order_book_class in (OrderBook, IndexedOrderBook):
+            with self.subTest(order_book_class=order_book_class.__name__):
+                clock: Clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=0.0, end_time=20.0)
+                order_book: OrderBook = order_book_class()
+                updater: OrderBookUpdater = OrderBookUpdater(order_book, [3.0, 4.0, 10.0])
+                strategy: RecordingStrategy = RecordingStrategy()
+                clock.add_iterator(updater)
+                clock.add_iterator(strategy, tick_interval=10.0)
+                clock.add_tick_trigger(strategy, order_book, OrderBookEvent.UpdateEvent)
+                clock.backtest_til(12.0)
+                # The update at 10 is seen by the scheduled tick, so it doesn't tick the strategy again.
+                self.assertEqual([3.0, 4.0, 10.0], strategy.tick_timestamps)
+
+                clock.remove_tick_triggers(strategy)
+                update_order_book(order_book, 13)
+                clock.backtest_til(20.0)
+                self.assertEqual([3.0, 4.0, 10.0, 20.0], strategy.tick_timestamps)
+
+    def test_update_events(self):
+        # Snapshots and diffs trigger an update event, whatever the order book backend.
+        for order_book_class in (OrderBook, IndexedOrderBook):
+            with self.subTest(order_book_class=order_book_class.__name__):
+                order_book: OrderBook = order_book_class()
+                event_logger: EventLogger = EventLogger()
+                order_book.add_listener(OrderBookEvent.UpdateEvent, event_logger)
+                update_order_book(order_book, 1)
+                order_book.apply_diffs([OrderBookRow(99.5, 2.0, 2)], [], 2)
+                self.assertEqual(2, len(event_logger.event_log))
+                self.assertIs(order_book, event_logger.event_log[-1])
+
+    def test_realtime_tick_trigger(self):
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=0.5)
+        order_book: OrderBook = OrderBook()
+        strategy: RecordingStrategy = RecordingStrategy()
+        clock.add_iterator(strategy)
+        clock.add_tick_trigger(strategy, order_book, OrderBookEvent.UpdateEvent, min_interval=0.2)
+        update_times: List[float] = []
+
+        async def update_order_books():
+            await asyncio.sleep(0.05)
+            for i in range(50):
+                update_times.append(time.time())
+                update_order_book(order_book, i)
+                await asyncio.sleep(0.02)
+
+        async def run():
+            with clock:
+                await asyncio.gather(clock.run_til(time.time() + 1.2), update_order_books())
+
+        asyncio.get_event_loop().run_until_complete(run())
+        # The scheduled ticks are on the tick size grid, the triggered ones are not.
+        triggered_ticks: List[float] = [timestamp for timestamp in strategy.tick_timestamps if timestamp % 0.5 != 0]
+        self.assertGreaterEqual(len(triggered_ticks), 3)
+        self.assertLessEqual(len(triggered_ticks), 7)
+        self.assertLess(triggered_ticks[0] - update_times[0], 0.01)
+        for previous_tick, tick in zip(triggered_ticks, triggered_ticks[1:]):
+            self.assertGreater(tick - previous_tick, 0.2 - 1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
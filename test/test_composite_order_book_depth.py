@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+from typing import List
+import unittest
+import numpy as np
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+
+class CompositeOrderBookDepthUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book: CompositeOrderBook = CompositeOrderBook()
+        self.order_book.apply_numpy_snapshot(
+            np.array([[99.0, 1.0, 1], [98.0, 2.0, 1], [97.0, 3.0, 1]]),
+            np.array([[101.0, 1.0, 1], [102.0, 2.0, 1], [103.0, 3.0, 1]])
+        )
+
+    def fill(self, trade_type: TradeType, rows: List[OrderBookRow]):
+        for fill_event in OrderFilledEvent.order_filled_events_from_order_book_rows(
+                10, "order", "COINALPHA-HBOT", trade_type, OrderType.MARKET, TradeFee(0), rows):
+            self.order_book.record_filled_order(fill_event)
+
+    def test_consume_depth(self):
+        buy_rows: List[OrderBookRow] = self.order_book.simulate_buy(Decimal("2.5"))
+        self.assertEqual([(101.0, 1.0), (102.0, 1.5)], [(row.price, row.amount) for row in buy_rows])
+        self.fill(TradeType.BUY, buy_rows)
+        self.assertEqual([(102.0, 0.5), (103.0, 3.0)], [(row.price, row.amount)
+                                                        for row in self.order_book.ask_entries()])
+        self.assertEqual(102.0, self.order_book.get_price(True))
+        self.assertEqual([[102.0, 0.5], [103.0, 3.0]], self.order_book.ask_depth_array()[:, :2].tolist())
+        self.assertEqual(102.0 * 0.5 + 103.0 * 0.5,
+                         self.order_book.get_quote_volume_for_base_amount(True, 1).result_volume)
+        self.assertEqual(103.0, self.order_book.get_price_for_volume(True, 1).result_price)
+
+        # Fills at the same price add up.
+        self.fill(TradeType.BUY, self.order_book.simulate_buy(0.25))
+        self.assertEqual([(101.0, 1.0), (102.0, 1.75)], [(row.price, row.amount)
+                                                         for row in self.order_book.traded_order_book.ask_entries()])
+
+        self.fill(TradeType.SELL, self.order_book.simulate_sell(4))
+        self.assertEqual([(97.0, 2.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+        self.assertEqual(97.0, self.order_book.get_price(False))
+        self.assertEqual(2.0, self.order_book.get_volume_for_price(False, 90).result_volume)
+        # The original order book is untouched.
+        self.assertEqual(3, len(list(self.order_book.original_bid_entries())))
+
+        # Consuming everything leaves nothing to quote.
+        self.fill(TradeType.SELL, self.order_book.simulate_sell(2))
+        self.assertEqual([], list(self.order_book.bid_entries()))
+        self.assertEqual([], self.order_book.simulate_sell(1))
+        with self.assertRaises(EnvironmentError):
+            self.order_book.get_price(False)
+
+    def test_consumed_depth_decay(self):
+        self.fill(TradeType.SELL, self.order_book.simulate_sell(4))
+        self.assertEqual([(99.0, 1.0), (98.0, 2.0), (97.0, 1.0)],
+                         [(row.price, row.amount) for row in self.order_book.traded_order_book.bid_entries()])
+
+        # Liquidity added at a level replenishes the amount consumed there, liquidity taken away shrinks the level but
+        # the amount consumed never exceeds it, and removing the level removes the consumption.
+        self.order_book.apply_numpy_diffs(
+            np.array([[99.0, 1.5, 2], [98.0, 1.0, 2], [97.0, 0.0, 2]]),
+            np.empty((0, 3)),
+            2
+        )
+        self.assertEqual([(99.0, 0.5), (98.0, 1.0)],
+                         [(row.price, row.amount) for row in self.order_book.traded_order_book.bid_entries()])
+        self.assertEqual([(99.0, 1.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+
+        # Consumed levels outside of the order book, after it's truncated by the other side, are removed too.
+        self.order_book.apply_numpy_diffs(np.array([[98.5, 1.0, 3]]), np.empty((0, 3)), 3)
+        self.order_book.apply_numpy_diffs(np.empty((0, 3)), np.array([[98.9, 1.0, 4]]), 4)
+        self.assertEqual([(98.0, 1.0)], [(row.price, row.amount)
+                                         for row in self.order_book.traded_order_book.bid_entries()])
+        self.assertEqual([(98.5, 1.0)], [(row.price, row.amount) for row in self.order_book.bid_entries()])
+
+        # A snapshot resets all the consumed depth.
+        self.fill(TradeType.BUY, self.order_book.simulate_buy(1))
+        self.order_book.apply_numpy_snapshot(np.array([[99.0, 1.0, 5]]), np.array([[101.0, 1.0, 5]]), 5)
+        self.assertEqual([], list(self.order_book.traded_order_book.ask_entries()))
+        self.assertEqual([(101.0, 1.0)], [(row.price, row.amount) for row in self.order_book.ask_entries()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+from typing import List
+import unittest
+from unittest.mock import patch
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.market.market_base import MarketBase
+
+
+def fill(timestamp: float, order_id: str, trade_type: TradeType = TradeType.BUY) -> OrderFilledEvent:
+    return OrderFilledEvent(timestamp, order_id, "COINALPHA-HBOT", trade_type, OrderType.LIMIT, Decimal(100),
+                            Decimal(1), TradeFee(0), exchange_trade_id=f"trade-{timestamp}")
+
+
+class EventLoggerUnitTest(unittest.TestCase):
+    def test_unbounded_log(self):
+        event_logger: EventLogger = EventLogger(max_events=0)
+        events: List[object] = []
+        for i in range(100):
+            events.append(fill(i, f"order-{i % 10}"))
+            events.append(OrderCancelledEvent(i, f"order-{i % 10}"))
+        for event_object in events:
+            event_logger(event_object)
+        self.assertEqual(events, event_logger.event_log)
+        self.assertEqual(events[0::2], event_logger.events_of_type(OrderFilledEvent))
+        self.assertEqual([e for e in events if e.order_id == "order-3"], event_logger.events_for_order("order-3"))
+        self.assertEqual(0, event_logger.evicted_count)
+
+        event_logger.clear()
+        self.assertEqual([], event_logger.event_log)
+        self.assertEqual([], event_logger.events_for_order("order-3"))
+
+    def test_max_events_per_type(self):
+        event_logger: EventLogger = EventLogger(max_events=5)
+        fills: List[OrderFilledEvent] = [fill(i, f"order-{i}") for i in range(20)]
+        cancel: OrderCancelledEvent = OrderCancelledEvent(0, "order-0")
+        event_logger(cancel)
+        for event_object in fills:
+            event_logger(event_object)
+
+        # The events of each type are bounded separately, and the old cancellation is kept.
+        self.assertEqual(fills[-5:], event_logger.events_of_type(OrderFilledEvent))
+        self.assertEqual([cancel] + fills[-5:], event_logger.event_log)
+        self.assertEqual(15, event_logger.evicted_count)
+        # The evicted events are removed from the order index.
+        self.assertEqual([cancel], event_logger.events_for_order("order-0"))
+        self.assertEqual([], event_logger.events_for_order("order-14"))
+        self.assertEqual([fills[15]], event_logger.events_for_order("order-15"))
+
+    def test_max_age(self):
+        event_logger: EventLogger = EventLogger(max_events=0, max_age=60)
+        fills: List[OrderFilledEvent] = [fill(i * 10, "order-0") for i in range(20)]
+        for event_object in fills:
+            event_logger(event_object)
+        # The fills from the last 60 seconds before the newest one are kept.
+        self.assertEqual(fills[-7:], event_logger.events_of_type(OrderFilledEvent))
+        self.assertEqual(fills[-7:], event_logger.events_for_order("order-0"))
+
+        # Events without a timestamp are not evicted by age.
+        event_logger(object())
+        event_logger(object())
+        self.assertEqual(9, len(event_logger.event_log))
+
+    def test_order_filled_balances(self):
+        for connector_class in (ConnectorBase, MarketBase):
+            with self.subTest(connector_class=connector_class.__name__), \
+                    patch.object(global_config_map["event_log_max_size"], "value", 10):
+                connector = connector_class()
+                # 3 buys for every sell.
+                for i in range(1, 101):
+                    connector.trigger_event(MarketEvent.OrderFilled,
+                                            fill(i, f"order-{i}", TradeType.SELL if i % 4 == 0 else TradeType.BUY))
+                self.assertEqual(10, len(connector.events_of_type(OrderFilledEvent)))
+                # The balances since the start count the fills evicted from the event log.
+                self.assertEqual({"COINALPHA": Decimal(50), "HBOT": Decimal(-5000)}, connector.order_filled_balances())
+                self.assertEqual({"COINALPHA": Decimal(2), "HBOT": Decimal(-200)}, connector.order_filled_balances(96))
+
+
+if __name__ == "__main__":
+    unittest.main()
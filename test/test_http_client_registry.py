@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import aiohttp
+from aiohttp import web
+import asyncio
+import unittest
+
+from hummingbot.core.utils.http_client_registry import (
+    HttpClientRegistry,
+    HttpClientStats,
+    shared_client_session,
+)
+
+
+class HttpClientRegistryUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.registry: HttpClientRegistry = HttpClientRegistry()
+        HttpClientRegistry._shared_instance = self.registry
+        self.ev_loop.run_until_complete(self.start_server())
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.registry.close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+        HttpClientRegistry._shared_instance = None
+
+    async def start_server(self):
+        async def handle_ticker(request: web.Request) -> web.Response:
+            return web.json_response({"price": "100.0"})
+
+        app: web.Application = web.Application()
+        app.router.add_get("/ticker", handle_ticker)
+        self.runner: web.AppRunner = web.AppRunner(app)
+        await self.runner.setup()
+        site: web.TCPSite = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port: int = site._server.sockets[0].getsockname()[1]
+        self.url: str = f"http://127.0.0.1:{port}/ticker"
+
+    async def get_price(self) -> str:
+        async with shared_client_session() as client:
+            async with client.get(self.url) as response:
+                return (await response.json())["price"]
+
+    def test_connections_reused(self):
+        requests: int = 10
+        for _ in range(requests):
+            self.assertEqual("100.0", self.ev_loop.run_until_complete(self.get_price()))
+        stats: HttpClientStats = self.registry.stats
+        self.assertEqual(1, stats.sessions)
+        self.assertEqual(requests, stats.requests)
+        self.assertEqual(1, stats.connections_created)
+        self.assertEqual(requests - 1, stats.connections_reused)
+        self.assertEqual(1, stats.open_connections)
+        self.assertEqual(1, stats.idle_connections)
+
+    async def get_client(self) -> aiohttp.ClientSession:
+        return self.registry.get_client()
+
+    def test_shared_client_lifecycle(self):
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(self.get_client())
+        self.assertIs(client, self.ev_loop.run_until_complete(self.get_client()))
+        # Leaving the context doesn't close the shared session.
+        self.ev_loop.run_until_complete(self.get_price())
+        self.assertFalse(client.closed)
+        self.assertIs(client, self.ev_loop.run_until_complete(self.get_client()))
+
+        self.ev_loop.run_until_complete(self.registry.close())
+        self.assertTrue(client.closed)
+        self.assertEqual(0, self.registry.stats.sessions)
+        new_client: aiohttp.ClientSession = self.ev_loop.run_until_complete(self.get_client())
+        self.assertIsNot(client, new_client)
+        self.assertFalse(new_client.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
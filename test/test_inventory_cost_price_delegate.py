@@ -1,9 +1,12 @@
+import os
+import tempfile
 import unittest
 from decimal import Decimal
 
 from hummingbot.core.event.events import OrderFilledEvent, TradeType
 from hummingbot.core.event.events import TradeFee, OrderType
 from hummingbot.model.inventory_cost import InventoryCost
+from hummingbot.model.sql_batch_writer import SQLBatchWriter
 from hummingbot.model.sql_connection_manager import (
     SQLConnectionManager,
     SQLConnectionType,
@@ -71,6 +74,8 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         self._session.add(record)
         self._session.commit()
+        # The inventory cost is loaded at start.
+        self.delegate = InventoryCostPriceDelegate(self.trade_fill_sql, self.trading_pair)
 
         amount_sell = Decimal("0.5")
         price_sell = Decimal("10000")
@@ -125,6 +130,8 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         self._session.add(record)
         self._session.commit()
+        # The inventory cost is loaded at start.
+        self.delegate = InventoryCostPriceDelegate(self.trade_fill_sql, self.trading_pair)
         delegate_price = self.delegate.get_price()
         self.assertEqual(delegate_price, price)
 
@@ -140,4 +147,40 @@ class TestInventoryCostPriceDelegate(unittest.TestCase):
         )
         self._session.add(record)
         self._session.commit()
+        # The inventory cost is loaded at start.
+        self.delegate = InventoryCostPriceDelegate(self.trade_fill_sql, self.trading_pair)
         self.assertIsNone(self.delegate.get_price())
+
+    def test_write_behind(self):
+        # The writer thread needs a database file, as each thread has its own in memory database.
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=os.path.join(temp_dir.name, "trades.sqlite"))
+        session = sql.get_shared_session()
+        writer = SQLBatchWriter(sql, batch_interval=60.0)
+        writer.start()
+        self.delegate = InventoryCostPriceDelegate(sql, self.trading_pair, writer=writer)
+        price = Decimal("9000")
+        for amount in [Decimal("1"), Decimal("2"), Decimal("3")]:
+            self.delegate.process_order_fill_event(OrderFilledEvent(
+                timestamp=1,
+                order_id="order1",
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=price,
+                amount=amount,
+                trade_fee=TradeFee(percent=Decimal("0"), flat_fees=[]),
+            ))
+        # The price is served from memory, while the writes of the fills are coalesced in one pending write.
+        self.assertEqual(price, self.delegate.get_price())
+        self.assertEqual(0, session.query(InventoryCost).count())
+        self.assertEqual(1, writer.pending_writes)
+
+        writer.stop()
+        record = InventoryCost.get_record(session, self.base_asset, self.quote_asset)
+        self.assertEqual(Decimal("6"), record.base_volume)
+        self.assertEqual(Decimal("6") * price, record.quote_volume)
+        # The written volumes are loaded on restart.
+        delegate = InventoryCostPriceDelegate(sql, self.trading_pair)
+        self.assertEqual((Decimal("6"), Decimal("6") * price), delegate.volumes)
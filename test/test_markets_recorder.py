@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import os
+import tempfile
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import patch
+from sqlalchemy import event
+
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+# Simulated duration of every database commit, as on a slow disk or a remote database.
+COMMIT_DURATION = 0.02
+
+
+class MockConnector:
+    display_name = "binance"
+
+    def __init__(self):
+        self.tracking_states: Dict[str, Any] = {}
+        self.trade_fills = set()
+        self.exchange_order_ids = {}
+        self.trade_history_cursors: Dict[str, int] = {}
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def add_trade_fills_from_market_recorder(self, trade_fills):
+        self.trade_fills.update(trade_fills)
+
+    def add_exchange_order_ids_from_market_recorder(self, exchange_order_ids):
+        self.exchange_order_ids.update(exchange_order_ids)
+
+    def add_trade_history_cursors_from_market_recorder(self, trade_history_cursors):
+        self.trade_history_cursors.update(trade_history_cursors)
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    config_file_path = "test_markets_recorder.yml"
+
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path_patch = patch("hummingbot.connector.markets_recorder.data_path", return_value=self.temp_dir.name)
+        self.data_path_patch.start()
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                        db_path=os.path.join(self.temp_dir.name, "trades.sqlite"))
+        event.listen(self.sql.engine, "commit", lambda connection: time.sleep(COMMIT_DURATION))
+        self.connector: MockConnector = MockConnector()
+        self.recorder: MarketsRecorder = MarketsRecorder(self.sql, [self.connector], self.config_file_path, "pmm",
+                                                         batch_interval=0.05)
+
+    def tearDown(self):
+        self.recorder.stop()
+        self.data_path_patch.stop()
+        self.temp_dir.cleanup()
+
+    def record_orders(self, first_order: int, orders: int) -> float:
+        """
+        Creates and fills `orders` orders. Returns the time spent in the event handlers, i.e. blocking the event loop.
+        """
+        blocking_time: float = 0
+        for i in range(first_order, first_order + orders):
+            order_id: str = f"buy-COINALPHA-HBOT-{1600000000000000 + i}"
+            self.connector.tracking_states = {order_id: {"amount": "1"}}
+            start: float = time.perf_counter()
+            self.recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self.connector, BuyOrderCreatedEvent(
+                i, OrderType.LIMIT, "COINALPHA-HBOT", Decimal(1), Decimal(100), order_id, f"exchange-{i}"
+            ))
+            self.connector.tracking_states = {}
+            self.recorder._did_fill_order(MarketEvent.OrderFilled.value, self.connector, OrderFilledEvent(
+                i, order_id, "COINALPHA-HBOT", TradeType.BUY, OrderType.LIMIT, Decimal(100), Decimal(1), TradeFee(0),
+                exchange_trade_id=f"trade-{i}"
+            ))
+            blocking_time += time.perf_counter() - start
+        return blocking_time
+
+    def test_write_behind(self):
+        orders: int = 20
+        # Without the worker thread, the records are committed right away, as they used to be.
+        synchronous_time: float = self.record_orders(0, orders)
+        self.assertEqual(orders, len(self.recorder.get_trades_for_config(self.config_file_path)))
+
+        self.recorder.start()
+        write_behind_time: float = self.record_orders(orders, orders)
+        self.assertGreater(self.recorder.writer.pending_writes + self.recorder.writer.rows_written, 0)
+        self.recorder.stop()
+        self.assertEqual(0, self.recorder.writer.pending_writes)
+        self.assertEqual(0, self.recorder.queue_lag)
+        self.assertGreaterEqual(synchronous_time, orders * 2 * COMMIT_DURATION)
+        self.assertLess(write_behind_time, synchronous_time / 10)
+
+        trade_fills: List[TradeFill] = self.recorder.get_trades_for_config(self.config_file_path)
+        self.assertEqual(2 * orders, len(trade_fills))
+        recorded_orders: List[Order] = self.recorder.get_orders_for_config_and_market(self.config_file_path,
+                                                                                      self.connector)
+        self.assertEqual(2 * orders, len(recorded_orders))
+        self.assertTrue(all(order.last_status == MarketEvent.OrderFilled.name for order in recorded_orders))
+        self.assertEqual(2 * orders, len(self.connector.trade_fills))
+        with open(os.path.join(self.temp_dir.name, "trades_test_markets_recorder.csv")) as csv_file:
+            self.assertEqual(2 * orders + 1, len(csv_file.readlines()))
+
+    def test_query_waits_for_pending_writes(self):
+        self.recorder.start()
+        self.record_orders(0, 1)
+        market_states: MarketState = self.recorder.get_market_states(self.config_file_path, self.connector)
+        self.assertEqual({}, market_states.saved_state)
+
+        self.connector.tracking_states = {"buy-COINALPHA-HBOT-1600000000000001": {"amount": "1"}}
+        self.recorder.save_market_states(self.config_file_path, self.connector)
+        market_states = self.recorder.get_market_states(self.config_file_path, self.connector)
+        self.assertEqual(self.connector.tracking_states, market_states.saved_state)
+
+        # Cancelling an unknown order doesn't write anything.
+        self.recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self.connector,
+                                        OrderCancelledEvent(1, "unknown"))
+        self.recorder._did_cancel_order(MarketEvent.OrderCancelled.value, self.connector,
+                                        OrderCancelledEvent(1, "buy-COINALPHA-HBOT-1600000000000000"))
+        [order] = self.recorder.get_orders_for_config_and_market(self.config_file_path, self.connector)
+        self.assertEqual(MarketEvent.OrderCancelled.name, order.last_status)
+        self.assertEqual(3, len(order.status))
+
+    def test_drain(self):
+        self.recorder.start()
+        self.record_orders(0, 10)
+        ticks: List[float] = []
+
+        async def tick():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.005)
+
+        async def query() -> List[TradeFill]:
+            tick_task: asyncio.Task = asyncio.ensure_future(tick())
+            await asyncio.sleep(0)
+            await self.recorder.drain()
+            trade_fills: List[TradeFill] = self.recorder.get_trades_for_config(self.config_file_path)
+            tick_task.cancel()
+            return trade_fills
+
+        self.assertEqual(10, len(self.ev_loop.run_until_complete(query())))
+        # The event loop kept running while the writes were committed.
+        self.assertGreater(len(ticks), 2)
+        self.assertLess(max(b - a for a, b in zip(ticks, ticks[1:])), COMMIT_DURATION * 2)
+
+    def test_get_trades_for_order(self):
+        self.recorder.start()
+        self.record_orders(0, 3)
+        order_id: str = "buy-COINALPHA-HBOT-1600000000000001"
+        self.recorder._did_fill_order(MarketEvent.OrderFilled.value, self.connector, OrderFilledEvent(
+            3, order_id, "COINALPHA-HBOT", TradeType.BUY, OrderType.LIMIT, Decimal(101), Decimal(1), TradeFee(0),
+            exchange_trade_id="trade-3"
+        ))
+        trade_fills: List[TradeFill] = self.recorder.get_trades_for_order(order_id)
+        self.assertEqual(["trade-1", "trade-3"], [trade_fill.exchange_trade_id for trade_fill in trade_fills])
+        self.assertEqual([], self.recorder.get_trades_for_order("unknown"))
+
+    def test_trade_history_cursors(self):
+        self.recorder.start()
+        # The cursors are saved with the trade fills, and on stop.
+        self.connector.trade_history_cursors = {"COINALPHA-HBOT": 100}
+        self.record_orders(0, 1)
+        self.assertEqual({"COINALPHA-HBOT": 100}, self.recorder.get_trade_history_cursors(self.connector))
+        self.connector.trade_history_cursors = {"COINALPHA-HBOT": 150, "ETH-USDT": 20}
+        self.recorder.stop()
+
+        # The next recorder hands them over to the connector.
+        connector: MockConnector = MockConnector()
+        recorder: MarketsRecorder = MarketsRecorder(self.sql, [connector], self.config_file_path, "pmm")
+        self.assertEqual({"COINALPHA-HBOT": 150, "ETH-USDT": 20}, connector.trade_history_cursors)
+        recorder.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
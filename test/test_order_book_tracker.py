@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import heapq
+import tempfile
+import time
+import unittest
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import (
+    OrderBookRecorder,
+    OrderBookRecordReader,
+    recording_file_path,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    Throttler,
+)
+
+
+class FakeClock:
+    """
+    Virtual time for asyncio.sleep: the sleepers are woken up in the order of their wake up times, once the other tasks
+    have run, and the time jumps to their wake up time.
+    """
+    def __init__(self):
+        self.now: float = 0.0
+        self._sleepers: List[Tuple[float, int, asyncio.Future]] = []
+        self._sleeps: int = 0
+        self._real_sleep: Callable = asyncio.sleep
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._sleeps += 1
+        heapq.heappush(self._sleepers, (self.now + delay, self._sleeps, future))
+        await future
+
+    async def run_until_complete(self, coroutine) -> float:
+        task: asyncio.Task = asyncio.ensure_future(coroutine)
+        while not task.done():
+            # Lets the woken up task, and the tasks it wakes up in turn, run up to their next sleep.
+            for _ in range(50):
+                await self._real_sleep(0)
+            if len(self._sleepers) > 0:
+                wake_up_time, _, future = heapq.heappop(self._sleepers)
+                self.now = max(self.now, wake_up_time)
+                if not future.done():
+                    future.set_result(None)
+        return task.result()
+
+
+class MockDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str], snapshot_delay: float = 0,
+                 clock: Callable[[], float] = time.perf_counter):
+        super().__init__(trading_pairs)
+        self.snapshot_delay: float = snapshot_delay
+        self.clock: Callable[[], float] = clock
+        self.requests_in_flight: int = 0
+        self.max_requests_in_flight: int = 0
+        self.request_times: List[float] = []
+        self.failures_left: int = 0
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.request_times.append(self.clock())
+        self.requests_in_flight += 1
+        self.max_requests_in_flight = max(self.max_requests_in_flight, self.requests_in_flight)
+        try:
+            await asyncio.sleep(self.snapshot_delay)
+            if self.failures_left > 0:
+                self.failures_left -= 1
+                raise IOError("Snapshot request failed.")
+        finally:
+            self.requests_in_flight -= 1
+        order_book: OrderBook = self.order_book_create_function()
+        order_book.apply_snapshot([], [], 1)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+def diff_message(update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": "COINALPHA-HBOT",
+        "update_id": update_id,
+        "bids": bids,
+        "asks": asks
+    }, timestamp=float(update_id))
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.tracker: OrderBookTracker = OrderBookTracker(MockDataSource(["COINALPHA-HBOT"]), ["COINALPHA-HBOT"])
+
+    def tearDown(self):
+        pending_tasks = asyncio.all_tasks(self.ev_loop)
+        for task in pending_tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
+
+    def run_tracker(self, messages: List[OrderBookMessage]) -> OrderBook:
+        trading_pair: str = "COINALPHA-HBOT"
+        order_book: OrderBook = self.ev_loop.run_until_complete(
+            self.tracker.data_source.get_new_order_book(trading_pair))
+        self.tracker._order_books[trading_pair] = order_book
+        message_queue: asyncio.Queue = asyncio.Queue()
+        self.tracker._tracking_message_queues[trading_pair] = message_queue
+        for message in messages:
+            message_queue.put_nowait(message)
+
+        async def track():
+            task = asyncio.ensure_future(self.tracker._track_single_book(trading_pair))
+            while not message_queue.empty():
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+
+        self.ev_loop.run_until_complete(track())
+        return order_book
+
+    def test_coalesced_diffs(self):
+        messages = [
+            diff_message(2, [["100", "1"], ["99", "2"]], [["101", "1"]]),
+            diff_message(3, [["100", "3"]], [["102", "1"]]),
+            diff_message(4, [["99", "0"]], [["101", "0"], ["103", "4"]]),
+        ]
+        order_book: OrderBook = self.run_tracker(messages)
+
+        self.assertEqual([(100.0, 3.0, 3)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual([(102.0, 1.0, 3), (103.0, 4.0, 4)], [tuple(row) for row in order_book.ask_entries()])
+        self.assertEqual(4, order_book.last_diff_uid)
+
+        stats = self.tracker.diff_stats["COINALPHA-HBOT"]
+        self.assertEqual(0, stats["queue_depth"])
+        self.assertEqual(3, stats["messages_applied"])
+        self.assertEqual(1, stats["batches_applied"])
+        self.assertEqual(3.0, stats["coalescing_ratio"])
+        self.assertEqual(8 / 5, stats["row_reduction_ratio"])
+        self.assertEqual(3, len(self.tracker._past_diffs_windows["COINALPHA-HBOT"]))
+
+    def test_snapshot_stops_coalescing(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 3,
+            "bids": [["98", "5"]],
+            "asks": [["105", "5"]]
+        }, timestamp=3.0)
+        messages = [
+            diff_message(2, [["100", "1"]], []),
+            snapshot,
+            diff_message(4, [["99", "1"]], []),
+        ]
+        order_book: OrderBook = self.run_tracker(messages)
+
+        self.assertEqual([99.0, 98.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(2, self.tracker.diff_stats["COINALPHA-HBOT"]["batches_applied"])
+
+    def test_coalescing_disabled(self):
+        self.tracker.COALESCE_DIFFS = False
+        messages = [diff_message(update_id, [["100", str(update_id)]], []) for update_id in range(2, 6)]
+        order_book: OrderBook = self.run_tracker(messages)
+
+        self.assertEqual([(100.0, 5.0, 5)], [tuple(row) for row in order_book.bid_entries()])
+        self.assertEqual(1.0, self.tracker.diff_stats["COINALPHA-HBOT"]["coalescing_ratio"])
+
+    def test_recorder(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 4,
+            "bids": [["98", "5"]],
+            "asks": [["105", "5"]]
+        }, timestamp=4.0)
+        messages = [
+            diff_message(2, [["100", "1"]], []),
+            diff_message(3, [["100", "2"], ["99", "1"]], [["101", "1"]]),
+            snapshot,
+            diff_message(5, [["99", "0"]], []),
+            diff_message(6, [], [["101", "3"]]),
+        ]
+        with tempfile.TemporaryDirectory() as data_dir:
+            self.tracker.recorder = OrderBookRecorder(data_dir)
+            self.run_tracker(messages)
+            self.tracker.recorder.close()
+            reader: OrderBookRecordReader = OrderBookRecordReader(recording_file_path(data_dir, "COINALPHA-HBOT"))
+            records = list(reader)
+            reader.close()
+
+        # The first coalesced diffs are recorded as a snapshot, since no snapshot of the pair was recorded before.
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.SNAPSHOT, OrderBookMessageType.DIFF],
+                         [record.type for record in records])
+        self.assertEqual([[100, 2, 3], [99, 1, 3]], records[0].bids.tolist())
+        self.assertEqual([[98, 5, 4]], records[1].bids.tolist())
+        self.assertEqual(4, records[1].update_id)
+        # The coalesced diffs keep the update id of each level.
+        self.assertEqual([[99, 0, 5]], records[2].bids.tolist())
+        self.assertEqual([[101, 3, 6]], records[2].asks.tolist())
+        self.assertEqual(6, records[2].update_id)
+
+    def test_concurrent_init(self):
+        clock: FakeClock = FakeClock()
+        trading_pairs: List[str] = [f"COIN{i}-HBOT" for i in range(20)]
+        data_source: MockDataSource = MockDataSource(trading_pairs, snapshot_delay=0.1, clock=clock.time)
+        data_source.failures_left = 1
+        tracker: OrderBookTracker = OrderBookTracker(data_source, trading_pairs)
+        tracker._ev_loop = MagicMock(time=clock.time)
+        tracker.INIT_ORDER_BOOK_CONCURRENCY = 4
+        tracker.INIT_ORDER_BOOK_INTERVAL = 0.01
+        tracker.INIT_ORDER_BOOK_RETRY_INTERVAL = 0.05
+        self.assertEqual({trading_pair: False for trading_pair in trading_pairs}, tracker.order_book_readiness)
+
+        # A diff that arrives before its order book is initialized is replayed after the snapshot.
+        tracker._order_book_diff_stream.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COIN19-HBOT",
+            "update_id": 2,
+            "bids": [["100", "1"]],
+            "asks": []
+        }, timestamp=2.0))
+
+        async def init():
+            router_task = asyncio.ensure_future(tracker._order_book_diff_router())
+            await tracker._init_order_books()
+            await asyncio.sleep(0.01)
+            router_task.cancel()
+
+        with patch.object(OrderBookTracker, "logger") as logger_method, patch("asyncio.sleep", clock.sleep):
+            logger = logger_method.return_value
+            self.ev_loop.run_until_complete(clock.run_until_complete(init()))
+
+        self.assertTrue(tracker.ready)
+        self.assertTrue(all(tracker.order_book_readiness.values()))
+        self.assertEqual(set(trading_pairs), set(tracker.order_books.keys()))
+        self.assertLessEqual(data_source.max_requests_in_flight, 4)
+        self.assertEqual(21, len(data_source.request_times))
+        intervals: List[float] = [b - a for a, b in zip(data_source.request_times, data_source.request_times[1:])]
+        self.assertGreaterEqual(min(intervals), 0.01 - 1e-9)
+        # 4 requests of 0.1 second at a time, the failed one being retried after 0.05 second. Serially, this would have
+        # taken 2 seconds of snapshot requests alone.
+        self.assertLess(clock.now, 1.0)
+        self.assertEqual([100.0], [row.price for row in tracker.order_books["COIN19-HBOT"].bid_entries()])
+        logger.network.assert_called_once()
+
+    def test_throttled_init(self):
+        # Snapshots weighing 10 against a limit of 20 per 0.2 second, as a connector does with its throttler.
+        trading_pairs: List[str] = [f"COIN{i}-HBOT" for i in range(6)]
+        data_source: MockDataSource = MockDataSource(trading_pairs)
+        tracker: OrderBookTracker = OrderBookTracker(data_source, trading_pairs)
+        tracker.INIT_ORDER_BOOK_CONCURRENCY = 6
+        throttler: Throttler = Throttler(rate_limits=[RateLimit(20, 0.2, "weight")], period_safety_margin=0.01)
+        tracker._init_request_slot = lambda: throttler.weighted_task(request_weight=0, limit_weights={"weight": 10})
+
+        with patch.object(OrderBookTracker, "logger"):
+            self.ev_loop.run_until_complete(tracker._init_order_books())
+
+        self.assertTrue(tracker.ready)
+        # The interval doesn't apply, the requests start in pairs as the weight is released.
+        request_times: List[float] = data_source.request_times
+        self.assertLess(request_times[1] - request_times[0], 0.05)
+        for first, third in zip(request_times, request_times[2:]):
+            self.assertGreaterEqual(third - first, 0.2)
+        self.assertLess(request_times[-1] - request_times[0], 0.8)
+
+
+if __name__ == "__main__":
+    unittest.main()
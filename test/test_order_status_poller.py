@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.order_status_poller import (
+    OrderStatusPollStats,
+    poll_order_statuses,
+)
+from hummingbot.core.event.events import (
+    OrderType,
+    TradeType,
+)
+
+
+def tracked_order(index: int, trading_pair: str) -> InFlightOrderBase:
+    return InFlightOrderBase(f"order-{index}", f"exchange-{index}", trading_pair, OrderType.LIMIT, TradeType.BUY,
+                             Decimal(100), Decimal(1), "OPEN")
+
+
+class OrderStatusPollerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        # Open orders of the mock exchange, by trading pair.
+        self.open_orders: Dict[str, List[Dict[str, Any]]] = {}
+        self.snapshot_requests: List[str] = []
+        self.lookups: List[str] = []
+
+    async def fetch_open_orders(self, trading_pair: str) -> List[Dict[str, Any]]:
+        self.snapshot_requests.append(trading_pair)
+        if trading_pair not in self.open_orders:
+            raise IOError(f"Error fetching the open orders of {trading_pair}.")
+        return self.open_orders[trading_pair]
+
+    async def fetch_order(self, order: InFlightOrderBase) -> Dict[str, Any]:
+        self.lookups.append(order.client_order_id)
+        if order.exchange_order_id is None:
+            raise IOError("Order does not exist.")
+        return {"id": order.exchange_order_id, "status": "FILLED"}
+
+    def poll(self, orders: List[InFlightOrderBase]) -> Tuple[List[Tuple[InFlightOrderBase, Any]],
+                                                              OrderStatusPollStats]:
+        return self.ev_loop.run_until_complete(poll_order_statuses(orders,
+                                                                   fetch_open_orders=self.fetch_open_orders,
+                                                                   fetch_order=self.fetch_order,
+                                                                   open_order_id=lambda entry: entry["id"],
+                                                                   snapshot_weight=3,
+                                                                   lookup_weight=2))
+
+    def test_open_orders_snapshots(self):
+        # 20 orders on each of 10 trading pairs, of which one order per trading pair left the open orders.
+        orders: List[InFlightOrderBase] = [tracked_order(i, f"PAIR{i % 10}-USDT") for i in range(200)]
+        for i in range(10):
+            self.open_orders[f"PAIR{i}-USDT"] = [{"id": f"exchange-{j}", "status": "NEW"}
+                                                 for j in range(i + 10, 200, 10)]
+
+        results, stats = self.poll(orders)
+        self.assertEqual(orders, [order for order, _ in results])
+        self.assertEqual(["FILLED"] * 10 + ["NEW"] * 190, [update["status"] for _, update in results])
+        self.assertEqual(10, len(self.snapshot_requests))
+        self.assertEqual([f"order-{i}" for i in range(10)], sorted(self.lookups, key=lambda o: int(o[6:])))
+        self.assertEqual(OrderStatusPollStats(orders=200, snapshot_requests=10, lookup_requests=10,
+                                              request_weight=50), stats)
+
+    def test_failed_snapshot(self):
+        orders: List[InFlightOrderBase] = [tracked_order(i, "ETH-USDT") for i in range(3)] + \
+                                          [tracked_order(i, "BTC-USDT") for i in range(3, 6)]
+        orders[1].exchange_order_id = None
+        self.open_orders["BTC-USDT"] = [{"id": f"exchange-{i}", "status": "NEW"} for i in range(3, 6)]
+
+        results, stats = self.poll(orders)
+        # The orders of the trading pair without open orders snapshot are looked up one by one.
+        self.assertEqual(["order-0", "order-1", "order-2"], self.lookups)
+        self.assertIsInstance(results[1][1], IOError)
+        self.assertEqual(["FILLED", "FILLED", "NEW", "NEW", "NEW"],
+                         [update["status"] for _, update in results if not isinstance(update, Exception)])
+        self.assertEqual(OrderStatusPollStats(orders=6, snapshot_requests=2, lookup_requests=3, request_weight=12),
+                         stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging
+import unittest
+from typing import (
+    List,
+    Tuple,
+)
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    OrderType,
+    SellOrderCompletedEvent,
+    TradeType,
+)
+
+
+class MockDataSource(OrderBookTrackerDataSource):
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        raise NotImplementedError
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    @property
+    def exchange_name(self) -> str:
+        return "binance"
+
+
+class MockMarket:
+    @staticmethod
+    def convert_from_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(trading_pair: str) -> str:
+        return trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+
+class PaperTradeLimitOrdersUnitTest(unittest.TestCase):
+    trading_pairs: List[str] = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+
+    def setUp(self):
+        tracker: MockOrderBookTracker = MockOrderBookTracker(MockDataSource(self.trading_pairs), self.trading_pairs)
+        self.market: PaperTradeExchange = PaperTradeExchange(tracker, MarketConfig.default_config(), MockMarket)
+        for trading_pair in self.trading_pairs:
+            order_book: OrderBook = tracker.data_source.order_book_create_function()
+            order_book.apply_numpy_snapshot(np.array([[99.0, 100.0, 1]]), np.array([[101.0, 100.0, 1]]))
+            tracker.order_books[trading_pair] = order_book
+            self.market.set_balance(trading_pair.split("-")[0], Decimal(10))
+        self.market.set_balance("HBOT", Decimal(1000))
+        tracker._order_books_initialized.set()
+        self.assertTrue(self.market.ready)
+
+        self.event_logger: EventLogger = EventLogger()
+        for event_tag in (MarketEvent.OrderFilled, MarketEvent.BuyOrderCompleted, MarketEvent.SellOrderCompleted):
+            self.market.add_listener(event_tag, self.event_logger)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, 0, 100)
+        self.clock.add_iterator(self.market)
+
+    def test_match_trade_to_limit_orders(self):
+        for price in ("102", "102.5", "103"):
+            self.market.sell("COINALPHA-HBOT", Decimal(1), OrderType.LIMIT, Decimal(price))
+        self.market.buy("COINALPHA-HBOT", Decimal(1), OrderType.LIMIT, Decimal("98"))
+
+        self.market.match_trade_to_limit_orders(
+            OrderBookTradeEvent("COINALPHA-HBOT", 1, TradeType.BUY, 102.75, 5.0)
+        )
+        fills: List[OrderFilledEvent] = [e for e in self.event_logger.event_log if isinstance(e, OrderFilledEvent)]
+        self.assertEqual([Decimal("102"), Decimal("102.5")], [fill.price for fill in fills])
+        self.assertTrue(all(fill.trade_type is TradeType.SELL for fill in fills))
+        self.assertEqual(2, len([e for e in self.event_logger.event_log if isinstance(e, SellOrderCompletedEvent)]))
+        self.assertEqual(Decimal(8), self.market.get_balance("COINALPHA"))
+        self.assertEqual(Decimal("1204.5"), self.market.get_balance("HBOT"))
+        self.assertEqual([Decimal("98"), Decimal("103")], sorted(order.price for order in self.market.limit_orders))
+
+        # A trade at the limit price does not fill the order.
+        self.market.match_trade_to_limit_orders(
+            OrderBookTradeEvent("COINALPHA-HBOT", 2, TradeType.SELL, Decimal("98"), Decimal(5))
+        )
+        self.assertEqual(2, len(self.market.limit_orders))
+
+    def test_process_crossed_limit_orders(self):
+        for trading_pair in self.trading_pairs:
+            self.market.buy(trading_pair, Decimal(1), OrderType.LIMIT, Decimal("98"))
+            self.market.buy(trading_pair, Decimal(1), OrderType.LIMIT, Decimal("97"))
+        # There won't be enough balance left to fill this order once it's crossed, so it will be dropped.
+        self.market.buy("COINGAMMA-HBOT", Decimal(10), OrderType.LIMIT, Decimal("96"))
+        self.clock.backtest_til(1)
+        self.assertEqual(7, len(self.market.limit_orders))
+        self.assertEqual(0, len(self.event_logger.event_log))
+
+        # Cross all the bids of all the trading pairs, over a single tick.
+        for trading_pair in self.trading_pairs:
+            self.market.order_books[trading_pair].apply_numpy_snapshot(np.array([[90.0, 100.0, 2]]),
+                                                                       np.array([[95.5, 100.0, 2]]))
+        self.clock.backtest_til(2)
+        completed: List[BuyOrderCompletedEvent] = [e for e in self.event_logger.event_log
+                                                   if isinstance(e, BuyOrderCompletedEvent)]
+        self.assertEqual(6, len(completed))
+        self.assertEqual(0, len(self.market.limit_orders))
+        for trading_pair in self.trading_pairs:
+            self.assertEqual(Decimal(12), self.market.get_balance(trading_pair.split("-")[0]))
+        self.assertEqual(Decimal(1000 - 3 * (98 + 97)), self.market.get_balance("HBOT"))
+
+    def test_process_limit_orders_missing_asset(self):
+        # A market with no COINDELTA balance.
+        trading_pairs: List[str] = ["COINDELTA-HBOT"]
+        tracker: MockOrderBookTracker = MockOrderBookTracker(MockDataSource(trading_pairs), trading_pairs)
+        market: PaperTradeExchange = PaperTradeExchange(tracker, MarketConfig.default_config(), MockMarket)
+        order_book: OrderBook = tracker.data_source.order_book_create_function()
+        order_book.apply_numpy_snapshot(np.array([[99.0, 100.0, 1]]), np.array([[101.0, 100.0, 1]]))
+        tracker.order_books["COINDELTA-HBOT"] = order_book
+        tracker._order_books_initialized.set()
+        market.set_balance("HBOT", Decimal(1000))
+        self.assertTrue(market.ready)
+        self.clock.add_iterator(market)
+        market.buy("COINDELTA-HBOT", Decimal(1), OrderType.LIMIT, Decimal("98"))
+        market.buy("COINDELTA-HBOT", Decimal(1), OrderType.LIMIT, Decimal("97"))
+        self.clock.backtest_til(1)
+
+        # The missing asset is reported once for the batch of orders, which are still filled.
+        order_book.apply_numpy_snapshot(np.array([[90.0, 100.0, 2]]), np.array([[95.5, 100.0, 2]]))
+        with self.assertLogs(level=logging.WARNING) as logs:
+            self.clock.backtest_til(2)
+        self.assertEqual(1, len([line for line in logs.output
+                                 if "Account balance does not have asset COINDELTA." in line]))
+        self.assertEqual(0, len(market.limit_orders))
+        self.assertEqual(Decimal(2), market.get_balance("COINDELTA"))
+        self.assertEqual(Decimal(1000 - 98 - 97), market.get_balance("HBOT"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,35 +1,183 @@
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
 from decimal import Decimal
-from typing import List
+import random
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Dict,
+    List,
+)
 import unittest
 import asyncio
 from unittest.mock import patch
 
-from hummingbot.client.performance import calculate_performance_metrics
+from hummingbot.client.command.export_command import ExportCommand
+from hummingbot.client.performance import (
+    calculate_performance_metrics,
+    PerformanceMetrics,
+    TradeColumns,
+)
 from hummingbot.core.data_type.trade import Trade, TradeType, TradeFee
+from hummingbot.model import get_declarative_base
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
 
 
-class PerformanceMetricsUnitTest(unittest.TestCase):
+def make_trade_fills(count: int, positions: List[str], seed: int = 0) -> List[TradeFill]:
+    rng: random.Random = random.Random(seed)
+    trades: List[TradeFill] = []
+    order_number: int = 0
+    while len(trades) < count:
+        order_number += 1
+        trade_type: str = rng.choice(["BUY", "SELL"])
+        position: str = rng.choice(positions)
+        for _ in range(rng.randint(1, 3)):
+            trades.append(TradeFill(config_file_path="test.yml", strategy="test", market="binance",
+                                    symbol=trading_pair, base_asset=base, quote_asset=quote,
+                                    timestamp=len(trades), order_id=f"order-{order_number}", trade_type=trade_type,
+                                    order_type="LIMIT", price=rng.uniform(90, 110), amount=rng.uniform(0.1, 10),
+                                    leverage=1, exchange_trade_id=str(len(trades)), position=position,
+                                    trade_fee={"percent": rng.choice([0.0, 0.001]),
+                                               "flat_fees": [{"asset": "BNB", "amount": rng.uniform(0, 0.01)}]}))
+    return trades
+
+
+def legacy_metrics(trades: List[Any]) -> Dict[str, Any]:
+    """
+    Volumes, fees and trade PnL computed fill by fill, the way calculate_performance_metrics did before it was
+    vectorized.
+    """
+    buys = [t for t in trades if t.trade_type.upper() == "BUY"]
+    sells = [t for t in trades if t.trade_type.upper() == "SELL"]
+    fees: Dict[str, Decimal] = {}
+    for trade in trades:
+        if trade.trade_fee["percent"] > 0:
+            fees[quote] = fees.get(quote, Decimal("0")) + Decimal(trade.price * trade.amount * trade.trade_fee["percent"])
+        for flat_fee in trade.trade_fee["flat_fees"]:
+            fees[flat_fee["asset"]] = fees.get(flat_fee["asset"], Decimal("0")) + Decimal(flat_fee["amount"])
 
-    def setUp(self):
-        pass
+    def aggregate(fills: List[TradeFill]) -> List[SimpleNamespace]:
+        aggregated: Dict[str, SimpleNamespace] = {}
+        for fill in fills:
+            if fill.order_id not in aggregated:
+                order_fills = [f for f in fills if f.order_id == fill.order_id]
+                aggregated[fill.order_id] = SimpleNamespace(
+                    position=fill.position,
+                    price=sum(f.price for f in order_fills) / len(order_fills),
+                    amount=sum(f.amount for f in order_fills))
+        return list(aggregated.values())
 
-    @patch('hummingbot.client.performance.get_last_price')
-    async def test_calculate_performance_metrics(self, mock_get_last_price):
-        f = asyncio.Future()
-        f.set_result(110)
-        mock_get_last_price.return_value = f
+    aggregated_buys, aggregated_sells = aggregate(buys), aggregate(sells)
+    longs = zip([b for b in aggregated_buys if b.position == "OPEN"],
+                [s for s in aggregated_sells if s.position == "CLOSE"])
+    shorts = zip([s for s in aggregated_sells if s.position == "OPEN"],
+                 [b for b in aggregated_buys if b.position == "CLOSE"])
+    pnls = [(close.price - open.price) * close.amount for open, close in longs] + \
+        [(open.price - close.price) * close.amount for open, close in shorts]
+    return {
+        "b_vol_base": Decimal(str(sum(b.amount for b in buys))),
+        "s_vol_quote": Decimal(str(sum(s.amount * s.price for s in sells))),
+        "fees": fees,
+        "derivative_pnl": Decimal(str(sum(pnls))),
+    }
 
+
+class PerformanceMetricsUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Imports all the models, for the relationships of TradeFill.
+        get_declarative_base()
+
+    @staticmethod
+    def calculate(trades: List[Any], cur_bals: Dict[str, Any], last_price: Any = 110) -> PerformanceMetrics:
+        with patch('hummingbot.client.performance.get_last_price') as mock_get_last_price, \
+                patch('hummingbot.client.performance.get_last_prices') as mock_get_last_prices:
+            mock_get_last_price.return_value = last_price
+            mock_get_last_prices.side_effect = lambda exchange, pairs: {pair: last_price for pair in pairs}
+            return asyncio.get_event_loop().run_until_complete(
+                calculate_performance_metrics("hbot_exchange", trading_pair, trades, cur_bals))
+
+    def test_calculate_performance_metrics(self):
         trades: List[Trade] = [
             Trade(trading_pair, TradeType.BUY, 100, 10, None, trading_pair, 1, TradeFee(0.0, [(quote, 0)])),
             Trade(trading_pair, TradeType.SELL, 120, 15, None, trading_pair, 1, TradeFee(0.0, [(quote, 0)]))
         ]
         cur_bals = {base: 100, quote: 10000}
-        metrics = asyncio.get_event_loop().run_until_complete(
-            calculate_performance_metrics("hbot_exchange", trading_pair, trades, cur_bals))
+        metrics = self.calculate(trades, cur_bals)
         self.assertEqual(Decimal("250"), metrics.trade_pnl)
-        print(metrics)
+        self.assertEqual(Decimal("-5"), metrics.tot_vol_base)
+        self.assertEqual(Decimal("800"), metrics.tot_vol_quote)
+
+    def test_decimal_trades(self):
+        trades: List[Trade] = [
+            Trade(trading_pair, TradeType.BUY, Decimal("0.1"), Decimal("3"), None, trading_pair, 1,
+                  TradeFee(0.001, [("BNB", Decimal("0.01"))])),
+            Trade(trading_pair, TradeType.BUY, Decimal("0.2"), Decimal("1"), None, trading_pair, 2,
+                  TradeFee(0.0, [("BNB", Decimal("0.02"))])),
+        ]
+        metrics = self.calculate(trades, {base: Decimal("4"), quote: Decimal("0")}, last_price=Decimal("0.3"))
+        self.assertEqual(Decimal("4"), metrics.b_vol_base)
+        self.assertEqual(Decimal("-0.5"), metrics.b_vol_quote)
+        self.assertEqual({"BNB": Decimal("0.03"), quote: Decimal("0.0003")}, metrics.fees)
+
+    def test_spot_trade_fills(self):
+        trades: List[TradeFill] = make_trade_fills(500, ["NILL"])
+        expected: Dict[str, Any] = legacy_metrics(trades)
+        metrics = self.calculate(trades, {base: 100, quote: 10000})
+        self.assertEqual(expected["b_vol_base"], metrics.b_vol_base)
+        self.assertEqual(expected["s_vol_quote"], metrics.s_vol_quote)
+        self.assertEqual(expected["fees"], metrics.fees)
+        self.assertEqual(metrics.cur_value - metrics.hold_value, metrics.trade_pnl)
+
+    def test_derivative_trade_fills(self):
+        trades: List[TradeFill] = make_trade_fills(500, ["OPEN", "CLOSE"])
+        expected: Dict[str, Any] = legacy_metrics(trades)
+        prices: List[float] = [t.price for t in trades]
+        metrics = self.calculate(trades, {base: 100, quote: 10000})
+        self.assertEqual(expected["b_vol_base"], metrics.b_vol_base)
+        self.assertEqual(expected["s_vol_quote"], metrics.s_vol_quote)
+        self.assertEqual(expected["fees"], metrics.fees)
+        self.assertEqual(expected["derivative_pnl"], metrics.trade_pnl)
+        # The fills are not modified by the aggregation of the orders.
+        self.assertEqual(prices, [t.price for t in trades])
+
+        # TradeFill query rows give the same metrics as the TradeFill objects.
+        rows = [SimpleNamespace(trade_type=t.trade_type, price=t.price, amount=t.amount, order_id=t.order_id,
+                                position=t.position, trade_fee=t.trade_fee) for t in trades]
+        columns: TradeColumns = TradeColumns.from_trades(rows, quote)
+        self.assertTrue(columns.is_derivative)
+        self.assertEqual(metrics, self.calculate(columns, {base: 100, quote: 10000}))
+
+    def test_trade_columns_from_session(self):
+        class TradesApp(ExportCommand):
+            markets_recorder = None
+            trade_fill_db = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path="")
+
+        app: TradesApp = TradesApp()
+        trades: List[TradeFill] = make_trade_fills(200, ["OPEN", "CLOSE"])
+        for trade in trades[100:]:
+            trade.market = "binance_perpetual"
+        session = app.trade_fill_db.get_shared_session()
+        session.add_all(trades)
+        session.commit()
+        expected: Dict[str, PerformanceMetrics] = {
+            "binance": self.calculate(trades[:100], {base: 100, quote: 10000}),
+            "binance_perpetual": self.calculate(trades[100:], {base: 100, quote: 10000}),
+        }
+
+        columns: Dict[Any, TradeColumns] = app._get_trade_columns_from_session(0, "test.yml")
+        self.assertEqual({("binance", trading_pair), ("binance_perpetual", trading_pair)}, set(columns.keys()))
+        for (market, symbol), market_columns in columns.items():
+            self.assertEqual(expected[market], self.calculate(market_columns, {base: 100, quote: 10000}))
+        self.assertEqual({}, app._get_trade_columns_from_session(0, "other.yml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.utils.price_oracle import PriceOracle
+
+
+class MockDataSource:
+    requests: List[List[str]] = []
+    prices: Dict[str, float] = {"ETH-USDT": 2000.5, "BTC-USDT": 50000.0, "BNB-USDT": 300.25}
+
+    @classmethod
+    async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
+        cls.requests.append(list(trading_pairs))
+        await asyncio.sleep(0.01)
+        return {trading_pair: cls.prices[trading_pair] for trading_pair in trading_pairs}
+
+
+class MockConnector:
+    def __init__(self, order_books: Dict[str, OrderBook]):
+        self.ready: bool = True
+        self.order_books: Dict[str, OrderBook] = order_books
+
+
+class PriceOracleUnitTest(unittest.TestCase):
+    def setUp(self):
+        MockDataSource.requests = []
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.patcher = patch("hummingbot.core.utils.price_oracle.order_book_data_source", self.order_book_data_source)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    @staticmethod
+    def order_book_data_source(exchange: str):
+        if exchange == "broken_exchange":
+            raise ImportError("No module named 'broken_exchange_api_order_book_data_source'.")
+        return (MockDataSource, {}) if exchange == "binance" else None
+
+    def test_batched_lookups(self):
+        oracle: PriceOracle = PriceOracle(price_ttl=0.2)
+
+        async def lookups():
+            return await asyncio.gather(oracle.get_last_price("binance", "ETH-USDT"),
+                                        oracle.get_last_price("binance_PaperTrade", "ETH-USDT"),
+                                        oracle.get_last_prices("binance", ["BTC-USDT", "BNB-USDT"]),
+                                        oracle.get_last_price("unknown_exchange", "ETH-USDT"))
+
+        eth_price, paper_eth_price, prices, unknown_price = self.ev_loop.run_until_complete(lookups())
+        self.assertEqual(Decimal("2000.5"), eth_price)
+        self.assertEqual(Decimal("2000.5"), paper_eth_price)
+        self.assertEqual({"BTC-USDT": Decimal("50000.0"), "BNB-USDT": Decimal("300.25")}, prices)
+        self.assertIsNone(unknown_price)
+        self.assertEqual([["ETH-USDT", "BTC-USDT", "BNB-USDT"]], MockDataSource.requests)
+
+        # Served from the cache until the prices expire.
+        self.ev_loop.run_until_complete(oracle.get_last_price("binance", "BTC-USDT"))
+        self.assertEqual(1, oracle.fetches)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+        self.ev_loop.run_until_complete(oracle.get_last_price("binance", "BTC-USDT"))
+        self.assertEqual(2, oracle.fetches)
+        self.assertEqual(["BTC-USDT"], MockDataSource.requests[-1])
+
+    def test_failed_lookup(self):
+        oracle: PriceOracle = PriceOracle()
+        self.assertIsNone(self.ev_loop.run_until_complete(oracle.get_last_price("binance", "XYZ-USDT")))
+        self.assertIsNone(oracle.get_cached_price("binance", "XYZ-USDT"))
+        # A connector whose data source fails to load has no price, the other lookups go on.
+        with patch.object(PriceOracle, "logger") as logger_method:
+            self.assertEqual({"ETH-USDT": None}, self.ev_loop.run_until_complete(
+                oracle.get_last_prices("broken_exchange", ["ETH-USDT"])))
+            logger_method.return_value.error.assert_called_once()
+
+    def test_live_prices(self):
+        oracle: PriceOracle = PriceOracle()
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(101.0, 1.0, 1)], 1)
+        oracle.add_connector("binance", MockConnector({"ETH-USDT": order_book}))
+        self.assertEqual(Decimal("100.0"), self.ev_loop.run_until_complete(oracle.get_last_price("binance",
+                                                                                                 "ETH-USDT")))
+        order_book.last_trade_price = 100.5
+        self.assertEqual(Decimal("100.5"), self.ev_loop.run_until_complete(oracle.get_last_price("binance",
+                                                                                                 "ETH-USDT")))
+        self.assertEqual(Decimal("100.0"), oracle.get_live_price("binance", "ETH-USDT", mid_price=True))
+        self.assertEqual(0, oracle.fetches)
+
+        # Markets which are not tracked by the connector are fetched.
+        self.assertEqual(Decimal("50000.0"), self.ev_loop.run_until_complete(oracle.get_last_price("binance",
+                                                                                                   "BTC-USDT")))
+        self.assertEqual(1, oracle.fetches)
+        oracle.remove_connectors()
+        self.assertIsNone(oracle.get_live_price("binance", "ETH-USDT"))
+
+        # Paper trade connectors serve the prices of their exchange, under either name.
+        oracle.add_connector("binance_PaperTrade", MockConnector({"ETH-USDT": order_book}))
+        self.assertEqual(Decimal("100.5"), oracle.get_live_price("binance_PaperTrade", "ETH-USDT"))
+        self.assertEqual(Decimal("100.5"), oracle.get_live_price("binance", "ETH-USDT"))
+
+
+if __name__ == "__main__":
+    unittest.main()
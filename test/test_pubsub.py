@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from enum import Enum
+import gc
+from typing import List
+import unittest
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class TestEvent(Enum):
+    EventA = 1
+    EventB = 2
+
+
+class RecordingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.args: List[any] = []
+
+    def __call__(self, arg: any):
+        self.args.append(arg)
+
+
+class SelfRemovingListener(RecordingListener):
+    def __init__(self, pubsub: PubSub, new_listener: EventListener):
+        super().__init__()
+        self._pubsub: PubSub = pubsub
+        self._new_listener: EventListener = new_listener
+
+    def __call__(self, arg: any):
+        super().__call__(arg)
+        self._pubsub.remove_listener(TestEvent.EventA, self)
+        self._pubsub.add_listener(TestEvent.EventA, self._new_listener)
+
+
+class PubSubUnitTest(unittest.TestCase):
+    def test_add_remove_listeners(self):
+        pubsub: PubSub = PubSub()
+        listener_1: RecordingListener = RecordingListener()
+        listener_2: RecordingListener = RecordingListener()
+        pubsub.add_listener(TestEvent.EventA, listener_1)
+        pubsub.add_listener(TestEvent.EventA, listener_1)
+        pubsub.add_listener(TestEvent.EventB, listener_2)
+        pubsub.trigger_event(TestEvent.EventA, 1)
+        pubsub.trigger_event(TestEvent.EventB, 2)
+        self.assertEqual([1], listener_1.args)
+        self.assertEqual([2], listener_2.args)
+
+        pubsub.add_listener(TestEvent.EventA, listener_2)
+        self.assertEqual({listener_1, listener_2}, set(pubsub.get_listeners(TestEvent.EventA)))
+        pubsub.trigger_event(TestEvent.EventA, 3)
+        self.assertEqual([1, 3], listener_1.args)
+        self.assertEqual([2, 3], listener_2.args)
+
+        pubsub.remove_listener(TestEvent.EventA, listener_1)
+        pubsub.trigger_event(TestEvent.EventA, 4)
+        self.assertEqual([1, 3], listener_1.args)
+        self.assertEqual([2, 3, 4], listener_2.args)
+        self.assertEqual([listener_2], pubsub.get_listeners(TestEvent.EventA))
+
+    def test_dead_listeners(self):
+        pubsub: PubSub = PubSub()
+        listener_1: RecordingListener = RecordingListener()
+        listener_2: RecordingListener = RecordingListener()
+        pubsub.add_listener(TestEvent.EventA, listener_1)
+        pubsub.add_listener(TestEvent.EventA, listener_2)
+        pubsub.add_listener(TestEvent.EventB, listener_2)
+        pubsub.trigger_event(TestEvent.EventA, 1)
+
+        del listener_2
+        gc.collect()
+        self.assertEqual([listener_1], pubsub.get_listeners(TestEvent.EventA))
+        self.assertEqual([], pubsub.get_listeners(TestEvent.EventB))
+        pubsub.trigger_event(TestEvent.EventA, 2)
+        self.assertEqual([1, 2], listener_1.args)
+
+        # Listeners don't keep the PubSub alive.
+        del pubsub
+        gc.collect()
+        del listener_1
+        gc.collect()
+
+    def test_change_listeners_during_dispatch(self):
+        pubsub: PubSub = PubSub()
+        new_listener: RecordingListener = RecordingListener()
+        listener: SelfRemovingListener = SelfRemovingListener(pubsub, new_listener)
+        pubsub.add_listener(TestEvent.EventA, listener)
+        pubsub.trigger_event(TestEvent.EventA, 1)
+        # The changes apply from the next trigger.
+        self.assertEqual([1], listener.args)
+        self.assertEqual([], new_listener.args)
+        pubsub.trigger_event(TestEvent.EventA, 2)
+        self.assertEqual([1], listener.args)
+        self.assertEqual([2], new_listener.args)
+
+
+if __name__ == "__main__":
+    unittest.main()
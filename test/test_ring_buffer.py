@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import random
+from typing import List
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.ring_buffer import RingBuffer
+
+
+def window_volatility(values: List[float], window: int, length: int) -> float:
+    # The volatility as LiquidityMiningStrategy computed it out of a list of mid prices, the first window being partial
+    # while the list fills up.
+    atr: List[float] = []
+    for i in range(len(values) - 1, 0, -window)[:length]:
+        prices: List[float] = values[max(i - window + 1, 0): i + 1]
+        atr.append((max(prices) - min(prices)) / min(prices))
+    return float(np.mean(atr)) if len(atr) > 0 else float("nan")
+
+
+class RingBufferUnitTest(unittest.TestCase):
+    def test_values(self):
+        buffer: RingBuffer = RingBuffer(5)
+        self.assertEqual(0, len(buffer))
+        self.assertIsNone(buffer.take_samples(1, 1))
+        for value in range(1, 8):
+            buffer.add_value(value)
+        # Only the last 5 values are kept.
+        self.assertEqual(5, len(buffer))
+        self.assertTrue(buffer.is_full)
+        self.assertEqual([3, 4, 5, 6, 7], list(buffer))
+        self.assertEqual((3.0, 7.0, 6.0), (buffer[0], buffer[-1], buffer[-2]))
+        self.assertEqual([5, 6], buffer[2:4].tolist())
+        with self.assertRaises(IndexError):
+            _ = buffer[5]
+
+    def test_take_samples(self):
+        buffer: RingBuffer = RingBuffer(10)
+        for value in range(1, 14):
+            buffer.add_value(value)
+        self.assertEqual([7, 10, 13], buffer.take_samples(3, 3).tolist())
+        self.assertEqual([4, 13], buffer.take_samples(9, 2).tolist())
+        self.assertEqual([13], buffer.take_samples(100, 1).tolist())
+        # The samples would go back to dropped values.
+        self.assertIsNone(buffer.take_samples(10, 2))
+        self.assertIsNone(buffer.take_samples(1, 11))
+
+    def test_mean(self):
+        random.seed(1)
+        buffer: RingBuffer = RingBuffer(50)
+        values: List[float] = []
+        for _ in range(120):
+            values.append(random.uniform(90, 110))
+            buffer.add_value(values[-1])
+            for length in [1, 7, min(50, len(values))]:
+                if length <= len(values):
+                    self.assertAlmostEqual(np.mean(values[-length:]), buffer.mean(length), places=9)
+        self.assertAlmostEqual(np.mean(values[-50:]), buffer.mean(), places=9)
+        self.assertTrue(math.isnan(buffer.mean(51)))
+
+    def test_rolling_min_max_and_volatility(self):
+        random.seed(2)
+        window, length = 5, 4
+        buffer: RingBuffer = RingBuffer(window * length, range_window=window)
+        values: List[float] = [random.uniform(90, 110)]
+        buffer.add_value(values[0])
+        # The volatility needs 2 values at least.
+        self.assertTrue(math.isnan(buffer.volatility(length)))
+        for _ in range(100):
+            values.append(random.uniform(90, 110))
+            buffer.add_value(values[-1])
+            self.assertEqual(min(values[-window:]), buffer.rolling_min())
+            self.assertEqual(max(values[-window:]), buffer.rolling_max())
+            self.assertAlmostEqual(window_volatility(values[-window * length:], window, length),
+                                   buffer.volatility(length))
+        with self.assertRaises(ValueError):
+            RingBuffer(10).rolling_min()
+
+    def test_timestamp_alignment(self):
+        buffer: RingBuffer = RingBuffer(10, interval=1.0, range_window=3)
+        buffer.add_value(100, 1000.5)
+        buffer.add_value(110, 1001.0)
+        # The last value of a second replaces the previous one.
+        buffer.add_value(90, 1001.9)
+        self.assertEqual([100, 90], list(buffer))
+        self.assertEqual(90, buffer.rolling_min())
+        self.assertEqual(100, buffer.rolling_max())
+        self.assertAlmostEqual(95, buffer.mean())
+        # The missed seconds are filled with the last value, and older values are ignored.
+        buffer.add_value(95, 1004.2)
+        buffer.add_value(80, 1003.0)
+        self.assertEqual([100, 90, 90, 90, 95], list(buffer))
+        self.assertEqual(1004.0, buffer.last_timestamp)
+        self.assertEqual(5, len(buffer.take_samples(1, 5)))
+        # A gap longer than the capacity only fills the buffer.
+        buffer.add_value(120, 2000.0)
+        self.assertEqual([95] * 9 + [120], list(buffer))
+        self.assertAlmostEqual(95 * 9 / 10 + 12, buffer.mean())
+
+    def test_replace_last_value(self):
+        random.seed(3)
+        window, length = 4, 5
+        buffer: RingBuffer = RingBuffer(window * length, interval=1.0, range_window=window)
+        values: List[float] = []
+        for second in range(60):
+            # A few values per second, the last one being kept.
+            for _ in range(random.randint(1, 3)):
+                value: float = random.uniform(90, 110)
+                buffer.add_value(value, 1000 + second + random.uniform(0, 0.99))
+            values.append(value)
+            fresh: RingBuffer = RingBuffer(window * length, range_window=window)
+            for value in values:
+                fresh.add_value(value)
+            self.assertEqual(list(fresh), list(buffer))
+            self.assertEqual(fresh.rolling_min(), buffer.rolling_min())
+            self.assertEqual(fresh.rolling_max(), buffer.rolling_max())
+            for n in range(1, length + 1):
+                self.assertTrue(np.allclose(fresh.volatility(n), buffer.volatility(n), equal_nan=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
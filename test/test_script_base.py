@@ -13,18 +13,17 @@ class ScriptIteratorUnitTest(unittest.TestCase):
 
     def test_avg_mid_price(self):
         script_base = ScriptBase()
-        script_base.mid_prices = [Decimal("10.1"), Decimal("10.2"), Decimal("10.1"), Decimal("10.2"), Decimal("10.4"),
-                                  Decimal("10.5"), Decimal("10.3"), Decimal("10.6"), Decimal("10.7"), Decimal("10.8"),
-                                  Decimal("10.0"), Decimal("10.1"), Decimal("10.1"), Decimal("10.1"), Decimal("10.1")]
+        for mid_price in [10.1, 10.2, 10.1, 10.2, 10.4, 10.5, 10.3, 10.6, 10.7, 10.8, 10.0, 10.1, 10.1, 10.1, 10.1]:
+            script_base.mid_prices.add_value(mid_price)
         avg_price = script_base.avg_mid_price(3, 10)
         # since there is not enough sample size, it should return None
         self.assertTrue(avg_price is None)
         # At interval of 3 and length of 5, these belows are counted as the samples
         samples = [Decimal("10.1"), Decimal("10.5"), Decimal("10.7"), Decimal("10.1"), Decimal("10.1")]
-        self.assertEqual(mean(samples), script_base.avg_mid_price(3, 5))
+        self.assertAlmostEqual(mean(samples), script_base.avg_mid_price(3, 5), places=10)
         # At length of 2, only the last two should be used for the avg
         samples = [Decimal("10.1"), Decimal("10.1")]
-        self.assertEqual(mean(samples), script_base.avg_mid_price(3, 2))
+        self.assertAlmostEqual(mean(samples), script_base.avg_mid_price(3, 2), places=10)
         # At 100 interval and length of 1, only the last item is counted.
         avg_price = script_base.avg_mid_price(100, 1)
         self.assertEqual(Decimal("10.1"), avg_price)
@@ -47,10 +46,16 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         expected = [7]
         samples = script_base.take_samples(a_list, 2, 1)
         self.assertEqual(expected, samples)
+        # Samples are taken the same way out of a ring buffer
+        for item in a_list:
+            script_base.mid_prices.add_value(item)
+        self.assertEqual([1, 3, 5, 7], script_base.take_samples(script_base.mid_prices, 2, 4))
+        self.assertIsNone(script_base.take_samples(script_base.mid_prices, 3, 10))
 
     def test_avg_and_median_mid_price_chg(self):
         script_base = ScriptBase()
-        script_base.mid_prices = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
+        for mid_price in range(1, 16):
+            script_base.mid_prices.add_value(mid_price)
         avg_chg = script_base.avg_price_volatility(3, 10)
         # since there is not enough sample size, it should return None
         self.assertTrue(avg_chg is None)
@@ -60,13 +65,13 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         # At interval of 4 and length of 3, these belows are counted as the samples
         # The samples are 15, 11,  7, 3
         expected_chg = [(15 - 11) / 11, (11 - 7) / 7, (7 - 3) / 3]
-        self.assertEqual(mean(expected_chg), script_base.avg_price_volatility(4, 3))
+        self.assertAlmostEqual(mean(expected_chg), float(script_base.avg_price_volatility(4, 3)))
         # The median change is (11 - 7) / 7
-        self.assertEqual((11 - 7) / 7, script_base.median_price_volatility(4, 3))
+        self.assertAlmostEqual((11 - 7) / 7, float(script_base.median_price_volatility(4, 3)))
 
         # At 10 interval and length of 1.
         expected_chg = (15 - 5) / 5
-        self.assertEqual(expected_chg, script_base.avg_price_volatility(10, 1))
+        self.assertAlmostEqual(expected_chg, float(script_base.avg_price_volatility(10, 1)))
 
     def test_round_by_step(self):
         self.assertEqual(Decimal("1.75"), ScriptBase.round_by_step(Decimal("1.8"), Decimal("0.25")))
@@ -74,3 +79,12 @@ class ScriptIteratorUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.75"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("0.01")))
         self.assertEqual(Decimal("1"), ScriptBase.round_by_step(Decimal("1.7567"), Decimal("1")))
         self.assertEqual(Decimal("-1.75"), ScriptBase.round_by_step(Decimal("-1.8"), Decimal("0.25")))
+
+    def test_mid_prices_aligned_on_seconds(self):
+        script_base = ScriptBase()
+        script_base.mid_prices.add_value(10.0, 1000.2)
+        # The last mid price of a second replaces the previous ones, and the missed seconds are filled.
+        script_base.mid_prices.add_value(10.5, 1000.7)
+        script_base.mid_prices.add_value(11.0, 1003.0)
+        self.assertEqual([10.5, 10.5, 10.5, 11.0], list(script_base.mid_prices))
+        self.assertEqual(Decimal("11.0"), script_base.mid_price)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import (
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+
+
+class MockDataSource:
+    requests: List[str] = []
+    trading_pairs: Dict[str, List[str]] = {"binance": ["ETH-USDT", "BTC-USDT"], "kraken": []}
+
+    def __init__(self, connector_name: str):
+        self._connector_name: str = connector_name
+
+    async def fetch_trading_pairs(self, **kwargs) -> List[str]:
+        MockDataSource.requests.append(self._connector_name)
+        if self._connector_name == "bittrex":
+            raise IOError("Error fetching the trading pairs.")
+        return MockDataSource.trading_pairs[self._connector_name]
+
+
+class TradingPairFetcherUnitTest(unittest.TestCase):
+    def setUp(self):
+        MockDataSource.requests = []
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self.temp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.catalogue_path: str = join(self.temp_dir.name, "trading_pairs.json")
+        self.patcher = patch("hummingbot.core.utils.trading_pair_fetcher.trading_pair_source",
+                             lambda conn_setting: MockDataSource(conn_setting.name))
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.temp_dir.cleanup()
+
+    def run_pending(self):
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+    def test_lazy_fetch_and_persistence(self):
+        fetcher: TradingPairFetcher = TradingPairFetcher(self.catalogue_path)
+        self.assertEqual([], MockDataSource.requests)
+
+        # The trading pairs are fetched on the first lookup only, and in the background.
+        self.assertEqual([], fetcher.get_trading_pairs("binance"))
+        self.assertEqual([], fetcher.get_trading_pairs("binance"))
+        self.run_pending()
+        self.assertEqual(["binance"], MockDataSource.requests)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], fetcher.get_trading_pairs("binance"))
+        self.assertEqual([], fetcher.get_trading_pairs("unknown_exchange"))
+        self.run_pending()
+        self.assertEqual(["binance"], MockDataSource.requests)
+
+        # The catalogue is loaded on start, without fetching its trading pairs.
+        fetcher = TradingPairFetcher(self.catalogue_path)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], fetcher.get_trading_pairs("binance"))
+        self.run_pending()
+        self.assertEqual(["binance"], MockDataSource.requests)
+
+    def test_failed_fetches_not_saved(self):
+        fetcher: TradingPairFetcher = TradingPairFetcher(self.catalogue_path)
+        self.ev_loop.run_until_complete(fetcher.fetch_all(["binance", "kraken", "bittrex"]))
+        self.assertEqual(["binance", "kraken", "bittrex"], MockDataSource.requests)
+        self.assertEqual({"binance": ["ETH-USDT", "BTC-USDT"]}, fetcher.trading_pairs)
+        with open(self.catalogue_path) as catalogue_file:
+            self.assertEqual(["binance"], list(json.load(catalogue_file).keys()))
+
+        # The failed fetches are retried after an interval.
+        self.assertEqual([], fetcher.get_trading_pairs("bittrex"))
+        self.run_pending()
+        self.assertEqual(["binance", "kraken", "bittrex"], MockDataSource.requests)
+        fetcher.RETRY_INTERVAL = 0
+        fetcher.get_trading_pairs("bittrex")
+        self.run_pending()
+        self.assertEqual(["binance", "kraken", "bittrex", "bittrex"], MockDataSource.requests)
+
+    def test_stale_refresh(self):
+        with open(self.catalogue_path, "w") as catalogue_file:
+            json.dump({"binance": {"timestamp": time.time() - TradingPairFetcher.CATALOGUE_TTL - 1,
+                                   "trading_pairs": ["ETH-USDT"]},
+                       "kraken": {"timestamp": time.time(), "trading_pairs": ["ETH-USD"]}}, catalogue_file)
+        fetcher: TradingPairFetcher = TradingPairFetcher(self.catalogue_path)
+        # The stale trading pairs are served until they're fetched again.
+        self.assertTrue(fetcher.is_stale("binance"))
+        self.assertFalse(fetcher.is_stale("kraken"))
+        self.assertEqual(["ETH-USDT"], fetcher.get_trading_pairs("binance"))
+        self.run_pending()
+        self.assertEqual(["binance"], MockDataSource.requests)
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], fetcher.get_trading_pairs("binance"))
+        self.assertFalse(fetcher.is_stale("binance"))
+
+    def test_corrupted_catalogue(self):
+        with open(self.catalogue_path, "w") as catalogue_file:
+            catalogue_file.write("{")
+        fetcher: TradingPairFetcher = TradingPairFetcher(self.catalogue_path)
+        self.assertEqual({}, fetcher.trading_pairs)
+        self.ev_loop.run_until_complete(fetcher.fetch_all(["binance"]))
+        self.assertFalse(os.path.exists(f"{self.catalogue_path}.tmp"))
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], TradingPairFetcher(self.catalogue_path).trading_pairs["binance"])
+
+
+if __name__ == "__main__":
+    unittest.main()